@@ -0,0 +1,59 @@
+"""AES-GCM throughput of every available crypto backend per chunk size.
+
+usage: python benchmarks/bench_aes.py [--chunk-kb 64 1024 7168] [--total-mb 256]
+
+Every backend encrypts and decrypts --total-mb of random data cut into chunks of
+each size through aes.encrypt/aes.decrypt (the wire format included), on one
+thread. The OpenSSL backend is only listed if cryptography is installed.
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import aes  # noqa: E402
+
+
+def bench(backend, key, chunk, count):
+    started = time.perf_counter()
+    for _ in range(count):
+        encrypted_chunk = aes.encrypt(key, chunk, backend=backend)
+    encrypt_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(count):
+        aes.decrypt(key, encrypted_chunk, backend=backend)
+    decrypt_time = time.perf_counter() - started
+
+    return encrypt_time, decrypt_time
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunk-kb", type=int, nargs="+", default=[64, 1024, 7168])
+    parser.add_argument("--total-mb", type=int, default=256)
+    args = parser.parse_args()
+
+    key = os.urandom(32)
+    total_size = args.total_mb * 1024 * 1024
+
+    print(f"default backend: {aes.BACKEND.name}")
+    print(f"{'backend':<14} {'chunk':>8} {'encrypt':>12} {'decrypt':>12}")
+    for backend in aes.BACKENDS:
+        for chunk_kb in args.chunk_kb:
+            chunk = os.urandom(chunk_kb * 1024)
+            count = max(total_size // len(chunk), 1)
+            encrypt_time, decrypt_time = bench(backend, key, chunk, count)
+
+            size_mb = count * len(chunk) / 1024 / 1024
+            print(
+                f"{backend.name:<14} {chunk_kb:>6}KB"
+                f" {size_mb / encrypt_time:>7.1f} MB/s {size_mb / decrypt_time:>7.1f} MB/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Encrypting/decrypting throughput of a big file, one chunk at the time vs the crypto pool.
+
+usage: python benchmarks/bench_crypto.py [--size-mb 700]
+
+The file is made of random bytes in a temporary directory. "serial" is the loop
+protector used before the pool (aes.encrypt/aes.decrypt on every 7MB chunk in
+turn), "pool" is encrypt_chunks/decrypt_chunks with CRYPTO_WORKERS threads.
+The speedup is bounded by the number of cores.
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import aes  # noqa: E402
+from src.protector import (  # noqa: E402
+    CRYPTO_WORKERS,
+    encrypt_chunks,
+    decrypt_chunks,
+)
+from src.utils import read_file_in_chunk  # noqa: E402
+
+
+def bench(name, run, size):
+    started = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - started
+    print(f"{name:<16} {elapsed:8.2f}s  {size / elapsed / 1024 / 1024:8.1f} MB/s")
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=700)
+    args = parser.parse_args()
+
+    key = os.urandom(32)
+    size = args.size_mb * 1024 * 1024
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "file")
+        with open(file_path, "wb") as f:
+            for _ in range(args.size_mb):
+                f.write(os.urandom(1024 * 1024))
+
+        print(f"{args.size_mb}MB, {CRYPTO_WORKERS} workers")
+        bench(
+            "encrypt serial",
+            lambda: [
+                aes.encrypt(key, chunk) for chunk in read_file_in_chunk(file_path)
+            ],
+            size,
+        )
+        encrypted_chunks = bench(
+            "encrypt pool", lambda: list(encrypt_chunks(key, file_path)), size
+        )
+        bench(
+            "decrypt serial",
+            lambda: [aes.decrypt(key, chunk) for chunk in encrypted_chunks],
+            size,
+        )
+        bench("decrypt pool", lambda: list(decrypt_chunks(key, encrypted_chunks)), size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Download time of one part under a simulated round-trip time.
+
+usage: python benchmarks/bench_download.py [--size-mb 7] [--rtt-ms 50 150 300] [--bandwidth-mbps 100]
+
+No network is used: a simulated client answers GetFile requests after one RTT,
+and the bytes of every answer take size / bandwidth on the link (one answer at
+the time). "sequential" is what client.download_file does (one 512KB block per
+round trip), "parallel" is download_document with its pipelined requests over
+CONNECTIONS simulated connections sharing the link.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from telethon.tl import functions, types  # noqa: E402
+
+from src.core._downloader import download_document  # noqa: E402
+from src.core._connections import (  # noqa: E402
+    CONNECTIONS,
+    Connection,
+    set_connection_pool,
+)
+
+
+class Document(dict):
+    # the stored info of a message + its data
+    def __init__(self, data):
+        super().__init__(
+            msg_id=1,
+            document_id=1,
+            access_hash=1,
+            file_reference=b"",
+            dc_id=2,
+            size=len(data),
+            file_name="part",
+        )
+        self.data = data
+
+
+class File:
+    def __init__(self, data):
+        self.bytes = data
+
+
+class SimulatedClient:
+    def __init__(self, document, rtt, bandwidth):
+        self.__document = document
+        self.__rtt = rtt
+        self.__bandwidth = bandwidth
+        self.__link = asyncio.Lock()
+
+    async def __call__(self, request):
+        block = self.__document.data[request.offset : request.offset + request.limit]
+
+        await asyncio.sleep(self.__rtt)
+        async with self.__link:
+            await asyncio.sleep(len(block) / self.__bandwidth)
+
+        return File(block)
+
+    async def download_file(self, document, file, part_size_kb):
+        location = types.InputDocumentFileLocation(
+            document["document_id"],
+            document["access_hash"],
+            document["file_reference"],
+            "",
+        )
+        part_size = part_size_kb * 1024
+
+        with open(file, "wb") as f:
+            for offset in range(0, document["size"], part_size):
+                result = await self(
+                    functions.upload.GetFileRequest(location, offset, part_size)
+                )
+                f.write(result.bytes)
+
+
+class SimulatedPool:
+    # the connections of a real client are opened to Telegram
+    # -> here every connection sends its requests to the simulated client (same RTT, same link)
+    def __init__(self, client):
+        self.__connections = [Connection(client) for _ in range(CONNECTIONS)]
+
+    async def get(self, dc_id=None):
+        return self.__connections
+
+
+async def bench(size, rtt, bandwidth, file_path):
+    document = Document(os.urandom(size))
+
+    client = SimulatedClient(document, rtt, bandwidth)
+    start = time.perf_counter()
+    await client.download_file(document, file_path, 512)
+    sequential_time = time.perf_counter() - start
+
+    client = SimulatedClient(document, rtt, bandwidth)
+    set_connection_pool(client, SimulatedPool(client))
+    start = time.perf_counter()
+    await download_document(client, document, file_path)
+    parallel_time = time.perf_counter() - start
+
+    with open(file_path, "rb") as f:
+        assert f.read() == document.data
+
+    return sequential_time, parallel_time
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=7)
+    parser.add_argument("--rtt-ms", type=int, nargs="+", default=[50, 150, 300])
+    parser.add_argument("--bandwidth-mbps", type=int, default=100)
+    args = parser.parse_args()
+
+    size = args.size_mb * 1024 * 1024
+    bandwidth = args.bandwidth_mbps * 1024 * 1024 / 8
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "part")
+
+        print(f"{args.size_mb}MB at {args.bandwidth_mbps}Mbps")
+        print(f"{'rtt':>8} {'sequential':>12} {'parallel':>12} {'speedup':>8}")
+        for rtt_ms in args.rtt_ms:
+            sequential_time, parallel_time = asyncio.run(
+                bench(size, rtt_ms / 1000, bandwidth, file_path)
+            )
+            print(
+                f"{rtt_ms:>6}ms {sequential_time:>11.2f}s {parallel_time:>11.2f}s"
+                f" {sequential_time / parallel_time:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Scan time of the push directory scanner on a synthetic tree.
+
+usage: python benchmarks/bench_scan.py [--files 1000000] [--files-per-dir 1000]
+
+The tree is created once in a temporary directory (empty files, so the scan is
+metadata only) and removed at the end. The os.walk + os.path.getsize loop is the
+scanner PushedDataPreparer used before switching to os.scandir.
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core._data_preparer import PushedDataPreparer  # noqa: E402
+
+
+def create_tree(root, files, files_per_dir):
+    # half of the files go into node_modules -> shows what pruning an excluded directory saves
+    for dir_num in range((files + files_per_dir - 1) // files_per_dir):
+        parent = "node_modules" if dir_num % 2 else "src"
+        dir_path = os.path.join(root, parent, str(dir_num))
+        os.makedirs(dir_path)
+
+        for file_num in range(min(files_per_dir, files - dir_num * files_per_dir)):
+            open(os.path.join(dir_path, f"{file_num}.txt"), "wb").close()
+
+
+def scan_with_walk(root, excluded_dirs):
+    file_paths = []
+    for dir_path, _, file_names in os.walk(root):
+        if os.path.basename(dir_path) in excluded_dirs:
+            continue
+
+        for file_name in file_names:
+            file_path = os.path.join(dir_path, file_name)
+            os.path.getsize(file_path)
+            file_paths.append(file_path)
+
+    return file_paths
+
+
+def scan_with_scandir(root, excluded_dirs):
+    preparer = PushedDataPreparer(
+        root_directory=root,
+        excluded_dirs=excluded_dirs,
+        excluded_files=[],
+        excluded_file_suffixes=[],
+        max_size=2 * 1024 * 1024 * 1024,
+        in_name=None,
+        is_recursive=True,
+        force=True,
+    )
+    return [entry.path for entry in preparer.scan()]
+
+
+def bench(name, scan, root, excluded_dirs):
+    started = time.perf_counter()
+    file_paths = scan(root, excluded_dirs)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{name:<10} {excluded_dirs!s:<18} {len(file_paths):>10} files  {elapsed:8.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=1_000_000)
+    parser.add_argument("--files-per-dir", type=int, default=1000)
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="tc_bench_scan_")
+    try:
+        print(f"creating {args.files} files in {root} ...")
+        create_tree(root, args.files, args.files_per_dir)
+
+        for excluded_dirs in ([], ["node_modules"]):
+            bench("os.walk", scan_with_walk, root, excluded_dirs)
+            bench("scandir", scan_with_scandir, root, excluded_dirs)
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
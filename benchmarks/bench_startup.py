@@ -0,0 +1,126 @@
+"""Cold-start time of the local commands (tc list, tc config) and what they import.
+
+usage: python benchmarks/bench_startup.py [--runs 10] [--budget-ms 250]
+
+Every command runs in a new interpreter against a throwaway ~/.telecloud
+(an empty cloudmap and a fake config, no network). It reports the median
+wall time of the command and the import time of main.py measured with
+`-X importtime`. It exits with 1 when the import time goes over --budget-ms,
+or when the command loads a module only push/pull/chan need (Telethon, the
+crypto libraries, the core push/pull modules).
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN_PATH = os.path.join(ROOT_DIR, "main.py")
+
+COMMANDS = (["list"], ["config"])
+# the modules a local command must not load (a prefix matches the submodules too)
+HEAVY_MODULES = (
+    "telethon",
+    "Crypto",
+    "cryptography",
+    "src.tl",
+    "src.protector",
+    "src.core.push",
+    "src.core.pull",
+)
+
+
+def make_home(home_dir):
+    stored_dir = os.path.join(home_dir, ".telecloud")
+    os.makedirs(stored_dir)
+
+    with open(os.path.join(stored_dir, "config.json"), "w") as f:
+        json.dump(
+            {
+                "api_id": 1,
+                "api_hash": "api_hash",
+                "cloud_channel_id": -1001,
+                "cloud_channels": {"TeleCloud": -1001},
+                "encrypted_symmetric_key": "",
+                "pulled_directory": home_dir,
+                "is_auto_fill_password": {"status": False, "value": None},
+            },
+            f,
+        )
+
+    # the cloudmap is created by main.py itself, it only has to exist
+    open(os.path.join(stored_dir, "cloudmap.db"), "wb").close()
+
+
+def run(command, env, *python_options):
+    return subprocess.run(
+        [sys.executable, *python_options, MAIN_PATH, *command],
+        env=env,
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def get_import_times(command, env):
+    # -X importtime -> "import time: self [us] | cumulative | name" on stderr
+    import_times = {}
+    for line in run(command, env, "-X", "importtime").stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, _, name = line[len("import time:") :].split("|")
+        import_times[name.strip()] = int(self_time)
+
+    return import_times
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=250)
+    args = parser.parse_args()
+
+    is_over_budget = False
+    with tempfile.TemporaryDirectory() as home_dir:
+        make_home(home_dir)
+        env = dict(os.environ, HOME=home_dir)
+
+        print(f"{'command':<8} {'wall':>10} {'imports':>10} {'modules':>8}  heavy")
+        for command in COMMANDS:
+            wall_times = []
+            for _ in range(args.runs):
+                started = time.perf_counter()
+                run(command, env)
+                wall_times.append(time.perf_counter() - started)
+
+            import_times = get_import_times(command, env)
+            import_time = sum(import_times.values()) / 1000
+            heavy_modules = [
+                heavy
+                for heavy in HEAVY_MODULES
+                if any(
+                    name == heavy or name.startswith(heavy + ".")
+                    for name in import_times
+                )
+            ]
+
+            print(
+                f"{command[0]:<8} {statistics.median(wall_times) * 1000:>8.1f}ms"
+                f" {import_time:>8.1f}ms {len(import_times):>8}  {', '.join(heavy_modules) or '-'}"
+            )
+            if import_time > args.budget_ms or heavy_modules:
+                is_over_budget = True
+
+    if is_over_budget:
+        print(f"over budget ({args.budget_ms}ms of imports, no heavy module)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,30 @@
 import asyncio
+from getpass import getpass
 
 from colorama import Fore
-from telethon import TelegramClient
 
+# only what every command needs is imported here
+# -> Telethon, the crypto libraries and the push/pull modules are imported by the commands which use them
+# -> tc list/config start without loading them (benchmarks/bench_startup.py)
 from src.config_manager.config_parser import parse_config
-from src.protector import load_symmetric_key
-from src.tl import load_string_session
-from src.utils import logging, clean_prepared_data, check_network_connection
+from src.agent import start_agent, stop_agent, request_symmetric_key
+from src.daemon import submit_job, stop_daemon
+from src.utils import logging, check_network_connection, is_socket_supported
 from src.core.config_setting import set_general_config, set_cloud_channel_config
 from src.core.listing import list_pushed_files
-from src.core.push import push_data
-from src.core.pull import pull_data
-from src.setup import setup_telecloud, check_health_cloudmap
+from src.cloudmap import create_cloudmap_db, check_health_cloudmap
 
 
 async def main():
     if not check_health_cloudmap():
+        from src.setup import setup_telecloud
+
         await setup_telecloud()
         return
 
+    # existing cloudmap may miss the tables added by newer versions
+    create_cloudmap_db()
+
     config = parse_config()
 
     if config.command == "config":
@@ -34,22 +40,57 @@ async def main():
         await set_cloud_channel_config(config)
         return
 
+    # a running daemon runs push/pull/list with its warm client
+    elif await submit_job(config):
+        return
+
     elif config.command == "list":
         list_pushed_files(config)
         return
 
+    elif config.command == "agent":
+        run_agent(config)
+        return
+
+    elif config.command == "daemon" and config.is_stopping_daemon:
+        if await stop_daemon():
+            logging(f"{Fore.GREEN}Stopped{Fore.RESET} the daemon")
+        else:
+            logging(f"{Fore.RED}Failed{Fore.RESET} - No daemon running")
+        return
+
     # network must be reachable to perform TelegramClient
     if not check_network_connection():
         logging(f"{Fore.RED}Failed{Fore.RESET} - Network error")
         return
 
-    result = load_symmetric_key(config.password)
-    if not result["success"]:
-        logging(f"{Fore.RED}Failed{Fore.RESET} - {result['error']}")
-        return
+    await run_with_client(config)
+
+
+async def run_with_client(config):
+    from telethon import TelegramClient
+
+    from src.protector import load_symmetric_key
+    from src.tl import load_string_session
+    from src.utils import clean_prepared_data
+    from src.daemon import Daemon
+    from src.core.push import push_data
+    from src.core.pull import pull_data
+    from src.core._connections import get_connection_pool
+
+    # the key agent (if started) holds the key -> no PBKDF2 + RSA
+    symmetric_key = request_symmetric_key()
+    if symmetric_key is None:
+        # the agent may have stopped since the password was skipped
+        password = config.password if config.password is not None else getpass()
+        result = load_symmetric_key(password)
+        if not result["success"]:
+            logging(f"{Fore.RED}Failed{Fore.RESET} - {result['error']}")
+            return
+        symmetric_key = result["symmetric_key"]
 
     async with TelegramClient(
-        load_string_session(result["symmetric_key"]),
+        load_string_session(symmetric_key),
         api_id=config.api_id,
         api_hash=config.api_hash,
     ) as client:
@@ -59,18 +100,51 @@ async def main():
                 return
 
             elif config.command == "push":
-                await push_data(client, result["symmetric_key"], config)
+                await push_data(client, symmetric_key, config)
 
             elif config.command == "pull":
-                await pull_data(client, result["symmetric_key"], config)
+                await pull_data(client, symmetric_key, config)
+
+            elif config.command == "daemon":
+                await Daemon(client, symmetric_key).serve()
 
         except KeyboardInterrupt:
             loop = asyncio.get_running_loop()
             for task in asyncio.all_tasks(loop):
                 task.cancel()
 
+        finally:
+            await get_connection_pool(client).close()
+
     clean_prepared_data()
 
 
+def run_agent(config):
+    if config.is_stopping_agent:
+        if stop_agent():
+            logging(f"{Fore.GREEN}Stopped{Fore.RESET} the key agent")
+        else:
+            logging(f"{Fore.RED}Failed{Fore.RESET} - No key agent running")
+        return
+
+    if not is_socket_supported():
+        logging(f"{Fore.RED}Failed{Fore.RESET} - The key agent needs Unix sockets")
+        return
+
+    from src.protector import load_symmetric_key
+
+    result = load_symmetric_key(config.password)
+    if not result["success"]:
+        logging(f"{Fore.RED}Failed{Fore.RESET} - {result['error']}")
+        return
+
+    if start_agent(result["symmetric_key"], config.agent_ttl):
+        logging(
+            f"{Fore.GREEN}Started{Fore.RESET} the key agent - the key is kept for {config.agent_ttl}s"
+        )
+    else:
+        logging(f"{Fore.RED}Failed{Fore.RESET} - The key agent did not start")
+
+
 if __name__ == "__main__":
     asyncio.run(main())
@@ -3,24 +3,87 @@ from Crypto.Hash import SHA256
 from Crypto.Protocol.KDF import PBKDF2
 from Crypto.Random import get_random_bytes
 
+from .constants import NONCE_LENGTH, TAG_LENGTH
+
+try:
+    from cryptography.exceptions import InvalidTag
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+except ImportError:
+    # optional -> PyCryptodome only
+    Cipher = None
+
+
+class PyCryptodomeBackend:
+    name = "pycryptodome"
+
+    @staticmethod
+    def encrypt(key, nonce, data, associated_data):
+        cipher = AES.new(key, AES.MODE_GCM, nonce)
+        if associated_data:
+            cipher.update(associated_data)
+        return cipher.encrypt_and_digest(data)
+
+    @staticmethod
+    def decrypt(key, nonce, tag, cipher_data, associated_data):
+        cipher = AES.new(key, AES.MODE_GCM, nonce)
+        if associated_data:
+            cipher.update(associated_data)
+        return cipher.decrypt_and_verify(cipher_data, tag)
+
+
+class OpenSSLBackend:
+    # cryptography (OpenSSL) -> AES-NI + PCLMULQDQ/VAES code paths of OpenSSL
+    name = "openssl"
+
+    @staticmethod
+    def encrypt(key, nonce, data, associated_data):
+        encryptor = Cipher(algorithms.AES(key), modes.GCM(nonce)).encryptor()
+        if associated_data:
+            encryptor.authenticate_additional_data(associated_data)
+        cipher_data = encryptor.update(data) + encryptor.finalize()
+        return cipher_data, encryptor.tag
+
+    @staticmethod
+    def decrypt(key, nonce, tag, cipher_data, associated_data):
+        decryptor = Cipher(algorithms.AES(key), modes.GCM(nonce, tag)).decryptor()
+        if associated_data:
+            decryptor.authenticate_additional_data(associated_data)
+        try:
+            return decryptor.update(cipher_data) + decryptor.finalize()
+        except InvalidTag:
+            # the same error as PyCryptodome -> callers catch ValueError for a wrong key/corrupted data
+            raise ValueError("MAC check failed")
+
+
+# the available backends, the fastest first -> the first one is used
+BACKENDS = [PyCryptodomeBackend()]
+if Cipher is not None:
+    BACKENDS.insert(0, OpenSSLBackend())
+BACKEND = BACKENDS[0]
+
 
 def generate_key(password, salt):
     return PBKDF2(password, salt, dkLen=32, count=600000, hmac_hash_module=SHA256)
 
 
-def encrypt(key, data):
-    nonce = get_random_bytes(12)
-    cipher = AES.new(key, AES.MODE_GCM, nonce)
-    cipher_data, tag = cipher.encrypt_and_digest(data)
-    return nonce + tag + cipher_data
+def encrypt(key, data, associated_data=None, backend=None):
+    # nonce + tag + cipher data whichever backend encrypts -> data encrypted by one is decrypted by the other
+    # associated_data -> authenticated along with the data but not part of the output
+    backend = backend or BACKEND
+
+    nonce = get_random_bytes(NONCE_LENGTH)
+    cipher_data, tag = backend.encrypt(key, nonce, data, associated_data)
+    return b"".join((nonce, tag, cipher_data))
+
 
+def decrypt(key, encrypted_data, associated_data=None, backend=None):
+    backend = backend or BACKEND
 
-def decrypt(key, encrypted_data):
+    # memoryview -> the cipher data (the whole chunk) is not copied just to split it off
+    encrypted_data = memoryview(encrypted_data)
     nonce, tag, cipher_data = (
-        encrypted_data[:12],
-        encrypted_data[12 : 12 + 16],
-        encrypted_data[12 + 16 :],
+        encrypted_data[:NONCE_LENGTH],
+        encrypted_data[NONCE_LENGTH : NONCE_LENGTH + TAG_LENGTH],
+        encrypted_data[NONCE_LENGTH + TAG_LENGTH :],
     )
-    cipher = AES.new(key, AES.MODE_GCM, nonce)
-    original_data = cipher.decrypt_and_verify(cipher_data, tag)
-    return original_data
+    return backend.decrypt(key, bytes(nonce), bytes(tag), cipher_data, associated_data)
@@ -0,0 +1,133 @@
+import os
+import time
+import socket
+
+from .utils import is_socket_supported, is_own_socket, get_peer_uid
+from .constants import AGENT_SOCKET_PATH
+
+# how long the agent holds the key when not told (seconds)
+DEFAULT_AGENT_TTL = 3600
+# a request is a single line, the key is 32 bytes
+_MAX_MESSAGE_LENGTH = 64
+_TIMEOUT = 1
+
+
+# The key agent holds the unlocked main symmetric key in memory (like ssh-agent)
+# -> tc push/pull/chan get it from the agent instead of PBKDF2 + RSA every time
+# -> the Unix socket is only usable by its owner (0600 + the peer's uid checked on both sides)
+# -> the agent exits once its TTL is over (or when stopped), nothing is written on disk
+def start_agent(symmetric_key, ttl=DEFAULT_AGENT_TTL):
+    # a running agent is replaced -> the new TTL applies
+    stop_agent()
+
+    pid = os.fork()
+    if pid == 0:
+        # the agent outlives the command which started it
+        os.setsid()
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+
+        try:
+            _serve(symmetric_key, time.monotonic() + ttl)
+        finally:
+            os._exit(0)
+
+    # wait until the agent listens
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        if request_symmetric_key() is not None:
+            return True
+        time.sleep(0.05)
+
+    return False
+
+
+def request_symmetric_key():
+    # None -> no agent (or not usable), the password is needed
+    return _request(b"KEY") or None
+
+
+def stop_agent():
+    return _request(b"STOP") == b"OK"
+
+
+def _serve(symmetric_key, expires_at):
+    if os.path.exists(AGENT_SOCKET_PATH):
+        os.remove(AGENT_SOCKET_PATH)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # the socket is created 0600 -> no moment where someone else can connect
+    old_umask = os.umask(0o177)
+    try:
+        server.bind(AGENT_SOCKET_PATH)
+    finally:
+        os.umask(old_umask)
+    server.listen()
+
+    try:
+        while (remaining_time := expires_at - time.monotonic()) > 0:
+            # wake up at least when the TTL is over
+            server.settimeout(remaining_time)
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                break
+
+            with conn:
+                if get_peer_uid(conn) != os.getuid():
+                    continue
+
+                conn.settimeout(_TIMEOUT)
+                try:
+                    request = conn.recv(_MAX_MESSAGE_LENGTH).strip()
+                    if request == b"KEY":
+                        conn.sendall(symmetric_key)
+                    elif request == b"STOP":
+                        conn.sendall(b"OK")
+                        break
+                except OSError:
+                    continue
+
+    finally:
+        server.close()
+        # a newer agent may already own the path -> only remove our own socket
+        if os.path.exists(AGENT_SOCKET_PATH) and not _is_listening():
+            os.remove(AGENT_SOCKET_PATH)
+
+
+def _request(message):
+    if not is_socket_supported() or not is_own_socket(AGENT_SOCKET_PATH):
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(_TIMEOUT)
+            client.connect(AGENT_SOCKET_PATH)
+            # the agent must be run by the same user
+            if get_peer_uid(client) != os.getuid():
+                return None
+
+            client.sendall(message + b"\n")
+            return _recv_all(client)
+
+    except OSError:
+        return None
+
+
+def _recv_all(client):
+    response = b""
+    while len(response) < _MAX_MESSAGE_LENGTH and (
+        data := client.recv(_MAX_MESSAGE_LENGTH)
+    ):
+        response += data
+    return response
+
+
+def _is_listening():
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(AGENT_SOCKET_PATH)
+            return True
+    except OSError:
+        return False
@@ -0,0 +1,107 @@
+import random
+
+from Crypto.Util.strxor import strxor
+
+from .constants import CHUNK_LENGTH_FOR_LARGE_FILE
+
+# Content-defined chunking
+# chunk boundaries depend on the content instead of fixed offsets
+# -> inserting/removing bytes in a file only changes the chunks around the edit
+MIN_CHUNK_LENGTH = 1024 * 1024  # 1MB
+# a chunk is encrypted and uploaded as one object -> no bigger than a part of a big file
+MAX_CHUNK_LENGTH = CHUNK_LENGTH_FOR_LARGE_FILE
+# 22 bits -> a boundary every ~4MB after the minimum length on average
+_HASH_BITS = 22
+# a boundary depends on the last 64 bytes
+_WINDOW_LENGTH = 64
+# the boundary is searched one block at a time -> stops at the first one, the temporary planes stay small
+_BLOCK_LENGTH = 1024 * 1024
+
+# The rolling hash is a buzhash over a table of random 64-bit values, rotated by one byte per position:
+# h(i) = T[byte(i)] ^ rotl(T[byte(i - 1)], 8) ^ ... ^ rotl(T[byte(i - 63)], 8 * 63)
+# and a boundary is placed after i where the low _HASH_BITS bits of h(i) are zero
+# -> every byte of the window changes every bit of the hash (structured data has boundaries too)
+# -> byte n of h(i) only takes byte (n - k) % 8 of the rotated T values
+# so it is computed for a whole block with bytes.translate (one table per byte of T) + strxor
+# which does the rolling in C instead of looping over every byte in Python
+# the table must never change, otherwise chunks pushed before would not be matched anymore
+_random = random.Random(0x7E1EC10D)
+_HASH_TABLE = [_random.getrandbits(64) for _ in range(256)]
+del _random
+# byte n of every T value
+_BYTE_TABLES = [
+    bytes((value >> (8 * n)) & 0xFF for value in _HASH_TABLE) for n in range(8)
+]
+# the low _HASH_BITS bits -> bytes of h which must be zero + the mask of the last one
+_HASH_BYTES = (_HASH_BITS + 7) // 8
+_LAST_BYTE_MASK = (1 << (_HASH_BITS - 8 * (_HASH_BYTES - 1))) - 1
+
+
+def _xor_shifted(data, shift):
+    # x[j] = data[j + shift] ^ data[j]
+    data = memoryview(data)
+    return strxor(data[shift:], data[:-shift])
+
+
+def _hash_block(window_data):
+    # byte n of h for every position of window_data which has a whole window before it
+    # -> the i-th byte of the result is for window_data[i + _WINDOW_LENGTH - 1]
+    # the same rotation comes back every 8 positions
+    # -> xor of the 8 positions k, k + 8, ..., k + 56 of every byte table at once (3 doublings)
+    xored_tables = []
+    for byte_table in _BYTE_TABLES:
+        xored = window_data.translate(byte_table)
+        for shift in (8, 16, 32):
+            xored = _xor_shifted(xored, shift)
+        # xored[j] -> positions j .. j + 56 of the window
+        xored_tables.append(memoryview(xored))
+
+    hash_length = len(window_data) - _WINDOW_LENGTH + 1
+    hash_bytes = []
+    for n in range(_HASH_BYTES):
+        # rotated by k bytes -> byte n of h takes byte (n - k) % 8 of T[byte(i - k)]
+        hash_byte = bytes(hash_length)
+        for k in range(8):
+            xored_table = xored_tables[(n - k) % 8]
+            hash_byte = strxor(hash_byte, xored_table[7 - k : 7 - k + hash_length])
+        hash_bytes.append(hash_byte)
+
+    return hash_bytes
+
+
+def _find_boundary(data):
+    if len(data) <= MIN_CHUNK_LENGTH:
+        return len(data)
+
+    end = min(len(data), MAX_CHUNK_LENGTH)
+    # the first boundary is right after the minimum length -> its window ends there
+    for block_start in range(MIN_CHUNK_LENGTH - 1, end - 1, _BLOCK_LENGTH):
+        block_end = min(block_start + _BLOCK_LENGTH, end - 1)
+        hash_bytes = _hash_block(data[block_start - _WINDOW_LENGTH + 1 : block_end])
+
+        # the first byte of h is zero once every 256 positions -> the others are only checked there
+        position = hash_bytes[0].find(0)
+        while position != -1:
+            if (
+                all(not hash_byte[position] for hash_byte in hash_bytes[1:-1])
+                and not hash_bytes[-1][position] & _LAST_BYTE_MASK
+            ):
+                return block_start + position + 1
+            position = hash_bytes[0].find(0, position + 1)
+
+    return end
+
+
+def read_file_in_content_defined_chunk(file_path):
+    with open(file_path, "rb") as f:
+        buffer = b""
+        while True:
+            # keep at least one max chunk in the buffer unless the file ends
+            if len(buffer) < MAX_CHUNK_LENGTH:
+                buffer += f.read(MAX_CHUNK_LENGTH)
+            if not buffer:
+                return
+
+            boundary = _find_boundary(buffer)
+            yield buffer[:boundary]
+            buffer = buffer[boundary:]
@@ -1,8 +1,22 @@
+import os
 import asyncio
 import sqlite3
 
 from .config_manager.config_loader import get_cloud_channel_id
-from .constants import CLOUDMAP_DB_PATH
+from .constants import CLOUDMAP_DB_PATH, INCLUDED_CLOUDMAP_PATHS
+
+
+def check_health_cloudmap():
+    return all(os.path.exists(path) for path in INCLUDED_CLOUDMAP_PATHS)
+
+
+def _add_missing_columns(cursor, table, columns):
+    cursor.execute(f"PRAGMA table_info({table})")
+    existing_columns = [i[1] for i in cursor.fetchall()]
+
+    for column, column_type in columns.items():
+        if column not in existing_columns:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
 
 
 def create_cloudmap_db():
@@ -23,6 +37,127 @@ def create_cloudmap_db():
         """
     )
 
+    # columns added after the first release -> existing cloudmap gets them too
+    # layout: how the file is stored (NULL for files pushed before -> small/big file by size)
+    # pack_offset, pack_length: where the encrypted file is in its pack (msg_id is the pack)
+    # codec: how the file is compressed before encrypting (NULL -> not compressed)
+    _add_missing_columns(
+        cursor,
+        "cloudmap",
+        {
+            "layout": "TEXT",
+            "pack_offset": "INTEGER",
+            "pack_length": "INTEGER",
+            "codec": "TEXT",
+        },
+    )
+
+    # chunks of content-defined chunked files -> a chunk is uploaded once per cloud channel
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS chunks (
+            channel_id INTEGER,
+            chunk_hash TEXT,
+            msg_id INTEGER,
+            chunk_size INTEGER,
+            PRIMARY KEY (channel_id, chunk_hash)
+        )
+        """
+    )
+
+    # dedup looks up pushed files by checksum
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS cloudmap_checksum ON cloudmap (channel_id, checksum)
+        """
+    )
+
+    # a watched directory looks up its changed files one by one
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS cloudmap_file_path ON cloudmap (channel_id, file_path)
+        """
+    )
+
+    # stat info of pushed files -> unchanged files do not need to be hashed again
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS file_index (
+            file_path TEXT PRIMARY KEY,
+            file_size INTEGER,
+            mtime_ns INTEGER,
+            inode INTEGER,
+            ctime_ns INTEGER,
+            checksum TEXT
+        )
+        """
+    )
+
+    # parts of big files which are uploaded but not pushed yet (no manifest, no cloudmap row)
+    # -> pushing the same unchanged file again only uploads the remaining parts
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS upload_journal (
+            channel_id INTEGER,
+            file_path TEXT,
+            file_size INTEGER,
+            mtime_ns INTEGER,
+            inode INTEGER,
+            ctime_ns INTEGER,
+            codec TEXT,
+            file_name TEXT,
+            part_num INTEGER,
+            msg_id INTEGER,
+            PRIMARY KEY (channel_id, file_path, part_num)
+        )
+        """
+    )
+
+    # parts (of big files) and chunks which are completely downloaded into the staging area
+    # -> pulling again after an interruption only downloads the missing ones
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS download_journal (
+            channel_id INTEGER,
+            msg_id INTEGER,
+            part_size INTEGER,
+            PRIMARY KEY (channel_id, msg_id)
+        )
+        """
+    )
+
+    # parts of big files which are written into their pulled file (still under its temporary name)
+    # -> pulling again after an interruption only writes the missing ones
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS written_parts (
+            channel_id INTEGER,
+            msg_id INTEGER,
+            file_path TEXT,
+            part_num INTEGER,
+            PRIMARY KEY (channel_id, msg_id, file_path, part_num)
+        )
+        """
+    )
+
+    # what downloading a message needs -> pulling does not ask Telegram for the message first
+    # file_reference expires after a while -> it is refreshed when Telegram says so
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS documents (
+            channel_id INTEGER,
+            msg_id INTEGER,
+            document_id INTEGER,
+            access_hash INTEGER,
+            file_reference BLOB,
+            dc_id INTEGER,
+            size INTEGER,
+            file_name TEXT,
+            PRIMARY KEY (channel_id, msg_id)
+        )
+        """
+    )
+
     conn.commit()
     conn.close()
 
@@ -34,7 +169,10 @@ async def update_cloudmap(cloudmap):
 
         cursor.execute(
             """
-            INSERT INTO cloudmap VALUES (?, ?, ?, ?, ?, ?, ?)
+            INSERT INTO cloudmap (
+                channel_id, msg_id, file_path, file_name, file_size, checksum, time,
+                layout, pack_offset, pack_length, codec
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 cloudmap["channel_id"],
@@ -44,6 +182,10 @@ async def update_cloudmap(cloudmap):
                 cloudmap["file_size"],
                 cloudmap["checksum"],
                 cloudmap["time"],
+                cloudmap.get("layout"),
+                cloudmap.get("pack_offset"),
+                cloudmap.get("pack_length"),
+                cloudmap.get("codec"),
             ),
         )
 
@@ -53,6 +195,372 @@ async def update_cloudmap(cloudmap):
     await asyncio.to_thread(update)
 
 
+async def update_file_index(file_index):
+    def update():
+        update_file_indexes([file_index])
+
+    await asyncio.to_thread(update)
+
+
+def update_file_indexes(file_indexes):
+    conn = sqlite3.connect(CLOUDMAP_DB_PATH)
+    cursor = conn.cursor()
+
+    cursor.executemany(
+        """
+        INSERT OR REPLACE INTO file_index VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (
+                file_index["file_path"],
+                file_index["file_size"],
+                file_index["mtime_ns"],
+                file_index["inode"],
+                file_index["ctime_ns"],
+                file_index["checksum"],
+            )
+            for file_index in file_indexes
+        ],
+    )
+
+    conn.commit()
+    conn.close()
+
+
+def get_file_index():
+    conn = sqlite3.connect(CLOUDMAP_DB_PATH)
+    cursor = conn.cursor()
+
+    cursor.execute(
+        """
+        SELECT * FROM file_index
+        """
+    )
+
+    result = cursor.fetchall()
+    conn.close()
+
+    # file_path -> (file_size, mtime_ns, inode, ctime_ns, checksum)
+    return {i[0]: i[1:] for i in result}
+
+
+def get_file_index_entry(file_path):
+    conn = sqlite3.connect(CLOUDMAP_DB_PATH)
+    cursor = conn.cursor()
+
+    cursor.execute(
+        """
+        SELECT * FROM file_index where file_path=?
+        """,
+        (file_path,),
+    )
+
+    result = cursor.fetchone()
+    conn.close()
+
+    return None if result is None else result[1:]
+
+
+def get_pushed_file_by_checksum(checksum):
+    channel_id = get_cloud_channel_id()
+
+    conn = sqlite3.connect(CLOUDMAP_DB_PATH)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+
+    cursor.execute(
+        """
+        SELECT * FROM cloudmap where channel_id=? AND checksum=? LIMIT 1
+        """,
+        (channel_id, checksum),
+    )
+
+    result = cursor.fetchone()
+    conn.close()
+
+    return None if result is None else dict(result)
+
+
+def get_chunk_msg_id(chunk_hash):
+    channel_id = get_cloud_channel_id()
+
+    conn = sqlite3.connect(CLOUDMAP_DB_PATH)
+    cursor = conn.cursor()
+
+    cursor.execute(
+        """
+        SELECT msg_id FROM chunks where channel_id=? AND chunk_hash=?
+        """,
+        (channel_id, chunk_hash),
+    )
+
+    result = cursor.fetchone()
+    conn.close()
+
+    return None if result is None else result[0]
+
+
+async def add_chunk(chunk_hash, msg_id, chunk_size):
+    channel_id = get_cloud_channel_id()
+
+    def add():
+        conn = sqlite3.connect(CLOUDMAP_DB_PATH)
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            INSERT OR IGNORE INTO chunks VALUES (?, ?, ?, ?)
+            """,
+            (channel_id, chunk_hash, msg_id, chunk_size),
+        )
+
+        conn.commit()
+        conn.close()
+
+    await asyncio.to_thread(add)
+
+
+def get_upload_journal(file_path):
+    channel_id = get_cloud_channel_id()
+
+    conn = sqlite3.connect(CLOUDMAP_DB_PATH)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+
+    cursor.execute(
+        """
+        SELECT * FROM upload_journal where channel_id=? AND file_path=?
+        """,
+        (channel_id, file_path),
+    )
+
+    result = cursor.fetchall()
+    conn.close()
+
+    return [dict(i) for i in result]
+
+
+async def add_upload_journal_part(journal_part):
+    channel_id = get_cloud_channel_id()
+
+    def add():
+        conn = sqlite3.connect(CLOUDMAP_DB_PATH)
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            INSERT OR REPLACE INTO upload_journal VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                channel_id,
+                journal_part["file_path"],
+                journal_part["file_size"],
+                journal_part["mtime_ns"],
+                journal_part["inode"],
+                journal_part["ctime_ns"],
+                journal_part["codec"],
+                journal_part["file_name"],
+                journal_part["part_num"],
+                journal_part["msg_id"],
+            ),
+        )
+
+        conn.commit()
+        conn.close()
+
+    await asyncio.to_thread(add)
+
+
+async def delete_upload_journal(file_path):
+    channel_id = get_cloud_channel_id()
+
+    def delete():
+        conn = sqlite3.connect(CLOUDMAP_DB_PATH)
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            DELETE FROM upload_journal where channel_id=? AND file_path=?
+            """,
+            (channel_id, file_path),
+        )
+
+        conn.commit()
+        conn.close()
+
+    await asyncio.to_thread(delete)
+
+
+def get_downloaded_part_size(msg_id):
+    channel_id = get_cloud_channel_id()
+
+    conn = sqlite3.connect(CLOUDMAP_DB_PATH)
+    cursor = conn.cursor()
+
+    cursor.execute(
+        """
+        SELECT part_size FROM download_journal where channel_id=? AND msg_id=?
+        """,
+        (channel_id, msg_id),
+    )
+
+    result = cursor.fetchone()
+    conn.close()
+
+    return None if result is None else result[0]
+
+
+async def add_download_journal_part(msg_id, part_size):
+    channel_id = get_cloud_channel_id()
+
+    def add():
+        conn = sqlite3.connect(CLOUDMAP_DB_PATH)
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            INSERT OR REPLACE INTO download_journal VALUES (?, ?, ?)
+            """,
+            (channel_id, msg_id, part_size),
+        )
+
+        conn.commit()
+        conn.close()
+
+    await asyncio.to_thread(add)
+
+
+async def delete_download_journal_parts(msg_ids):
+    channel_id = get_cloud_channel_id()
+
+    def delete():
+        conn = sqlite3.connect(CLOUDMAP_DB_PATH)
+        cursor = conn.cursor()
+
+        cursor.executemany(
+            """
+            DELETE FROM download_journal where channel_id=? AND msg_id=?
+            """,
+            [(channel_id, msg_id) for msg_id in msg_ids],
+        )
+
+        conn.commit()
+        conn.close()
+
+    await asyncio.to_thread(delete)
+
+
+def get_written_parts(msg_id, file_path):
+    channel_id = get_cloud_channel_id()
+
+    conn = sqlite3.connect(CLOUDMAP_DB_PATH)
+    cursor = conn.cursor()
+
+    cursor.execute(
+        """
+        SELECT part_num FROM written_parts where channel_id=? AND msg_id=? AND file_path=?
+        """,
+        (channel_id, msg_id, file_path),
+    )
+
+    result = cursor.fetchall()
+    conn.close()
+
+    return [i[0] for i in result]
+
+
+async def add_written_part(msg_id, file_path, part_num):
+    channel_id = get_cloud_channel_id()
+
+    def add():
+        conn = sqlite3.connect(CLOUDMAP_DB_PATH)
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            INSERT OR REPLACE INTO written_parts VALUES (?, ?, ?, ?)
+            """,
+            (channel_id, msg_id, file_path, part_num),
+        )
+
+        conn.commit()
+        conn.close()
+
+    await asyncio.to_thread(add)
+
+
+async def delete_written_parts(msg_id, file_path):
+    channel_id = get_cloud_channel_id()
+
+    def delete():
+        conn = sqlite3.connect(CLOUDMAP_DB_PATH)
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            DELETE FROM written_parts where channel_id=? AND msg_id=? AND file_path=?
+            """,
+            (channel_id, msg_id, file_path),
+        )
+
+        conn.commit()
+        conn.close()
+
+    await asyncio.to_thread(delete)
+
+
+def get_document(msg_id):
+    channel_id = get_cloud_channel_id()
+
+    conn = sqlite3.connect(CLOUDMAP_DB_PATH)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+
+    cursor.execute(
+        """
+        SELECT * FROM documents where channel_id=? AND msg_id=?
+        """,
+        (channel_id, msg_id),
+    )
+
+    result = cursor.fetchone()
+    conn.close()
+
+    return None if result is None else dict(result)
+
+
+async def update_documents(documents):
+    channel_id = get_cloud_channel_id()
+
+    def update():
+        conn = sqlite3.connect(CLOUDMAP_DB_PATH)
+        cursor = conn.cursor()
+
+        cursor.executemany(
+            """
+            INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    channel_id,
+                    document["msg_id"],
+                    document["document_id"],
+                    document["access_hash"],
+                    document["file_reference"],
+                    document["dc_id"],
+                    document["size"],
+                    document["file_name"],
+                )
+                for document in documents
+            ],
+        )
+
+        conn.commit()
+        conn.close()
+
+    await asyncio.to_thread(update)
+
+
 def get_cloudmap():
     channel_id = get_cloud_channel_id()
 
@@ -62,7 +570,7 @@ def get_cloudmap():
 
     cursor.execute(
         """
-        SELECT * FROM cloudmap where channel_id=?
+        SELECT * FROM cloudmap where channel_id=? ORDER BY rowid
         """,
         (channel_id,),
     )
@@ -92,6 +600,25 @@ def get_pushed_file_paths():
     return [i[0] for i in result]
 
 
+def is_pushed_file_path(file_path):
+    channel_id = get_cloud_channel_id()
+
+    conn = sqlite3.connect(CLOUDMAP_DB_PATH)
+    cursor = conn.cursor()
+
+    cursor.execute(
+        """
+        SELECT 1 FROM cloudmap where channel_id=? AND file_path=? LIMIT 1
+        """,
+        (channel_id, file_path),
+    )
+
+    result = cursor.fetchone()
+    conn.close()
+
+    return result is not None
+
+
 def get_pushed_file_names():
     channel_id = get_cloud_channel_id()
 
@@ -130,9 +657,8 @@ def get_pushed_checksums():
     return [i[0] for i in result]
 
 
-def delete_pushed_files():
-    channel_id = get_cloud_channel_id()
-
+def delete_pushed_files(channel_id):
+    # the deleted channel -> never the one being used
     conn = sqlite3.connect(CLOUDMAP_DB_PATH)
     cursor = conn.cursor()
 
@@ -142,6 +668,37 @@ def delete_pushed_files():
         """,
         (channel_id,),
     )
+    # the chunks are messages of the deleted channel -> never reused by a push
+    cursor.execute(
+        """
+        DELETE FROM chunks where channel_id = ?
+        """,
+        (channel_id,),
+    )
+    cursor.execute(
+        """
+        DELETE FROM upload_journal where channel_id = ?
+        """,
+        (channel_id,),
+    )
+    cursor.execute(
+        """
+        DELETE FROM download_journal where channel_id = ?
+        """,
+        (channel_id,),
+    )
+    cursor.execute(
+        """
+        DELETE FROM written_parts where channel_id = ?
+        """,
+        (channel_id,),
+    )
+    cursor.execute(
+        """
+        DELETE FROM documents where channel_id = ?
+        """,
+        (channel_id,),
+    )
 
     conn.commit()
     conn.close()
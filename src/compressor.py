@@ -0,0 +1,146 @@
+import zlib
+
+from .constants import CHUNK_LENGTH_FOR_LARGE_FILE
+
+CODEC = "zlib"
+COMPRESSION_LEVEL = 6
+
+# already compressed formats -> compressing them again only burns CPU
+INCOMPRESSIBLE_SUFFIXES = (
+    ".7z",
+    ".avi",
+    ".bz2",
+    ".docx",
+    ".flac",
+    ".gif",
+    ".gz",
+    ".heic",
+    ".jpeg",
+    ".jpg",
+    ".m4a",
+    ".mkv",
+    ".mov",
+    ".mp3",
+    ".mp4",
+    ".ogg",
+    ".pdf",
+    ".png",
+    ".pptx",
+    ".rar",
+    ".tgz",
+    ".webm",
+    ".webp",
+    ".xlsx",
+    ".xz",
+    ".zip",
+    ".zst",
+)
+# compress a sample of the file first -> skip the file if the sample does not shrink enough
+SAMPLE_LENGTH = 256 * 1024  # 256KB
+MAX_SAMPLE_RATIO = 0.9
+
+
+def choose_codec(file_path):
+    if file_path.lower().endswith(INCOMPRESSIBLE_SUFFIXES):
+        return None
+
+    with open(file_path, "rb") as f:
+        sample = f.read(SAMPLE_LENGTH)
+    if not sample:
+        return None
+
+    if len(zlib.compress(sample, 1)) / len(sample) > MAX_SAMPLE_RATIO:
+        return None
+
+    return CODEC
+
+
+class Compressor:
+    def __init__(self, codec):
+        self.codec = codec
+        # for reporting the saved bytes
+        self.original_size = 0
+        self.compressed_size = 0
+
+    def compress(self, data):
+        self.original_size += len(data)
+        if self.codec is not None:
+            compressed_data = zlib.compress(data, COMPRESSION_LEVEL)
+            if len(compressed_data) < len(data):
+                self.compressed_size += len(compressed_data)
+                return compressed_data
+
+            # not worth it -> the file is stored as it is
+            self.codec = None
+
+        self.compressed_size += len(data)
+        return data
+
+    def compress_chunks(self, chunks):
+        if self.codec is None:
+            for chunk in chunks:
+                self.original_size += len(chunk)
+                self.compressed_size += len(chunk)
+                yield chunk
+            return
+
+        # the compressed stream is cut into chunks of the same length as the original ones
+        # -> the encrypted frames keep their size, only there are fewer of them
+        compressor = zlib.compressobj(COMPRESSION_LEVEL)
+        buffer = b""
+        for chunk in chunks:
+            self.original_size += len(chunk)
+            buffer += compressor.compress(chunk)
+            while len(buffer) >= CHUNK_LENGTH_FOR_LARGE_FILE:
+                yield self.__count(buffer[:CHUNK_LENGTH_FOR_LARGE_FILE])
+                buffer = buffer[CHUNK_LENGTH_FOR_LARGE_FILE:]
+
+        buffer += compressor.flush()
+        while buffer:
+            yield self.__count(buffer[:CHUNK_LENGTH_FOR_LARGE_FILE])
+            buffer = buffer[CHUNK_LENGTH_FOR_LARGE_FILE:]
+
+    @property
+    def saved_size(self):
+        return self.original_size - self.compressed_size
+
+    def __count(self, compressed_chunk):
+        self.compressed_size += len(compressed_chunk)
+        return compressed_chunk
+
+
+def decompress(data, codec):
+    if codec is None:
+        return data
+    return zlib.decompress(data)
+
+
+class Decompressor:
+    # decompresses a stream given chunk by chunk, in order
+    def __init__(self, codec):
+        self.__decompressor = None if codec is None else zlib.decompressobj()
+
+    def decompress(self, chunk):
+        if self.__decompressor is None:
+            yield chunk
+            return
+
+        # limit the output of every step -> a highly compressed chunk does not expand into memory at once
+        decompressor = self.__decompressor
+        yield decompressor.decompress(chunk, CHUNK_LENGTH_FOR_LARGE_FILE)
+        while decompressor.unconsumed_tail:
+            yield decompressor.decompress(
+                decompressor.unconsumed_tail, CHUNK_LENGTH_FOR_LARGE_FILE
+            )
+
+    def flush(self):
+        if self.__decompressor is None:
+            return b""
+        return self.__decompressor.flush()
+
+
+def decompress_chunks(chunks, codec):
+    decompressor = Decompressor(codec)
+    for chunk in chunks:
+        yield from decompressor.decompress(chunk)
+    yield decompressor.flush()
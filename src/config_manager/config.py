@@ -18,6 +18,11 @@ class Config:
         deleted_cloudchannel,
         is_recursive,
         force,
+        paranoid,
+        dedup,
+        cdc,
+        pack_size,
+        compress,
         excluded_dirs,
         excluded_files,
         excluded_file_suffixes,
@@ -25,6 +30,10 @@ class Config:
         max_size,
         is_auto_fill_password,
         zip_file,
+        watch,
+        agent_ttl,
+        is_stopping_agent,
+        is_stopping_daemon,
     ):
         self.__api_id = api_id
         self.__api_hash = api_hash
@@ -38,6 +47,11 @@ class Config:
         self.__deleted_cloudchannel = deleted_cloudchannel
         self.__is_recursive = is_recursive
         self.__force = force
+        self.__paranoid = paranoid
+        self.__dedup = dedup
+        self.__cdc = cdc
+        self.__pack_size = pack_size
+        self.__compress = compress
         self.__excluded_dirs = excluded_dirs
         self.__excluded_files = excluded_files
         self.__excluded_file_suffixes = excluded_file_suffixes
@@ -45,6 +59,10 @@ class Config:
         self.__max_size = max_size
         self.__is_auto_fill_password = is_auto_fill_password
         self.__zip_file = zip_file
+        self.__watch = watch
+        self.__agent_ttl = agent_ttl
+        self.__is_stopping_agent = is_stopping_agent
+        self.__is_stopping_daemon = is_stopping_daemon
 
     @property
     def api_id(self):
@@ -94,6 +112,28 @@ class Config:
     def force(self):
         return self.__force
 
+    @property
+    def paranoid(self):
+        return self.__paranoid
+
+    @property
+    def dedup(self):
+        return self.__dedup
+
+    @property
+    def cdc(self):
+        return self.__cdc
+
+    @property
+    def pack_size(self):
+        if self.__pack_size is None:
+            return None
+        return convert_bytes_to_int(self.__pack_size)
+
+    @property
+    def compress(self):
+        return self.__compress
+
     @property
     def excluded_dirs(self):
         return [os.path.basename(excluded_dir) for excluded_dir in self.__excluded_dirs]
@@ -123,3 +163,53 @@ class Config:
     @property
     def zip_file(self):
         return self.__zip_file
+
+    @property
+    def watch(self):
+        return self.__watch
+
+    @property
+    def agent_ttl(self):
+        return self.__agent_ttl
+
+    @property
+    def is_stopping_agent(self):
+        return self.__is_stopping_agent
+
+    @property
+    def is_stopping_daemon(self):
+        return self.__is_stopping_daemon
+
+    def to_dict(self):
+        # the arguments of the config -> Config(**config.to_dict()) is the same config
+        # (it is sent to the daemon which already holds the key -> the password is left out)
+        return {
+            "api_id": self.__api_id,
+            "api_hash": self.__api_hash,
+            "command": self.__command,
+            "target_path": self.__target_path,
+            "password": None,
+            "new_password": self.__new_password,
+            "new_default_pulled_dir": self.__new_default_pulled_dir,
+            "new_cloudchannel": self.__new_cloudchannel,
+            "switched_cloudchannel": self.__switched_cloudchannel,
+            "deleted_cloudchannel": self.__deleted_cloudchannel,
+            "is_recursive": self.__is_recursive,
+            "force": self.__force,
+            "paranoid": self.__paranoid,
+            "dedup": self.__dedup,
+            "cdc": self.__cdc,
+            "pack_size": self.__pack_size,
+            "compress": self.__compress,
+            "excluded_dirs": self.__excluded_dirs,
+            "excluded_files": self.__excluded_files,
+            "excluded_file_suffixes": self.__excluded_file_suffixes,
+            "in_name": self.__in_name,
+            "max_size": self.__max_size,
+            "is_auto_fill_password": self.__is_auto_fill_password,
+            "zip_file": self.__zip_file,
+            "watch": self.__watch,
+            "agent_ttl": self.__agent_ttl,
+            "is_stopping_agent": self.__is_stopping_agent,
+            "is_stopping_daemon": self.__is_stopping_daemon,
+        }
@@ -4,16 +4,23 @@ from ..utils import read_file
 from ..constants import CONFIG_PATH
 
 
-def load_config(func):
-    config = None
-    if os.path.exists(CONFIG_PATH):
-        config = read_file(CONFIG_PATH, mode="r", deserialize=True)
+# config.json is read once, the first time a getter is called (not at import time)
+# -> read again only when the file changed (tc chan --switch while a daemon runs, update_config)
+_config = None
+_config_version = None
+
 
+def load_config(func):
     def load():
-        nonlocal config
-        if config is None:
-            config = read_file(CONFIG_PATH, mode="r", deserialize=True)
-        return func(config)
+        global _config, _config_version
+
+        config_stat = os.stat(CONFIG_PATH)
+        config_version = (config_stat.st_mtime_ns, config_stat.st_size)
+        if _config is None or config_version != _config_version:
+            _config = read_file(CONFIG_PATH, mode="r", deserialize=True)
+            _config_version = config_version
+
+        return func(_config)
 
     return load
 
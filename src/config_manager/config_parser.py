@@ -6,6 +6,9 @@ from getpass import getpass
 
 from colorama import Fore
 
+from ..agent import DEFAULT_AGENT_TTL, request_symmetric_key
+from ..daemon import JOB_COMMANDS, is_daemon_running
+from ..core._watcher import is_watch_supported
 from ..constants import CONFIG_PATH
 from .config import Config
 from .functions import get_current_cloud_channel
@@ -74,6 +77,43 @@ def _parse_args():
         action="store_true",
         help="force to push remained files",
     )
+    push.add_argument(
+        "--paranoid",
+        dest="paranoid",
+        action="store_true",
+        help="hash every file to detect changes instead of trusting unchanged size and modification time",
+    )
+    push.add_argument(
+        "--dedup",
+        dest="dedup",
+        action="store_true",
+        help="do not upload files whose content is already pushed to the cloud channel",
+    )
+    push.add_argument(
+        "--cdc",
+        dest="cdc",
+        action="store_true",
+        help="split big files by content and only upload the chunks which are not pushed yet",
+    )
+    push.add_argument(
+        "--pack",
+        dest="pack_size",
+        nargs="?",
+        const="64MB",
+        help="pack small files into encrypted pack objects of the given size (64MB if not provided)\nexample:\n   --pack or --pack 128MB",
+    )
+    push.add_argument(
+        "--compress",
+        dest="compress",
+        action="store_true",
+        help="compress files before encrypting them (already compressed files are skipped)",
+    )
+    push.add_argument(
+        "--watch",
+        dest="watch",
+        action="store_true",
+        help="keep pushing the files of the directory once they are created or modified (Linux only)\nexample:\n   tc push -r --watch example_dir/",
+    )
 
     # pulling command
     pull = subparsers.add_parser(
@@ -143,6 +183,57 @@ def _parse_args():
         "-d", "--delete", dest="deleted_cloudchannel", help="delete a cloud channel"
     )
 
+    # key agent command
+    agent = subparsers.add_parser(
+        "agent",
+        usage="tc [options] agent [options]",
+        description=(
+            "keep the unlocked key in memory for a while (like ssh-agent) "
+            "-> push, pull and chan do not ask for the password and skip deriving the key\n\n"
+            "example:\n"
+            "   tc agent --ttl 28800\n"
+            "  then:\n"
+            "   tc push example_dir/  # no password asked until the agent stops"
+        ),
+        help="start or stop the key agent",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    agent.add_argument(
+        "--ttl",
+        dest="agent_ttl",
+        type=int,
+        default=DEFAULT_AGENT_TTL,
+        help=f"seconds the key is kept in memory ({DEFAULT_AGENT_TTL} if not provided)",
+    )
+    agent.add_argument(
+        "--stop",
+        dest="is_stopping_agent",
+        action="store_true",
+        help="stop the running agent",
+    )
+
+    # daemon command
+    daemon = subparsers.add_parser(
+        "daemon",
+        usage="tc [options] daemon [options]",
+        description=(
+            "keep one connected client running in the foreground "
+            "-> push, pull and list are sent to it as jobs instead of connecting every time\n\n"
+            "example:\n"
+            "   tc daemon &\n"
+            "  then:\n"
+            "   tc push example_dir/  # run by the daemon, its output shown here"
+        ),
+        help="start or stop the daemon",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    daemon.add_argument(
+        "--stop",
+        dest="is_stopping_daemon",
+        action="store_true",
+        help="stop the running daemon",
+    )
+
     # listing pushed files command
     listing = subparsers.add_parser(
         "list",
@@ -224,6 +315,8 @@ def parse_config():
         "config",
         "list",
         "chan",
+        "agent",
+        "daemon",
         "-p",
         "--password",
         "-n",
@@ -253,6 +346,18 @@ def parse_config():
 
         target_path = {"is_file": os.path.isfile(absolute_path), "value": absolute_path}
 
+        # only the files of a directory can be watched
+        if args.watch and (target_path["is_file"] or args.zip_file):
+            print(
+                f"{Fore.BLUE}{time.strftime('%H:%M:%S')}{Fore.RED} Failed{Fore.RESET} - Only a directory can be watched (without --zip)"
+            )
+            exit()
+        if args.watch and not is_watch_supported():
+            print(
+                f"{Fore.BLUE}{time.strftime('%H:%M:%S')}{Fore.RED} Failed{Fore.RESET} - Watching needs Linux (inotify)"
+            )
+            exit()
+
     elif args.command == "pull":
         if not args.target_path:
             default_dir = get_default_pulled_directory()
@@ -272,10 +377,10 @@ def parse_config():
         # only pushing/pulling command uses target_path -> they do not touch it then target_path can be anything
         target_path = {}
 
-    # check if the max_size arg is valid or not
-    if (
-        args.max_size[-2:].upper() not in ("KB", "MB", "GB")
-        or not (args.max_size[:-2]).strip().isdigit()
+    # check if the max_size/pack_size args are valid or not
+    if not _is_valid_bytes_unit(args.max_size) or (
+        _set_none_if_uncalled_attrib(args, "pack_size") is not None
+        and not _is_valid_bytes_unit(args.pack_size)
     ):
         print(
             f"{Fore.BLUE}{time.strftime('%H:%M:%S')}{Fore.RED} Failed{Fore.RESET} - Invalid bytes unit"
@@ -297,6 +402,25 @@ def parse_config():
         if args.new_cloudchannel or args.deleted_cloudchannel:
             password = _get_password(args)
 
+    elif args.command == "agent":
+        if not args.is_stopping_agent:
+            password = _get_password(args)
+
+    elif args.command == "daemon" and args.is_stopping_daemon:
+        pass
+
+    # the daemon runs the job with its own key -> the password is not needed
+    elif (
+        args.command in JOB_COMMANDS
+        and not _set_none_if_uncalled_attrib(args, "watch")
+        and is_daemon_running()
+    ):
+        password = None
+
+    # the key agent holds the key -> the password is not needed
+    elif not args.password and request_symmetric_key() is not None:
+        password = None
+
     else:
         password = _get_password(args)
 
@@ -322,12 +446,28 @@ def parse_config():
         max_size=_set_none_if_uncalled_attrib(args, "max_size"),
         is_recursive=_set_none_if_uncalled_attrib(args, "is_recursive"),
         force=_set_none_if_uncalled_attrib(args, "force"),
+        paranoid=_set_none_if_uncalled_attrib(args, "paranoid"),
+        dedup=_set_none_if_uncalled_attrib(args, "dedup"),
+        cdc=_set_none_if_uncalled_attrib(args, "cdc"),
+        pack_size=_set_none_if_uncalled_attrib(args, "pack_size"),
+        compress=_set_none_if_uncalled_attrib(args, "compress"),
         new_password=_set_none_if_uncalled_attrib(args, "new_password"),
         excluded_dirs=_set_none_if_uncalled_attrib(args, "excluded_dirs"),
         excluded_files=_set_none_if_uncalled_attrib(args, "excluded_files"),
         new_cloudchannel=_set_none_if_uncalled_attrib(args, "new_cloudchannel"),
         deleted_cloudchannel=_set_none_if_uncalled_attrib(args, "deleted_cloudchannel"),
         zip_file=_set_none_if_uncalled_attrib(args, "zip_file"),
+        watch=_set_none_if_uncalled_attrib(args, "watch"),
+        agent_ttl=_set_none_if_uncalled_attrib(args, "agent_ttl"),
+        is_stopping_agent=_set_none_if_uncalled_attrib(args, "is_stopping_agent"),
+        is_stopping_daemon=_set_none_if_uncalled_attrib(args, "is_stopping_daemon"),
+    )
+
+
+def _is_valid_bytes_unit(bytes_num):
+    return (
+        bytes_num[-2:].upper() in ("KB", "MB", "GB")
+        and bytes_num[:-2].strip().isdigit()
     )
 
 
@@ -362,6 +502,16 @@ def _set_none_if_uncalled_attrib(args, attrib_name):
         return args.is_recursive if attrib_name in args else None
     elif attrib_name == "force":
         return args.force if attrib_name in args else None
+    elif attrib_name == "paranoid":
+        return args.paranoid if attrib_name in args else None
+    elif attrib_name == "dedup":
+        return args.dedup if attrib_name in args else None
+    elif attrib_name == "cdc":
+        return args.cdc if attrib_name in args else None
+    elif attrib_name == "pack_size":
+        return args.pack_size if attrib_name in args else None
+    elif attrib_name == "compress":
+        return args.compress if attrib_name in args else None
     elif attrib_name == "in_name":
         return args.in_name if attrib_name in args else None
     elif attrib_name == "max_size":
@@ -370,3 +520,11 @@ def _set_none_if_uncalled_attrib(args, attrib_name):
         return args.is_auto_fill_password if attrib_name in args else None
     elif attrib_name == "zip_file":
         return args.zip_file if attrib_name in args else None
+    elif attrib_name == "watch":
+        return args.watch if attrib_name in args else None
+    elif attrib_name == "agent_ttl":
+        return args.agent_ttl if attrib_name in args else None
+    elif attrib_name == "is_stopping_agent":
+        return args.is_stopping_agent if attrib_name in args else None
+    elif attrib_name == "is_stopping_daemon":
+        return args.is_stopping_daemon if attrib_name in args else None
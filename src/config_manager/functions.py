@@ -3,21 +3,15 @@ import time
 import json
 
 from colorama import Style, Fore
-from telethon import TelegramClient
 
 from .config_loader import get_config
-from .. import aes, rsa
-from ..protector import load_symmetric_key
 from ..utils import logging, write_file
 from ..constants import ENCRYPTED_PRIVATE_KEY_PATH, CONFIG_PATH
-from ..tl import (
-    create_channel,
-    set_channel_photo,
-    delete_channel,
-    send_delete_confirmation_code,
-)
 from ..cloudmap import delete_pushed_files
 
+# the crypto libraries and Telethon are imported by the functions which use them
+# -> showing/switching the config does not load them
+
 
 def update_config(config):
     write_file(CONFIG_PATH, config, mode="w", serialize=True)
@@ -38,6 +32,9 @@ def remove_password_from_config():
 
 
 def change_password(old_password, new_password):
+    from .. import aes, rsa
+    from ..protector import load_symmetric_key
+
     result = load_symmetric_key(old_password)
     if not result["success"]:
         logging(f"{Fore.RED}Failed{Fore.RESET} - {result['error']}{Style.RESET_ALL}")
@@ -91,7 +88,9 @@ def show_all_config_setting():
             print(f"+ {Fore.GREEN}{key}{Fore.RESET}: {config[key]}")
 
 
-async def create_new_cloud_channel(client: TelegramClient):
+async def create_new_cloud_channel(client):
+    from ..tl import create_channel, set_channel_photo
+
     config = get_config()
 
     title = input("Title: ").strip()
@@ -131,7 +130,9 @@ def switch_cloud_channel(cloud_channel_name):
     logging(f"Switched to {Fore.GREEN}{cloud_channel_name}{Fore.RESET}")
 
 
-async def delete_cloud_channel(client: TelegramClient, cloud_channel_name):
+async def delete_cloud_channel(client, cloud_channel_name):
+    from ..tl import delete_channel, send_delete_confirmation_code
+
     config = get_config()
     cloud_channels = config["cloud_channels"]
 
@@ -154,7 +155,7 @@ async def delete_cloud_channel(client: TelegramClient, cloud_channel_name):
     cloud_channel_id = cloud_channels[cloud_channel_name]
     await delete_channel(client, cloud_channel_id)
 
-    delete_pushed_files()
+    delete_pushed_files(cloud_channel_id)
 
     config["cloud_channels"].pop(cloud_channel_name)
     update_config(config)
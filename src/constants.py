@@ -3,6 +3,8 @@ import datetime
 
 
 _HOME_DIR = os.path.expanduser("~")
+# the files shipped along with the code
+_RESOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 PULLED_DIR_IN_DESKTOP = os.path.join(
     _HOME_DIR, os.path.join("Desktop", "TeleCloudFiles")
@@ -23,11 +25,20 @@ CONFIG_PATH = os.path.join(STORED_CLOUDMAP_PATHS, "config.json")
 CACHE_PATH = os.path.join(STORED_CLOUDMAP_PATHS, "cache")
 CURRENT_TIMESTAMP = str(datetime.datetime.now().timestamp())
 PREPARED_DATA_CACHE_PATH = os.path.join(CACHE_PATH, CURRENT_TIMESTAMP)
+# unlike the prepared data cache, it is kept across runs -> an interrupted pull resumes from it
+DOWNLOAD_STAGING_PATH = os.path.join(CACHE_PATH, "staging")
 STRING_SESSION_PATH = os.path.join(STORED_CLOUDMAP_PATHS, "StringSession")
 CLOUDMAP_DB_PATH = os.path.join(STORED_CLOUDMAP_PATHS, "cloudmap.db")
+AGENT_SOCKET_PATH = os.path.join(STORED_CLOUDMAP_PATHS, "agent.sock")
+DAEMON_SOCKET_PATH = os.path.join(STORED_CLOUDMAP_PATHS, "daemon.sock")
 INCLUDED_CLOUDMAP_PATHS = (STORED_CLOUDMAP_PATHS, CLOUDMAP_DB_PATH)
+ICON_PATH = os.path.join(_RESOURCE_DIR, "icon.jpg")
 
 NAMING_FILE_MAX_LENGTH = 255
 NONCE_LENGTH = 12
 TAG_LENGTH = 16
 CHUNK_LENGTH_FOR_LARGE_FILE = 7 * 1024 * 1024  # 7MB
+# encrypted objects are containers of frames -> the frame length does not depend on the part length
+CONTAINER_MAGIC = b"TCEC"
+CONTAINER_VERSION = 1
+FRAME_LENGTH = 1024 * 1024  # 1MB
@@ -0,0 +1,18 @@
+import weakref
+
+from telethon import TelegramClient
+
+from ..config_manager.config_loader import get_cloud_channel_id
+
+# the resolved cloud channels per client -> a long-running client (tc daemon) resolves a channel once
+_channels = weakref.WeakKeyDictionary()
+
+
+async def get_cloud_channel(client: TelegramClient):
+    # keyed by the channel id -> switching to another cloud channel resolves that one
+    channel_id = get_cloud_channel_id()
+    channels = _channels.setdefault(client, {})
+    if channel_id not in channels:
+        channels[channel_id] = await client.get_entity(channel_id)
+
+    return channels[channel_id]
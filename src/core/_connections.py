@@ -0,0 +1,121 @@
+import asyncio
+import weakref
+
+from telethon import TelegramClient
+from telethon.network import MTProtoSender
+
+from ._retry import retrier
+from ._scheduler import scheduler
+
+# connections to a DC the blocks of a transfer are spread over (the client's own connection included)
+CONNECTIONS = 4
+# requests waiting for their answer on a connection at the time -> requests are pipelined instead of one RTT each
+PIPELINE_DEPTH = 4
+
+
+class Connection:
+    # a connection sends requests pipelined, at most PIPELINE_DEPTH of them in flight
+    def __init__(self, invoke):
+        self.__invoke = invoke
+        self.__pipeline = asyncio.Semaphore(PIPELINE_DEPTH)
+
+    async def send(self, request):
+        async with self.__pipeline:
+            return await retrier.call(self.__send, request)
+
+    async def __send(self, request):
+        # every attempt is watched -> a flood wait lowers the scheduler limit even if the retry passes
+        with scheduler.watch():
+            return await self.__invoke(request)
+
+
+class ConnectionPool:
+    # Telethon sends the blocks of a file one after another over one connection
+    # -> the pool opens more connections (per DC) once and shares them between transfers
+    def __init__(self, client: TelegramClient, connections=CONNECTIONS):
+        self.__client = client
+        self.__max_connections = connections
+        self.__connections = {}
+        self.__senders = []
+        self.__lock = asyncio.Lock()
+
+    async def get(self, dc_id=None):
+        # dc_id None -> the home DC
+        if dc_id is None:
+            dc_id = self.__get_home_dc_id()
+
+        async with self.__lock:
+            if dc_id not in self.__connections:
+                self.__connections[dc_id] = await self.__connect_all(dc_id)
+
+        return self.__connections[dc_id]
+
+    async def close(self):
+        for sender in self.__senders:
+            await sender.disconnect()
+        self.__senders = []
+        self.__connections = {}
+
+    async def __connect_all(self, dc_id):
+        connections = []
+        if dc_id == self.__get_home_dc_id():
+            connections.append(Connection(self.__client))
+
+        while len(connections) < self.__max_connections:
+            try:
+                sender = await self.__connect(dc_id)
+            except (ConnectionError, OSError, asyncio.TimeoutError):
+                # transfers still work over the connections which are already up
+                break
+
+            self.__senders.append(sender)
+            connections.append(Connection(self.__get_invoke(sender)))
+
+        return connections
+
+    async def __connect(self, dc_id):
+        client = self.__client
+        if dc_id != self.__get_home_dc_id():
+            # the authorization is exported to the other DC
+            return await client._create_exported_sender(dc_id)
+
+        # a new connection with the same authorization key -> it gets its own MTProto session
+        sender = MTProtoSender(client.session.auth_key, loggers=client._log)
+        await sender.connect(
+            client._connection(
+                client.session.server_address,
+                client.session.port,
+                dc_id,
+                loggers=client._log,
+                proxy=client._proxy,
+                local_addr=client._local_addr,
+            )
+        )
+
+        return sender
+
+    def __get_home_dc_id(self):
+        return self.__client.session.dc_id
+
+    @staticmethod
+    def __get_invoke(sender):
+        async def invoke(request):
+            return await sender.send(request)
+
+        return invoke
+
+
+# one pool per client -> the extra connections are opened once per run
+_pools = weakref.WeakKeyDictionary()
+
+
+def get_connection_pool(client: TelegramClient):
+    if client not in _pools:
+        _pools[client] = ConnectionPool(client)
+
+    return _pools[client]
+
+
+def set_connection_pool(client, pool):
+    # another pool for a client -> anything with get(dc_id) returning its connections (benchmarks/bench_download.py)
+    _pools[client] = pool
@@ -1,15 +1,22 @@
 import os
+import stat
 import time
+from collections import Counter
 
 from colorama import Fore
 
-from ..utils import get_checksum
+from ..utils import get_checksum, get_stat_info, echo
 from ..constants import NAMING_FILE_MAX_LENGTH
 from ..cloudmap import (
     get_cloudmap,
     get_pushed_file_paths,
     get_pushed_file_names,
     get_pushed_checksums,
+    get_file_index,
+    get_file_index_entry,
+    get_pushed_file_by_checksum,
+    is_pushed_file_path,
+    update_file_indexes,
 )
 
 
@@ -60,6 +67,7 @@ class PushedDataPreparer(DataFilter):
         in_name,
         is_recursive,
         force,
+        paranoid=False,
     ):
         super().__init__(
             excluded_dirs,
@@ -71,48 +79,141 @@ class PushedDataPreparer(DataFilter):
         self.__root_directory = root_directory
         self.__is_recursive = is_recursive
         self.__force = force
+        self.__paranoid = paranoid
 
-    def prepare(self):
-        pushed_file_paths = get_pushed_file_paths()
-        checksums = get_pushed_checksums()
-
-        file_paths = []
-        for dir_path, _, file_names in os.walk(self.__root_directory):
+    def scan(self):
+        # os.scandir instead of os.walk
+        # -> the excluded directories are pruned before descending into them
+        # -> DirEntry already knows whether it is a file/directory, no extra stat call for that
+        directories = [self.__root_directory]
+        while directories:
+            dir_path = directories.pop()
             if not self.is_valid_directory(dir_path):
                 continue
 
-            for file_name in file_names:
-                file_path = os.path.join(dir_path, file_name)
+            try:
+                entries = os.scandir(dir_path)
+            except OSError:
+                # the same as os.walk -> skip unreadable directories
+                continue
 
-                if not self.is_valid_file(file_name):
-                    continue
-                if not self.is_valid_file_suffix(file_name):
-                    continue
-                if not self.is_valid_size(os.path.getsize(file_path)):
-                    continue
-                if not self.is_match_in_name(file_name):
-                    continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if self.__is_recursive:
+                            directories.append(entry.path)
+                        continue
 
-                if self.__force:
-                    file_paths.append(file_path)
-                    continue
+                    if not entry.is_file():
+                        continue
+                    if not self.is_valid_file(entry.name):
+                        continue
+                    if not self.is_valid_file_suffix(entry.name):
+                        continue
+                    if not self.is_match_in_name(entry.name):
+                        continue
+                    if not self.is_valid_size(entry.stat().st_size):
+                        continue
 
-                if file_path not in pushed_file_paths:
-                    file_paths.append(file_path)
-                    continue
+                    yield entry
 
-                if get_checksum(file_path) not in checksums:
-                    file_paths.append(file_path)
-                    continue
+    def select(self, file_paths):
+        # the changed files of a watched directory -> the same filters as scanning without walking the tree
+        for file_path in file_paths:
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                # removed since it changed
+                continue
 
-                print(
-                    f"{Fore.BLUE}{time.strftime('%H:%M:%S')}{Fore.GREEN} Remained{Fore.RESET}   {file_path}"
+            file_name = os.path.basename(file_path)
+            if not stat.S_ISREG(file_stat.st_mode):
+                continue
+            if not self.is_valid_file(file_name):
+                continue
+            if not self.is_valid_file_suffix(file_name):
+                continue
+            if not self.is_match_in_name(file_name):
+                continue
+            if not self.is_valid_size(file_stat.st_size):
+                continue
+
+            yield file_path, file_stat
+
+    def prepare(self, file_paths=None):
+        # a generator -> file paths are yielded while scanning, the caller can start pushing right away
+        if file_paths is None:
+            # sets -> constant time membership checks no matter how many files were pushed
+            pushed_file_paths = set(get_pushed_file_paths())
+            checksums = set(get_pushed_checksums())
+            file_index = get_file_index()
+            is_pushed_file = pushed_file_paths.__contains__
+            is_pushed_checksum = checksums.__contains__
+            get_indexed_file = file_index.get
+            # DirEntry caches the stat result -> reused here
+            files = ((entry.path, entry.stat()) for entry in self.scan())
+        else:
+            # file_paths -> only these files are checked instead of the whole tree
+            # a few files (the changes of a watched directory) -> looked up one by one instead of loading the cloudmap
+            is_pushed_file = is_pushed_file_path
+            is_pushed_checksum = _is_pushed_checksum
+            get_indexed_file = get_file_index_entry
+            files = self.select(file_paths)
+
+        updated_file_indexes = []
+        for file_path, file_stat in files:
+
+            if self.__force:
+                yield file_path
+                continue
+
+            if not is_pushed_file(file_path):
+                yield file_path
+                continue
+
+            # the same size, mtime, inode and ctime as the last time -> the file is not touched, no need to read it
+            # paranoid mode does not trust the stat info and always hashes the file
+            indexed_file = get_indexed_file(file_path)
+            if (
+                not self.__paranoid
+                and indexed_file is not None
+                and indexed_file[:4] == get_stat_info(file_stat)
+            ):
+                checksum = indexed_file[4]
+            else:
+                try:
+                    checksum = get_checksum(file_path)
+                except OSError:
+                    # removed since it was scanned
+                    continue
+                updated_file_indexes.append(
+                    {
+                        "file_path": file_path,
+                        "file_size": file_stat.st_size,
+                        "mtime_ns": file_stat.st_mtime_ns,
+                        "inode": file_stat.st_ino,
+                        "ctime_ns": file_stat.st_ctime_ns,
+                        "checksum": checksum,
+                    }
                 )
+                # write in batches -> memory does not grow with the number of files
+                if len(updated_file_indexes) >= 1000:
+                    update_file_indexes(updated_file_indexes)
+                    updated_file_indexes = []
+
+            if not is_pushed_checksum(checksum):
+                yield file_path
+                continue
+
+            echo(
+                f"{Fore.BLUE}{time.strftime('%H:%M:%S')}{Fore.GREEN} Remained{Fore.RESET}   {file_path}"
+            )
+
+        update_file_indexes(updated_file_indexes)
 
-            if not self.__is_recursive:
-                break
 
-        return file_paths
+def _is_pushed_checksum(checksum):
+    return get_pushed_file_by_checksum(checksum) is not None
 
 
 class PulledDataPreparer(DataFilter):
@@ -135,8 +236,10 @@ class PulledDataPreparer(DataFilter):
 
     def prepare(self):
         cloudmap = get_cloudmap()
-        pushed_file_names = get_pushed_file_names()
-        pulled_files = os.listdir(self.__saved_directory)
+        pushed_file_names = Counter(get_pushed_file_names())
+        pulled_files = set(os.listdir(self.__saved_directory))
+        # deduped files of the same name point at the same object -> pulled once
+        prepared_objects = set()
 
         prepared_data = []
         for pushed_file in cloudmap:
@@ -144,6 +247,7 @@ class PulledDataPreparer(DataFilter):
             file_name = pushed_file["file_name"]
             file_size = pushed_file["file_size"]
             pushed_time = pushed_file["time"]
+            pack_offset = pushed_file["pack_offset"]
 
             if not self.is_valid_file(file_name):
                 continue
@@ -154,10 +258,20 @@ class PulledDataPreparer(DataFilter):
             if not self.is_match_in_name(file_name):
                 continue
 
+            pushed_object = (file_name, msg_id, pack_offset, pushed_file["checksum"])
+            if pushed_object in prepared_objects:
+                continue
+            prepared_objects.add(pushed_object)
+
             # If a file has multiple uploads, when downloading we need to make its name different with time
             # since it shares the same name
-            if pushed_file_names.count(file_name) != 1:
-                differentor = "." + str(msg_id) + "." + pushed_time
+            # packed files share the msg_id of their pack (+ the time of their push) -> the offset tells them apart
+            if pushed_file_names[file_name] != 1:
+                differentor = "." + str(msg_id)
+                if pack_offset is not None:
+                    differentor += "-" + str(pack_offset)
+                differentor += "." + pushed_time
+
                 base, ext = os.path.splitext(file_name)
                 new_file_name = base + differentor + ext
 
@@ -175,8 +289,7 @@ class PulledDataPreparer(DataFilter):
                 continue
 
             saved_path = os.path.join(self.__saved_directory, file_name)
-            prepared_data.append(
-                {"msg_id": msg_id, "file_size": file_size, "saved_path": saved_path}
-            )
+            # the whole cloudmap row -> how the file is stored (layout, pack, ...) goes along with it
+            prepared_data.append(dict(pushed_file, saved_path=saved_path))
 
         return prepared_data
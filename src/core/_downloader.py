@@ -0,0 +1,90 @@
+import asyncio
+
+from telethon import TelegramClient
+from telethon.tl import functions, types
+
+from ._connections import get_connection_pool, PIPELINE_DEPTH
+from ._retry import retrier
+from ._scheduler import scheduler
+
+# GetFile takes blocks of 4KB x 2^n, up to 1MB
+MIN_BLOCK_SIZE = 128 * 1024  # 128KB
+MAX_BLOCK_SIZE = 1024 * 1024  # 1MB
+
+
+def get_block_size(file_size, connections):
+    # the smallest files still keep every connection busy -> halve the block until there are enough of them
+    block_size = MAX_BLOCK_SIZE
+    while (
+        block_size > MIN_BLOCK_SIZE
+        and file_size < block_size * connections * PIPELINE_DEPTH
+    ):
+        block_size //= 2
+
+    return block_size
+
+
+async def download_document(client: TelegramClient, document, file_path):
+    # document -> the stored info of the message (cloudmap documents table)
+    # client.download_file fetches the blocks of a file one after another
+    # -> here GetFile requests at different offsets are sent at the same time over the connections to the file's DC
+    location = types.InputDocumentFileLocation(
+        id=document["document_id"],
+        access_hash=document["access_hash"],
+        file_reference=document["file_reference"],
+        thumb_size="",
+    )
+    file_size = document["size"]
+
+    connections = await get_connection_pool(client).get(document["dc_id"])
+    if not connections:
+        # no connection to the file's DC could be opened -> let Telethon handle it
+        # not sent through a Connection -> watched and retried here the same way
+        async def download():
+            with scheduler.watch():
+                await client.download_file(
+                    location,
+                    file=file_path,
+                    part_size_kb=512,
+                    file_size=file_size,
+                    dc_id=document["dc_id"],
+                )
+
+        await retrier.call(download)
+        return
+
+    block_size = get_block_size(file_size, len(connections))
+    block_count = (file_size + block_size - 1) // block_size
+
+    # the blocks arrive in any order -> each one is written into place in a file of the final size
+    with open(file_path, "wb") as f:
+        f.truncate(file_size)
+
+    def write(offset, block):
+        with open(file_path, "r+b") as f:
+            f.seek(offset)
+            f.write(block)
+
+    async def fetch(block_num):
+        offset = block_num * block_size
+        request = functions.upload.GetFileRequest(location, offset, block_size)
+
+        # round-robin -> the blocks are evenly spread over the connections
+        connection = connections[block_num % len(connections)]
+        result = await connection.send(request)
+
+        expected_size = min(block_size, file_size - offset)
+        if len(result.bytes) != expected_size:
+            raise RuntimeError(
+                f"Got {len(result.bytes)} bytes instead of {expected_size} at offset {offset}"
+            )
+
+        await asyncio.to_thread(write, offset, result.bytes)
+
+    tasks = [asyncio.create_task(fetch(block_num)) for block_num in range(block_count)]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
@@ -0,0 +1,79 @@
+import random
+import asyncio
+
+from colorama import Fore
+from telethon.errors import (
+    FloodWaitError,
+    FloodPremiumWaitError,
+    ServerError,
+    TimedOutError,
+)
+
+from ..utils import logging
+
+# a request is tried at most 1 + MAX_RETRIES times
+MAX_RETRIES = 5
+# exponential backoff for transient errors -> 1s, 2s, 4s, ... (jittered, capped at MAX_DELAY)
+BASE_DELAY = 1
+MAX_DELAY = 60
+# Telegram tells how long to wait
+FLOOD_WAIT_ERRORS = (FloodWaitError, FloodPremiumWaitError)
+# Telegram failed on its side -> the same request may pass the next time
+# ConnectionError is not here since it is what a request raises when pressing Ctrl+C
+TRANSIENT_ERRORS = (ServerError, TimedOutError, asyncio.TimeoutError)
+
+
+class Retrier:
+    # Wraps a single request (upload_file, send_file, get_messages, download_file)
+    # -> a failing part is retried on its own instead of failing the whole file
+    def __init__(self, max_retries=MAX_RETRIES):
+        self.__max_retries = max_retries
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.__stats = {"retries": 0, "flood_waits": 0, "waited_time": 0}
+
+    async def call(self, request, *args, **kwargs):
+        attempt = 0
+        while True:
+            try:
+                return await request(*args, **kwargs)
+            except FLOOD_WAIT_ERRORS + TRANSIENT_ERRORS as e:
+                if attempt == self.__max_retries:
+                    raise
+
+                delay = self.__get_delay(e, attempt)
+                attempt += 1
+
+                self.__stats["retries"] += 1
+                self.__stats["waited_time"] += delay
+                if isinstance(e, FLOOD_WAIT_ERRORS):
+                    self.__stats["flood_waits"] += 1
+
+                logging(
+                    f"{Fore.YELLOW}Retrying{Fore.RESET} in {delay:.1f}s ({attempt}/{self.__max_retries}) - {type(e).__name__}"
+                )
+                await asyncio.sleep(delay)
+
+    def log_stats(self):
+        stats = self.__stats
+        if stats["retries"] == 0:
+            return
+
+        logging(
+            f"{Fore.BLUE}Retries{Fore.RESET} {stats['retries']} (flood waits {stats['flood_waits']})"
+            f" - waited {stats['waited_time']:.1f}s"
+        )
+
+    @staticmethod
+    def __get_delay(error, attempt):
+        if isinstance(error, FLOOD_WAIT_ERRORS):
+            # waiting a bit longer than asked -> parts waiting together do not hit the limit again at once
+            return error.seconds + random.uniform(0, 1)
+
+        # full jitter -> parts failing together do not retry together
+        return random.uniform(0, min(MAX_DELAY, BASE_DELAY * 2**attempt))
+
+
+# one retrier for the whole process -> the counters cover every request of a run
+retrier = Retrier()
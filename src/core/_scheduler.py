@@ -0,0 +1,200 @@
+import time
+import asyncio
+import contextlib
+from collections import deque
+
+from colorama import Fore
+from telethon.errors import FloodError, TimedOutError
+
+from ..utils import logging, convert_bytes
+
+# how many part transfers (uploads/downloads) can be in flight at the time, across all files
+MIN_TRANSFERS = 2
+MAX_TRANSFERS = 16
+INITIAL_TRANSFERS = 8
+# Telegram asks to slow down -> the limit is halved
+CONGESTION_ERRORS = (FloodError, TimedOutError, asyncio.TimeoutError)
+# the throughput of a window may be a bit lower than the previous one before it counts as a drop
+THROUGHPUT_TOLERANCE = 0.9
+
+
+class TransferScheduler:
+    # Every part transfer takes a slot -> 8 big files do not mean 8 x 8 parts in flight anymore
+    # the limit follows AIMD:
+    # -> +1 after a window of transfers (one per slot) which is not slower than the previous window
+    # -> -1 after a window which is slower
+    # -> halved when Telegram answers with a flood wait or a timeout
+    #    (once per congestion: the requests sent before the limit was halved do not halve it again)
+    def __init__(
+        self,
+        min_limit=MIN_TRANSFERS,
+        max_limit=MAX_TRANSFERS,
+        initial_limit=INITIAL_TRANSFERS,
+    ):
+        self.__min_limit = min_limit
+        self.__max_limit = max_limit
+        self.__limit = initial_limit
+        self.__in_flight = 0
+        self.__waiters = deque()
+        self.__halved_at = float("-inf")
+
+        self.reset_stats()
+
+    @property
+    def limit(self):
+        return self.__limit
+
+    @property
+    def in_flight(self):
+        return self.__in_flight
+
+    def reset_stats(self):
+        self.__stats = {
+            "transfers": 0,
+            "transferred_size": 0,
+            "peak_in_flight": 0,
+            "lowest_limit": self.__limit,
+            "highest_limit": self.__limit,
+            "congestions": 0,
+            "started_at": time.monotonic(),
+        }
+        # a new run -> the idle time before it does not count as a throughput drop
+        self.__reset_window()
+        self.__last_throughput = 0
+
+    async def acquire(self):
+        if self.__in_flight < self.__limit and not self.__waiters:
+            self.__take()
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.__waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.exceptions.CancelledError:
+            # the slot was handed over right before the cancellation -> give it back
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+
+    def release(self):
+        self.__in_flight -= 1
+        self.__wake_up()
+
+    @contextlib.asynccontextmanager
+    async def slot(self):
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def submit(self, coro):
+        # waits for a slot then runs the coro as a task which holds the slot until it is done
+        try:
+            await self.acquire()
+        except asyncio.exceptions.CancelledError:
+            coro.close()
+            raise
+
+        task = asyncio.create_task(coro)
+        # done callback -> the slot is released even if the task is cancelled before it starts
+        task.add_done_callback(lambda _: self.release())
+        return task
+
+    @contextlib.contextmanager
+    def watch(self):
+        # wraps a single request -> Telegram asking to slow down lowers the limit
+        sent_at = time.monotonic()
+        try:
+            yield
+        except CONGESTION_ERRORS:
+            self.__stats["congestions"] += 1
+            # sent before the limit was halved -> the same congestion, the limit already went down for it
+            if sent_at >= self.__halved_at:
+                self.__decrease(multiplicative=True)
+            raise
+
+    @contextlib.contextmanager
+    def track(self, size):
+        # wraps the requests of one transfer -> its throughput adjusts the limit
+        # the requests are watched on their own (Connection) -> a failure is not counted again here
+        yield
+
+        self.__transferred(size)
+
+    def log_stats(self):
+        stats = self.__stats
+        if stats["transfers"] == 0:
+            return
+
+        elapsed_time = max(time.monotonic() - stats["started_at"], 1e-9)
+        throughput = convert_bytes(stats["transferred_size"] / elapsed_time)
+        logging(
+            f"{Fore.BLUE}Transfers{Fore.RESET} {stats['transfers']} ({convert_bytes(stats['transferred_size'])}, {throughput}/s)"
+            f" - limit {self.__limit} (lowest {stats['lowest_limit']}, highest {stats['highest_limit']}),"
+            f" peak in flight {stats['peak_in_flight']}, congestions {stats['congestions']}"
+        )
+
+    def __take(self):
+        self.__in_flight += 1
+        self.__stats["peak_in_flight"] = max(
+            self.__stats["peak_in_flight"], self.__in_flight
+        )
+
+    def __wake_up(self):
+        while self.__waiters and self.__in_flight < self.__limit:
+            waiter = self.__waiters.popleft()
+            # cancelled waiters are skipped -> their slot goes to the next one
+            if not waiter.done():
+                self.__take()
+                waiter.set_result(None)
+
+    def __transferred(self, size):
+        self.__stats["transfers"] += 1
+        self.__stats["transferred_size"] += size
+
+        self.__window_transfers += 1
+        self.__window_size += size
+
+        if self.__window_transfers < self.__limit:
+            return
+
+        now = time.monotonic()
+        throughput = self.__window_size / max(now - self.__window_start, 1e-9)
+        if throughput >= self.__last_throughput * THROUGHPUT_TOLERANCE:
+            self.__increase()
+        else:
+            self.__decrease()
+
+        self.__last_throughput = throughput
+        self.__reset_window()
+
+    def __reset_window(self):
+        self.__window_start = time.monotonic()
+        self.__window_transfers = 0
+        self.__window_size = 0
+
+    def __increase(self):
+        self.__set_limit(self.__limit + 1)
+        # more slots -> waiting transfers can start right away
+        self.__wake_up()
+
+    def __decrease(self, multiplicative=False):
+        if multiplicative:
+            self.__set_limit(self.__limit // 2)
+            self.__halved_at = time.monotonic()
+            # the throughput of the next window is not comparable with the one before the congestion
+            self.__last_throughput = 0
+        else:
+            self.__set_limit(self.__limit - 1)
+
+    def __set_limit(self, limit):
+        # the transfers already in flight are not stopped -> a lower limit applies to the next ones
+        self.__limit = min(max(limit, self.__min_limit), self.__max_limit)
+        self.__stats["lowest_limit"] = min(self.__stats["lowest_limit"], self.__limit)
+        self.__stats["highest_limit"] = max(self.__stats["highest_limit"], self.__limit)
+
+
+# one scheduler for the whole process -> pushing and pulling share the same limit
+scheduler = TransferScheduler()
@@ -0,0 +1,73 @@
+import asyncio
+import hashlib
+
+from telethon import TelegramClient, helpers
+from telethon.tl import functions, types
+from telethon.tl.custom import InputSizedFile
+
+from ._connections import get_connection_pool, PIPELINE_DEPTH
+
+# Telegram takes sub-parts of 1KB x 2^n, up to 512KB
+MIN_SUB_PART_SIZE = 64 * 1024  # 64KB
+MAX_SUB_PART_SIZE = 512 * 1024  # 512KB
+# bigger files must be uploaded with SaveBigFilePart
+BIG_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+
+
+def get_sub_part_size(data_size, connections):
+    # the smallest buffers still keep every connection busy -> halve the sub-part until there are enough of them
+    sub_part_size = MAX_SUB_PART_SIZE
+    while (
+        sub_part_size > MIN_SUB_PART_SIZE
+        and data_size < sub_part_size * connections * PIPELINE_DEPTH
+    ):
+        sub_part_size //= 2
+
+    return sub_part_size
+
+
+async def upload_buffer(client: TelegramClient, data, file_name):
+    # client.upload_file sends the sub-parts of a buffer one after another
+    # -> here they are spread over the connections to the home DC
+    connections = await get_connection_pool(client).get()
+
+    data_size = len(data)
+    sub_part_size = get_sub_part_size(data_size, len(connections))
+    sub_part_count = max((data_size + sub_part_size - 1) // sub_part_size, 1)
+    is_big = data_size > BIG_FILE_SIZE
+    file_id = helpers.generate_random_long()
+
+    async def send(sub_part_num):
+        sub_part = data[
+            sub_part_num * sub_part_size : (sub_part_num + 1) * sub_part_size
+        ]
+        if is_big:
+            request = functions.upload.SaveBigFilePartRequest(
+                file_id, sub_part_num, sub_part_count, sub_part
+            )
+        else:
+            request = functions.upload.SaveFilePartRequest(
+                file_id, sub_part_num, sub_part
+            )
+
+        # round-robin -> the sub-parts are evenly spread over the connections
+        connection = connections[sub_part_num % len(connections)]
+        if not await connection.send(request):
+            raise RuntimeError(f"Failed to upload sub-part {sub_part_num}")
+
+    tasks = [
+        asyncio.create_task(send(sub_part_num))
+        for sub_part_num in range(sub_part_count)
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    if is_big:
+        return types.InputFileBig(file_id, sub_part_count, file_name)
+    return InputSizedFile(
+        file_id, sub_part_count, file_name, hashlib.md5(data), data_size
+    )
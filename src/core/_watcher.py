@@ -0,0 +1,156 @@
+import os
+import sys
+import errno
+import struct
+import asyncio
+import ctypes
+import ctypes.util
+
+from ._data_preparer import DataFilter
+
+# a file is pushed once it has not changed for this long -> a burst of writes is pushed once
+DEBOUNCE_SECONDS = 2
+
+# inotify(7)
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = os.O_CLOEXEC
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_ONLYDIR
+# struct inotify_event -> wd, mask, cookie, len + the name
+_EVENT = struct.Struct("iIII")
+_READ_LENGTH = 64 * 1024
+
+
+def is_watch_supported():
+    return sys.platform.startswith("linux")
+
+
+class DirectoryWatcher:
+    # inotify through ctypes -> no dependency, the kernel tells which files changed instead of rescanning the tree
+    # -> every (valid) directory is watched, new directories are watched once they are created
+    # -> the changed file paths are given in batches once they are quiet for DEBOUNCE_SECONDS
+    def __init__(self, root_directory, is_recursive, filter: DataFilter):
+        self.__is_recursive = is_recursive
+        self.__filter = filter
+        self.__directories = {}
+        self.__changed_files = {}
+        self.__is_overflowed = False
+        self.__changed = asyncio.Event()
+        self.__loop = asyncio.get_running_loop()
+
+        self.__libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.__fd = self.__libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.__fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.__watch_tree(root_directory, is_new=False)
+        self.__loop.add_reader(self.__fd, self.__read_events)
+
+    def close(self):
+        self.__loop.remove_reader(self.__fd)
+        os.close(self.__fd)
+
+    async def changed_files(self):
+        # None -> the kernel dropped events (the queue overflowed), the whole tree has to be checked
+        while True:
+            if self.__is_overflowed:
+                self.__is_overflowed = False
+                yield None
+                continue
+
+            if not self.__changed_files:
+                self.__changed.clear()
+                await self.__changed.wait()
+                continue
+
+            now = self.__loop.time()
+            quiet_files = [
+                file_path
+                for file_path, changed_at in self.__changed_files.items()
+                if now - changed_at >= DEBOUNCE_SECONDS
+            ]
+            if not quiet_files:
+                # until the first file gets quiet
+                await asyncio.sleep(
+                    DEBOUNCE_SECONDS - (now - min(self.__changed_files.values()))
+                )
+                continue
+
+            for file_path in quiet_files:
+                del self.__changed_files[file_path]
+            yield quiet_files
+
+    def __watch_tree(self, directory, is_new):
+        # is_new -> the files created before the watch was added are changed files too
+        directories = [directory]
+        while directories:
+            dir_path = directories.pop()
+            if not self.__filter.is_valid_directory(dir_path):
+                continue
+
+            wd = self.__libc.inotify_add_watch(
+                self.__fd, os.fsencode(dir_path), _WATCH_MASK
+            )
+            if wd < 0:
+                # removed in the meantime/unreadable -> the same as scanning, skip it
+                if ctypes.get_errno() in (errno.ENOENT, errno.EACCES, errno.ENOTDIR):
+                    continue
+                raise OSError(
+                    ctypes.get_errno(), f"inotify_add_watch failed: {dir_path}"
+                )
+            self.__directories[wd] = dir_path
+
+            if not self.__is_recursive and not is_new:
+                continue
+
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if self.__is_recursive:
+                                directories.append(entry.path)
+                        elif is_new:
+                            self.__changed_files[entry.path] = self.__loop.time()
+            except OSError:
+                continue
+
+    def __read_events(self):
+        try:
+            data = os.read(self.__fd, _READ_LENGTH)
+        except BlockingIOError:
+            return
+
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, name_length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = os.fsdecode(data[offset : offset + name_length].rstrip(b"\0"))
+            offset += name_length
+
+            if mask & _IN_Q_OVERFLOW:
+                self.__is_overflowed = True
+                continue
+            if mask & _IN_IGNORED:
+                # the directory was removed
+                self.__directories.pop(wd, None)
+                continue
+            if wd not in self.__directories:
+                continue
+
+            path = os.path.join(self.__directories[wd], name)
+            if mask & _IN_ISDIR:
+                # a new (or moved in) directory -> watched along with what it already has
+                if self.__is_recursive and mask & (_IN_CREATE | _IN_MOVED_TO):
+                    self.__watch_tree(path, is_new=True)
+                continue
+
+            self.__changed_files[path] = self.__loop.time()
+
+        self.__changed.set()
@@ -3,7 +3,7 @@ from colorama import Fore
 from ._data_preparer import DataFilter
 from ..config_manager.config import Config
 from ..cloudmap import get_cloudmap
-from ..utils import convert_bytes
+from ..utils import convert_bytes, echo
 
 
 def list_pushed_files(config: Config):
@@ -31,6 +31,6 @@ def list_pushed_files(config: Config):
             continue
 
         count += 1
-        print(
+        echo(
             f"[{count}] {file_name}  - {Fore.GREEN}{convert_bytes(file_size)}{Fore.RESET}"
         )
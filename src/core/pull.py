@@ -1,125 +1,642 @@
 import os
 import asyncio
-import threading
+from collections import Counter, deque
 
 from colorama import Fore
 from telethon import TelegramClient
+from telethon.errors import FileReferenceExpiredError
 
 from ._data_preparer import PulledDataPreparer
+from ._retry import retrier
+from ._channel import get_cloud_channel
+from ._downloader import download_document
+from ._scheduler import scheduler, MAX_TRANSFERS
 from ..config_manager.config import Config
-from ..protector import decrypt_file
-from ..utils import logging, read_file, read_file_in_chunk
-from ..cloudmap import get_cloudmap
+from ..compressor import decompress, Decompressor
+from ..protector import decrypt_file, decrypt_chunks, decrypt_object
+from ..utils import (
+    logging,
+    read_file,
+    write_file,
+    get_random_number,
+    get_document_info,
+)
+from ..cloudmap import (
+    get_cloudmap,
+    get_document,
+    update_documents,
+    get_downloaded_part_size,
+    add_download_journal_part,
+    delete_download_journal_parts,
+    get_written_parts,
+    add_written_part,
+    delete_written_parts,
+)
 from ..config_manager.config_loader import get_cloud_channel_id
-from ..constants import CHUNK_LENGTH_FOR_LARGE_FILE, PREPARED_DATA_CACHE_PATH
+from ..constants import (
+    CHUNK_LENGTH_FOR_LARGE_FILE,
+    PREPARED_DATA_CACHE_PATH,
+    DOWNLOAD_STAGING_PATH,
+)
+
+# files being pulled at the time -> bounds the cache and the decrypting, the transfers are limited by the scheduler
+SEMAPHORE = asyncio.Semaphore(MAX_TRANSFERS)
+# parts of a big file downloaded ahead of the one being written -> bounds the staging area a file uses
+STREAMING_WINDOW = 8
+# get_messages takes at most 100 ids
+MAX_IDS_PER_REQUEST = 100
+# a big file is written under a temporary name -> only a complete file gets the real name
+PULLING_FILE_SUFFIX = ".part"
+
+
+class _DocumentResolver:
+    # The document of every pushed message is stored in the cloudmap -> it is downloaded without getting the message
+    # Telegram expires the file references after a while -> they are refreshed only when a download is refused
+    # -> messages waiting for a refresh at the same time are got together, up to 100 per get_messages call
+    def __init__(self, client: TelegramClient, cloud_channel):
+        self.__client = client
+        self.__cloud_channel = cloud_channel
+        self.__pending = {}
+        self.__flushing = None
+        self.__refreshed = 0
+
+    @property
+    def refreshed(self):
+        return self.__refreshed
+
+    async def get(self, msg_id):
+        document = await asyncio.to_thread(get_document, msg_id)
+        if document is None:
+            # pushed before the documents were stored -> got from Telegram once
+            document = await self.refresh(msg_id)
+
+        return document
+
+    async def prefetch(self, msg_ids):
+        # the parts/chunks of a file are known at once -> the missing ones are got in batches beforehand
+        # instead of one by one as the scheduler lets their downloads start
+        def get_missing():
+            return [msg_id for msg_id in msg_ids if get_document(msg_id) is None]
+
+        missing_msg_ids = await asyncio.to_thread(get_missing)
+        await asyncio.gather(*(self.refresh(msg_id) for msg_id in missing_msg_ids))
+
+    async def refresh(self, msg_id):
+        if msg_id not in self.__pending:
+            self.__pending[msg_id] = asyncio.get_running_loop().create_future()
+            if self.__flushing is None:
+                self.__flushing = asyncio.create_task(self.__flush())
+
+        # shield -> cancelling one waiting download does not cancel the refresh others wait for
+        return await asyncio.shield(self.__pending[msg_id])
+
+    async def __flush(self):
+        # let the other downloads being refused at the same time add their messages first
+        await asyncio.sleep(0)
+
+        while self.__pending:
+            msg_ids = list(self.__pending)[:MAX_IDS_PER_REQUEST]
+            futures = [self.__pending.pop(msg_id) for msg_id in msg_ids]
 
-# 8 upload/retrieve files at the time
-SEMAPHORE = asyncio.Semaphore(8)
+            try:
+                msgs = await retrier.call(
+                    self.__client.get_messages, self.__cloud_channel, ids=msg_ids
+                )
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+                continue
+
+            documents = [get_document_info(msg) for msg in msgs if msg is not None]
+            await update_documents(documents)
+            self.__refreshed += len(documents)
+
+            for msg_id, msg, future in zip(msg_ids, msgs, futures):
+                if msg is None:
+                    future.set_exception(
+                        RuntimeError(f"Message {msg_id} not found in the cloud channel")
+                    )
+                else:
+                    future.set_result(get_document_info(msg))
 
+        self.__flushing = None
 
-async def _download_small_file(client: TelegramClient, cloud_channel, msg_id):
-    msg = await client.get_messages(cloud_channel, ids=msg_id)
-    file_from_cloud = os.path.join(
-        PREPARED_DATA_CACHE_PATH, msg.document.attributes[0].file_name
-    )
-    await client.download_file(msg.document, file=file_from_cloud, part_size_kb=512)
 
-    return file_from_cloud
+async def _download_document(
+    client: TelegramClient,
+    documents: _DocumentResolver,
+    msg_id,
+    download_dir,
+    file_name=None,
+):
+    # every download (file, part, chunk or pack) takes a scheduler slot
+    async with scheduler.slot():
+        document = await documents.get(msg_id)
+        if file_name is None:
+            file_name = document["file_name"]
+        file_from_cloud = os.path.join(download_dir, file_name)
+
+        # the blocks are retried on their own inside the downloader
+        with scheduler.track(document["size"]):
+            try:
+                await download_document(client, document, file_from_cloud)
+            except FileReferenceExpiredError:
+                document = await documents.refresh(msg_id)
+                await download_document(client, document, file_from_cloud)
 
+    return file_from_cloud
 
-async def _merge_file_parts(file_parts):
-    loop = asyncio.get_running_loop()
-    future = loop.create_future()
 
-    def merge():
-        any_file_part_name = os.path.basename(file_parts[0])
-        any_file_part_name_without_num = any_file_part_name[
-            any_file_part_name.index("_") + 1 :
-        ]
-        merged_file = os.path.join(
-            PREPARED_DATA_CACHE_PATH,
-            any_file_part_name_without_num,
+async def _download_small_file(client: TelegramClient, documents, msg_id, download_dir):
+    return await _download_document(client, documents, msg_id, download_dir)
+
+
+class _PartStager:
+    # Parts of big files and chunks are downloaded into the staging area which is kept across runs
+    # -> a part is named by its channel and message (a message never changes)
+    # -> the download journal records the parts which are completely downloaded
+    # -> pulling again after an interruption reuses them (once their GCM tags are verified)
+    def __init__(
+        self, client: TelegramClient, documents: _DocumentResolver, symmetric_key
+    ):
+        self.__client = client
+        self.__documents = documents
+        self.__symmetric_key = symmetric_key
+        self.__channel_id = get_cloud_channel_id()
+        # how many pulled files are using each part -> the part is removed after the last one
+        self.__part_users = Counter()
+        self.__fetches = {}
+        self.__reused_parts = 0
+
+        os.makedirs(DOWNLOAD_STAGING_PATH, exist_ok=True)
+
+    @property
+    def reused_parts(self):
+        return self.__reused_parts
+
+    async def fetch(self, msg_id):
+        self.__part_users[msg_id] += 1
+        if msg_id not in self.__fetches:
+            self.__fetches[msg_id] = asyncio.create_task(self.__fetch(msg_id))
+
+        # shield -> cancelling one waiting file does not cancel the download others wait for
+        return await asyncio.shield(self.__fetches[msg_id])
+
+    async def release(self, msg_ids):
+        # the file using the parts is pulled -> parts no other file uses are not needed anymore
+        removed_msg_ids = []
+        for msg_id in msg_ids:
+            self.__part_users[msg_id] -= 1
+            if self.__part_users[msg_id] == 0:
+                os.remove(self.__get_part_path(msg_id))
+                del self.__fetches[msg_id]
+                removed_msg_ids.append(msg_id)
+
+        await delete_download_journal_parts(removed_msg_ids)
+
+    async def discard(self, msg_ids):
+        # parts which are not needed anymore without being fetched (already written into their file)
+        # -> left behind when a pull is interrupted right after writing them
+        discarded_msg_ids = []
+        for msg_id in msg_ids:
+            if self.__part_users[msg_id] == 0 and msg_id not in self.__fetches:
+                part_path = self.__get_part_path(msg_id)
+                if os.path.exists(part_path):
+                    os.remove(part_path)
+                discarded_msg_ids.append(msg_id)
+
+        await delete_download_journal_parts(discarded_msg_ids)
+
+    async def __fetch(self, msg_id):
+        part_path = self.__get_part_path(msg_id)
+
+        part_size = await asyncio.to_thread(get_downloaded_part_size, msg_id)
+        if part_size is not None and await asyncio.to_thread(
+            self.__is_valid_part, part_path, part_size
+        ):
+            self.__reused_parts += 1
+            return part_path
+
+        # downloaded under a temporary name -> a part in the staging area is always complete
+        downloading_part_path = await _download_document(
+            self.__client,
+            self.__documents,
+            msg_id,
+            DOWNLOAD_STAGING_PATH,
+            os.path.basename(part_path) + ".part",
         )
+        os.replace(downloading_part_path, part_path)
+        await add_download_journal_part(msg_id, os.path.getsize(part_path))
 
-        with open(merged_file, "wb") as f:
-            for i in range(1, len(file_parts) + 1):
-                file_part = os.path.join(
-                    PREPARED_DATA_CACHE_PATH,
-                    str(i) + "_" + any_file_part_name_without_num,
-                )
-                for encrypted_chunk in read_file_in_chunk(file_part, is_encrypted=True):
-                    f.write(encrypted_chunk)
-                os.remove(file_part)
+        return part_path
 
-        if not future.done():
-            loop.call_soon_threadsafe(future.set_result, merged_file)
+    def __is_valid_part(self, part_path, part_size):
+        if not os.path.exists(part_path) or os.path.getsize(part_path) != part_size:
+            return False
 
-    merging_thread = threading.Thread(target=merge, daemon=True)
-    merging_thread.start()
+        # every part/chunk is encrypted on its own -> its GCM tags verify it
+        try:
+            decrypt_object(self.__symmetric_key, read_file(part_path))
+        except ValueError:
+            return False
+
+        return True
 
-    return await future
+    def __get_part_path(self, msg_id):
+        return os.path.join(
+            DOWNLOAD_STAGING_PATH, str(self.__channel_id) + "_" + str(msg_id)
+        )
 
 
 async def _download_big_file(
-    client: TelegramClient, cloud_channel, msg_id, is_single_file=False
+    client: TelegramClient,
+    documents: _DocumentResolver,
+    symmetric_key,
+    msg_id,
+    download_dir,
+    saved_path,
+    file_size,
+    codec,
+    stager: _PartStager,
 ):
-    if is_single_file:
-        semaphore = asyncio.Semaphore(8)
-    else:
-        semaphore = asyncio.Semaphore(3)
+    # a part which still fails after retrying (or Ctrl+C -> ConnectionError) raises
+    file_info_path = await _download_document(client, documents, msg_id, download_dir)
+    file_parts = await asyncio.to_thread(read_file, file_info_path, "r", True)
+    os.remove(file_info_path)
 
-    async def download(id):
-        async with semaphore:
+    # file parts are named "<part num>_<file name>"
+    # big files pushed before kept the cache path of the part -> only its base name counts
+    part_msg_ids = [
+        file_parts[file_part]
+        for file_part in sorted(
+            file_parts, key=lambda i: int(os.path.basename(i).split("_", 1)[0])
+        )
+    ]
+    await documents.prefetch(part_msg_ids)
+
+    # every part is decrypted in memory and written straight to the pulled file
+    # -> no merged copy of the encrypted file
+    # the file is written under a temporary name -> an interrupted pull never leaves a partly written file
+    # under the real name (which the next pull would take as already pulled)
+    pulling_path = saved_path + PULLING_FILE_SUFFIX
+    try:
+        if codec is None:
+            await _write_parts_in_place(
+                symmetric_key,
+                msg_id,
+                part_msg_ids,
+                pulling_path,
+                file_size,
+                stager,
+            )
+        else:
+            await _write_parts_in_order(
+                symmetric_key, part_msg_ids, pulling_path, codec, stager
+            )
+
+    except ValueError:
+        # the parts are kept in the staging area, the file is not usable
+        if os.path.exists(pulling_path):
+            os.remove(pulling_path)
+        await delete_written_parts(msg_id, pulling_path)
+        return {"success": False, "error": "Invalid password"}
+
+    os.replace(pulling_path, saved_path)
+    await delete_written_parts(msg_id, pulling_path)
+
+    return {"success": True}
+
+
+async def _write_parts_in_place(
+    symmetric_key, msg_id, part_msg_ids, pulling_path, file_size, stager: _PartStager
+):
+    # every part but the last one holds CHUNK_LENGTH_FOR_LARGE_FILE bytes of the file
+    # -> a part is written at its offset as soon as it is downloaded, a slow part does not hold up the others
+    # -> the written parts are recorded (written_parts) -> an interrupted pull goes on with the same file
+    # and only downloads/writes the missing parts, a written part leaves the staging area right away
+    part_count = len(part_msg_ids)
+    # bit n -> part n is written
+    written_parts = bytearray((part_count + 7) // 8)
+    window = asyncio.Semaphore(STREAMING_WINDOW)
+
+    # only the parts recorded for this file are kept -> a leftover file without records is written from scratch
+    # the last part is always written again -> it sets where the file ends
+    recorded_parts = []
+    if os.path.exists(pulling_path):
+        recorded_parts = [
+            part_num
+            for part_num in await asyncio.to_thread(
+                get_written_parts, msg_id, pulling_path
+            )
+            if part_num < part_count - 1
+        ]
+    is_resuming = bool(recorded_parts)
+    if is_resuming:
+        for part_num in recorded_parts:
+            written_parts[part_num // 8] |= 1 << (part_num % 8)
+    else:
+        # recorded for a file which is gone -> written again
+        await delete_written_parts(msg_id, pulling_path)
+
+    def is_written(part_num):
+        return written_parts[part_num // 8] & (1 << (part_num % 8))
+
+    # resuming -> no O_TRUNC, the parts written by the interrupted pull are kept
+    flags = os.O_WRONLY | os.O_CREAT
+    if not is_resuming:
+        flags |= os.O_TRUNC
+    fd = os.open(pulling_path, flags, 0o666)
+    try:
+        # the final size right away -> nothing after the end of the file survives from before
+        os.ftruncate(fd, file_size)
+        if not is_resuming:
+            # the blocks of the file are allocated at once instead of growing it part by part
             try:
-                msg = await client.get_messages(cloud_channel, ids=id)
-                file_from_cloud = os.path.join(
-                    PREPARED_DATA_CACHE_PATH, msg.document.attributes[0].file_name
-                )
-                await client.download_file(
-                    msg.document, file=file_from_cloud, part_size_kb=512
-                )
-                return file_from_cloud
+                os.posix_fallocate(fd, 0, file_size)
+            except (AttributeError, OSError):
+                # not supported (by the OS or the file system) -> a sparse file of the final size
+                pass
+
+        def write(part_num, part_path):
+            original_part, _ = decrypt_object(symmetric_key, read_file(part_path))
+
+            offset = part_num * CHUNK_LENGTH_FOR_LARGE_FILE
+            is_last_part = part_num == part_count - 1
+            if not is_last_part and len(original_part) != CHUNK_LENGTH_FOR_LARGE_FILE:
+                raise ValueError(f"Part {part_num + 1} has an unexpected size")
+
+            os.pwrite(fd, original_part, offset)
+            if is_last_part and offset + len(original_part) != file_size:
+                # the file changed while it was pushed -> the last part tells its real end
+                os.ftruncate(fd, offset + len(original_part))
+            # on the disk before it is recorded -> a power loss cannot leave a recorded part unwritten
+            os.fsync(fd)
+
+        async def write_part(part_num):
+            async with window:
+                part_msg_id = part_msg_ids[part_num]
+                part_path = await stager.fetch(part_msg_id)
+                await asyncio.to_thread(write, part_num, part_path)
+
+                written_parts[part_num // 8] |= 1 << (part_num % 8)
+                await add_written_part(msg_id, pulling_path, part_num)
+                # written (and recorded) -> the part leaves the staging area
+                await stager.release([part_msg_id])
+
+        await stager.discard(
+            [
+                part_msg_ids[part_num]
+                for part_num in range(part_count)
+                if is_written(part_num)
+            ]
+        )
+        tasks = [
+            asyncio.create_task(write_part(part_num))
+            for part_num in range(part_count)
+            if not is_written(part_num)
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # do not leave the other parts downloading in the background
+            for task in tasks:
+                task.cancel()
+            raise
 
-            except ConnectionError:
-                return
+    finally:
+        os.close(fd)
 
-    file_info_path = await download(msg_id)
-    if file_info_path is None:
-        # file_info_path is None when pressing Ctrl+C to stop the program
-        # which cancels all the tasks -> client.download_file coro will raise ConnectionError
-        # after that the worker download will return to stop -> None
-        return
+    if not all(is_written(part_num) for part_num in range(part_count)):
+        raise RuntimeError(f"Not every part of {pulling_path} was written")
 
-    file_parts = await asyncio.to_thread(read_file, file_info_path, "r", True)
-    os.remove(file_info_path)
 
-    tasks = [download(file_parts[file_part]) for file_part in file_parts]
-    downloaded_file_parts = []
-    for task in asyncio.as_completed(tasks):
-        downloaded_file_part = await task
-        downloaded_file_parts.append(downloaded_file_part)
+async def _write_parts_in_order(
+    symmetric_key, part_msg_ids, saved_path, codec, stager: _PartStager
+):
+    # the compressed stream runs across the parts -> where a part ends up is only known after the ones before it
+    # -> they are decompressed and written in order, downloading at most STREAMING_WINDOW parts ahead
+    # a written part leaves the staging area right away -> at most STREAMING_WINDOW parts are staged
+    # the decompressor cannot be resumed in the middle -> an interrupted pull downloads the released parts again
+    # only decompressing has to wait for the parts before -> the parts of the window are decrypted in parallel
+    decompressor = Decompressor(codec)
+
+    def decrypt(part_path):
+        return decrypt_object(symmetric_key, read_file(part_path))[0]
+
+    async def decrypt_part(part_msg_id):
+        part_path = await stager.fetch(part_msg_id)
+        return await asyncio.to_thread(decrypt, part_path)
+
+    def write(f, original_part):
+        for original_chunk in decompressor.decompress(original_part):
+            f.write(original_chunk)
+
+    tasks = deque()
+    next_part_num = 0
+    try:
+        with open(saved_path, "wb") as f:
+            for part_msg_id in part_msg_ids:
+                while len(tasks) < STREAMING_WINDOW and next_part_num < len(
+                    part_msg_ids
+                ):
+                    tasks.append(
+                        asyncio.create_task(decrypt_part(part_msg_ids[next_part_num]))
+                    )
+                    next_part_num += 1
+
+                original_part = await tasks.popleft()
+                await asyncio.to_thread(write, f, original_part)
+                await stager.release([part_msg_id])
+
+            await asyncio.to_thread(f.write, decompressor.flush())
+
+    finally:
+        # do not leave the other parts downloading in the background
+        for task in tasks:
+            task.cancel()
+
+
+async def _download_chunked_file(
+    client: TelegramClient,
+    documents: _DocumentResolver,
+    symmetric_key,
+    msg_id,
+    download_dir,
+    saved_path,
+    stager: _PartStager,
+):
+    chunk_info_path = await _download_document(client, documents, msg_id, download_dir)
+    chunk_info = await asyncio.to_thread(read_file, chunk_info_path, "r", True)
+    os.remove(chunk_info_path)
+
+    # a chunk may appear several times in a file -> download it once
+    # chunks shared by other files/versions are staged once as well
+    chunk_msg_ids = list({chunk_msg_id for chunk_msg_id, _ in chunk_info})
+    await documents.prefetch(chunk_msg_ids)
+    tasks = [
+        asyncio.create_task(stager.fetch(chunk_msg_id))
+        for chunk_msg_id in chunk_msg_ids
+    ]
+    try:
+        chunk_paths = dict(zip(chunk_msg_ids, await asyncio.gather(*tasks)))
+
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    def merge():
+        # chunks have different sizes -> each one is decrypted on its own then written in order
+        encrypted_chunks = (
+            read_file(chunk_paths[chunk_msg_id]) for chunk_msg_id, _ in chunk_info
+        )
+        # the same as big files -> the real name only once the whole file is written
+        pulling_path = saved_path + PULLING_FILE_SUFFIX
+        try:
+            with open(pulling_path, "wb") as f:
+                for original_chunk in decrypt_chunks(symmetric_key, encrypted_chunks):
+                    f.write(original_chunk)
+        except ValueError:
+            # not decryptable -> nothing usable is left behind
+            os.remove(pulling_path)
+            raise
+
+        os.replace(pulling_path, saved_path)
+
+    await asyncio.to_thread(merge)
+    await stager.release(chunk_msg_ids)
+
+
+class _PackCache:
+    # Packed files share their pack -> a pack is downloaded once, when the first of its files is pulled
+    # only packs of the pulled files are downloaded
+    def __init__(self, client: TelegramClient, documents: _DocumentResolver, files):
+        self.__client = client
+        self.__documents = documents
+        # how many pulled files still need each pack -> the pack is removed after the last one
+        self.__pack_users = Counter(
+            file["msg_id"] for file in files if file["layout"] == "pack"
+        )
+        self.__downloads = {}
+
+    async def read(self, msg_id, offset, length):
+        if msg_id not in self.__downloads:
+            self.__downloads[msg_id] = asyncio.create_task(self.__download(msg_id))
 
-    return await _merge_file_parts(downloaded_file_parts)
+        # shield -> cancelling one waiting file does not cancel the download others wait for
+        pack_path = await asyncio.shield(self.__downloads[msg_id])
+
+        def read():
+            with open(pack_path, "rb") as f:
+                f.seek(offset)
+                return f.read(length)
+
+        encrypted_data = await asyncio.to_thread(read)
+
+        self.__pack_users[msg_id] -= 1
+        if self.__pack_users[msg_id] == 0:
+            os.remove(pack_path)
+
+        return encrypted_data
+
+    async def __download(self, msg_id):
+        return await _download_document(
+            self.__client,
+            self.__documents,
+            msg_id,
+            PREPARED_DATA_CACHE_PATH,
+            "pack_" + str(msg_id),
+        )
+
+
+async def _download_packed_file(symmetric_key, file, pack_cache: _PackCache):
+    encrypted_data = await pack_cache.read(
+        file["msg_id"], file["pack_offset"], file["pack_length"]
+    )
+
+    def decrypt():
+        original_data, codec = decrypt_object(
+            symmetric_key, encrypted_data, file["codec"]
+        )
+        original_data = decompress(original_data, codec)
+        write_file(file["saved_path"], original_data)
+
+    await asyncio.to_thread(decrypt)
 
 
 async def _download_file(
-    client: TelegramClient, cloud_channel, symmetric_key, file, is_single_file=False
+    client: TelegramClient,
+    documents: _DocumentResolver,
+    symmetric_key,
+    file,
+    pack_cache: _PackCache,
+    stager: _PartStager,
 ):
     async with SEMAPHORE:
         logging(f"{Fore.YELLOW}Pulling{Fore.RESET}  {file['saved_path']}")
 
+        if file["layout"] == "pack":
+            try:
+                await _download_packed_file(symmetric_key, file, pack_cache)
+            except ConnectionError:
+                # the same as below -> Ctrl+C was pressed
+                await asyncio.sleep(0.1)
+                return
+
+            return file["saved_path"]
+
+        # every pulled file gets its own directory in the cache
+        # -> deduped files pointing at the same message do not collide
+        download_dir = os.path.join(PREPARED_DATA_CACHE_PATH, get_random_number())
+        os.makedirs(download_dir)
+
+        # files pushed before the layout was recorded are small/big files by their size
+        layout = file["layout"]
+        if layout is None:
+            layout = (
+                "small" if file["file_size"] < CHUNK_LENGTH_FOR_LARGE_FILE else "big"
+            )
+
         try:
-            if file["file_size"] < CHUNK_LENGTH_FOR_LARGE_FILE:
-                file_from_cloud = await _download_small_file(
-                    client, cloud_channel, file["msg_id"]
+            if layout == "cdc":
+                await _download_chunked_file(
+                    client,
+                    documents,
+                    symmetric_key,
+                    file["msg_id"],
+                    download_dir,
+                    file["saved_path"],
+                    stager,
                 )
-            else:
-                file_from_cloud = await _download_big_file(
+                os.rmdir(download_dir)
+
+                return file["saved_path"]
+
+            elif layout == "big":
+                result = await _download_big_file(
                     client,
-                    cloud_channel,
+                    documents,
+                    symmetric_key,
                     file["msg_id"],
-                    is_single_file=is_single_file,
+                    download_dir,
+                    file["saved_path"],
+                    file["file_size"],
+                    file["codec"],
+                    stager,
                 )
+                os.rmdir(download_dir)
+
+                if not result["success"]:
+                    logging(
+                        f"{Fore.RED}Failed{Fore.RESET} - {result['error']}   {file['saved_path']}"
+                    )
+                    return
+
+                return file["saved_path"]
+
+            file_from_cloud = await _download_small_file(
+                client, documents, file["msg_id"], download_dir
+            )
         except ConnectionError:
             # This exception raises when pressing Ctrl+C to stop the program
             # which cancels all the tasks -> ConnectionError will be raised in client.download_file
@@ -133,33 +650,63 @@ async def _download_file(
             await asyncio.sleep(0.1)
             return
 
-        await decrypt_file(symmetric_key, file_from_cloud, file["saved_path"])
+        await decrypt_file(
+            symmetric_key, file_from_cloud, file["saved_path"], file["codec"]
+        )
         os.remove(file_from_cloud)
+        os.rmdir(download_dir)
 
         return file["saved_path"]
 
 
+async def _finish_pulling(documents: _DocumentResolver, stager: _PartStager):
+    if documents.refreshed:
+        logging(
+            f"{Fore.BLUE}Refreshed{Fore.RESET} {documents.refreshed} file references"
+        )
+    if stager.reused_parts:
+        logging(
+            f"{Fore.GREEN}Resumed{Fore.RESET} {stager.reused_parts} parts from the staging area"
+        )
+    scheduler.log_stats()
+    retrier.log_stats()
+
+
 async def pull_data(client: TelegramClient, symmetric_key, config: Config):
-    os.makedirs(PREPARED_DATA_CACHE_PATH)
+    # a daemon runs one job after another in the same cache
+    os.makedirs(PREPARED_DATA_CACHE_PATH, exist_ok=True)
+
+    cloud_channel = await get_cloud_channel(client)
+    documents = _DocumentResolver(client, cloud_channel)
+    stager = _PartStager(client, documents, symmetric_key)
 
-    cloud_channel = await client.get_entity(get_cloud_channel_id())
+    scheduler.reset_stats()
+    retrier.reset_stats()
+
+    async def pull_file(file, pack_cache):
+        try:
+            return await _download_file(
+                client, documents, symmetric_key, file, pack_cache, stager
+            )
+        except Exception as e:
+            # one file failing (out of retries, ...) does not stop the others -> pulled again next time
+            logging(f"{Fore.RED}Failed{Fore.RESET} - {e}   {file['saved_path']}")
 
     if config.target_path["is_file"]:
-        file = {}
         # get the lastest file
         reversed_cloudmap = reversed(get_cloudmap())
         for pushed_file in reversed_cloudmap:
             file_name = pushed_file["file_name"]
             if file_name == os.path.basename(config.target_path["value"]):
-                file["msg_id"] = pushed_file["msg_id"]
-                file["file_size"] = pushed_file["file_size"]
-                file["saved_path"] = os.path.abspath(file_name)
+                file = dict(pushed_file, saved_path=os.path.abspath(file_name))
+                pack_cache = _PackCache(client, documents, [file])
 
                 try:
-                    result = await _download_file(
-                        client, cloud_channel, symmetric_key, file, is_single_file=True
-                    )
-                    logging(f"{Fore.GREEN}Pulled{Fore.RESET}   {result}")
+                    result = await pull_file(file, pack_cache)
+                    # None -> failed (already logged)
+                    if result is not None:
+                        logging(f"{Fore.GREEN}Pulled{Fore.RESET}   {result}")
+                    await _finish_pulling(documents, stager)
                     return
 
                 except asyncio.exceptions.CancelledError:
@@ -176,20 +723,34 @@ async def pull_data(client: TelegramClient, symmetric_key, config: Config):
             max_size=config.max_size,
             in_name=config.in_name,
         ).prepare()
+        pack_cache = _PackCache(client, documents, prepared_data)
+        # tasks created here -> cancelling the pull (Ctrl+C, a daemon job being cancelled) reaches every download
         tasks = [
-            _download_file(client, cloud_channel, symmetric_key, file)
-            for file in prepared_data
+            asyncio.create_task(pull_file(file, pack_cache)) for file in prepared_data
         ]
 
         count = 0
-        for task in asyncio.as_completed(tasks):
-            try:
+        try:
+            for task in asyncio.as_completed(tasks):
                 result = await task
+                if result is None:
+                    # failed (already logged) -> pulled again next time
+                    continue
                 count += 1
                 logging(
                     f"{Fore.GREEN}Pulled{Fore.RESET} {str(count).zfill(len(str(len(tasks))))}/{len(tasks)}   {result}"
                 )
-            except asyncio.exceptions.CancelledError:
-                # This exception raises when pressing Ctrl+C to stop the program
-                # which cancels all the coros -> return to stop immediately (no need to iterate the rest)
-                return
+
+        except asyncio.exceptions.CancelledError:
+            # This exception raises when pressing Ctrl+C to stop the program
+            # -> return to stop immediately (no need to iterate the rest)
+            return
+
+        finally:
+            # the downloads are stopped before returning
+            # -> none of them keeps writing into the cache which is cleaned after the pull
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        await _finish_pulling(documents, stager)
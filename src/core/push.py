@@ -1,6 +1,9 @@
 import os
+import json
+import hashlib
 import asyncio
 import threading
+import contextvars
 import time
 from zipfile import ZipFile
 
@@ -8,107 +11,274 @@ from colorama import Fore
 from telethon import TelegramClient
 
 from ._data_preparer import PushedDataPreparer
+from ._retry import retrier
+from ._scheduler import scheduler, MAX_TRANSFERS
+from ._channel import get_cloud_channel
+from ._uploader import upload_buffer
+from ._watcher import DirectoryWatcher
+from ..chunker import read_file_in_content_defined_chunk
+from ..compressor import Compressor, choose_codec
 from ..config_manager.config import Config
-from ..protector import encrypt_file
+from ..protector import encrypt_data, encrypt_chunks, encrypt_object
 from ..constants import CHUNK_LENGTH_FOR_LARGE_FILE, PREPARED_DATA_CACHE_PATH
 from ..config_manager.config_loader import get_cloud_channel_id
-from ..cloudmap import update_cloudmap
+from ..cloudmap import (
+    update_cloudmap,
+    update_file_index,
+    get_file_index_entry,
+    get_pushed_file_by_checksum,
+    get_chunk_msg_id,
+    add_chunk,
+    get_upload_journal,
+    add_upload_journal_part,
+    delete_upload_journal,
+    update_documents,
+)
 from ..utils import (
     logging,
-    async_get_checksum,
     get_random_number,
-    write_file,
-    read_file_in_chunk,
+    get_checksum,
+    get_stat_info,
+    get_document_info,
+    convert_bytes,
 )
 
-# 8 upload/retrieve files at the time
-SEMAPHORE = asyncio.Semaphore(8)
+# as many workers as the scheduler may allow transfers -> the scheduler is what limits uploading
+UPLOAD_WORKERS = MAX_TRANSFERS
+# scanned file paths waiting for a worker -> the scanner pauses when the queue is full
+QUEUE_SIZE = UPLOAD_WORKERS * 4
+# how often the scanner waiting for room in the queue checks whether the push stopped
+SCAN_WAITING_SECONDS = 0.5
 
 
-async def _upload_small_file(client: TelegramClient, cloud_channel, file_path):
-    file = await client.upload_file(file_path, file_name=file_path, part_size_kb=512)
-    msg = await client.send_file(cloud_channel, file)
-    os.remove(file_path)
+async def _upload_buffer(client: TelegramClient, cloud_channel, data, file_name):
+    # the caller holds a scheduler slot for the upload
+    # upload straight from memory -> the encrypted data never touches the disk
+    # the sub-parts are retried on their own inside the uploader
+    with scheduler.track(len(data)):
+        file = await upload_buffer(client, data, file_name)
+    msg = await retrier.call(client.send_file, cloud_channel, file)
+    # pulling downloads it without asking Telegram for the message first
+    await update_documents([get_document_info(msg)])
 
     return msg.id
 
 
-async def _split_big_file(file_path):
-    loop = asyncio.get_running_loop()
-    future = loop.create_future()
+async def _upload_small_file(
+    client: TelegramClient,
+    cloud_channel,
+    symmetric_key,
+    file_path,
+    file_name,
+    checksum,
+    compressor,
+):
+    async with scheduler.slot():
+        encrypted_data = await encrypt_data(
+            symmetric_key, file_path, checksum, compressor
+        )
+        return await _upload_buffer(client, cloud_channel, encrypted_data, file_name)
 
-    def split():
-        file_parts = []
-        part_num = 1
 
-        for encrypted_chunk in read_file_in_chunk(file_path, is_encrypted=True):
-            file_part = os.path.join(
-                PREPARED_DATA_CACHE_PATH,
-                str(part_num) + "_" + os.path.basename(file_path),
+async def _upload_big_file(
+    client: TelegramClient,
+    cloud_channel,
+    symmetric_key,
+    file_path,
+    file_stat,
+    file_name,
+    checksum,
+    compressor,
+):
+    # the journal identifies the file by its stat info and codec
+    # -> parts uploaded by an interrupted push are reused only if the file is unchanged
+    journal_part = _get_file_info(file_path, file_stat)
+    journal_part["codec"] = compressor.codec
+
+    journal = await asyncio.to_thread(get_upload_journal, file_path)
+    uploaded_parts = {}
+    if journal:
+        if all(
+            (part["file_size"], part["mtime_ns"], part["inode"], part["ctime_ns"])
+            == get_stat_info(file_stat)
+            and part["codec"] == journal_part["codec"]
+            for part in journal
+        ):
+            # the parts keep their names -> the same file name as the interrupted push
+            file_name = journal[0]["file_name"]
+            uploaded_parts = {part["part_num"]: part["msg_id"] for part in journal}
+            logging(
+                f"{Fore.YELLOW}Resuming{Fore.RESET} {file_path} - {len(uploaded_parts)} parts already uploaded"
+            )
+        else:
+            await delete_upload_journal(file_path)
+    journal_part["file_name"] = file_name
+
+    async def upload(part_num, file_part, encrypted_chunk):
+        msg_id = await _upload_buffer(client, cloud_channel, encrypted_chunk, file_part)
+        # recorded right away -> an interrupted push does not lose this part
+        await add_upload_journal_part(
+            dict(journal_part, part_num=part_num, msg_id=msg_id)
+        )
+        return {file_part: msg_id}
+
+    # Each encrypted chunk is sent as its own part
+    # -> prevent reaching over 2GB max
+    # -> faster when sending concurrency part files
+    encrypted_chunks = encrypt_chunks(
+        symmetric_key, file_path, checksum, compressor, uploaded_parts
+    )
+    end_of_file = object()
+    upload_info = {}
+    tasks = []
+    try:
+        part_num = 1
+        while True:
+            encrypted_chunk = await asyncio.to_thread(
+                next, encrypted_chunks, end_of_file
             )
-            write_file(file_part, encrypted_chunk)
+            if encrypted_chunk is end_of_file:
+                break
 
-            file_parts.append(file_part)
+            file_part = str(part_num) + "_" + file_name
+            if encrypted_chunk is None:
+                # uploaded by the interrupted push
+                upload_info[file_part] = uploaded_parts[part_num]
+            else:
+                # the next part is encrypted only after this one gets a scheduler slot
+                # -> the parts held in memory are the uploading ones (one per slot), this one and the few read ahead
+                # by the crypto pool (protector._map_in_order) instead of writing the encrypted file and its parts to the cache
+                tasks.append(
+                    await scheduler.submit(upload(part_num, file_part, encrypted_chunk))
+                )
             part_num += 1
 
-        if not future.done():
-            loop.call_soon_threadsafe(future.set_result, file_parts)
+        for task in asyncio.as_completed(tasks):
+            upload_info.update(await task)
 
-    splitting_thread = threading.Thread(target=split, daemon=True)
-    splitting_thread.start()
+    except BaseException:
+        # one part failed (or Ctrl+C) -> do not leave the other parts uploading in the background
+        for task in tasks:
+            task.cancel()
+        raise
 
-    return await future
+    # upload_info just contains msg_id of file_parts then no need to encrypt
+    upload_info_data = json.dumps(upload_info, ensure_ascii=False).encode()
+    async with scheduler.slot():
+        msg_id = await _upload_buffer(
+            client, cloud_channel, upload_info_data, "0_" + file_name
+        )
 
+    # the file is complete -> nothing to resume anymore
+    await delete_upload_journal(file_path)
+    return msg_id
 
-async def _upload_big_file(
-    client: TelegramClient, cloud_channel, file_path, is_single_file=False
+
+async def _upload_chunked_file(
+    client: TelegramClient,
+    cloud_channel,
+    symmetric_key,
+    file_path,
+    file_name,
+    checksum,
 ):
-    if is_single_file:
-        semaphore = asyncio.Semaphore(8)
-    else:
-        semaphore = asyncio.Semaphore(3)
+    def read_chunks():
+        for chunk in read_file_in_content_defined_chunk(file_path):
+            checksum.update(chunk)
+            yield hashlib.sha256(chunk).hexdigest(), chunk
+
+    async def upload(chunk_num, chunk_hash, chunk):
+        encrypted_chunk = await asyncio.to_thread(encrypt_object, symmetric_key, chunk)
+        msg_id = await _upload_buffer(
+            client, cloud_channel, encrypted_chunk, str(chunk_num) + "_" + file_name
+        )
+        await add_chunk(chunk_hash, msg_id, len(chunk))
+        return msg_id
+
+    # Only chunks which are not in the cloud channel yet are uploaded
+    # -> pushing a new version of a file sends just the changed chunks
+    chunks = read_chunks()
+    chunk_list = []
+    stored_chunks = {}
+    tasks = {}
+    try:
+        while True:
+            next_chunk = await asyncio.to_thread(next, chunks, None)
+            if next_chunk is None:
+                break
+
+            chunk_hash, chunk = next_chunk
+            chunk_list.append((chunk_hash, len(chunk)))
+
+            # the same chunk may also appear several times in a file -> upload it once
+            if chunk_hash in stored_chunks or chunk_hash in tasks:
+                continue
+
+            msg_id = await asyncio.to_thread(get_chunk_msg_id, chunk_hash)
+            if msg_id is not None:
+                stored_chunks[chunk_hash] = msg_id
+                continue
+
+            tasks[chunk_hash] = await scheduler.submit(
+                upload(len(chunk_list), chunk_hash, chunk)
+            )
 
-    async def upload(file_part):
-        async with semaphore:
-            try:
-                file = await client.upload_file(
-                    file_part, file_name=file_part, part_size_kb=512
-                )
-                msg = await client.send_file(cloud_channel, file)
-                os.remove(file_part)
+        for chunk_hash, task in tasks.items():
+            stored_chunks[chunk_hash] = await task
 
-                return {file_part: msg.id}
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        raise
 
-            except ConnectionError:
-                return
+    logging(
+        f"{Fore.GREEN}Chunked{Fore.RESET}  {file_path} - {len(tasks)}/{len(chunk_list)} chunks uploaded"
+    )
 
-            except FileNotFoundError:
-                # This exception raises when trying to stop the program during sending file parts (from big file)
-                # in the main thread the program will call clean_prepared_data which cleans all the encrypted file parts
-                # and the pushing process (_upload_big_file) may touch that one encrypted file part
-                # and that part is already deleted (clean by clean_prepared_data) -> FileNotFoundError
-                return
+    # chunk_info just contains msg_id and size of chunks in order then no need to encrypt
+    chunk_info = [[stored_chunks[chunk_hash], size] for chunk_hash, size in chunk_list]
+    chunk_info_data = json.dumps(chunk_info).encode()
+    async with scheduler.slot():
+        return await _upload_buffer(
+            client, cloud_channel, chunk_info_data, "0_" + file_name
+        )
 
-    # Split the big file into multiple smaller files
-    # -> prevent reaching over 2GB max
-    # -> faster when sending concurrency part files
-    file_parts = await _split_big_file(file_path)
-    os.remove(file_path)
 
-    upload_info = {}
-    tasks = [upload(file) for file in file_parts]
-    for task in asyncio.as_completed(tasks):
-        msg_id = await task
-        upload_info.update(msg_id)
+async def _dedup_file(file_path, file_stat, paranoid):
+    # dedup needs the checksum before uploading
+    # -> take it from the file index if the file is untouched, otherwise hash the file
+    indexed_file = await asyncio.to_thread(get_file_index_entry, file_path)
+    if (
+        not paranoid
+        and indexed_file is not None
+        and indexed_file[:4] == get_stat_info(file_stat)
+    ):
+        checksum = indexed_file[4]
+    else:
+        checksum = await asyncio.to_thread(get_checksum, file_path)
 
-    # upload_info just contains msg_id of file_parts then no need to encrypt
-    upload_info_path = os.path.join(
-        PREPARED_DATA_CACHE_PATH, "0_" + os.path.basename(file_path)
-    )
-    await asyncio.to_thread(write_file, upload_info_path, upload_info, "w", True)
-    msg = await upload(upload_info_path)
+    pushed_file = await asyncio.to_thread(get_pushed_file_by_checksum, checksum)
+    if pushed_file is None:
+        return
+
+    logging(f"{Fore.GREEN}Deduped{Fore.RESET}  {file_path}")
 
-    return msg[upload_info_path]
+    # the new row points at the already uploaded message(s) -> nothing to upload, nothing saved by compressing
+    pushed_file.update(_get_file_info(file_path, file_stat))
+    pushed_file["saved_size"] = 0
+    return pushed_file
+
+
+def _get_file_info(file_path, file_stat):
+    return {
+        "file_path": file_path,
+        "file_name": os.path.basename(file_path),
+        "file_size": file_stat.st_size,
+        "time": time.strftime("%d-%m-%y.%H-%M-%S"),
+        "mtime_ns": file_stat.st_mtime_ns,
+        "inode": file_stat.st_ino,
+        "ctime_ns": file_stat.st_ctime_ns,
+    }
 
 
 async def _upload_file(
@@ -116,57 +286,192 @@ async def _upload_file(
     cloud_channel,
     symmetric_key,
     file_path,
-    is_single_file=False,
+    config: Config,
 ):
-    async with SEMAPHORE:
+    logging(f"{Fore.YELLOW}Pushing{Fore.RESET}  {file_path}")
+
+    # stat before reading -> if the file changes while being pushed, the next push will hash it again
+    file_stat = os.stat(file_path)
+
+    if config.dedup:
+        pushed_file = await _dedup_file(file_path, file_stat, config.paranoid)
+        if pushed_file is not None:
+            return pushed_file
+
+    # the checksum is not known before reading the file anymore
+    # -> random numbers as the name of encrypted file, short enough so Telegram does not cut it
+    encrypted_file_name = get_random_number() + "_" + get_random_number()
+
+    # each chunk feeds both the checksum and the encryption -> the file is read only once
+    checksum = hashlib.sha256()
+
+    # codec None -> the file is stored as it is
+    compressor = Compressor(
+        await asyncio.to_thread(choose_codec, file_path) if config.compress else None
+    )
+
+    try:
+        # files are encrypted chunk by chunk in memory right before uploading
+        file_size = file_stat.st_size
+        if file_size < CHUNK_LENGTH_FOR_LARGE_FILE:
+            layout = "small"
+            msg_id = await _upload_small_file(
+                client,
+                cloud_channel,
+                symmetric_key,
+                file_path,
+                encrypted_file_name,
+                checksum,
+                compressor,
+            )
+        elif config.cdc:
+            # chunks are deduplicated by their content -> they are not compressed
+            layout = "cdc"
+            compressor.codec = None
+            msg_id = await _upload_chunked_file(
+                client,
+                cloud_channel,
+                symmetric_key,
+                file_path,
+                encrypted_file_name,
+                checksum,
+            )
+        else:
+            layout = "big"
+            msg_id = await _upload_big_file(
+                client,
+                cloud_channel,
+                symmetric_key,
+                file_path,
+                file_stat,
+                encrypted_file_name,
+                checksum,
+                compressor,
+            )
+    except ConnectionError:
+        # This exception raises when pressing Ctrl+C to stop the program
+        # which cancels all the tasks -> ConnectionError will be raised in client.upload_file
+        # sleep for 0.1 seconds just to hit an await
+        # basically if we just return without letting the coro hit an await
+        # -> the cancellation will stay pending (it does not know its already cancelled until it hit an await)
+        # though in this case, we do not even need to await sleep()
+        # since at the end it just returns a dict (not doing work like download_file) -> but still a good practice
+        # also the return statement is not necessary at all
+        # just to make it less confused whenever come back to read code
+        # -> its like Ah! return to stop the function (instead of why sleep for 0.1 after catching error then return the info???)
+        await asyncio.sleep(0.1)
+        return
+
+    pushed_file = _get_file_info(file_path, file_stat)
+    pushed_file.update(
+        {
+            "msg_id": msg_id,
+            "checksum": checksum.hexdigest(),
+            "layout": layout,
+            "codec": compressor.codec,
+            "saved_size": compressor.saved_size,
+        }
+    )
+    return pushed_file
+
+
+class _Packer:
+    # Small files are concatenated (each one encrypted on its own) into pack objects
+    # -> one message per pack instead of one message per file
+    def __init__(self, client, cloud_channel, symmetric_key, config, on_pushed):
+        self.__client = client
+        self.__cloud_channel = cloud_channel
+        self.__symmetric_key = symmetric_key
+        self.__config = config
+        self.__on_pushed = on_pushed
+        self.__lock = asyncio.Lock()
+        self.__pack = bytearray()
+        self.__packed_files = []
+
+    async def add(self, file_path):
         logging(f"{Fore.YELLOW}Pushing{Fore.RESET}  {file_path}")
 
-        # checksum is now the name of encrypted file -> prevent long file name from reaching over 255 chars
-        # adding random number to prevent checksum name conflict > two different files could have the same data
-        checksum = await async_get_checksum(file_path)
-        encrypted_file_path = os.path.join(
-            PREPARED_DATA_CACHE_PATH,
-            # take the first 15 chars since somehow Telegram sometimes cuts the file name
-            get_random_number() + "_" + checksum[:15],
+        file_stat = os.stat(file_path)
+
+        if self.__config.dedup:
+            pushed_file = await _dedup_file(
+                file_path, file_stat, self.__config.paranoid
+            )
+            if pushed_file is not None:
+                await self.__on_pushed(pushed_file)
+                return
+
+        checksum = hashlib.sha256()
+        compressor = Compressor(
+            await asyncio.to_thread(choose_codec, file_path)
+            if self.__config.compress
+            else None
+        )
+        encrypted_data = await encrypt_data(
+            self.__symmetric_key, file_path, checksum, compressor
         )
-        # encrypt file before uploading to cloud
-        await encrypt_file(symmetric_key, file_path, encrypted_file_path)
 
+        async with self.__lock:
+            packed_file = _get_file_info(file_path, file_stat)
+            packed_file.update(
+                {
+                    "checksum": checksum.hexdigest(),
+                    "layout": "pack",
+                    "codec": compressor.codec,
+                    "saved_size": compressor.saved_size,
+                    "pack_offset": len(self.__pack),
+                    "pack_length": len(encrypted_data),
+                }
+            )
+            self.__pack += encrypted_data
+            self.__packed_files.append(packed_file)
+
+            if len(self.__pack) < self.__config.pack_size:
+                return
+
+            # the pack is full -> the next files go into a new pack while this one is uploading
+            pack, packed_files = self.__take_pack()
+
+        await self.__upload(pack, packed_files)
+
+    async def flush(self):
+        async with self.__lock:
+            pack, packed_files = self.__take_pack()
+
+        if packed_files:
+            await self.__upload(pack, packed_files)
+
+    def __take_pack(self):
+        pack, packed_files = self.__pack, self.__packed_files
+        self.__pack = bytearray()
+        self.__packed_files = []
+
+        return pack, packed_files
+
+    async def __upload(self, pack, packed_files):
         try:
-            file_size = os.path.getsize(file_path)
-            if file_size < CHUNK_LENGTH_FOR_LARGE_FILE:
-                msg_id = await _upload_small_file(
-                    client, cloud_channel, encrypted_file_path
-                )
-            else:
-                msg_id = await _upload_big_file(
-                    client,
-                    cloud_channel,
-                    encrypted_file_path,
-                    is_single_file=is_single_file,
+            async with scheduler.slot():
+                msg_id = await _upload_buffer(
+                    self.__client,
+                    self.__cloud_channel,
+                    bytes(pack),
+                    get_random_number() + "_" + get_random_number(),
                 )
         except ConnectionError:
-            # This exception raises when pressing Ctrl+C to stop the program
-            # which cancels all the tasks -> ConnectionError will be raised in client.upload_file
-            # sleep for 0.1 seconds just to hit an await
-            # basically if we just return without letting the coro hit an await
-            # -> the cancellation will stay pending (it does not know its already cancelled until it hit an await)
-            # though in this case, we do not even need to await sleep()
-            # since at the end it just returns a dict (not doing work like download_file) -> but still a good practice
-            # also the return statement is not necessary at all
-            # just to make it less confused whenever come back to read code
-            # -> its like Ah! return to stop the function (instead of why sleep for 0.1 after catching error then return the info???)
+            # the same as _upload_file -> Ctrl+C was pressed
             await asyncio.sleep(0.1)
             return
+        except Exception as e:
+            # the files of the pack are not pushed -> the next push tries them again
+            for packed_file in packed_files:
+                logging(
+                    f"{Fore.RED}Failed{Fore.RESET} - {e}   {packed_file['file_path']}"
+                )
+            return
 
-        return {
-            "msg_id": msg_id,
-            "file_path": file_path,
-            "file_name": os.path.basename(file_path),
-            "file_size": file_size,
-            "checksum": checksum,
-            "time": time.strftime("%d-%m-%y.%H-%M-%S"),
-        }
+        for packed_file in packed_files:
+            packed_file["msg_id"] = msg_id
+            await self.__on_pushed(packed_file)
 
 
 async def _zip_file(dir_path, zip_file, file_paths):
@@ -181,11 +486,180 @@ async def _zip_file(dir_path, zip_file, file_paths):
     await asyncio.to_thread(zip)
 
 
+async def _push_files(
+    client: TelegramClient,
+    cloud_channel,
+    channel_id,
+    symmetric_key,
+    file_paths,
+    config: Config,
+):
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+    scanning_error = []
+    # set once the workers are gone (done, Ctrl+C or an error) -> nobody takes from the queue anymore
+    scanning_stopped = threading.Event()
+
+    def put(item):
+        # blocks this thread while the queue is full -> memory stays flat however big the tree is
+        # False -> the push stopped, the scan stops too instead of waiting for good
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        while not scanning_stopped.is_set():
+            try:
+                future.result(timeout=SCAN_WAITING_SECONDS)
+                return True
+            except TimeoutError:
+                continue
+
+        future.cancel()
+        return False
+
+    def scan():
+        try:
+            for file_path in file_paths:
+                if not put(file_path):
+                    return
+        except Exception as e:
+            scanning_error.append(e)
+        finally:
+            # None tells a worker there is nothing left to push
+            for _ in range(UPLOAD_WORKERS):
+                if not put(None):
+                    break
+
+    count = 0
+    saved_size = 0
+
+    async def record(result):
+        nonlocal count, saved_size
+
+        result["channel_id"] = channel_id
+        await update_cloudmap(result)
+        await update_file_index(result)
+
+        count += 1
+        saved_size += result.get("saved_size", 0)
+        logging(f"{Fore.GREEN}Pushed{Fore.RESET} {count}   {result['file_path']}")
+
+    packer = None
+    if config.pack_size:
+        packer = _Packer(client, cloud_channel, symmetric_key, config, record)
+
+    async def upload_worker():
+        while (file_path := await queue.get()) is not None:
+            try:
+                if (
+                    packer is not None
+                    and os.path.getsize(file_path) < CHUNK_LENGTH_FOR_LARGE_FILE
+                ):
+                    await packer.add(file_path)
+                    continue
+
+                result = await _upload_file(
+                    client, cloud_channel, symmetric_key, file_path, config
+                )
+                if result is None:
+                    # Ctrl+C was pressed -> _upload_file stopped
+                    return
+
+                await record(result)
+            except Exception as e:
+                # one file failing (removed in the meantime, out of retries, ...) does not stop the others
+                # -> it is not in the cloudmap, the next push tries it again
+                logging(f"{Fore.RED}Failed{Fore.RESET} - {e}   {file_path}")
+
+    # daemon thread -> pressing Ctrl+C does not wait for the scan to finish
+    # run in a copy of this context -> its "Remained" lines go to the same output (the daemon's CLI)
+    scanning_thread = threading.Thread(
+        target=contextvars.copy_context().run, args=(scan,), daemon=True
+    )
+    scanning_thread.start()
+
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            for _ in range(UPLOAD_WORKERS):
+                task_group.create_task(upload_worker())
+
+        # the last pack is not full
+        if packer is not None:
+            await packer.flush()
+
+    except asyncio.exceptions.CancelledError:
+        # This exception raises when pressing Ctrl+C to stop the program
+        # which cancels all the workers -> return to stop immediately
+        # False -> a watch stops too
+        return False
+
+    finally:
+        scanning_stopped.set()
+
+    if scanning_error:
+        raise scanning_error[0]
+
+    if config.compress:
+        logging(f"{Fore.GREEN}Compressed{Fore.RESET} {convert_bytes(saved_size)} saved")
+
+    return True
+
+
+async def _push_watched_files(
+    client: TelegramClient,
+    cloud_channel,
+    channel_id,
+    symmetric_key,
+    file_paths,
+    config: Config,
+):
+    # the failed files are logged by _push_files, this is what is left (the scan, the cloudmap, ...)
+    # -> the watch goes on, the files are checked again with their next change (or the next rescan)
+    try:
+        return await _push_files(
+            client, cloud_channel, channel_id, symmetric_key, file_paths, config
+        )
+    except Exception as e:
+        logging(f"{Fore.RED}Failed{Fore.RESET} - {e}")
+        return True
+
+
+async def _watch_files(
+    client: TelegramClient,
+    cloud_channel,
+    channel_id,
+    symmetric_key,
+    watcher: DirectoryWatcher,
+    preparer: PushedDataPreparer,
+    config: Config,
+):
+    logging(f"{Fore.BLUE}Watching{Fore.RESET} {config.target_path['value']}")
+
+    async for changed_files in watcher.changed_files():
+        if changed_files is None:
+            logging(f"{Fore.YELLOW}Rescanning{Fore.RESET} - Missed changes")
+
+        # the same checks as a push -> untouched/already pushed files are skipped
+        # changed_files None -> the whole tree
+        # False -> Ctrl+C was pressed, so the watch stops too
+        if not await _push_watched_files(
+            client,
+            cloud_channel,
+            channel_id,
+            symmetric_key,
+            preparer.prepare(changed_files),
+            config,
+        ):
+            return
+        scheduler.log_stats()
+
+
 async def push_data(client: TelegramClient, symmetric_key, config: Config):
-    os.makedirs(PREPARED_DATA_CACHE_PATH)
+    # a daemon runs one job after another in the same cache
+    os.makedirs(PREPARED_DATA_CACHE_PATH, exist_ok=True)
 
     channel_id = get_cloud_channel_id()
-    cloud_channel = await client.get_entity(channel_id)
+    cloud_channel = await get_cloud_channel(client)
+
+    scheduler.reset_stats()
+    retrier.reset_stats()
 
     if config.target_path["is_file"]:
         try:
@@ -194,19 +668,24 @@ async def push_data(client: TelegramClient, symmetric_key, config: Config):
                 cloud_channel,
                 symmetric_key,
                 config.target_path["value"],
-                is_single_file=True,
+                config,
             )
 
             result["channel_id"] = channel_id
             await update_cloudmap(result)
+            await update_file_index(result)
 
             logging(f"{Fore.GREEN}Pushed{Fore.RESET}   {result['file_path']}")
+            if config.compress:
+                logging(
+                    f"{Fore.GREEN}Compressed{Fore.RESET} {convert_bytes(result['saved_size'])} saved"
+                )
 
         except asyncio.exceptions.CancelledError:
             return
 
     else:
-        prepared_data = PushedDataPreparer(
+        preparer = PushedDataPreparer(
             root_directory=config.target_path["value"],
             excluded_dirs=config.excluded_dirs,
             excluded_files=config.excluded_files,
@@ -215,7 +694,9 @@ async def push_data(client: TelegramClient, symmetric_key, config: Config):
             in_name=config.in_name,
             is_recursive=config.is_recursive,
             force=config.force,
-        ).prepare()
+            paranoid=config.paranoid,
+        )
+        prepared_data = preparer.prepare()
 
         if config.zip_file:
             try:
@@ -231,7 +712,7 @@ async def push_data(client: TelegramClient, symmetric_key, config: Config):
                     cloud_channel,
                     symmetric_key,
                     zip_file,
-                    is_single_file=True,
+                    config,
                 )
 
                 result["channel_id"] = channel_id
@@ -244,24 +725,42 @@ async def push_data(client: TelegramClient, symmetric_key, config: Config):
             except asyncio.exceptions.CancelledError:
                 return
 
-        else:
-            tasks = [
-                _upload_file(client, cloud_channel, symmetric_key, file_path)
-                for file_path in prepared_data
-            ]
-
-            count = 0
-            for task in asyncio.as_completed(tasks):
-                try:
-                    result = await task
-                    result["channel_id"] = channel_id
-                    await update_cloudmap(result)
-
-                    count += 1
-                    logging(
-                        f"{Fore.GREEN}Pushed{Fore.RESET} {str(count).zfill(len(str(len(tasks))))}/{len(tasks)}   {result['file_path']}"
-                    )
-                except asyncio.exceptions.CancelledError:
-                    # This exception raises when pressing Ctrl+C to stop the program
-                    # which cancels all the coros -> return to stop immediately (no need to iterate the rest)
+        elif config.watch:
+            # watching before the first push -> the changes made while it runs are not missed
+            watcher = DirectoryWatcher(
+                config.target_path["value"], config.is_recursive, preparer
+            )
+            try:
+                if not await _push_watched_files(
+                    client,
+                    cloud_channel,
+                    channel_id,
+                    symmetric_key,
+                    prepared_data,
+                    config,
+                ):
                     return
+                scheduler.log_stats()
+
+                await _watch_files(
+                    client,
+                    cloud_channel,
+                    channel_id,
+                    symmetric_key,
+                    watcher,
+                    preparer,
+                    config,
+                )
+            except asyncio.exceptions.CancelledError:
+                # Ctrl+C -> the only way a watch ends
+                return
+            finally:
+                watcher.close()
+
+        else:
+            await _push_files(
+                client, cloud_channel, channel_id, symmetric_key, prepared_data, config
+            )
+
+    scheduler.log_stats()
+    retrier.log_stats()
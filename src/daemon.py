@@ -0,0 +1,260 @@
+import os
+import json
+import asyncio
+import socket
+
+from colorama import Fore
+
+from .utils import (
+    logging,
+    set_output,
+    clean_prepared_data,
+    is_socket_supported,
+    is_own_socket,
+    get_peer_uid,
+)
+from .constants import DAEMON_SOCKET_PATH
+from .config_manager.config import Config
+
+# the commands the daemon runs for the CLI
+JOB_COMMANDS = ("push", "pull", "list")
+# a message is a JSON line, a config is far smaller
+_MAX_MESSAGE_LENGTH = 1024 * 1024
+
+
+# The daemon keeps one connected client (+ its pool of connections, the resolved cloud channel) for good
+# -> tc push/pull/list send their config to it over a Unix socket instead of connecting every time
+# -> the jobs are queued and run one after another (they share the prepared data cache and the stats)
+# -> the output of a job is sent back to the CLI which sent it, line by line
+# -> the socket is only usable by its owner (0600 + the peer's uid checked on both sides)
+class _Job:
+    def __init__(self, config: Config, cwd, write):
+        self.config = config
+        self.cwd = cwd
+        self.write = write
+        self.done = asyncio.get_running_loop().create_future()
+        self.task = None
+
+
+class Daemon:
+    # the CLI side (is_daemon_running, submit_job) is imported by every command
+    # -> Telethon and the core modules are only imported by the daemon itself
+    def __init__(self, client, symmetric_key):
+        self.__client = client
+        self.__symmetric_key = symmetric_key
+        self.__jobs = asyncio.Queue()
+        self.__running_job = None
+        self.__stopped = asyncio.Event()
+
+    async def serve(self):
+        if is_daemon_running():
+            logging(f"{Fore.RED}Failed{Fore.RESET} - A daemon is already running")
+            return
+        if os.path.exists(DAEMON_SOCKET_PATH):
+            os.remove(DAEMON_SOCKET_PATH)
+
+        from .core._channel import get_cloud_channel
+
+        # warmed up before the first job
+        await get_cloud_channel(self.__client)
+
+        # the socket is created 0600 -> no moment where someone else can connect
+        old_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(
+                self.__handle,
+                DAEMON_SOCKET_PATH,
+                limit=_MAX_MESSAGE_LENGTH,
+            )
+        finally:
+            os.umask(old_umask)
+
+        worker = asyncio.create_task(self.__work())
+        logging(f"{Fore.GREEN}Started{Fore.RESET} the daemon - {DAEMON_SOCKET_PATH}")
+        try:
+            await self.__stopped.wait()
+        finally:
+            worker.cancel()
+            if self.__running_job is not None:
+                self.__running_job.task.cancel()
+            server.close()
+            if os.path.exists(DAEMON_SOCKET_PATH):
+                os.remove(DAEMON_SOCKET_PATH)
+
+        logging(f"{Fore.GREEN}Stopped{Fore.RESET} the daemon")
+
+    async def __handle(self, reader, writer):
+        try:
+            if get_peer_uid(writer.get_extra_info("socket")) != os.getuid():
+                return
+
+            request = json.loads(await reader.readline())
+            if request["command"] == "stop":
+                self.__stopped.set()
+                _send(writer, {"done": True})
+
+            elif request["command"] == "job":
+                await self.__run_job(
+                    Config(**request["config"]), request["cwd"], reader, writer
+                )
+
+            await writer.drain()
+
+        except (ValueError, KeyError, TypeError, OSError):
+            pass
+
+        finally:
+            writer.close()
+
+    async def __run_job(self, config: Config, cwd, reader, writer):
+        loop = asyncio.get_running_loop()
+
+        def write(msg):
+            # the job logs from its worker threads too
+            loop.call_soon_threadsafe(_send, writer, {"output": msg})
+
+        job = _Job(config, cwd, write)
+        if self.__running_job is not None:
+            write(
+                f"{Fore.YELLOW}Queued{Fore.RESET}   {self.__jobs.qsize()} jobs before"
+            )
+        await self.__jobs.put(job)
+
+        # the CLI closing the connection (Ctrl+C) -> its job is cancelled
+        disconnected = asyncio.create_task(reader.read())
+        await asyncio.wait(
+            (job.done, disconnected), return_when=asyncio.FIRST_COMPLETED
+        )
+
+        if not job.done.done():
+            job.done.cancel()
+            if job.task is not None:
+                job.task.cancel()
+            return
+        disconnected.cancel()
+
+        error = job.done.exception()
+        if error is not None:
+            _send(writer, {"error": str(error) or type(error).__name__})
+        else:
+            _send(writer, {"done": True})
+
+    async def __work(self):
+        while True:
+            job = await self.__jobs.get()
+            if job.done.done():
+                continue
+
+            self.__running_job = job
+            job.task = asyncio.create_task(self.__run(job))
+            # the job ends one way or another -> the worker goes on with the next one
+            await asyncio.wait((job.task,))
+            self.__running_job = None
+
+            if job.done.done():
+                continue
+            if job.task.cancelled():
+                job.done.cancel()
+            elif job.task.exception() is not None:
+                job.done.set_exception(job.task.exception())
+            else:
+                job.done.set_result(None)
+
+    async def __run(self, job: _Job):
+        from .core.listing import list_pushed_files
+        from .core.push import push_data
+        from .core.pull import pull_data
+
+        # the task has its own context -> only the output of this job goes to its CLI
+        set_output(job.write)
+        config = job.config
+
+        # the paths of a job are relative to the directory of its CLI (tc pull file.txt)
+        # -> the jobs run one after another, so the working directory is the job's
+        os.chdir(job.cwd)
+        try:
+            if config.command == "push":
+                await push_data(self.__client, self.__symmetric_key, config)
+            elif config.command == "pull":
+                await pull_data(self.__client, self.__symmetric_key, config)
+            elif config.command == "list":
+                list_pushed_files(config)
+        finally:
+            clean_prepared_data()
+
+
+def is_daemon_running():
+    if not is_socket_supported() or not is_own_socket(DAEMON_SOCKET_PATH):
+        return False
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(DAEMON_SOCKET_PATH)
+            return get_peer_uid(client) == os.getuid()
+    except OSError:
+        return False
+
+
+async def submit_job(config: Config):
+    # False -> no daemon, the CLI runs the job itself
+    # a watch never ends -> it would hold the queue, the CLI runs it
+    if config.command not in JOB_COMMANDS or config.watch or not is_daemon_running():
+        return False
+
+    response = await _request(
+        {"command": "job", "config": config.to_dict(), "cwd": os.getcwd()}
+    )
+    if response is None:
+        return False
+
+    if "error" in response:
+        logging(f"{Fore.RED}Failed{Fore.RESET} - {response['error']}")
+    return True
+
+
+async def stop_daemon():
+    if not is_daemon_running():
+        return False
+
+    response = await _request({"command": "stop"})
+    return response is not None and response.get("done", False)
+
+
+async def _request(request):
+    try:
+        reader, writer = await asyncio.open_unix_connection(
+            DAEMON_SOCKET_PATH, limit=_MAX_MESSAGE_LENGTH
+        )
+    except OSError:
+        return None
+
+    try:
+        # the daemon must be run by the same user
+        if get_peer_uid(writer.get_extra_info("socket")) != os.getuid():
+            return None
+
+        _send(writer, request)
+        await writer.drain()
+
+        # output lines until the result of the job
+        while line := await reader.readline():
+            response = json.loads(line)
+            if "output" in response:
+                print(response["output"])
+            else:
+                return response
+
+        # the daemon stopped in the middle of the job
+        return {"error": "The daemon stopped"}
+
+    except (ValueError, OSError):
+        # the request may have been run already -> not run again by the CLI
+        return {"error": "Lost the connection to the daemon"}
+
+    finally:
+        writer.close()
+
+
+def _send(writer, message):
+    if not writer.is_closing():
+        writer.write(json.dumps(message).encode() + b"\n")
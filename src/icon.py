@@ -1 +0,0 @@
-ICON = "/9j/4AAQSkZJRgABAQAAAQABAAD/4QBiRXhpZgAATU0AKgAAAAgABQESAAMAAAABAAEAAAEaAAUAAAABAAAASgEbAAUAAAABAAAAUgEoAAMAAAABAAEAAAITAAMAAAABAAEAAAAAAAAAAAABAAAAAQAAAAEAAAAB/9sAQwADAgICAgIDAgICAwMDAwQGBAQEBAQIBgYFBgkICgoJCAkJCgwPDAoLDgsJCQ0RDQ4PEBAREAoMEhMSEBMPEBAQ/9sAQwEDAwMEAwQIBAQIEAsJCxAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQ/8AAEQgEAAQAAwERAAIRAQMRAf/EAB0AAQEAAgIDAQAAAAAAAAAAAAABBwgCBgQFCQP/xABgEAABAgQFAwIEAwIIBwsHCQkBABECAyExBAUGQVEHYXESgQgTkaEiMrEUwRUjQlLR4fDxFiRDYnKCkjNTY3ODk6KjwtPUFxglNFWVsic1NkRFVGRldYWzJnSU47TDxP/EABwBAQEAAwEBAQEAAAAAAAAAAAABBQYHBAIDCP/EAEgRAQABAgMEBgYGCAUEAgMBAQABAgMEBREGITFBElFhcYGREyIyUqHBFEJicpKxFSOCorLR0vAHFjPC4SQ04vFTYyVDczWT/9oADAMBAAIRAxEAPwD6g0Zfg/U8IDl2ZQCRuqFGvVAfs6COxQN6EIL4QBdkCvKAQWcFJFJLoIAgdkCooEB2NBdA3ogIADC6A1fKADtZAdAaxQOOEAUrUlA2v2QDxugVLPRA8FAArUID7IAuxCB2ugF6mwQO90DdiEC3dBKVqgo7VQVmN0EdAPa6A9RV0DwSUEKC+6BUl2ogPXuoDuqFEA3uyATVBN01F3YIDmzICBtdAoCgIB5KA3CB4QOxcoIwCCgFAcOyA9igbsUE9T+HQXs/hDQZBbl2SBHYtd0A1ugbOLoHlAtVBAaVugrkH3QKP2QRkF9kAuKBA8oG7goDIL3KCDhAA3KCiqCBroA5QL1CATVAcpqCC70QStkB0DwgIFeUBgglAEFqEAWIugeUBAqLoDoAcIAoXQPqgcVogIBoUC90DdBL2QUNwgbu6AaWQKtRAJIKA5uxqgWQDd2sgppbdBN3Q4hQN0FKCOaIF2/oQGN0FZ7IG6CVd0DwgO2yB90FqUAVcG2yCWLu4sgfRBLtdByowTiIOBsgVIQKUq5tZAq1kAOEFrayAK7oJvR0DugleUFobPVADWJQLoAHKA26Bb9UBu7oHsgPTygIFR5QL0KBvVBbWQS3dAQSxr7VQXl0C9nQOO6CHsgvkugDzdAJoyA9bXQLhAuUFfgsEEpsgUoAgeUC2yAbILzygnlBCgpQCSEgCx2QG37IHtQoDA1QW2yBc88oI5sEAB/ZA3rugHlA7IFB7IBYoG6AWZkAcIGyBugDsgv7kEHc12KAPKB90FB5QTbygF90BANHQECm6AyAgUdAeqAgNuKoIUFPZAsgXsgCtEENHQWrWKByEBmLoHdBBQvwgvflAN0AitEClt0DsgNVAq90Avtd0C1AgouAgnCBYoDHejIAflAtQ0QKoDcIDkVCBchA9kA8FAbZqoANUBw9kA82QO6AL3QLEFA3ZAeqCNSpQW4QPZAH6IA+yB+9AsgAA1CAT+iAXBblBAgt90Ad0AUJYVQSxKC+UBkBAiCCWIKCm9ECjl90Eq9ECr1CC3qEDu3sgdv3IDcFAobBArZA7lA7boArsgGpQRBaGyAa0dAAJY/vQKchBGb3QUU2QOyBenKAzIJuxQU8GyC93QQhrIFWZkCoQLoFiGZkCr2QKbFA/egECrlDiG9bIGwvVA7ID77IDHk1QT3QWvCAWe1UEJ9kF/cgC9EA2vVAr5QLhAPLIQVd2QGra6C+EENLlA7IFqoDNVkCgqgVdwgCj1QK2ayClgUEF0Au3dALAoFXpsgNsSgAF6hkB33QA1kCrEFkAdroHgoajM1UA0PhAtRAfs5KBdA4QUCtUAM4CCV90EuLIKwJQHOxQAS9QgNV0Co2QGF0EuUHL3QLUNUEAG6B+iC2sUE80oghoaIKC26BR3QP0QN+UBqMEF90EBdiboLUmlggCiCOyBdAYnehQA+6EAcIFDV0DvwgBhugoFt0ELuX5QGam6Bua1QG2QG/uQKMxQOAgDy6ATs6AQH3QBc890BAPdAoLIA7sUAAfVA87oH3QLsN0C9BRAFLUqgAPugb3QLe6BceUBi90AjdyglRQBBQODdAA7oD0pR0DtwgUBqgNugWQCKoDcoDd6IG7sgBA7IDbhAZiyA4NkBt0BigANugUZAeqAKi6CEVQcmewsgl/ZBQ/dkECAzhAIF+aIBAoXQC7oFLFAQOA4QWv1QPP2QRBaWdBNkBAQKlAaqALUKBtaqAGuzoDGyADUF0BuEAdkBAZAeyBwgpvdBPFEBnugd3QVt3QSoKC/3IJT6oFHugdkCx3QLWJQGYoB7FApsgNVigGl90CvKBa5uge9UAu928Kh2dQGBugUdAP0QKsgUZA2YMUC3dAuahBPaqC8MUAsdkBAdihobk8oHblAB2AQA6ARS7F0Cu6C0NkEF2BQHCAOUDeoQCe6BZqoBuwQR2HKC2KA1EC9QEAPygE8kIApVAalEChuUC9QgWFEAfzmQEBvogVb9yA+6BtQVQRBRTygPVAG6ALsgNu/sgGlAgFBKd/KAO7d0F9qIADbICCVo4QXcFAB7OgB/ZAsLoFigW2QEDaqCXqEFN+UAM1ECtDCzugWQLiyADsECgogUcNZAAQR9mdBQd2QAxt90DflAshqE2ZBA4oECnhAO5CC33QN+yAalADm6BugEDdArwglBQBBfA2QBS6B7hwgX2QCzUAQTdghwUFAoTZANC6A9yUNCtDRAFmNEBAt7oFroB9nQTygp+pQ4nugBkDdAYULIAAPCAPDIALmyBuyBavCAOEAEOgUCAUA1QGc9kBh4QD5ZASAbZAogIBO+yASXQCWKA+yAyAQAXQU2vZAPcIIQQgqCeKoFd0CpKAz1CAQ5d0CxLoHi3CB/QgB0BAZ7oBrc0QS6C7uaIAugF7goG6BXcBAF+EDdyUA12Q1G7IBZA2QPCAb7IHhANAgP3QG4QAA10C9UAAm6B4sgM+6AeQgXq+yB9EEtUn6IKKEVogH+wQGPCBem6Bc3QC70CB9ggboBYsgdtkDZBK8oKxQB2NGQCEC1eENUNUFpw6AW2QAge9UAlqBBAC7CyCm90D3QQDuUFNRayBZiSge6aCb9+EFYFAZkDyUDjugBi5ugEtugDugeCgDsG3QGHFEC9kDtsggugpuwKBdnQEDfygbICC73QQXZkAV5QAwP2QU8FBPBQKWKA5P6IDugbOyBxygWogfVBTVu6CcIBFHZAFqlAH3QUVIqgNRBN2dAeqAzmrugeUBmQKO6C+AghqaoDA3QXelkEatfohqcIFKFBX3QQsSgFzsyAXNOEDeougFwHCC7oIweqBW6BUGoQCW2QHogGpaqCsaIJv2QN3KBV7oLVBLVBQHL02QN7oBtwgdkC3sgIDCjhAqdkF7boOLNTlBb2TUOUFPhBG4LoAsgiC3sEChQL2ugbugg2QDSyCsD7IADoG9kDsyBs7ID8IDC6B2CC0/vQRAf+9AKAgA90DlBdiEEIBqaIGzoHcIDhAfvQIBQKiroBsUC1KlAFboF63ZAevIQPqgWqgdyEBw1aIBPZANNkCjugorXhBLNygGtAECjMgrMKhmQA90EqEAcoF7oDfdA7bIB5QAQLBAQUsUEvRA8boK1bWQRwL32QLCiAfCAeLugoe7Mgh7IH7kAgPRAoQwBQH8oCA7OgAC3KAPCBQG6BQoD19kDe10BhZAaqBV3FEBrsgb1KCg1YIJTYFAerWQC/DUQB2QLb9kFPZBPdAsWcOgVKAAdkA8IFEBnsgOxQA90C/wBED1NsEFdroJ4QCyB7XQ1CgbXQA4QPKBu10A03dA2qboDMaoFTVAtVArugD7ILXdBGoaoHZ3QGdAZzbZA3d7BA8BAN3CBtZBKkoFbIL7MgPtdAqNkDuQgVfhA78oACAyBuEByUDwUA1KB7oFwgDdAce/dAugIF0DdwSgFuaoAvZkBiU4iG7oLV73QQ2QV+KdkBxuUChKBWzoBB5QGsEAgsW3QN33QPdBKugvZBPZBe+yAK28oG4eyCIOV7lCEDugMfbhBfFECpDIHuQghsgVdAqgeCgX3QA6HEb9EBu6AK3QWxZBK7oFigb0QWvKEJUGqBYugWogXsUByNi6AzX+yCbsXQU0CAWZ0Cr3QHsgrEnsNkEd0D3QLFkDugt7oDfdEEVxZqFBRUuEAugEkUQLU5QHB8oHlAJp3QL2KB3ugt/wC5BLCpugPVuSgF3ogCpQL+6BamyC7sURO5KKVFwge10BygXPCCmzjZBL90DugGrAoG9UCrFBSUEtvVArYVQG5QL7oKACxREZx3RR/ogCp3ogUFECgdA5ogWQ4ndAp7oG9/sgBAcksCEAubIHsgMR+5AbhAsgV5QOUAuKoFPqglP60F3dwghqgt6bIDlA2ogM9igAdkIPKBb+5AcOyB4sgUQNnCA32QCO7IDoFqBAdAetLIBYF0Cu5QAQL1QKhAvXZAogF7IJ3dBXQKPdAAJQGq72QN3ayBWxdDVHYWQVqiqBchAIJuge6AgtDYoJ3QG7ugvfZBPCA27IH0QUlhQgoJ7IFhVAdg6AwuXQHrdAFqgIAq7GvKSFBcFBSR3QR+LIFqfRAHDoLeiBS7oIDwgAMboAfeg/RBXqgUQSoo6BTmiBXsgu1SgnlNwfohBV0DdtvKAwB8IL2eyCUO6A4sKoDVZ0DuEAAGhDoHd2QTvzRBdyED2QG59kC5clAdkB/ugcFBDe6CsNkCvZAIBQLeUDiqAXdACAO6Bu26BwgrbbhBGALhA7goDG4QLDdigiCj7oFAGNEAh90BhZA+6B32QT9yAxHdBbi1kBrVQTZAu1UFAQGAQPZBGQBvVAZt2KC+KlBCCgsQexQK7oIfKC8VQKuxqgXsoFgxVCrsgAGxFeEBvbwgN/YIAu5KB5qgMWHKBvT3QRu/lBboFySgXPdAogd0EIO6AxQVwac0QTdBTdAFqIDIFLIam90EugvYboJ2JQW9SSgjEboKXQO1kBhsgDy3KBf6oDe4KBamyC0D1QQAhAo9CgB7FAFkA1qgFAq90Bq8IAYoJRkF7cIAJFkC1EF2LlBPevCAL+EAVoEAWQG4CAxcEIDIK3dBGYoDHZAI5QGJHhA3ugteCUEQAPCIgdxRFW+6Ct5QTcuSyC08OglkCp3ZkAWqgbuEA0oaoAQK/VAt2QLPVAdAfi6ASbk0QLXQN6BBalBGsUFPlBDSqAHKBeyAxZg6CnygUQSpZ7oKCxp9kBBDShQUUuglw7oFDdBRxUoJTdAJQPdAAHCAwsgWQVqIIgC7IAsgUsghQXxv90CrUZAo9SgW3ugVPvugo/vQQu9UCo3QKHmqBZBKoLuge6ALcIFy6AQyAQgVJqgG9UBygfmeqBWmwQEDaiBW5QDdAo1kAcFAuLoDObUQQoKgXKd4l3ZBbbVQGavevZA8UCAxO6BS/KAb1qgEOgjUQVmsgbXdAHdAPayCsKBBDuEFLXIQQ/RkAjmiB+pQV+EEbcoBtQ2QGeu6B3QKigQCwqAgcUQO90FF0EJPNEFdiyDi1kFFSSUA3dA77oFxQoDA3KC7tUIDi7+ECqCenugXogW9kCg2QXwghqgAMUDwEADtRAYu6Aexsgt6Mghs/KCeAgpD32QLXugAEDwgvcmyCVuyBQGpQA2yB7pqDtVA5QP0KAKDdAYbIG96IFbgIDEboFCxaiAfLID8h0B+6A+yAgV4ogooghQDfyhqA1sgICBayBa6CILR6oFCgfykENQDugvd/ogPSiA3NHQK7hADVQECrIJ2QUMgd0A1DhAqS9kBh3Q1K7sgBkAMKDdAN0Ad0C9r90EBq3CClgKhApclAD2ugClUAml6IDEoCAeQ6CFi7oLvygWuEBArugg8sgr7oI72QVt2NEEB+yAGNAgOAUBj/egFBbiiAbuUE3QXsCgm17IKfCBTZA80QAQgGzIAcigqgFt7oDVBJQL3QOw2QKGtaoF7oDGqBX6IFWd0DtYoFHYoAs6AARugByR2QK2AQKW+qB3RC3cop4CCEcoKA7OUF7+q1EEqSgo/ciIH22RR6PugMH4QA79kAtsEDugWLIHblBajdBGagKCctsgDwzIOVHQQ3sgOKfuQSvCC1ugHh0AUQN3sghqgoJdkEelUFNKmqC90NXFu3sgDd0FFiOUDwEANZ0Cg3QKGqA/BQGQ1CaVD8IBP0QEC1nQKPTdA7oBa4QKID9igUuyCkoJVAZAQX3QcRygt0DugDsgfUoJW72QXz5QQ2pZAYNugroAcIIUFcvsgN7II7eyBQ8oLwR90AV2+qAGFyoSOXVAIHO6BwgPv+qAgOxuge90EAq2yCkIJQN+qAyC3QC7sghoX3QK7oLSyA77IG6CC9kAj7oBA2dBd0A12ZBG5rwgrDhA87IcThAd7jwgWQHJHCAgroI7bIFXQC48IFBRAfkMgcFAQLIDUugB90FrZkEDG26Bax8oFX3QNnZAepvVAeqA5QHD1FEE2dBd0A0N6WQKXQXtsgiBUMzsgruUEF+UCqBY2QN6IAvXdAFaugIL7oIhJSgsgb1QC72QK2QK8IA4JqgbuEClygC9UEerPUIK92RAHdFD2CBvVALirUQLfRAdAdA8FAoC4QH8oHmyASUB32QN3CA/KASBugodBEFq4r7IJTmiAgiCg8BAsUBAqdkDsHQGDOC6A+ze6CG6BfaqCuyCOEFq/CAPugWogPyghO/dBeW9kCpqgUFQghvaiCk+yAAWQKBAcUrdAHcoBB8IDbBAAQKFA2QKFnQN0CwpVBbV3QSlkEqVBdq2VENT3Q4Ka0CaA1S6AP0QKoBcWFUDZkEaqA+/7kFaxQTwUFYPdBPCBQXQWu6CbhvqgeEFFEC4oSgWZBSfugjeUCtwEAVCBYUQLWQPCCduEBzsgPygpoUBuECrsNkAXogVdwgU9TugPygPsgX3QDSqAgOBsgOgXqgVFrlAvZBbIIGBcFA4coFBTjZAN3QH35QKXCBRAPdAFK0QQWdBSgAOgU8oBrRygAh2CAPeiCO1fqgU5qgo5QQUqUFcPdAblAq7ugD3QC4Lsgm10FcvcIH1HKBblAvsgOUDdAqEBqVKCDhBb3ugC9Cgo5JQTsgb1QCS90BjblBXCCe9kDtVAFECl+UCu42QO6CIKXNroHkIJ7oAQX8XlA8oI3BogrIDEd0Cu1EAjugcIA8h0AWogpugngoDPvVAJPHsghJdBQXPpFfFUSXHETpeEkx4nFTIJEmWHimTYhBBCO5LMvum3Vcno0xrPm+arlFEdKqdIdMzfrd0eyIR/wp1U0pJjgLGVDm0mZMH+pATF9llbOz+a4n/Tw1cx92YjzmNGKvbQ5Vh/bxFGv3o1/N1TH/Ft0JwssnC6uxmYxQ2hwWS4yY/iIyxD91krexecV+1binvrp/nqxlzbXJqY1puTV3U1T8tPi63ifjZ6aw+qHA6O1niyPyk4XCyYSf8AlJ4iH0Xvp2Bx8767tuPGqfypmGPr2+wFO6i1cnwpj86nX8X8ccsE/wAH9JcbGBb9qzuTK+volxr3Uf4ff/JiY8KJn85h4a/8Qv8A48NM99cR+US9fiPjh1BGD+y9KMtkxbGdqGbM/wDhw4/Vein/AA/w8e1iZnuoiP8Ae/Cr/EG/PDDRH7f/AIvWTvjX6ixH1SNDaXlj/PxmKj/QBeinYHL443q/Kn+bz1bf4/lZo86v5PHi+NPqx/I0noyDz+1xf9sL7jYPLOdy5+7/ACfn/n7M5/8A12/3v5uJ+NHq47Q6a0V6f+Lxn/eK/wCRMr/+S5+7/J8/58zX/wCO3+9/N+kHxp9U4W9ekdHRDcQx4uH/ALRXzOweW8rtz919xt7mXO1b/eedh/ja1xAXxfTrTs7/AIvNcTL/AFlRL8atgcHPs364/Zp/qh+1P+IGLj27FM91Ux/teyw/xzZnUYrpBIiG5kaj/wCzHhx+q/Cr/D61Ps4qfGj+VT0U/wCIVyPawseFf86Xt8v+OPTU2L1Zx001Fhwf/uuLwmI+0UcBXkuf4e4iP9PEUT3xVHyl6rX+IOHmP1tiuO6aZ+cOw5X8ZvSDGzAMfhtVZRCf5WLygzIR74eKYvDe2EzO3/p1UV91Wn8UQ99nbvLLntxXR306/wAPSdly74nug+aTBLk9Sstw0R/9oSp+C+8+CELHXdks6s75w8z3TFX8MyyNna7Jr06U34jv1p/iiHdsj1zovVEUI0zrDIs3MVhgMykTyfaGIrFYjLsZhP8AuLVVHfTMfnDLYfMsHi92Hu0191UT+UvdfiBIMMQ8gsvFo9msALkEEFBEVd0C+9UEoR4QC4QVA4aiAxJQC4ayAfCBsgePugXQUbhBNroG4QL+UB3qUCjMyBsyAWFUAXQLIF2QC9nqglqAsgtTdAqECr0QK70qge9UDfygVsgBiWQA5NB3QGaqA4DlDiVJo6B+WoQLFBCgtigHsKIFeWQPZA3QN/KQD97oKz3KCeaoFNwgF9kCxdAqblkAWoglEFpygU3QCfZAFkCrtRAtQoCASd0C5d0DaiCkBBKblA7BAvWxKAQDRIBuyAf1QUGiCChqhxOyACDdAb7oBu1kC6A9WCAxugo4JqaoFvKCIHlAqSgeWQGrygbtZAHiiAaocAmJAD2dAAQCavygXQD7BANEAlqoIwQcg9yglOKoAPZkAijugtW9TFm/NsPeyREzwSZiN8sf6m6/dGdJTThs76i5McRDEYYsNgphx2IhiFxFKw4jihPllnMJs3muNjW1Yq065jox51aQwmL2lynBzpdv069UT0p8qdZYu1B8bmksM8vSegs+zWIREevMJsrL5MQ5FZkz6wBbHhv8P8TVvxN+mn7utc/KPi1rE/4gYajdhrNVU9ulMfOf3WOc9+Mbq5mfzJWSZZpnIZMX5DDhpuOnw/68yKCA/wDNrP4fYfK7O+7VXXPfFMeURM/FgMRtzmd7WLVNFEd01T5zMR8HQM661dZdRE/wt1S1AxBHy8FPgwEDeMNDAfqVm7GRZVhv9PDU+MTV/FMx8GDv5/muJ/1cRV4aU/wxDpeMlQZnPOKzaKbmM81M3HTo8TG/+lMMRWVon0VPRterHVERH5aMTX+tq6VyelPbMz+eqyoJUgemRKgkw2aXAIR9AkzNW+Z170iNPZjTuciTEak/VRd8o1mVQruoFdkDtVUHOyihJFnQKiiBVVDzuoqGjf0KoACiiuQjILCIsNnTSF3vwnYDAYmJ5+Aw8wn+VFJhJ+rOv0i7cp4VT5y+JtUTxpjyh7nI9Uat01CIdM6w1DlED+r0YLNsRKlv3l+r0H3hK8mIweFxf/cWqK++mJnz01+L14fGYrC7sPdqo7qpiPLXT4O+5H8TnXXJJksx60w+cSoAwk5vlcmaD5jlCVM/6RWFxGyeTYiJ/UzRPXTVMfCelHwZrDbW5zh533oqjqqpj86ejLIOQfG5qWQIYNWdN8vxpMX4p+T5lHhyIe0mdDECf+UCweJ/w/w9W/DX5p7KqdfjTP8AtZ7Df4gYindibET201afCqP9zJ2nvi/6L5y0vNMyzXTkwkQiHNsujED950n5koDuYgtdxWxGbWN9qKbn3ao18p0q+DYsLtvlN/dcqm3P2on841j4srZBqbTmq8IcfpfUGW5zhf8AfsBi5eIgHkwEstaxODxGCq6GJtzRPVMTH5tlw2Nw2Np6eHriuOumYn8nsX2P6LzPUp7oIw90FZxZANN0EAYODdBdwyAaboJtW6CkueUAnlA2tZAKAaMgboDEoDPeyB+9AKBX6oHCADz9UBjZQDyqHsgboHuyA1UFoA6CIKPug47CtEFfg3QLU2QOBsgPfugeyBUlAeiCuyDjRBbOgovVBxQUvugl7ILYoArtdAbmyBz3QLHuUNQXqgtqsghAKA/hA7lAelUCpQCxoEAuL2QHQXsggtQBALILV2QPZBD2QV2NB7II27oH7kEFbugruGCBQNRQXe6ojEtWqgV91QFTQIajbAoAKCigJQG3CCFt0F3ZBHJQGI7IBvRAN3QX9EHHuAgu1UAsUC1UFoglx3QCEC9WQBdAuGeiCGjkt7pxHiZxneS6dwEea6hzjBZVgZZAjxONxEEiVCTzFGQF+1jDXsVX6OxRNVXVETM+UPwxGJs4Sibl+uKaY5zMRHnLDOq/jE6T5GI5GnBmuqsRCCxy7DfLwwiFgZ870wkd4BGtrwew2Z4jff0tR9qd/wCGNZ89Gp43bnLMPusa3J+zG78U6R4xqw7qn4x+qecmOVpfLck0vIj/ACx+g5jiof8AXmemUP8Amytrwew+W4ffiKqrk/gp8o1q+MNTxm3OZYjdYpptx+KfOdI+EsQ6m1drDXERi1pq3Oc9Bi9XycbjIjhweRIh9Moe0C2jCYLC5fGmEtU0dsRv/FOtXxati8disfP/AFd2qvsmZ08KY0pjyepkwQSJYlSJcEqAWglwiGEewXqmZq31b3liIp3Ruch/ZioI/sgImqbuyqq+ygoYCnKDjWqIEUuqqud91APCCVugVdggos5QGoKeyId3RUHhBXLvsgMxKAH5QAAN0AbAoAG/KBC4NCyTw3nc4yZUvC4uDMMH6sLi5ZeDE4eMyZ0J5EyAiIfVfVVU10zbr30zynfHlOsJRT0Koro3VRzjdPnG9kjSvxF9bNIGXBhdbzM4wss/+q57JhxkMX/K/hnj/nD4WAxmzGUY7XpWehM86J6Pw30/BsGD2ozfA+zd6cdVcdL47qvizJpD428umfLw3UDQeMwMQAEWMyaeMXJJ3iMmP0TYR2h9ZWp43YCuNasFeieyuOjPnGsefRbbgv8AECidKcdZmO2n1o8t0x4dJnDRXVrpr1EPy9GazyzMsQxJwgmGTi4QLmLDzBDMA7mFafj8kzDLN+KtTTHXxj8Uax8W5YDO8vzP/tbsVT1cJ/DOk/B20kwxNE4O4IZYvRlNYNmIunALlmQNnZBO6C1arIBIBDoFDdqoFdtkA3pdAo6BQ0QOyBZQPKoA18oAQLhygV2QKugVO1EFNKhBDeyC7UQTvZBQ+6A5syCB+OyALF6uoBDqggWQLUZAY8IAOwQA5NqIG/hABZAoAgGrPQoFHogprZBHYVCB2QN3QKIFUDs6B3CBvVBN2+iSKQdkA13QGF6oD8koA90B2tugPtwgUJLhBf7MgM5QSvCBu7IDAn96AR2QN6hkAdkAgPUugVJcBAHsUDav0QG3JdAYboBvSyClAYoFGLIJW4qgofwgm1/ogMLIBtRAaqBsgbtVAuXH0QL1JQU90BjZBALNVA37IFGogd3LIJFHBBBHNjiAglgxRxxECEAVJJNArETM6RxfM1RTGsyw/rf4rekOkY5uDy7N5up8wlgj9nyOET5cMTUEeIJEmGtC0RiHC2rL9jc0x2lVyn0VM8690+FPtfCI7WrZhtnleB1oor9JVHKjf51bqY89exgTWXxc9VtSGORpmVl2kcHFY4WEYzGEEMQZ82EQQ/6spxyt1wOxWWYT1r+t2rt9Wnyjf51NHx+22ZYzWmxEWqez1qvOd3lDDWa4/MNQY/8AhXUeZ47OcczftWY4mPEzQOAYyfSO0LBbXZt0Yaj0VimKKeqmIpj4cfFqd65cxNfpL9U11ddUzM/H5PycxFySSvp8FhdBBQVQQVFEQbhVVvRQOO6IF9y6sCdkFHZRTZAcu1kAV7IIA9kBm7oi0QTyUFF1QoN7qKlGQUXZEQU3+yKo5DIJ7BUOKqCtRgggBG4QVAqGQX2TiOE6Rh8SYTPkwTDCXhMQeKE8wm4PcMvumuqiPVn++181RTVxhkHRvX3rDob5crKNaYjMMFKIIwOdg4+SwtCI4iJ0AHEMwDssDjtnMrzGNbtqKauuj1Z8vZnxhnsFtLmmXz+ruzVT1V+tHnPrR4Sz1of41NKY8wYTqLprGaemkARY7BRRY7BkgViiEMInS3O3oiA3iWmZhsFiLetWAuRcj3Z9Wrw19WfOO5u2Xbe4a7pRjrc25649anx09aPKe9nnTOqtNayywZ1pPUGXZxgj+H5+BxEM6CEs/pi9JeGIbgsQtKxeCxGBueixNE0VdUxp+bdsJjcNjqPS4auKo64nX/09qSBULyvUVvxRAv5QOwpwgX5QLoFkBAZBSglHZ0AgIAtQIJTvyg5XFEEZqboF7lAajvVAqxKB9kB2HKBvaiAXKCt/cgg3ogUHCAaVCAHBQAOUByakVQVi7HZBLbIKGbcIIXdAZ/CBV6oAa9EAHdkADuglGdkFrdAG1UFbmyCMgfRA4coAc7sgGm5QGJA79kCgQPZAdAoLXdAfZ0FfbsglH7oFg6BvwgbUKAxQA16oGzoBsgU3LsgXqgFAQK3IQBcO6AgUNroLvTdBECr1CBbdAKCu1UCj0CCfogfqgF0DaqAWdAsLoDbBAFCgU+iAQLh0HrdRal0/pHKpmeaozvBZTl8otFicZPhlS3YtCDEfxRFi0IcnZenC4O/jrnosNRNdXVEay82KxuHwNubuJriimOczp/f5teNffGnk+G+bgOl2npmbzXaHM81hjw2D2/FBJpOmj/S+WO5W9ZbsHcq0rzGvo/Zp0mrxn2Y8Ol3NDzPb61b9TL6OnPvVbqfCPan93va6666k6/6lzjFrjVOLzLDmL1Q4CH+IwMDOzYeBoYmehmeuLut7y/K8Flcf9Hbimfe41finfHdGkdjQswzbG5rOuLuTVHu8Kfwxu8Z1ntdbhAhhEAhhhhFBCAwHgLITOs6yx+kRGkAPZQKqh3BUDe/dBEHJigl7IAI+qIhbdlVHJL89lA8+EQtRlVX3UErYIAL0TgKCSFRPFlBWcsEE2/rQWoo1URKMaIq/dAtygnc0RB78IqgclBLUQP3ILUbBALGgVBnLbKCDyqK/BUDsgB/7lR5GV4/McjzKHOdP5njcozGAMMZgMRFh5zcGKBvUP82JwdwvzvW7eJt+hv0xXT1VRrHx4d8b36WbtzDXPTWKppq64nSfh82ddBfGPrvIIpWC1/k8jVGDhIBxmG9GEx8IepihpJnFrBpZ5JWnZlsPg8VrVgq5t1dU61U+ftR+83PLdusZhdKcbTFynrjSmr+mf3e9sl0562dNuqMMMrSmo5RzAw+qZleMH7PjpbBy8mOsYG8UHqh7rn+Z7P5hlG/E2/V96N9M+McO6dJ7HQss2gy/No0w9z1vdndV5fONY7Xd3r4WGZldwgPUIFbIABLIArZA+3ugVKB2CBt3KAKXNSgUNkChs4QKvZAH2FggFrMgUQEAILX+lBOxNUAHd3QUMghLWQLA7eUCnCB7ohUWRQmtEDd0A1ogUdBQC90De9UEfZAAGyAXLlvCB5KA6JAWBRSmyB9WQXZwEEsgeSgOSgt7XQA9QyBWhQSvKA9igtHQRwTZAZ6lAYBBfaiCb2dA7oLdCEsGQXyghAuyCt2QRtygC29UBxdkDwgIK2zIIf3oLuxQQu/ZA3ZANN0CriiC+yCU2QACfKBU22QWxZBC2yAEDbugVdjZDi9RqvV+l9D5RMz7V2eYLKcvgp87FTRAI4mf0wD80cRALQwgk8L14PAYnMLvocLRNdXVHz6o7Z3PJjMfhsvtTexNcUUx1/lHXPZG9rR1F+NDGTxNyzpRkIkSmMH8M5xKPqNw8nCgg8ERTSO8BXQcr2Foo0uZlXrPuUz+dXyp/E55mu3ldetvLaNPtVR+VP5dKY7mumodQZ/q/N/4d1fnuOzvMQ/on42b6/lAmsMqAAQSof8ANghhC3vDYaxgrfocNRFFPVEaa988ZntmZaFicTfxtz02KrmurrmeHdHCI7Ih4Rc1e6/Z+CNWiBZAobPVA7qiHmwUFfugV4QBSgQTflUUk3siAHCKAC11AHIBbyggB4KCgGrFUHq7lQSoLqoofwoo4YgIAeroAc+EBuEEqaMqKSWruogioCFQI5UFNOyIIoakkWCoO2/1UEsaF1Q3o6CseaIFbKBTcILWrKibOFBQ42QcYpcEyKXHHA8cqIRy4wSI5cQtFDECDCe4IK+tZ0mI5/Hv6zTfrzj4dzMPTz4qOqGiflYDO58GsMqltD8rMp3oxsuEfzMUATHX/fYYyWb1Barmex+XZhE12o9FX10x6s99PL9mY7m1ZXthmOX6UXZ9LR9qfWjuq5/tRPe2l6Zdeem/VMw4PIM3iwebkGKLJ8yAkYwM9YYXMM2Fg/qlxRAUdrLm+bbN4/KPWvU60e9Tvp/47qtHSsp2lwGb+rZr0r92rdV5c++JlkIX7iiwTPQe7IKKn7IFDZBBRAsK7oBQPCAgAVsgvjdBHdA3ZAQCAaoLvUuglbVugqCB6WdAetkBmQAUChQG5QOasgqCEbsgHlALlBaWBQQcIKyCWoEFbdAvUoIRsEF4DoI44qgtWQSt7hAHKC90AvcMggdygfZBTTYoIKBAqxO9kFAa6CVtV0F7AeUE8oG7hA7bIKz0sgli+yBwgvLCyCbkfdA3dBWABJQRAoS7sgXugr8IAYnygEDc0QD3QCKU+iBY2QSxB2QGogEb2QBXdAATiKyCD7oDOgpOwQQ3QeNmeZ5bk2Xz82zfMMNgMDhYfmT8Vip0MqTKh5ijiIAHkr9LNm5iK4t2qZqqnhERrM+EPyvX7eHtzcvVRTTHGZnSI75lrT1O+MvCShNybpHlcGPjLwnO8xlRQ4WEteRIpHO/0o/RC4BAjC6HlOwtU6Xczq6P2KZ9b9qrfFPdGs90ue5vt1TTE28sp1n36uH7Mbpnx0jvhrNqHUOoNX5xFqDVueY3OcyicDE4yYIjLhJcwyoABBKgf+TAIQug4bDWMFa9BhqIoo6o5988ZntmZc6xOJv4276bFVzXX1zy7o4RHZEQ8Hlqr9n4JuyihuAgipotKFQLMPZkABqoIzX9lRSGPdQGCA7tVAZ6ugfZA3/rVE7koAe5KgoZ3CElBuEE4ZAcvUHyEB2LlAarf2KoXUFr3QN0A9t0CluEAgUQANkRGqij7EKivUAuyglUF7II/ZBVQ8lQPogjN2VAXUFFKlAoLoKw2QBsyDjFLgj9HrhB+XEI4C5BgiFooSKwxDYioX1EzHD++986a8WaumXxWdQtE/JyzVxmawyaFoXxE0Q5jIhe8E80nMH/AAzfxH/fAtRzbY7A5jrcw36mvs9ie+n6vfTu+y3DKNssfl2lvFfraO32o7p5/tb/ALTbDp11Y0J1TwMWM0fnkGInSYRFisBOhMrGYR2pNkn8QDlvUHhLUiK5lmmS4zKK+jiaNInhVG+me6eHhx64h0/LM6wWb0dLDV6zHGJ3VR3x8+HVMu3uGpVYtlUDCjILWyBVmUBtgqIeXQVt0AtYoI6C7oJuzBBfBsghGxQBU8JwAHa6Ct9UE8ugrXQSj0QXa6AbVQD+b9UAAIcAcMgUKCF+yAgoCBQEfuQAPsglQboL2QQoKXFgglAgNuPdBfZBN6oDOXsgV3dBWL1ZBC3CBayClBP0QHJZBbCoZkELA+UFo7BBG5QOUFcgOAgNV6oJ3QO6Bu7s6AXJsgd0BkF8koJZgUDdkFHBQGsbIFt0AO/9KA3eyAwdAYCqCDndAHZAoBQoK9UEFboK1XBqghqwugMXYVOw5Q10YW6tfFJonp7NxGQ6dEOptRyYjLjw2GnenC4OYKEYieHAiFXlwCKNwxELutuyXY/F5lEXsR+rtTzmPWqj7NPznSOcatPzvbHB5bM2cP8ArLkcondH3p+UazynTi1E191J1t1Rx8OP1xnZxkEqP5mGy+TD8rA4U1Yy5LkGIOfxxmKPvsuo5bleDyijoYOjSZ41Tvqnvnq7I0hy3Ms1xmb19PF16xHCmN1Md0fOdZ7XXDy5Pde5j9AvyqHsoH1QCEEat0ACu7Ki0UErcl0CvL+6Cs6CEBqqg3KgWqUBApZVB+P0UUFdqKhWjn6KIABkAXRVJdArugGtCgVQRuUBUK2CHAf6qCoIfdVBqm6irzRADAsggewKBtwUQFKV91VUt/W6gAFq0QRqM3hAEPKoooFA4cIANHbsgWAQBygrV7oIHO6D9MHisbl2PkZrlmPxWAx+EJOGxmEnRSZ8km5hjhII4IsdwVLlFF2ibVymKqZ4xMaxPfE/+31brrtVxct1TTVHCYnSY7pbKdK/jGx2BEnJesOG/acOGhhz/A4f8cIe+Jw8F93jlDj+LFSuf5xsPRdmb2VzpPuTP8NU/lV+J0HJtua7elrNI1j34j+KmPzp8m0mU5xlWf5bh85yPMsLmGX4yD5kjFYadDNlTYeYYoaGrrnF+xdw1ybN6maao4xMaTHe6TYxFrE24u2aoqpnhMTrEvLrwvyfsW3QL0QVnHCCdyHQGccILsgli6ALoHdAqxPKA1boLVBL1QKMCgV2dApZ0C45QD4QU0KBaoQKve6B7oJW5QPZAr/cgVQG3oyAeyBuwQWoLHdBD2QUuKIFSLoG9EENaFIC1EF32dBCKBA9/CAKWugtwBdAbdBKs7lAZ6hALuQ6B7BAYPwgEfRAZAIqUAMUD8KCtRAP0QRmQ1OwQUUQQ35ZAQVAYcoIgp5ZETd0UalEFO1E4iM31QOyAG4QVALPV0E4YoOu676haQ6bZLFn+ss6lYDDEmCRLP45+Kmf73JlD8UyKtgKCpIAJWQy7LMVmt70OFo6U8+qI65nhEd/5sfmWaYXKrPpsVX0Y5dcz1RHGZ7vyaddXPib1t1JhxGR5CMRpfTU31S4sPJmtj8bB/8AiJ0J/i4SLypZ3IijiFF1XJdk8JlOl69pdu9cx6tM/ZieP3qu+IhyfOtrcXm2tqxrbtdUe1PfMcPux3TMww9LlQSpcMmTKhlwQBoYIQAIR2AW0zMzOs8WqxEUxpC/vUBAH17IJYoKLuUEDg2dAJIB4QUcMyCB6qis5oLKA9PwhAItW6BTiiBSuyCOTsgo7IGyCWJCClz4KCAPRBd3N0Dd7IDHugjcoLYsgXQBSxQRq0QX3DIApdygeEBBDdhVBWogV33QHJQCyBVAdqhAHKCeEFYtRAqLoG9CaoIzd0FFLoDjZAetLoFtkFQBS1PCLwdn6ddTtbdKczizHRmaQysPOj9eLyzEAx4LGcmOX/IjoP4yAiKgf1Chx+aZTg85t9DF06zHCqN1VPdPOOydY7p3sjleb4vJrnTwtWkTxpn2Z745T2xv725/R/4hdF9XIYcqlRHJdRwwmKZk2LmAxzIQHMeHmUE+ChqGiDfihho/Js82ZxeTfrJ9e170flVH1Z+E8pl1vI9p8JnMRbj1LvOmf9s/Wju39cQyj3C1vVspwAgP/cgnuggoWsgtmqyA236oHlAr/YIA7IFzUIDPZ0BAayC0eqCAblAFQgpogW3QQU3QEBm3QGZAt7oH6IDbMgXH2QDQs6AOyAgrXZBEBgNkACyA7oHkIG6AB4QH2KBUboDtsWQXel0EdABJN0BhygbXsgMgedkCn8oIFjdAO71QN3QECmyA47ILc3QLByyCX/rQPFEBBTWiB5QRxugrksyAf70An2QO7hBB2KBaqCm7WQS/NUNWDutPxR6e6eTcRpjR8rDZ/qiTEZU6Axn9iy6Nv8vHCXjjB/yUB9VD6jBR9xyDZG/mURicXrRZnh71X3Y5R9qd3VEtLz/a+xlkzh8LHTvRun3afvTzn7Mb+uYad6m1LqLWedzdS6uzvE5tmc6EwftE8gCXLd/lyoB+GVAH/LC3Jcl11XCYWxgbMYfDUxTR1RznrmeMz2y5Ti8XiMfenEYmqaq+ueXZEcIjueuIbwv3edL1f2QAb1sgb8IFOEDx7oDbAoIA1TdBd7oFvZAqPKIe/wDUioHQUsDw1EOAyA2zoH3QXZBGs6ALMEAEMzoI5NEFFKbIDIDOa/RDicBAc1YoBbdAoyAx5QGQL8IADmiAL0qgVe5QHO5QKigNEC1QgOLA9kAA+UBnJdkBxRi6CBACoMWsoB7FBaC1AhoWB4QKtUXRCuxaqKBygtkACtED9EEqIpU2GKOCZJmQzZMyXEYI5UYtHBEGMMQNiCCFeUxynj1THVMc4XnExxjh2d08myPRj4t8Xlv7NpnrBiI8VhIQJcjUUMt5koCwxkEI/FC1PnQBxT1w/mjXP892Lova38rjSrjNHKfuT/tn9meEOg5DtpVZ0w+aTrTyr03x9+P90eMcZbY4TF4XH4WTjsFiZOJw2JlwzZM+TGI5c2XEHhjhiFIoSCCCFzOuiu1VNFcTExumJ3TE9rp1u5RdoiuiYmJ3xMb4mH69l8voYbIG6Agb+d0ClahAdAblAvsgDygD7oF7oKe/ugb+UE/cgIKTuboBoGQTb+1ECoF0A0ogu4QS1Qgdggp7cIJ2ogd0APV0FYv+5BLXTiG/KACLg0QKensgOUC90Cln2QKG6AGP9KAW2QOBugGg5QKO6ALsgewQDwEC/ZAQL7oFAgt6G/CCHhA8E1QDRBWa6BYOyAC+yCN3QHG5QKcoF0CmyBTygFigIBAFygXQP3oPGzLNMuybL8Rm2b5hh8FgcJLM7EYnETYZcqVALxRRGgC/S1ZuX64tWqZqqnhEb5nwflevW8Pbm7dqimmOMzOkQ1A60/Fbm+rzP010wn4nKMiLwTs2aKVjcfDZpILRYaUf5x/jYgzfL36nkOx9nA6YjMIiu5yp4009/vT2ezHa5Vn22N3GzOHy6Zpt86uFVXd7sdvtT2NfpUEuTLhkyoIYIIfywwhgFu81TVOs8WjREUxpDnbeyilEHFq0QL3VB2UFHlAtZ0E7Eugord0E3KEgAepQACKhBW2QTmqB5NkBxVALbhAuLoBsgoDBAAo7IJerBBf6UQDd0Ufk3QAON0EraqCkCiCMgD9SgNxRA7hBaiqAw5QG8JwChLoDeP60AV3ZBHFh90F3qg4qjletVBPCoofkqCNVygU2+qAA26IvqRSho9FQKgHhAYbIAayBX6IAqf60FI2QAK0LIMi9HOumrejuLhwWEhjzbTM2IxYnJZk30/K9ReKZhYjSVG5JMB/BGSX9JPrGBzzZ7DZ5R0q/Uu8q+vsq647eMdsbmw5HtDicjqiin1rPOjXh209U9nCeyd7d/QevtKdSdPytSaPzSHGYSM+iZAYfROw00fmkzpZrLjHBuGIJBBPIMxyzE5VfnD4mnSeXVMdcTzj/ANTvdiy3M8NmtiL+Gq1jn1xPVMcp/wDfDe7EOFj3vLboApdAGyBxVA/VAogVQEFod0EogP4QAR4QKIDh2B9kAoFjQoFqMgN2ZAo3KCoJ4CBR71QXfdBKcoH96AexogOWfcIFroAozGyAR9UC5KBQOEB0F+6Cdggr+6CdygtLgoIKhwgeNkD+1UBA80QC1n3QVBCNggAFq3CBfZBQd0EvU+EA1YWQGeiB+7dAArZuEAd0AjsgOLlA9kFubIIOxQG/VAfYPXhQHdUHL2qg65r7qJpTpnp6bqXV+ZDC4aE/LkyoB65+LmtSTJl3jjPFgHJIhBIyGW5Xic2vxh8NTrPOeUR1zPKP7jWWPzPNMNlNicRiqtI5dcz1RHOf/c7t7Rjq91p1b1hzCH+FXy3IcLM9eBySTMeXDEDSbPi/y03g/lg/kh3iPZMlyLC5Hb/VetcnjXp8KeqPjPPqcYzvP8Vndf6z1bccKfnV1z8I5c5dDP1WZYRGIugP7IDdkAlkAWsgn2VFoaA0UEFbEOUF7ugnuqK/BsoIXRFRUugC70QGLIL7W7oJZ0FLs7oBHF1UDwAoqe3uqLTlQGtREQoqt3QBQ3KAL+UCvKIEOioK2QVmRA9kVKeURWFkUruUCgo6A3KBYvZBK7Ki3ICCMCiKCPogjIK/2UE3PCoo+lEUtyFEH2NOUUG1FQoWKgDs4dAoN3RFqd0VANmRFFmf2RRzQtVAqgDc7oPdaJ1xqrpxqCXqnRuafsmOAEM+VGPVhsbLH+SxEsEeuC7ENFC7wkLyZhl+GzSxOGxdOtPKedM9dM8p+E84e3AZjicrvxiMLVpVz6pjqqjnHxjlLeXo11z0t1hy+ZLwUJyzPsDAI8flE6YIpkqEsPmyoqfNkklvWACCwiEJouO57s7ickr1q9a3PCqOHdPVPZ4xMuy5DtFhs8t+r6tyONM8Y7Y647fOIZIB7rX2wFdgggoahAdAdxdADB6oFdkAeXQBTygdvugE7sgOLhAcgMEFJ2CCcVugo4QCQaugbPzRBLNYIBqR+qBV0FA5qgmyB5QEFcbBAcmqA4FEENCgWqgP3QUl0DyUENSgXQAxN0Al7oKyCWtZADgugO/ZAbhAIq6B9EC6A4dBSH90ELkB+UFueyB3QTsgtQbmiCeyAzFAqdnCBV0FY07IFqIJWxQHDsCgVZAqAgNRBj7rB1p0t0fyiDE5o+PzfGQRfwblEiYIZ2JI/lREv8uUD+aYRSwEUTQnO5HkOJzy7pb9W3HtVTwj+c9Ueekb2BzzP8NkdnW561c+zTHGf5R1zPhrO5otrXXGquo2oJmqdY5j+142L1QSJUsGDD4KUS/yZEBJ9ENnJeKIh4iSuy4DL8NlliMNhadKefOap66p5z2cI5OMY/McTml+cRi6tauXVTHVEcvznm9ExXseI7cocCtnUCrvV0B2oEUtRERu6Ct/YoJTsgUFCgUBuUC5ugb2sgoqb+yAHNCUEIDIAG7IDKhwFAttVBSBtZAPZAQPdgiA5KKlqkoORJNSg47oKB3+qAPsholdlUW3lRUrYIKRaqCV7DZBRR+EB6lAFqFAtWxQGYH96oAVqQoFRR0EcsKIFjVBav8A0oIBW6IeSijm1VUDSyinuiFLIqsXDWQHrRAq9/sgM9UEFKFBXDMEAFiwQCSKuUCm1kFQO5KDyMtzLM8lzXCZ3kuY4jL8xy+Z87C4zDx+mbJjZnBsQQSDCXhiBIIILL4u2rd+3VZvUxVTVumJ4T/fKeMTvh92rtyxcpvWappqp3xMcY/vnHCY3S3R6AfEbgOpol6R1aJGXaulSyZYgHokZrLAeKZIf8swCscp3FYoXhf08m2k2WryrXFYXWqz8aOyeuOqrwnSePXdm9qaM1iMLidKb0eVWnOnt66fGNY4ZttZac3IDBBfdBGOyBXlAqboFj+9A3HfdA96cIHlBfKCN2QHQG79kFtwglXZBWAAQRBatRABQHZA33CCO6A25ogrbhBOzIA7oDVogqAAXogGvYIAQRygDsUAkFAuggPKALVKC+yA9UCweqCdygoqgGgdAuXQU1QEE3SCQd0Dvt5QX/NQGrZBECjPsUDyge10gDdnKC92QRne6AXBogFmugxV11685N0iy2HAYGXJzPVePlevA5aYj6JUFR+0YkisMoF2h/NMI9MP8qKHZtndnLudXPSV+rZp41dc+7T1z8IjfPKJ1naPaS1klv0dGlV6r2aer7VXVHxmd0c5jRvPM7zrU+c4zUepc0nZlmuYR+vE4uawiia0MMIpBBCKQwQ0hHuV2LD4ezhLVNixTFNFPCPn2zPOZ3y4ziMRdxd2q/iKulXVxmfl1RHKI3Q8Ffq/EY7oJX7qorszMooakoDbD3QQ+UFYN+qCNuOyCgAEkgIJW6BSyA1qoFeUD3ogMLIKeSWQQtygAByRZUX32UE8/ogcfuQVzdBPogoYVf2QGb+hA+3hBaUZBIQgW3KAQ5qhKO1kFZ3PCCe6C1ogUF0ABggWp9kBnQNg3hAvQ7oFXQGINAgC6CW3QBWxCACwH6IAdvCB73Q4rfeiBu7OqBZ+FAZBKcoK24RAVF67ooBZx7oI77AIL3QLgVZ0EJ3CIu7bopXug5D+pBAY5cyXOkzpsmdImQzZM2VMMEyTMhLwxwRQsYYgQCIgXBsrpExMTGsTumJ4TE8YmOcdhEzTMTTOkxviY4xPKY7Y5NwPh2+JEawOF0D1FxcuVqMtLwOYxAQS81YUhiAYQYilYbRs8LF4RyvabZX6FFWNwMfqvrRxmj+dPbxjhPW6rsvtZGN6OCx06XeU8Iq/lV2c+XU2HK0VvqO26Cd3QW5cIFXZAFd0AdyUAXZ0Al0DuEErZBb22UD61VAMRRA904i0G6CeUFvsglNkDcF/sgtjW6CXr+5Aq6BuyCt3Q1S6ACB3QVuNkELcID8FBQK1YoISBdANN6IFAEAshB4QC+yBa6BUF+UFBdBGdAFLISHhBLm6CiiCgvVBH4dAN0CtmogIFWpsgb1KBS4QKtRAAG3hAZ7XQLVQK1QD+iDEvX3rzl/SXK4cqyiGTj9W5hKMWCwcdZeFl2/acQ1RADSGGhjiDCgiih2jZvZ25nNz0t3WmzTO+eufdp7eueFMb55ROrbSbR28mt+jtaVXqo3R1R71XZ1RzndHOY0ZzHMMyzrM8XnWdZjiMwzLMJpn4vF4iJ5k+YQznYABgIQ0MIAAAAXY7du3Yt02bVMU007oiOER/fGeMzvlxq7duX7lV67V0qqp1mZ4z/fKOERuh+I7L6fmgKAwPv3QPZBGQXaiBTgIJ7oJtVlRbeygBr2RF2RUB3QLElBaWCCdyqFLk1QKcuoDgboLR7oDFv0QQXQUgAU3QPBdAA2FigNsyB4KAL1QK7j3QTZEVq1p7opuyAUAln2QA17FAuHdAYMXuUEpz7qi0a6gC7E15VENGDsQoFN0FHCBQboIKiiAGhFEDb8xQABYAUQIQRQoD1QGFygrBqoh+G7ooB3QQcOzIB4c+yCugnhABDgEoK3lBKf1Ki02ooDk+EE7CgQUVO6ADsUCOGGMNEYhYgwxGEwxAuIgRUEEAgioIBViZidU0id0tvfht+I2PVJwvTrqFjgc+hHy8tzObEAMzhApKmGwxAHtMAcficLlu1Wy8YXXHYGP1f1qfd7Y+z/Dw4OqbK7U/S9MBjqv1n1ave7J+1+fHi2KI5Wht/ARThA8b0QBQOgCn9ScAoasgMQgUeiBwUBqM6BZBbGiCV2ogAPQ+UFNSglNk0Cj1QX7IJ4sgtRRwgjuam6AOXogbIKG+qBfZBBdyEgL12QCwNHQUBBK/wBaA1GQLNWqCC72IQV/dkEtZBSOUCu6GpugjE3QL2QVt00DaiCVJQUhi6BvRBaWZBOQgVdAL7EMgm7ILQGpQTh3QXdAYFArcIAegAQKvb2QYs689dsq6P5NDg8FDJzHVWZSojluXREmCXDY4nENWGTCbCkUwj0wt+KKHZdnNnbmd3enX6tmn2quv7NPbPlEb55ROsbSbR2sktdCj1r1Xs0/7quqI+M7o5zGiuaZrmue5pjc+z7Mp2Y5nmU04jGYuc3rnTGZ2FIYQGhhgDQwwgQgABdltWbWHt02bNPRopjSIjlH975njM75cZvXrmIuVXr1XSrqnWZ65/45RwiN0PGqGqvt+Ti7IKxcWQAC/flADgF2QCdkEALeUFsEHEiqC+UBy9BUocFrZBB5QUEbbIIDyEAByqKKqCMxdBaeXQQgPRBYTd0EFr90AkBA7gIKK1GyoMygV2f2QKMgO+/ugVFQS+6AERATy6SqhrIAoXRC10VERWN2qyCbsDdFV+BZAfmqBUXAQAgVuEAbugWIqgOGo6B4L70QKvygO1XQSg3qgEIKKohewRdEtsFRbitggjB7IKAd1BLm6CgNdABQLGoQDS6GpWxCALugMSeEAP8AVAAL0CotqFQ4ozsxiBhihihigiMMUMQLiIEVBBAIIqCAVY3Jp1Nx/hq+IWPXEEnp9rrGg6lkSicDjI2hGbSoA5B2/aIIQ8QH54R6xaIQ8p2q2YjAa47Bx+qmfWj3Jn/bPKeU7p5a9Z2U2o/SERgsZP62PZn3oj/dHOOcb456bAEjb7LR29KxNAUEZAdkBm/oQP1QA/CAH3QEAAna6A7l2tRAtsgUarugC6CgMzFBN6oFbsgd2QPP1QN7IHkOgWQLh+UABkBggc1QN96IAQN3sgUG6CORRBQTuUB2KBThAQEAmqBwgIFQ9UAUQXuaMglCwGyAeBdAQGaqATZBf3oIP3IDugBrIF/CAEBAsgxz1u6y5R0e02MZFJl43PMx9crKcuMTCdMDeqZMasMqBwYjcloRWILP7P5FdzvEdHhbp9qrqjqjtnl5zuhr+0Oe2skw3S43KvZp65657I5+XGWhWc5znOpc5xuo9R5lNzHNcxmfNxWKm3mGwEItBBCKQwCkIAAXabFi1hbVNixT0aKeEf3xmec8ZlxPEYi7i71V+/V0q6uM/wB8IjlHKHh7sv1fib2VB61URHPCqqPCgioN2qgNyVBQeyCeyAT2+ioPVgoAO7IK+9HQRBXrRAQSuyA7+EF7oI9EFFCgj8OqDMoKwAQSlKNwqL2CCA8qC7Uqgb1VEcnhkQPdRQULl0FFTc0REcH+pFAOaoLv/SiBb6Ip3N0FQQitEBEQcqqtBVlA7lAQBeiCXo6qGzsooKFg6qG6in6ogT7poq7WuglHNmTiLRBOKqgwBQUObKCM3sgByQgtD3QHeiA5vWiCF2oiL7Ip2QHN0Dc1QWxQcpUydKnScXhsTPw2Jw02DEYfEYeYZc2ROgLwTIIhWGKEgEEJMRVE01RrE7pid8TE8YmOcSsTNMxVTOkxviY4xMcJjqmG7/w7deIeqeVRad1NNkydXZXJ+ZioYB6IMwkBof2qXDYFyBMgH5YiCPwxQrj21Gzs5Tc+kYeJmzVO7n0Z92flPOO2Jdj2W2kpze19HxE6XqY3/aj3o+ccp7NGZfd1qbbj3QP1QHCBUFAZkBArYoAQEDZA3ZAQHQC/h0Bq8IH2QG4QLVQP0QCXQW1ggg5KAXO9kAly4QHQPsgU3CBR0FBqxQSgNEBrEFArRADcVQLFArVA7FAcm90DsyCsHZkEq/Y3QGDIG17IAAsgbIG/lBRwgB0B3N0EAowQLUBKAUFpwg6n1O6kZB0r0lidWZ/EY4YCJGDwkuICbjcTED6JED7liSbQwiKI0BWTyjKr+b4mMNZ75nlTHOZ/vfO6N8sZm+aWcnws4m/3RHOZ5RH97o1nhD5+ay1hqPqBqbGav1XjIZ+Y41oRBLJEnCyYSfRh5IP5ZcLnvETFFE8URK7hgcFYy3D04XDRpTHnM86p7Z+EaRG6HC8fjr+ZYirFYmdap8ojlEdkfGd875enuaFep5EFAyBQc1QHN7gboiUs6qqzVURG5KKCjhEUBy9wyKjVQUeKoL+5Bx37oLUIF9ggdkA1LWQHItZBK7oFEAbAKorcKKClkEqD/aqA2/bdBa0qyBQUNkCj1QRnogM5QV+6A31QTegQhWCIlkVRd0DdAtR0BuEAhvCAxeiARsEDa9UFHl0AA2ZBAAaDepQQA2Jo6CsUABzQ3QGYgfdAYbhAY3QQA23KAeSbdlQNa/ZQU7MEDsEBhfdAYhAoyGiVJuqDGyCigdQGPCBdiUE3d0F5QWw2dBKv5QNh3QUVoED6oPJyrNM1yDNcFn+QZjNy/NMtnDEYPFym9UqYHFjSKEgmGKE0ihJBoV8XrVvEWqrF6npUVRpMTzj5THGJ4xO9+lm9cw1ym9Yq6NVM6xPVPzjlMcJjc336G9Zcs6xaXOOMqTgs9y30Sc3y6CJxJmEH0zZb1MmYxMJNmihNYSuKbQ5FcyTE9Hjbq301dcdU9sc/CeEu3bO57bzvDdPhcp3VR1T1x2Ty8uMMjXrssA2ADOBsgoL9kEAeiBS3CBTdAtZAFbIDUvVA8FAo6AEFaqCGiAL1qge6AH8IKB3QSoNkB90FqakoJsyB/ayAgNzsgXQV/ZBKXDsgVdwahOAO9TQIK9UEsyAHQN0By9UCnCC+eEEBG6C2dADFBN3ugpuzoIwugNW6Cs6cRH8oAZ0Fdv7kEccIGxCgCyo8DUGoMm0rkuN1HqLMpOX5Zl0mLEYrEzT+GXAPuSSwEIqSQACSF++Fw13GXqcPYp6VVU6RH9/ny4vPisTawVmq/fq6NNO+Z/v4c54Q+fXVvqnnXV7Vsepcxhm4XLsKI5GT5dGR/imHJDmIAt86YwMZ2aGEEiGvcclye1kuFjD299U76qvens+zH1fPjLhmdZxezvE+nubqY3U09Uf1Tz8uEOmh2fusqxAOUBmuaIJUUeiC2vuglmN0DZ0Ah0C4uECr/oghBFkF/KAXdA7oFkEbcIKHFggIFTRAALMEEZiyBV2dBeyCN9EFrZAO3qKBWzboI1EFLu6QFdggg7tVBXpygMW3qgCm6BVA5ogbuQfCBu7IHugeaICBRkDwUC+zIHPZAbfdBd7oiEVRQWq6GhY1QK3QAgf2sgB0E3QUjhkAWZ90Ac3QgqDVDgOReiBbfygbIIANk1FYmnKHAYm5QLAOggtUe6Ci1qoAfipQN6BAava6QL9EByNqIH6IFbIPdaJ1rqDp1qnBay0tPEGOwbwRyY4iJWMw8RHzMPN5giYMf5MQhiFQvHj8BYzTDVYXEx6s8+dM8qo7Y+MaxL2ZfmF/LMTTisPPrRy5VRzpnsn4TpMb30J6e6+071N0ngtYaYxEUeExYMMyTMYTcLOhpMkTYR+WOE0OxDRAkEE8OzTLb+U4mrC4iN8c+UxymOyf+J3u7ZXmVjNsNTicPO6fOJ5xPbH/ADwdkc0IKx7IIxQUfVBEF2aiB5QLblBOQyBRBSwoggJZt0FuyCD+zIL3+yBcoI/ZkAoAQEFDcoSFgzMyCXbhBQxQEE8WQHLoKON0EoEAkXQLIHnZAendAcmqBdAavlAYAk7oBpZAPlAF3FUCwqgMgANugWqge1UDuCUCpNED3CAXZigprfZAAJIADk8J3E7mjfxJ9bouqGf/AODOm8UDpLJZ7y5ksuM0xkJIM8neVAXEsWiLx1/A3Ytlsg/RFj6Rfj9dXH4aZ5d8/W6o3devG9qtoZza99GsT+pon8VUc+6OXXO/q0w5eodbW1E2fZBGLUQDSrIFAXQN62QK3QRBQ9UBmQVhdBLVQLe6ACyBRmb7II963G6CngoAsECnHhAd7G4VENLqCkABkDwEEQWgo5QKAsblAIPKBc/qgr07oGyCObBA97oG+zdkBu6B+4IDkFA/LZArygAIHg3QKGlkFalC3CBYOgj1o7IFye6A7IBcP90FYoONLAIL3QK2CAb0/vQKe6A/KAwQSuyCoK3NEED0ZBduEE/0nQ7gvt7IHchAar0+qA9G4QBQIAexKB4KA5CAHv8AqgElqBBaBBR3CCHhAc2KCh7pJoyB0O6v4zo5q3+EcRFNnaczQwys6wsIMRhhFIcVLhFfmS9wPzwPDUiBsHtBkdOeYX0dMfrafYn/AGz2T8J38JnXPbPZ5XkeK6c77VW6uP8AdHbHxjWOOmn0AweNwmY4PD5hl+Lk4rC4qVBPkT5MQilzZcUIihjhiFIoSCCCNiuI3LddmubdyJiYnSYnjExyntdxt3KL1EXKJ1iY1iY4TE8Jh+1TQr4faUsgMd0AAOgV2QG5QK8oFePsgF+EFandBK2aiCtVkEL2Q4KOHQRxzdAqC4ugEFBQgANcoFBaxQR61QGs4QC+7IFUBA2QLjsgWKQDVQLF0Al2Iqgd6oKQLgoJX2QLhwgXCA7XQUhz/UgVZ3ughrSqBYsUDeyAX5QAe6C9wgXYC6COblQQtuVRrh8WnWmPJMDM6TaWxvozPM5AizvEyY/x4PBxikgN+WbOF3rDLcs8cBG/7GZBF+r9J4mPUpn1In61Uc+6n41buUw59tntD9Hp/RuFn16o9eeqmeXfV8Kd/OJakQgQQwwS4RDDCBCIQGAAsAun9suXaaboXgfqoIGQUV3uglABaqA7WsbIFiaIAsqDOoOLVAKo5VuoA5KAGswQH8oaB5pygbuz8oA7IADhigClEBxugMLl3QN0E7ugOdigtXQQ3onEUF/DIAPKCMHqgqBU7oDFAtVAB7oIz1JZBe1kB2bdBAPZBbm90APdBQ+6CbMEFAQcfaoQXygEIg4RVq92dBHa6CAO9+EFqP6EBmsgj1rQoLc0KEH7kBr8oHuyAxsgeyAKE1fZAIagRF27oqE+EB9x/egBr+1EB290C5dBH+iC2u9EDdANRcj96A9WQHL1qgV3QKoKwdygUuyCgkH1Cidg2O+ErrPFkmNldINTYqEYDGxxHT0+ZE3yJ5cxYIm3pj/FFKe0Xqgq8AWhbaZF9IonNMPHrRp04649/vjdFXhV1ugbFZ96CuMsxM+rPsT1Tzp8eNPbrHU24hc0XL3URu10UQR0FtU7oITWqBvT3QPw2CAKXo6CvyggZ3d0Fcu6Ba9kCj9kB9qoJV0AXQWqCMgtTvsgm6B5KCs39CByeU0NU/egpAZBN3QGdkCpsgMgMNkCu6AD7IBrdAQPZALb3QD390Co2ugMDQIF9mQGdAcPZDgpDIJwxQBayB4QdH6ydUcu6TaJxOpp8MvEZjNP7LlOCif/ABrFxA+mEtUQQgGOM7QwlqkA5nIcnrznGRYjdRG+qeqmOPjPCO2WFz7N6MmwdV+d9XCmOurl4c57Il89sbjcwzPG4rNc3xszGZhj58eKxmKjDRT58ZeOMgUDmwFAAAKBdyot27VFNq1GlNMaRHVEcIcKuXK71dVy7OtVU6zPXM8Z/vg/JfT4QNbZBbl/1QcblgETeu39CKWPZBLlBXZAB29VEAAiiAGeqAO7IHv9kB2NEC10FqK/ZAv7oJugEABBGqRZAA/qQUNZnKoUqVAtwqH+ioJ5CCgVqgm/ZAqgod2eqbgAALCyCh6iFBHPAQPIZBSxuEEZi5oggoWIVhFDcKKAoACA3v5QW1z7II9P0QCDvSiBVkB3oiDlFA9kDvVBGI8IOQpcIHhqoFQKeyCDhAf+9AY1a6IAd+yKN2QLhiboDMWogVN0AOiK/KKm6A1WhKAzD+lAYvfwgUAQO2wQH4QN2CALeEBq12RAFFX2QK7oDbMgBubIIQ4/DNmQRQkRQxy4zDHBEC8MUJFRECAQdiAVYnT+/h3HHs/vj4N7vhy6y/8AlV0jFhc6ny/8KMi9EjNIRCIBiYCD8rFwAUaYAREBQRwxhgPS/GNqcj/Q+K6dmP1Ne+ns66Z7uXXExPW7Tsrnn6YwvRvT+to3VdvVV4/CYnsZZDcLWG0hogIBrZBTXaqCf2ZBbGiCIDeUF/VBGpUoKfKB9UB61KA5QGqgldwgpsgg8oFQgOeEBuaIAFaoGyC7JxEpsUAClkJKsgFwQBuVAPZwqADUchAQK1N0DsKoHugr9kCtmQGHuggQKXF0FDu4KCClCLoApVA97oBH1QflicThsHhpuMxmIlYfD4eXFNnTpsQhglS4Q8UURNAAASSdl9W6KrlUUURrM8I5y+bldNuma650iOOvU+fHWvqriur2t5mfSY5sGRYCGLC5Hh43Hpw5IMc8wm0c4wwxGjiES4bwl+5ZDk9OS4OLE/6lW+ue3lHdTw79ZcJ2gzirO8ZN6P8ATp3UR2c576vhGkOiu5YrMwwoG90EP0QKG2yAO5QLoIOyAa0SBWYu6AAyCCiB2dkFpsgV2ugON0EttRArZ0FJayCdkB7OfogoqXdBH7JxCg3QGrRigr+kIJ7oDUZmQch57oON0Fdtvogh4TgLXf6IIgvDlBNqOgMyCuNqoAoWa6AgH6IFBUVQLB3QG+6AOyBQUCCfvQWr3QOzoAfygOdkA3u6BU7oJUWQW90B60QHfsgMzB0Btyaog3dFOyBexugrs10EYk0QShDkWQWxogCnCAGKAB/c6COyB/QgOHqf6k4CskCbsnIU7CiIU7oo/KBQboHcP9EB+6AGQe/6f64zrprrDL9bZCIps/AxGDEYYR+mHG4SIj52HiP+cADCSC0cMB2XjzHL7Wa4WrB3uE8J92rlV/PriZh7stzG7lWKpxdrjTxj3qZ4xPfy6piJfRXS+pMl1hp7LtUaexsOLyzNMPBicNNBvBELRDaIF4YoTUEEGoXBsXhL2Bv14e/TpXTOkx/fwnnG93vB4u1jrFOJsTrTVGsT/fPrjlO57Oi870gugMSgtt0EsWQVmNkEO6EKSSWdAFW2KBdkA3FaII3JQLsgXvZAugtbhBPZAsgAsaVCC3KCGlqoHdBWGyAEJTe9Cgtigle6C1CAO6Cf2ZBT/YII1boHvRA2QCgUe6B4QPAQN7oBL0ZA8v4QHPdAFbIFXQay/GL1X/Y8vldIsixPpxWZy4cVnkcuNjKwb/xeGJFQZ0QeIP8A7nAQQ0YXQ9h8l6Vc5pejdTuo7audXdTy+1PY51txnPQojLLM76t9c9VPKP2uf2e9qlUm5XS3MtFdQSo2Q4FLBA7boJ+4IKBUocBwN00EsaIhbeiKtqU8oDA7ohe32RTbugNVApYgIAc2ZAZt/qgdzSiAOAgGyCVdkBmP9CA7bMUFq7ID1oUEbnZBUAUJN0EILWQX3CAHdADCyBY0AQStvUgu4KAHBJQSjOxQUDblAdAqgUJZAe6B4qUCgG6CkW54QQcG6B3KBtRAHFEFDWdBxqRx2QUFAYIAp/UgC7GqB9UAbhBR2QSP+LAimEQjmIsrG/gTExxSCKGYPVLjhjG5hIP6JppxI7HIdmUDyXdDRO1kQN6FFH2sgF7MAgWqAgt7lBxrfdAtXlBf1QVuS7IHY2Z0EAqzoIadkF7oSGzv7ohD3RTdBaksyA5QbAfCP1b/AMGNRnphnuKEOVagnRTspjmRgQ4bMCHik1tDOAeEO3zISACZi0jbXJfplj9IWY9e3GlXbTynvp5/Znqpb1sVnX0S/wDo+/PqXJ1p7Kucd1XL7X3m4z8Gi5S6wuyBWyCf3IFqIcRANR3QX9UBg+yCeSgHsUFN/NUEQO+6BflAq9EFQTygdygMQUCvCA1XFECx/qQB3NUA90Bx/UgpBFTZBN0DlAq93QHqWQKE0KBRAJeuwQUkguEEfYIFa7goKBuUEbgIHtVAF0BuEFsUHW+oeu8n6b6NzPWedj5kjLpTy5EJaPEz4j6ZUiC/4o4yIezkmgK9+V5ddzTF0YS1xqnj1RzmeyI3/wDLH5pmFrKsJXirvCmOHXPKI7Znc+dGc5znGpM5x+o9RYz9pzTNcRHi8ZND+n5kX8mF3aCEAQQjaGCEbLvVjD2sLaow9mNKKY0ju6++Z3z1zLgeIv3cVdqxF6da6p1nv6u6OERyiHh3uv0finsgVsUEtR1Q33UFsN0Cu6Ihd7ooxs7BEVnLMqFSoqWQW6AHFCgVJ/egjIFXogPEgoegBQKuCgEoFygB4qbIIHetEFcUogOxd0B6IALIJ2eiAC3ugfvVF5+igVFkEFroKHKBUboHdAcsgMeEEuWDBUXe/lQQOgo3RAclFLXQhXNnKCVfZA2qgVRF3RRBAH3QB4QAgpJ4uge3hAk/MxOLk5ZhZM7E43ERemRhcPKinT5p4hlwAxRewUnSimblU6UxxmZ0iO+Z3QtETXXFuiNap4RG+Z7ojey3ov4VusOrxJxOY5ZhNK4GYIYvm5vM9WIMJ3hw0omIEcTIpZWs4/a/K8DrTRVN2r7PD8U/KJbRgNj80xulVymLVP2t8/hj5zDNWmPgt6e4CGGZq/UOe6inQv65UE4ZfhT4gk/xn1mFali9u8bdnTC26bcdftT51bv3W3YTYLBWo1xVdVyfwx5Rv+LIOUfD90RyOEw4DpXpqMgf7pi8DDipn+1O9R+6wV7aXN8R7eJr8Kpj4RpDPWdmsow8aUYejxiKvjOsuWc9AeimfyP2fHdL9OyS7idgMHDgZ4PabI9EY+qYfaXNsNV0qMRVPZVPSjyq1gxGzWUYmno14emO2I6M+dOk/Fq/10+GvNOluFm6r0rj8VnWl5RfFDEARYzLYSw9ccUIHzZL3jYRQU9Th4h0TZ7am1nFUYbERFF6eGns1dkdVXZwnlpO5znaHZO7lFM4rCzNdqOOvtU9s9cdvGOesaywubrbWoJRArsgbuwQL1KA9UB2tugOefCA7XDIHhA+7oBQO9+yCvSoQS3CA70G6BUf0oLSzoQPugjsURIhER/Fz5kqOEiOXMlRmGOXGC8McJFooSAQdiArHbGv98O6V38p07ert8H0B6B9VYOrOgcPmuNmS4c8y2MYDOZULD/GYYQROhho0E2EiYNgTFC5MJXEdpMmnJsdNuj/AE6vWpnsnl30zunz5u47NZzGc4KLlX+pTuqjt6+6Y3x5cmRwDstfbCWNbIFjugMgFiXQPZAvYoLdnqgjtZNAFOUFcoFXq/hBA7MycQBQL+yCh+EEo9GQVyyCEswQGa71QOd0C1kDe6AS12KA7oFAEC6Agb9kDZxfugb3KBZA7BBas+yCWNPogW3QKu6BYsgMCXb6oJ3QVwzBAZgeyDSz4tOpp1dreXoPKsSYso0nMJxJhieGfmkULRbsRJgiMA3Eccz+aF1vYvKYwWDnGXI9e7w7KOX4pjXuiOtyLbTN5xuMjBWp9S1x7a//ABjd3zPUwYzbrcmlIGoBVBGL3Q4AcbqoF6f0qKr7MyAGBdBHBQOAKIKCwKAOKoDe/ugWCA9UAVDvVAYuC4QQgjdA3QW1HdAYAX+yBdApVBKu1UC1kQDGiKKitW6gcEoF6IJbZBW5QGcvdBBTwEDeiAHclBeyAKXQTygoc2KoBRAHjZFRmfdkFZ7bIcUDoKwBepQOwQKkkoF0Q7BUACN1A39kUPKA3ZBQ9kEiiglwRzJsUMMEIeKIlgB3KsRM7o4pMxHF2bRHTDqJ1Jihj0VpHGY/CRGuYTQMNgRVifnzGEbcSxGeyx2PzbA5XH/V3Ypn3Y31fhjh46QyeAyfH5nMThbUzHvTup854+GstgtEfBThQYMX1N1fNxcQqctyN5Elwfyx4mMfNjBH8yGWVo+YbfVb6Mvtafar3z4Ux6sePSbxl+wNMevmF3X7NO6PGqd8+EUs/wCjen2iOnuDOC0TpXLsmlxgCZFh5P8AGzmt8yaXjmHvFEStIx2aYzM6+ni7k1z2zujujhHhDecDleDy2joYW3FEdkb5754z4y9+wBoL3Xh11e/TRbGhQGblAQfnicLh8ZIm4TGYaXiJE+XFKmypsIigmQRAiKGKE0MJBIIK+qK6qKoqonSY4Pmuim5TNFUaxL51dXen0PS/qRnGjcN8z+DpMUGMyqKMuYsDOBMuFzU+iKGZKc3+WDuu8ZLmU5vgLeLq9qdYq+9HHzjSrxcEzvLf0Rj7mFp9ndNP3Z4eU6x4Oot/QsmxR2QTs9kFq9EDcMfqhxHNggENuEAW5QK7oFBvZDijWYoOQbZBHKCMgVJuiLU718IqboLYWQN7IK7IO/8AQjqfF0p6h4XOcbPigyLNBBl2dwkn0wyYov4vEEcyY4vU7E+iKaBdYTaLKIznAVWqY/WU+tR386f2o+MQzuzmbzk2Ppu1Tpbq9Wru5Vfsz8Jl9CLFvV77FcNmHdEalEUd73QGAq6B2sge6BXlBQOUEAIugXNSyAEFHAKCPVAFUFY/0IJ7bICBRnJogGhugcHlA/cgtqAoJ2CCoJ3JQXwEEtu6Bsgo8lBDSqCvVAPZBH4QWiDj3QWjuyC3DXQTwUF7BAvtRBKhnsg6D1z6ljpX05zDUWFMuLNp8QwGTyo6iPGzAfSSKvDBCI5sQNxLIeoWc2dymc3x9Nir2I9aqeqmOPnuiO2WC2jzaMnwFd+PbndT96eHlvmeyHz2gE0AmbOmTpkZijmTZsXqjmRxExRRxE3iiJJJ3JXct3KNI6urs8HCt88Z1+fb48VLWUE4CB5NEBwgj1ogtnDoajvu7IFi2yCVuiKKO5RStrIgL1RRySgAnZA8EIHhAe7V7oCBav6oBugduUE90F8II4DBygoqboG7VQN3DIJRBW4JdBAKG7IK5KB7oH9yBYUCAzGv2QHO9kEqLILRAAogA7fVBOyCh3A/eglvZAB2VFZ2UFd7oIS6BayA3J+iCg/2CBfZAfYIcSWI52KkZfhpM3EYzExCCRhZEuKbOnRGwglwAxRHwEnSmma6p0pjjM7ojvmdyxE1VxRTGtU8IjfM90RvZg0H8KfVfWXy8XnkjD6Py6Yx+ZmUPzcZHCReHCwH8P8AyscBD/lK1bMdsMtwOtNmZu1fZ3U/imN/7MT3try7Y7MsdpVeiLVP2t9XhTHzmO5sToT4WekmiopOMxuTRamzOXX9tzv0z4YYqf7nIAEmWxDg+kxD+cVomY7YZlj4miir0dE8qN3nV7U+enY3zLtj8swGldVPpK4517/Kn2Y7N2vay7eEA2FANgOwWrTMzxbVERHAogD9ECg4QWnuglaEVQO6Chj/AFoatP8A43cDIk630hmsL/PxeT43DTDzBJxEqKD6GdH9V1PYC5VVg79qeEVUz5xVr+UOVf4gWYpxdi5HGaao8piY/OWvAW9NCTalUC71QAz3+6GgauECgGyCeAgtOUB9kELewQN0FtR/oiJ3RSlHqgt9kQvbwiiCPwEFfiqBQ2QWKGGZDFLmQQxwxAwxQmxBuD7KxOk6wTv3S3U+EzqdM1joaLRmcYozM50nDLwwjjLx4jL4nGHm9zD6YpUVy8sRE/iXI9s8pjBYyMXajSi7rPdV9aPH2o79I4OvbF5vOOwf0S7OtdrSO+n6s+Gk0z3a82c2Wmt0RBXQQIB7IKGagQSlkFFy6A+zIHlBDWyA+wCA+4QW2yBVApcBBBfwgeUF3qyA9Qx8oIz0e6CoI3f7IAPCBYsgG7s/lAvugfdAu7IKNkEALIBrSgdAbYoIeQUFpzdALbugeKKC+6om6AxdhV/ug0T+J/qL/h91On5ZgcR68n0l8zLMKx/DNxZP+NTrfzoYZQ7SoiKRLs2yWVTluXRcrj17ulU9lP1Y8vW8Y6nFdrs1/SeYTbon1LWtMdtX1p/2+E6cWJf3LZ2rhJO6CeECyBRr2QGQB5ugXKCDlkRQbmpRQMgeUDegQLFggG9GQGKA4P7kE5QU8MgeEAbkvVAYVZA3Z0EpwyAQbh0FJ7fRBKC+yCitygQ8XCA7bhBL2qyGi7WogGod6FBGq6C12QQOUFtUIAuwCCB+yAgu1HdAA7IFqgVQLboDdkEKDlV6D7IJugb+UFD7XQACPYOUHuNIaM1j1BxMWE0HpfH55FBH6Jk7DSxDhpUV2mYiMiVCW29T9l5cbjsLltPSxlyKOqJ4z3UxrM+Wj2YHL8XmVXRwdua+2OHjVO6PPVn/AEP8FePxJl47qdq+DDwRfiOWZFU8tHipg9iIJY7RbrSMx28t0a0Zfa1+1X8qY+dU9zeMu2Crq9fMLmn2aPnVPyiO9sPofploHpvho8NojSmByn5oabPlwmPEzhdpk+MmZH7xLRcwzfHZpV0sXcmrs5R3RGkR4Q3vL8owOWU6YS3FPbznvmdZnxl2cUWNZMfYILRABCBtSyANzugXQGe1EDwhqN7oNKfjHzuHM+ruCyiVOMUGSZFJlzIf5s7ETY5kQ/2Jco+4XXdhsP6LK6rsx7dc+VMRH5zLj+3OI9NmdNqJ3UUR51TM/lEMH3BW4NNRkC29UC21kCzfqgMN39kC9HQTdAr7IL9iiFtrIFXtUIpQb+yBYWQTfugoDjZA3owZArdA7AIgzWuiqEHaOl/UDEdLde5VreXFMOEwkZw+aSpYJM7ATCBOHpB/EYWhmwj+dLHKx2b5bGb4KvBz7U76eyqOHnvpnslksozKcox1vF/VjdV20zx8vajth9G8PiMPisPKxeExEE+RPghmypsEXqhmQRB4YoSKEEEF+64LXRVRVNFUaTHF36ium5TFdM6xPB+n7l8vpGfhADlBWY3ugiC1JIsgIJvV0C21UC9Qgu10E3ugG9EFB9kEJ9T7MgbUKA/96B+iC2qgA1ANENUHY+yABsAgdz7IHlAQKbIA8oBoHNkIHZA3ugEWI3QXuyDjswogt6PZA3ogdkEpygE1BQY+69dR4+mHTPNNQYKbDDm2J9OW5QDvjZwIhisQflwiOaQbiWQs7s3lf6VzCizX7EetV92OPnup8WA2lzT9E5fXep9ufVp+9PDy31d0PnzJkQSJMEiWYohAG9UVYojuSdyTU9yu41VTVMzLhkU9GNIctrKBf9yCMPCA32QH7oFqkX7qgeygDsLoDIAa6CILtZAAs99kEo9QgC9SgtHaiCW3RF8cIqXev3RAUoCiqL8IA9XLII3BQA1qpxCtwUFe1EAUJQCG3QPZA90EHIQUUugGh2QLhAZz2QN3ZAYcoJdBb0QCOPuUAOK7IFHpdA8oIByqLSoUAByyQKEADflBBFCcTKwUIimYmfEIJWHlwmOdMJsIIIQYoj4BV09Wa54Rxmd0R3zO6CN9UURxnhHPwjiyvoj4Xur+tBLxOKyaVpXL5jH9ozsmGfFDv6MLB/GE9phlrWsftbleA1ppq9LV1UcPGqd3lq2fL9kczx2lVdPo6euvj+GN/no2C0N8IXSzS5l4zU0vE6vx8BET5o0ODhiH83CwNAR/xhmHutGzDbXMcXrRh9LVP2fa8ap3/h6Lecv2Jy7CaV4jW7V9r2fCmN3n0maMJg8PgcLKwGCw0rD4bDwiCTJkyxLly4QKCGGEAAeAtSruV3aprrnWZ5zvlt9u1Rapii3GkRyjc/aq+H2WZBLlBWavKBfdkC9WZAIKB5CAXOyATZBa3QT0ufQT+alNnSEmdHze6oakOsOp2rdTCdDOl43OcRLw8yG0WHkEYeUR2MEmE+679lOF+hZdYw87piiNe+r1p+Mv5+zfFfTcxv343xNc6d1Pqx8IdaDL3selOUBq3QACzn9UD3QN3QTaioOKB2UC9igVdud2QVENrJCg96oIBSiIdkVQRccIaI7VQAHPCChhV0D2QLmm6Ch/PZBuZ8H/AFCOotBT9CZjifVmOkYoJMj1F4pmWzHOHNb/ACyI5NLCXA91ybbfLPo2MjGUR6t3fP349rz3VeM9Trew+afScFODuT61rdHbRPs+W+nwhnqo2Wlt3KugBkFd6ChQPHCCXLoKD9UBq1CAxO6CWqLsgVe5QHDh0BnLIK2wQQcOgM5qgAMXQN/CaBa6Cjsggbc+6AyB7oDkIDF+yB9kC4QCKvugFrv9UB7sgNUkIFWclAZ+6BsgC6AgXLoI4uyI0n+LrXo1V1Kl6SwU8RZdo+SZUz0kER5hOhEU0uL+iX8uDkGKYF17YrLfoeXziq49a7P7sTu851nuiHH9tsy+mZhGFon1bUfvVcfKNI7JmWE69vdbe05LVQTe7oA3rehQQULOgtCWd0EavmiCgc+6AX9kAjcC/KA9X/VDgdqIhZFTwUBUXijlQ0N0Ch7oICOd0BAB2ZA3pfsnEWvYBAqQwHlBPdBUEu6EqWQAGsaoBNWd0Eq6Cnj7IFfKCAiwVFNKKATYIILt+9BRbsgWQCdkEN+PdNBR5QANnqgdwgMbAIKBsED1CXCZscYgghDxRxEAAdyaBI3zpBO6NXY9E9NeoPUiMRaH0ljszwxLHHxgYfBQtf8Aj5jQxNxB6z2Xhx+aYHK/+8uxTPu8avwxvjx0jtZDAZTjsz/7S1NUdfCn8U7p8NZbAaH+CaS0GL6maxmYggucuyN5Uq9o8TMHzIwR/Mhl+Vo+Ybezvpy+1p9qvfPhTG6PGam85fsFEaV5hd1+zRujxqnfPhFLP+iumugunWHiwuiNJ5dlHzIfTMnSZXqxE4f8JOieZM/1oitJx+bY3M6uli7k1d87o7ojSI8IbxgMpwWW09HCWop7uM988Z8Zl2SjkvfdY5kRggbOgdmZAuboFGogWQRwaoL3QL0QGJ7ILf2ogh8sgVQda6k6qOiOn+o9XwxQiZlGVYnFyRFaKdDLPy4feMwj3WQynB/T8dZw3vVRE92u/wCDHZvjPoGBu4n3aZmO/Td8dz5s4XDxYTCScKYniky4YIjzEBU+5df0BXV06pq638+009GmIl+p7L4VPZAQHagQQDclBS6CP2uiFeEUZAG1ERTQ04RR6OyAB9VQNG7qA9KMgPsyA1UB+yINUf0IogtdyhKHyg7n0a6gDph1LyfVeJnfLyyOI5dmzkgfsU+KERRltpcYlzfEBG6xOe5b+lsvuYamPX9qn71Mbo8Y1jxhl8izL9E5hbxFU6UT6tX3auf7M6T4S+ijEEg/3rhGjvUcNSqKP2QCf7kC3uhxCgW8eUDwgXN0FHYugndAFSAnAOyAgeR3QKOwQEDyEADZALb1KCuAKboIPKBvZAP0QWxZAarM3lAtZBLd2QNrkIHlAbd6oFSoDV3CoAHc+yB90CtmCgM5og691B1ngun2ic71tjxDHKyjBx4iCWS3zp35ZUrzHMMEI7lZDK8DVmWMt4SjjXOndHOfCNZY/NMdRluDuYuv6sa988o8Z0jxfNuZPx2KnTsdmmJOJx+LnTMVi50RczZ8yIxzIz5iiJXfqaaKKYotRpTERER1REaRHk/n6uuu5VNdydaqpmZnrmd8/FKgBJQ9mQTdgUDk9uEEtsgWqyoXooLQXQL1QKg2cIhepNUUqTQgeURBugOWZkVXQBalkEBYuwqgtfdAHv4QGIQNrgoIKCiCsUBBLlggVBKC94blAYm3HKCO3lAZwLIL5QN3dA2ZkD7IAqK2QHO6AP0QLG6B3QKsyBSrlAsKIKx3QGNgEHPA4XGZnmMvKMpwOKzDMJw/isHgsPHPxEfiXADE3chlLldNmibt2YppjnMxEecvq3RXeuRatUzVVPKImZ8o3szaI+Efqpqn5WK1HFgtH4GNi2LIxeNMJDgiRLPoh/15gI3hWp5htpluD1psa3quz1afxTGs+FPi23L9isyxmlWI0tU9vrVeUTpHjVr2NgND/Cv0i0ZFKxuMyaLU2ZS2P7ZnhhxAhi/zJAAkwMag+kxDlaRmO2GZ46Joor9HTPKjd51e1Pnp2N4y7Y/K8DMVVUekq669/lHsx5a9rLohAhEIFIQ0IApCOwsFq8zMy2qIiEUUA3QXZQTvdUVA7oJ2QUmt1AsX+yod0Ail0AoGwYvRA7FA8BkBmsgwV8ZeoRlnSWTp6AwmZqPOMLg4oSa/JlPiZh8fxMMJ/wBILdNhMN6bM5vzwt01T4z6sfxa+DSdu8T6HLIsx/8Asqpjwj1p/h08Wl3qqX3K6y5HxQUQHuiI58lFjcrEV+iA/FUC93QRBf15QAaUQAALFAdj2QH4p5QOzoDuGdET3RXJ6sgDuyCM10AHkEPygE73KAQHqUFodyEEiglzIIpcyERQRgwxg7g0IV1mJ1hJjpRpPBvZ8Luvo9c9KMDhsxxBm5tpuM5LjooovxTBLhBkTTVz65Jgcm8Qj4XGdr8tjL8yqqojSi568ePGPCrXw0dq2PzP9IZbTTXOtdv1J8OE+Mab+vVltmWrtpHetUC9WQA4QVnQK3NEEtW6CizFATUQAoKhqHsUCvCALiqCE0oEFZkELmqCjhkDd0E2QHQXyghoQ1EF9kBt90B9v1QT7oLZBLUQO6C33QSgoUC5ogboAHsgeEODV342NbmGTkHTLBTWOKi/hzMgHBMmWTBhoDsRFN+ZG3/AhdG2By//AFcwrjh6lPfO+qfCNI/alzfb3MJ0tZfTPH16u6N1MeM6z+y1bY3Lro7mo25ctsgm4LUQDRAbd0EeqC78oI4qf7BUVQLnlOAj08ILwe6AO4RBwCzVRUQUPwiIOyAxdkFN0VL9kAGu6ALAhAoH/cgteUBq0QCgMIQSyEm71QHcVQQEmhsgAAAfRAqaIL7oFKoBoEABt6oI9bEoivZh2RT3CA/uiDKqopsoOEyZLkyzOnTIJcuD80ccQhhHkmitMTVOkRvJnSNZdx0N0e6ndSPl4jSWkMXMwExv/SePP7HgvSS3qhmTB6pg/wCLhjWLzDOsvyvWnFXYiqPq0+tV5RujxmGVy/I8xzPScNanoz9ar1afOd8/sxLYHQvwVZJhflY3qVqnE5tNDRRZdlXqweEBq8MU0/x0wd4TL8LR8w29u1a0ZfaimPeq9arwj2Y8qm85fsFao0rzC5NU+7T6tPjPtT+6z5pLROkdB5cMp0bpvLslwhb1wYTDiWZpAYRTI/zTIv8AOiJPdaTjcxxWY1+kxVya57Z107o4RHc3fBZfhcvo9HhbcUx2Rx7+c+L3dBYMvG9p9kBuEBggmwogu7coAdArYoHayAa0ZAfhAat0DyEBnQPZABpugNRigM16IDfiZBp38auoosfr/Tul4DDFKyXKZmPjI/33FzfRCD3EGHP+2uq7BYX0eBu4meNdUU+FMa/nV8HJ9vsT6XG2sPHCimavGqdPypnza+izfqt4aKn7lUBUqKBigbVQGP8AQgDcoDvdBCwNqqpINnKKrF6KBQbIcC3hAb6Ih+WhqipWqAzWCCgNZA8lAsgD6oG5oGQBQ0F0FpwgzL8JmuDpPqxBkGKnCDAaww37BF6ogIRjJIimYaIk7kfOltuY4Fqm2eXxjcsm/THrWp6X7M6RV8ejPdEtt2MzH6FmcWKp9W7Gn7UazTPlrHbMw3hoWPNVx12UFkFL3dBC+xQKblBfKA+xCBVAetEEpf7oAogVdBWILDdBHOyC/qgndBR4QRvYoG6BfZAtUIHdAPdApugCtyEA1QCP60C/lBD3KC2QK7IScWQA5uEBnsgOCKOgCExkQg3LUQndD5wdVNaDqF1I1FrGVNEeFxmMMjLyHb9ikfxUgh7eoQmZ5mFd8yjAfozAWsLMaTEa1feq3z5cPBwDOMd+k8wu4qJ3TOlP3ad0efHxdXCyLGB+iKjtwUQH3ZABZULFgLqAzFmQUN4QQUoyBbcIK9mQSveiIEgOyKvDIIXtwgU8IAVQUUpygnlBd6oCojMpqOQ3AQRv7kCgtugAmgQGe/6Kg1atZQUNayAaXKCWLBA343QW1kEelygp4QA70v2QBwEBg10ABB+2W4HH51mUGS5HlmMzTMYwTDg8Dh4588jn0QAkDuWHdfN25RYt+lvVRTT1zOkecvu1buXrnorNM1VTyiNZ8oZp0N8HvU3URgxOr8dgtI4OL/JRenG4+IU/kS4vlS3G5jiIN4VqOYbb5fhPVwtM3avw0+cx0p8Ijvbhl+w+YYv1sVVFqnq9qry16Mec9zYfQfw1dJNBTZWPw2nv4azSV+KDMs7iGLnQRAuDBCQJUojmCCE91o2ZbV5nmUTRVX0KJ+rR6seM8Z8ZlvWW7KZZluldNvp1x9ar1p8OUeEQyjF+IgxEnytb1bJoNwEUFbID1IQTwgILawQSgPJQXsgdkBBKcIAYlkFYd0DuzIJ71QWhQR9kDsBRBdmG6BUXO6CEGKgNTQeUg1fO3rdqIar6xayzuAj5f8KRZfJYuPl4SEYenYxS5kX+su75BhfoeV4ezz6PSnvrnpflMR4OC5/ifpea37vLpdGO6j1fziZ8XS6XO6y7Dp4NAoL71QS90Fsf0QC/hNQqzIIQw5QAxABHdALXKBXfbhAvygtLCiCGm6C0tygbUN0EDIKO6Ce9kFsGiQKW7oF2KA26agLuKeEHOVisfgZ0jMspnGTmGBnysZg5m8GIlRiZLP8AtQj7pNFF2mbd2NaaomJ7pjSfgtNddqqLlqfWpmJjvidY+L6V6L1Tl+uNJZPrDK6YXOsFJx0uB3MHzIQTAe8MTwnuF/PuPwleAxVzC3ONEzHlz8eL+hcvxlGPwtvE2+FcRPn/AC4S9zuzryPYpHhBLlrIH6oFBb+5AtSqAz1QD9UDwWCBf8uyAb0HZArv4QL7WQPFEFalUEA4QUUL0QRmqgEWKBwgfuQKlBWPug470QUUcBAarMgNW6AXBQK1QKg2QDcMgVQX2qgh4QY3+IvW0zQvSHP8xwc8SsfmEqHKMvIiIiGIxJ+X6oSN4IDHM/1FsGy+AjMM0t0VRrRTPSq7qd/xnSPFr21OP/R2V3blM6VVR0ae+rdu7o1nwfP6CXLky4JMkemXLhEMI4hAYfZdumZmdZ5uHRERGkOTh6XUCtiEC1DdBCA/9KAAd0FsyC+Qg4iiAgcOgcVRFtT6oqA7k77oFlReAoDB6lBHLugFqMgG+yA3dUR2og5VAdQRmoOFRauoDJxRKWRTyEQYD3RRq0aqoNW5qoKN90Ag3QGG5QB4qgFmsgpANCggFfsgGKCXLimzIhBBCHMRLADkk0VjfOkcThGs8HbNB9I+pHUn0TtH6TxU/AxGuZ4w/smBAdiRNjDzAN/lwxrGZjnOAyvWMVdiKvdj1qvKOH7UwymXZJmGaaThrczT70+rT5zx/ZiWw2hfgqyHBmVjupep8TnM1hFFl2WGLB4MUrDFNf58wdwZfhaNmG3l2rWjL7cUR71XrVeXsx5Vd7esu2Ds0evmFya592n1ae7X2p86e5n7S+kdL6Iy0ZNpHT2X5NggxMnBSIZQjIDeqIgPHFzFESStIxeOxOPuelxVya6uuZ18urwbzg8BhsBb9FhqIpp7I0/vvne9tDCy8j1q1KIGyAUD8VyEA/ZA3dkBAfgoFd3QCK3QACSKX4CDEXVL4m+n/TfFzchwon6jz+STDNy/LY4PThorNiJ5Polm/wCEeqP/ADautpyfZLHZpTF6r9Xbn61Wu/7tPGe/dHa1bONrsDlVU2aP1lyPq08vvTwju3z2Px6MfExp/qvnEelsxyGbpzPjLjn4bDTMXDiZOMlQVj+VNEMJMcI/EYDAD6agxARN957speya19Jt1+kt8JnTSaZnhrG/dPCJ1nfunTdr+eQ7WWc5u/R7lHo7m+YiZ1iYjqndvjnGnDfv36ZihqFqbbV7PRAbdzVALbIF/KCEAVOyC+yB4ogBB6nV+o5OkdJ51qzEAGVkuXYnMIwSwiEqXFE3uQAvVgMNONxVvDR9eqKfOdHkx+JjBYW5iKvqUzPlGr5l4aGeMNKOLjijxEUPrnxEuYpsX4oyTyYjEV/Q1enSno8OXdG6Pg/namJ6MdLjz754/F+jcVXw+kq9UEIa6oChbuoKgUoyAatsgMbMgU+yCPuSgVFeEBy6CttZOAE7ApoAq1UAgXCAzUJ90APsEAU5RC90UpugDkboA/E7IF2qgop+UmiDb34LNYHMNG5xoLEzf43TmO/acLDEQP8AE8WYowBz6Z0M8dhFCFy3b3A+ixVvG0xuuRpP3qdI+NPR+LqmwWP9JhLmDqnfbnWPu1b/AOLpfBsTfdaG34Yc+yoXpwgB0B0AHv8ARAFB37oD1ogVogW5QEFqdroAofayCC7tThAfsgMCQEBtggVN0CuyBXdAN0A2ogUcFkClwXQLFggU+yARWqBs/wBSgfZBWN+EE+6A1KILtVBCHpuoNSPjY1acZqTTOg5MwmVluGmZ1i4QXBmzTFJw7jkQQ4g/64XUdgsF0MNexk8apiiO6PWq+M0+UuW7fYzp37ODid1MTXPfO6ny0q82t+/Hhb65+bgsyA4al0E/RA8NRIDd3QGI3ogrF3Psgdt0EL7BUK3JUAFvKCoIxBoURWqwaiAKIqWPlBakVKAxPZAbhBGBZ1Q+zcqBdBa7FkE2oEFb2QGrdkEcgIDIADd0NFunAAgMgd2QACDRBWejXQcXefJwsEMUeIxEQgkyJcJjmTYjYQQQgxRHsAVZ3RNU7ojjPKO+eEERM1RTHGeERvme6OMsvaD+FbqvrT5WLzjBydIZbGQTNzWEx4uKDmDCwEEHtMjgPYrV8x2wy3Aa02p9LX9ndT41T/tie9teXbH5ljtK7sRap+17XhTHzmO5sdoH4XOk+h4pWPxOURalzWW0Qx2d+meIIqVlSABKlsQ4Ih9Q/nFaFmW1+ZZhrRTV6OieVG7zq9qfPTsb7luyGW5fpXVT6SuOde/yj2Y8te1l1yW9Rdgw7LVpmZbTEacEuKIpu5qggH0QXuxQGb2QVi5dDghB24QGbZkC26AGD0QKvZFQUuiS9bqPU2n9IZNiNRaozjC5ZluEHqnYnEx+mAHaEbxRGwhheIlgASV6cJg7+NuxYw1E1VTwiP74dc8IebF4yxgbU38RXFNMc5/v4c+TT/rH8U+o9cifp7p/HitPaei/BNxh/i8xx8O4BH/q0o8D+MIFTA5hPU8i2PsZdpfxuly71caKf6p/djqni5Vnm2N/MNbOC1t2+vhVV/TH73bHBgqTLlYeXDJky4ZcuH8sMIYD+vutyqqmqdamlREUxpTwZT+GjR+c6s6wZLmOXS5sGA0tP/hPMsXBSGV/FTIZUn1fzppib039AjNmWt7V461gsruUXNOldjo0x174mZ7qdOPXo2bZPBXcZmluu3r0bc9KqY7piI/a14dWrfSEEAA8bLirtsKoG/lUGUECqqe+yIlroLXlA7IML/F9n/8ABHRfGZVA4m6izDCZTCQWPoMfzpvsZcmMe623YnDemzaLk8LdNVXw0j4zDT9uMT6DKarfO5MU/OfhEtIoi5fldg0cdcbUNkAgGiIVL0CKVG7IF6bIJTdBa+4QQWd1QPdioL6e/wBUAl2AsglBVgUAc7lBWI3Q4IQf6kFo6CAH3QVq02QGoyCdwgoA3IdBD5QUCjgMnYFdigVQZP8Ahn1aNI9aMkinTRBhNQQTMixJi5nNFIPn50uCEf8AGFa9tZgvp2U3IiNZt6Vx4bqv3ZmfBseyeN+hZtb14V60T476f3oiPFvxftyuJu3nhA2ayAyAyAx2CAeLIKxNOEEELmqBYsEDZnQUh92QQB6oB90Fq7koJV7IKwNQUC1kEr3QKkglBaNS6CXKgdlRSyAyCfVAuUA0o6ARR3v3SQ7IDvcoHlBa2YoIzkQ/ziAkEvnB1V1WNc9TtU6rgmwTJOMzKZJwkcP5ThMP/ESSOxhl+vzGV3zKMH+j8usYaY3xTEz96r1p8tdPB/P+cYyMwzG/ieU1TEd1Pqx56a+Lq9ywKyLGnaqB3sgN3QGaiCAU28IAFUFI25QSK1APCC2q6BvQoaJ9kDZgSqgHdruoquBuiDIoHZmQL1ogNYxIAelQgWNDtugf3oBYGlUDd7IG17IAd6oDAIKeUEH96A3ZkAgbboHlAYGyCtVhVF0edp3Ic/1hmhyXR+RY7O8fCQI5GBk/M+U5YGbHSCUH3jihC/HE4izgrfpcVXFFPXVOmvdHGfCJfthcNfxtz0WFomur7Ma6d88I8ZhnzQfwYajzQSsd1L1NKyWRE0UWW5OYZ+KZrR4iMfLlkG4ghj7RLSsx27w9nWjL7fTn3qt0eFMb58ZjubxluweIvaV4+vox7tO+fGqd0eET3tjtA9JOnXTOV6dGaVweBxEcJgm46MGdjJzs/rxEbzCKP6XAGwWhZjnePzWf+ruTMco4Ux3Uxub7l2SYDKqdMLbiJ5zxme+Z3/HR20B/xLFMrot3qilUBQPdUN0B6oFyzoFXoEBQC71NFQ8oIT2UAkiooqcGL+sPxB6O6TSosumvnGpIoBFJybDTAI4AQ4jxEbESILXBiif8MMVW2PI9mcVnM+k9i1zqn8qY+tPdujnMNbzzafCZNHo59e7PCmP90/Vjv39US0t191G1l1QzmHPNZ5r+0RSTF+x4OQDBg8CDcSZZJqRQzInjO5ZguuZdleFymz6HCU6a8Zn2qu+fyiN0dXNyLMs0xWb3fS4qrXThEbqae6PnO+fg62/uvexzsXT7p9qTqjqiRpTTEqGGbEBNxmNmQEycBh3YzZnO4hgd44qUAiIx+Z5nYyjDzicRw5Rzqnqj5zyjwZHLMsv5viIw2H8Z5Ux1z8o5z5voD096f6b6Z6Xw2lNLYWKVhpJM2dOmMZ2LnxAeufOi/lRxMOwAhhhAhhAHEszzPEZriZxOInfPCOURyiOqI/5nfMy7hleWYfKcNThcPGkRxnnM85ntn/iN0RDsaxzIrapKBTc3QDXdQPqqDbIDt2UClKoFVRqR8bmov2nUuk9ISoy2BweJzifC9Iop0QkyS3Ihlz/9pdQ2AwsU4e/ip+tMUx4b5/Oly7b/ABU14ixhYn2YmqfH1Y/KprexNlvrny9kE8oBpdA2JdANWa90Bm3QEEuGu6CmpugmwFFRXH2UD8OzD7IJtfugf2KCubH7IJvdBR2KCNWtEF3QBWhQKe6BejIIw5t2VFDszhQPCCRTsZhWxeWzTKxuFjgxOFjBrDPlxCOWfaOGFWKaa/VuR6s7p7p3T8Fiqq369udKo3x3xvj4vpnpPUeD1hpfJ9WYBhhs6wEjMJUL1hE2WI2PcEkHwv57x2FqwWJuYavjRVNPlOj+hsBiqcbhbeIo4V0xV5xq9q7FeV61v7oJ3KCnugAgIIgMdkC9SgGpBQUUNUEo/dA9/ugeLoLu5QSr1NkF82QTdArtugM5pZAQLU3QO90CoJHKBvUIG9UBkCnP2QLoD1oEBnsEAMEAE3QdO6yavi0H0t1RqqTMil4nA5bNGEihv+1Tf4qR/wBZMgWWyLA/pHMrOGnhNUa90b6vhEsRn2O/R+XXsTE74pnTvndT8Zh85pEiDCyJWFg/LJghlg8gBn+y7zVVNczVPNwOKehEU9Tm16L5UatDZA2ZkDtdBAXPZAFVRbs/6KBVwgVHJQGbeqCV5RF4KKDhEADwio1xRBahA9IdnREat1VVwd1BbM+6CU3qgm73QUffsgVDVQDXtRA3o6AKID7MgC1qIKLk90IQOUEiigly4ps2OGCCCsUURAhA8misRMzpHEnSI1ng7joLpB1L6l/Ln6Q0rOjy+Yf/AJ1x5OEwLO3qhmRD1TR/xUMaxWY51l+VaxirnrR9Wn1qvLhH7UwyuXZHmGaaThrU9GfrTup8+M/sxLYzQ3wYaRy4QY3qPnuJ1JiGc4HC+rB4GEtaL0xfOmsf50cMJ3hWh5jt3ibnqYCiLcdc6VVf0x4RM9rfsu2Ew1qOnj65uT1R6tP858ZjuZ9yTIsl01l0vJtO5RgsqwEh/l4XBYeGRKhe7QwgBzd1pOIxN7F3Ju36pqqnnM6z8W8YfDWMJbi1YpimmOURpHlDzhRfg/cBc90CvCgOLKgEB2QGZA2QCgdwUBi7lAc3ugMgjtQXQfjjcdg8uwc/MMxxkjCYXCy4p06fPmCXLlSwHMUcUVIQAKkr7t2671cW7cTMzuiI3zM9z4u3KLNE3LkxFMb5mZ0iI7WqfWP4uMVmUM/TfR+ZFh8PE8E/UU2W0cwbjBy4rDb5sYe/phtGul5HsVTY0xGaxrPKiP8AfP8Atjxnk5nnu2tV7XD5XOkc65jf+zE/xT4RwlrYTFHNmz5s2ZNnT5kU6dNmzDHMmzIi8UcccTmKImpiJJK3/hEUxuiN0RG6IjqiOUdkOezrMzVM6zM6zM75meuZ5z3g4ZEe10fpDUev9S4TSGksGMRmWMeJ43EnDSQQI586IfllwuHNySIYQYiAvNjcbYy7D1YrEzpTHnM8ojrmfhGszuh68Dgb+ZYinC4aNap8ojnM9UR/xG+X0A6VdLdP9JtLS9O5EDPnTCJ2Y5hNgAnY7ENWZE1gLQwCkMLDkniWc5xfznEzfu7o4U0xwpjqj5zzne7hk2T2Mlw0WLW+eNU86p65+Uco3O4u9wsQy4BvZBDfwgt/ZBKPZBfZAP8AaiBvUkIDDnyoJH+UtUqj59/EJqL/AAm616sxkqZFFIwGKl5PIERdocLLEMYH/LRTj7ruGzOF+iZRYonjVE1T+1O792IcL2mxX0zN79ccKZimP2Y3/vTLH1rUWdYFKXQC2yCIFTygtbOyB9UELO4CHEoXaiAGFUDyg5BhV2QcfxMSyCmzmhQTxsgMGsqFiBsoAs+6Cg1P6IIBUlA9kFYjZAobBBG3QLWZBRy6CiIwl+KpoRubp/B1qT+F+ksWn5kwCdpnNMRgIYXeL5EwjESSeA00wD/QXJNucL6DM4v8rlMT4x6s/lr4uvbC4v02WTYnjbqmPCfWj89I7mdPdaa3Qv7oIGLIAu7ILayCW3QOyCGp7oKeOUCl0D9EBjfdAF1BR+ioXogj1ogVQGQECr3QEFayCDgIBvSxQEFs5QRt0CyBccoIzIKGNkBy4CDXb419TfsOiMh0hJmxQzM9zb9pnQi0eGwkHrIP/LR4db3sDhfSYu7ip4UU6R31zp/DFTQdvsX6PCW8LE766tfCnfPxmlqF4K6k5Wl9kB6UCAx8MgVQBdBCgtmZUFBGYcILaiAPblBDe6cBfZArcIIKG5QV0DZkAfRAfgoHqAYIFvdAogVO9EE8sgtKVZAQLf1oADoL714QSH1TMVJwMqXMnYrExeiRh5UuKZOnRGwglwgxRHsAVZ3UzXM6RHGeER3zO6CmJqqiinfM8IjfM90RvlmDQXwp9VdZ/LxedYWTo/LZjRfNzOH5uMiB3gwsBBht/lY4CH/KVq2Y7YZbgNabM+mq+zup8apjf+zE97bMu2NzHHaVXoi1T11b6vwxw/amO5sdoD4XulGhZsnMJ2UR6jzaSRHDj86MM8y4qVlyQBKlsQ4Ih9Q/nFaFmW1+ZZjE0RX6Oifq0bvOfanz07G+5bshlmXaVzR6SuPrV7/KPZjwjXtZZLxF4iSdn28LV20RBWwRQV90AuoDMaqhdDQuWFEDe9kC5JogIJUIK1bFAuXQLIAQKFB0jqh1f0V0ny2HGaox8UWMxMJOCyzCgR4zFnmCAkemAbzIiIBZ3IBzGUZHi85udHDx6scap9mO+evsjWZ6mHzfPcHktrp4irfPCmPanuj85nSI62lHVXrNrXrBi4YdRTYMDkkmZ8zC5HhYycPLL/hjnREA4iYKfiiAhBcwwwuSeu5PkWEyOn/p46VyeNc8Z7vdju3zzmXH84z7GZ3V+vno2+VEcO+fenv3RyiHR715WYYVBdB7LTGms/1pqDBaV0rl/wC25pj4iJUtzDBLhDeqbNi/kS4RWKLwA5IB/DF4uxgLFWJxNXRop/vSI5zPKPGdz0YTCXsfiKcNhqda6uH856ojn/Nvv0b6Qae6QacOVZdEMXmmN9M3Nczjl+mPFzYQWAH8mVA5EEGzkl4ooieK57nl/O7/AKSvdRT7NPKI+czznn3RER27IcjsZJh/R0b659qrnM/KI5Ry75mZ77UvQrBs4vg/RAuH34QCNzVBGY3QU9/sgC72HCAxsgWKASDsg8TOM3wmQZTjc9x8RGFy3CzsZPI2lyoDHEfpCv2w9irE3qbNHGqYiO+Z0fhib9OGs1Xq+FMTM90Rq+YYxuMzT15rmUwzMZmE2ZjcTEbmdOjM2M/7UZX9EejpsxFq37NMREd1MaR8IfzpNyu9VN2ufWqmZnvnfP5nH2UD6kIFHDbbIHiqCA81QNzugu7AIBbcoGwZAQRq/wBKoNuHUADdz9UF2IIZA8VQG4QAGpYIA+6Ck7UQRibmqAWagQAaUQTtwgCm9EBi3CCsQgB7Ogz98F2pP4N6j53pabMhhk59lEOKgBvFPwkxmh7mXiIvaDstK27wnpcvt4iI30VaeFcfzp+LeNg8X6HH3MPM7q6dfGmf5VfBuSX2XJ3WiuyADwgr1pugn6ILT2QK/uQQVQWnNEEbf7IL3QRggGthZA4ZBLbugrGxKAgVuEC1EBjd/ZAHOyAzIL3QQOgG/CATv9EDahYdkA7OgXp+qADVkDsgUNXZDg0l+MLUP8MdX5OSy5pMnTuTSJJgP8nEYmOKdM/6EOHXX9iMN6DKpvTG+5VM+FMaR8Zqcd23xPps1izE7rdMR41TMz8OiwlULb2nlyoA7OgMAUAIIEFtuaIJblBe7oBsglkDuqhuooRugoPJQPAQGdA7CyA21aIFWQLMxQTZnogor9EHFr0QchwhwOAgoYnZABJLVPi6Gmr2Ol9M6m1xj4sq0Vp7H57ioYhDHDgpfqlySbfNmkiXLH+nEF+GLxeHwFHpMXciiO3jPdG+Z8IejB4PEZhX6PC0TXPZG6O+eEeMs/aD+CvPMd8vHdTNUQZbKiaI5bkpE2eQR+WPExw+mAg0Iggi7R7rScy28s2taMvt9Kfer3R4UxvnxnvhvOW7BXbmleYXOjHu08fGqeHhHdLYzQfSvp700kRSdE6VwWWzZkPpnYtjNxU4f58+N5kVdiWGwWhZjnOOzWrXF3JqjlHCI7qY0iPJvuX5Ngcrp0wtuKe3jM99U6zPn3O1sx73WMZRf0QL1QQOTwge6B5QK8oKxQSuxQC/lBbiqCNxwgW3QLqBeqoEfVQK2Dn+hXTXgTMQ1w6yfFrlmTftGmelEWFzfMx6pU/OYx8zA4OKxEoP/jMwVq/ywWcxMYVv+RbF13ujiMy1po4xRwqqjt92P3uyOLn2fbaW7GuHy3SqvhNXGmmez3pjs9WOczwao5lmOZZ3mmKz3PMzxOY5ljovXicZiphjmzTsCdoQGAhDQwigAC6XatW7FuLNmmKaI4RHCP8AnrnjPNzK9duYi5N69VNVc8ZnjP8AfKI3RyeM1XX2/NAKsCg83IcgzzVed4PTWmcumZhmuYzPl4bDwGhb80ccVoJcIrFEaAd2C/LE4mzg7NWIxFXRop4z/LrmeUc374bDXsZepw+Hp6VdXCPnPVEc5b6dFei2TdINPnDy5kvH59mEMMWa5kIazYhaVLBrDJhc+kb/AJjUri+f59ezq/rwt0+zT1ds9dU858Hatn8hs5LZ6Mb7lXtVdfZHVEco8eLI1jSy19sJ3JQVv60EAI90AoG6GpR0A97oFTUqCi6ob8oMS/FTqI6f6H6hkyp4l4jOxJySSP537RMEM0DxJE0+Atn2Owv0nOLUzGsUa1z+zGsfvaNW2yxf0XJ7sRO+vSmP2p0n93VokS5cW2XZocXQjdEN9vZAZ6EoBayCOzUQU0A2QKuEEPLoDsgBv7FAetUAGhQN0Ff1WQPAZALjwgli7oK+6AxdwggL3QTenhVF32UU2QGeqBVr/RBW4QEHb+jWof8ABbrBo3PYooRLgzeVgpxJYCVioYsNET2HzoYv9XssXnuG+mZXiLPPozMd9PrfJlMixP0PNMPe+1ET3Ver89X0YaJ/QT+X8P0XBpd+jhqteUCr3dBKkoAaxQUC26AS1CUEuaILvvVAcu6BeougChdyghrRkFYs7oI1aoFzVA3+yggqbFUcjVAugH6II1eUCn9ggUoEOIboFzXwgWq6AfJQUuggcWCcAQQ/j/A/5iB9UgndD5w9UtQHVPVDV+ojNhmwYrOsTLkxw2ikSIhh5RH+pJhPuu+5RhvoeXYexziiNe+r1p+NT+fs3xH0zMb9/rrnTup9WPhDrCyDHJVAcVQBQMQEDsgh5BQVuAyBuw32QBahFKFBOWFEFFA4sgj0qgVBfdBbm3tuqCgUN0Qsij1o1E0By1ECo3LIH6oFHF0EugDugoAsURxmzZOHg+biJ0EqB/zRxCEPwHurTTNU6UxrJMxTGsyyDoXoJ1Z6hiXisl0tHluXTWIzLOvVg5BhIcRQQEGdMBFjDB6f85YPMNossyzWm7c6VUfVo9afGfZjxnXsZ3LtnMzzLSq1b6NM/Wr9WPCPanwjTtbEaF+DbQGSCXjNd5jitW4sH1GREDhcvhNCP4mCIxTGqP4yOKE/zQtFzDbrG39acFTFqnr9qr8UxpHhET2t8y7YXBYb18ZVN2rq4U/hidZ8ZmOxnbLMqyzJMvk5Tk2W4TL8Dh4fTJwuEkQyZMscQwQgAfRaXev3MRXNy7VNVU85nWfOd7dbNi1h6It2aYppjhERpEeDyu4C/J+qgbsqJTdBb3UA1QhO/KoAD6oHdkDZ2QAHCA27oLRBN0B+6A32QLugGoqg69rjXuk+nWSTNRaxzqTl+DH4ZYP4puImbS5UsfimRniEHclgCV7svyzFZpeixhaOlV8IjrmeER2z+bwZhmWFyuzN/FVxTHxnsiOMz/fBpj1k+IzVnVb5+R5dBP0/pSImH9ghjH7TjoNjipkJYQkf5GA+mpEUUdG61key2FybS9Xpcvdem6n7sTz+1O/qiHJM92pxWc62betuz1c6vvTH8MTp1zLE0IhhhEEEAhhhAhAAYAcBbNxnVq/DdDkByoHhB5mQ5Dneqs7wWmtNZbMzDNcxmfLw2Hl09TfmiiiNIIIRWKM0A7sF+eIxFrB2asRiKujRTxn5R1zPKOb9sNhr2MvU4fD09KurhHznqiOc8m93Q/ohkfR/JoovmS8w1FmMuEZnmfpZ2r8iSDWCTCdrxH8UVWA4xtDtBezu9pHq2qfZp+c9dU/DhDtOz2z1nJbWvtXavaq+UdVMfHjLJgda62NeyCMGpYIF6BQKKkA90FQRgoDKg3PugpFKIJtXwg1X+N7UsMeI0homTPDQnFZ3ipZuPTD+zyD7/Mn/AOyulf4f4TSm/i5jqoj+Kr8qfNzP/EHF61WMJE9dc+EdGn858msNSuhucofKC7sgg7boAp7IJtugodAsaFBKXFEE8qor0UXiVVBmUF8oJ3VRbMVBBViyKu78oG1ED3ZkE3LFUVnFf1UAEoIKVCBayoO1lBR9EAXBCD8saZwwc6LDRGGfLgMySRcTIPxQH/ahBX3b06cRVw4T3Tun4PmvXozpx4+Mb4fTzTWeYfU+nsq1LhIfTIzfAYfHyv8ARmy4Yx/8S/nfGWKsJiK8PVxpmY8p0f0Xg8RTisPRfp4VRE+Exq9gzcrzvSEOzCiC9kE/QoKO6CXPZAF2dACCi7oJdAAJu6BaiAyBcoAfZADOyA1ygUu6Bc9kCt2HsgboHDIBvUoAb3QP6EA88IKwKCIAuQfogbiiD1eqc8g0vpfONTTR6oMoy7FZhGORKlRR/uXqwWHnF4m3Yj69UR5zo8uOvxhMNcxE8KaZnyjV8xsEJkGCkCdE80yoYphO8cQeL7kr+hrkx0504fJ/O1vXoRrx/vV+xe4qvhQu/CAgbuXQHDoJvdBdqBAHG6CbUJCC1Y1dDggLGpQLoA5J7BAv+F3RFFkUt5QLlAevZBNnQUu7sgCqB23QVg9BdDR5GTZXmuocxhyXTmUY7OMxNf2TAYeKfMhHMQhDQCt4iB3XzfvW8Lb9NiKoop66p0jw1490ay+7Fm7irnorFM11dVMaz8OHjoznob4N9f55FBjNeZzhdLYMkPhMN6cbj4g9QYgfkyiRYgzW4Wm5jtzgsNrRg6Ju1dc600/1T+63TLthcbiYivGVxbjqj1qv6Y/ebFdP+gXSzprHKxuRaal4rNJYDZpmUX7XjHG8McdJXiWIR2Wh5ltLmWaRNF65pR7tO6nxiOPjMt8y3ZrLssmK7VvWuPrVb6vOeHhoyDf8RrFyalYJn+AOLIDVogCmyA3dQO7KijzRBPJQAKUKBXlA2oyC+KIOPlBa8oDn6oA7IBQKG5QR6s39aaDC/Wf4m9MdN5mJ03puXJ1BqmWDDHhoJjYXARbHEzB/KF/lQ/jLV9AIiW3ZDsliM0iL+I/V2evnV92P907u/g0/P9rsNlWtjD/rL3Vyp+9P+2N/dxab6p1bqbXeex6l1jnE3NMxjh9EMyMCGXIl/wC9yZY/DKg7Q1JrEYjVdWwmDw+X2Yw+Eo6NHxmeuqeMz38OWjk+MxuIzG9OIxVXSq+ER1UxwiPz4zMy9UBRrr0vLojoG6DzshyHPNVZ3g9NaZyyZmGa5hH6MNh4Czt+aOKK0EEIrFGaAd2C/HEYizg7NWIxFXRop4z8o65nlHN++Hw17GXqcPh6elXVwj5z1RHGZb3dEeiGSdH8ljiMcrMdR5jBD/CeZ+hvVuJEkGsEmE2F4j+KKrAcZ2g2gvZ3e09m1T7NPznrqn4cIdo2f2fs5JZ1n1rtXtVfKOqmPjxlkta82NKmn6IL5QHdygXsgOgW8oD8oDNbdALbUQC5ogE8IBPpHq7Og0E+JfUn+E3XDUcUM0TcPk0OHyTDlrfJl+uaP+enTB7LtuymF+iZPZiY3161z4zpH7tMOH7WYr6Xm92YndRpRHhGs/vVSxoxdbA13gj7XQTdrKijyoB72QAghLoKBSpqglbt90AhtkAOK/2KCk7MglggAtS6B9kFJN90EFKH9URyeiKnuggugoPdBHHG6AW3QLP3RClHq6KOQGCAD3ZBfF0HKD8MQiIo7lJ3rG5vj8LmcRZx0J0sJs4RzstlT8pmB3MIw0+OVAD/AMnDAfBC4ttfYixnF7SN1WlX4oiZ+My7ZshiJxGT2elxpiafwzNMfCIZUIq3C1tsqXQWwoUDilEFCCV8IAp7IAaqBRAaiB9ECyA5QK7lkCt2QG7VQGBaqA7h0BnFCgXrygUNkDvZAtUFAe9EAixQBXZANBwyBdokCxtRA8oMV/FFm0WU9CdVmVM9M3HyJGVwVYxDE4iXKjA/1Ioj7FbLshYi/nNnXhTM1fhpmfzhrO19+bGTXtONURT+KYj8plodFWKItc/Zdojg4pO9xYuiIfLoLwAgtkEh2YMgUuggrcIKTwXQP0CBuzkIKC9kHEIKbuEB9gEC1kAWoyB5ugBnp+qB4QANqoEyOCVLM2dMhgghH4oo4gIR5JsrETVOkcSdIjWeDt+g+j3U3qWJU/SWk8THgJpDZpj3wmCELt6hMjHqmj/ioY1i8wzvL8rmYxV2OlH1afWq8o3R+1MMrl+R5hmulWGt+rP1qvVp853z+zEtiNCfBbprBCXjOpWosRn0+hiy/AevB4KGlYYogfnTa7+qAHeFaHmO3l+56uX24oj3p0qq8Pqx5T3t8y7YOxa0qx9c1z7sa00/1T5x3M+6c0zpzSOWQ5NpXIsBk+AhqMPgcPDJgJZvURCPxRFg5LkrSsVjMRjrnpcTXNdXXM6/m3jC4PD4K36LDURTT1RGn5PZt6aCgXmeka1UDgwlANnQKcFApsgM6BcoHYFAo1UD2QH2BQK8hAatSgU4UAV3VFalEEodkCyD12f6hyPSuT4rUGpc1wuWZbgofXPxWKmCCXCLAObklgIQ5JIABJZfvhsLexl2LGHpmqqeERvn+/yefFYqxgrVV/EVRTTHGZ4NQusfxWZ/rGLEae6bzMXkORl5czMqyswxsI/mb4aWf+dIb/c6hdTyPY6xgNL+P0uXPd4009/vT+7HbxcrzzbG/j9bGX60W/e4VVd3ux+93b2BJUuXJlwyZEsQwQ2hA/tXkrdaqpqnWWkREU7oc+zr5U+qCV4Qew05pzPtY59hNMaWy2ZmGbY4kSZMBYQwhvVMmRWglwv+KI2oA5IB8+KxNnBWasRiKujRTxn5RHOZ5R8npwuFvY69GHw9PSrnl856ojnLe7on0SyHo9kccEuODMNQZhDD/CeaGWxmbiVKBrBJhNobk/iicmnGs/z+/nd7f6tun2afnPXVPXy4Q7RkGz9jJLO71rlXtVfKOqI6vGd7JIBWvthTfZBQyAUBmKAwQRmrdBagIDdkA3QED7IFXcC6DjNnycPLixGImiXKlAzJkcRpDDCPUSezBfVFNVdUU08ZfFddNFM1Vboh8v8AGZviNRZhjtS4on5+dY3EZnMf+dPmxTf0iA9l/RVuxThbdOHo4URFMfsxo/nO5fqxV2rEVca5mr8UzL89791XwlblAA3QDVAc7oJVqFBaGyCsRvZBPbsgOKugWq1UE8oK1KGqCfiFEFvQoJYsUQuboqu5FEBmqEBhcBvZAA7fRAHc3QSm+yAG2+6B9kFcsEJLUZAHeiC70CDbn4Is4gnaN1Vp31PNwGew4wXpLxOHlt/05Uxcv2/sdHFWb/vUafhqn5TDqX+H9+Jwt6xzpr18KqY+cS2MF1oToA1hCS6CtXygBBSEEFnJZAqS6AaFqoG7EICC3LeyCd2ogXqyBWjIFzQlAoLoBozFArsLIFReiSK9QEIR6ILwghbugV3dAoS6BvcoFQCgtWcA1QS1WQD3Qa8fGzmgkdPtPZPDMIjzDUUuZEOZcjDzph+kfy1vewNnpY27dn6tE+dVVMflq0Tb+70cData75rifCKap/PRqBtuupOUJQoDAl3sgUa59kC1iU4iWtRBWGyAPKCAXcoLc1f3VC9VA3oaoF0EDILs4CAEC1SfZBQQUAAs6DlhMPiswzCVlGVYLE4/MJ/+5YLByYp+Imf6MuAGI+WZSuqm1bm7cmKaY5zOkec7n1boru1+it0zVVPKI1nyjezPof4ReqOqvl4vU83CaPwEdfTiQMVjogwIIky4vRA9vxzHG8K1LMdtMuwetOH1u1dnq0+c758I07W3ZdsVmOM0qxGlqnt9aryjdHjOvY2M0F8M/SXQU2TjZOQHO81lH1QZjnUQxU2CK7y4CBKlEbGCAHutDzLazM8yiaJr6FE/Vo9WPGeM+My33Ldk8sy2Yrijp1x9arfPhHCPCIZRJJLxRE+VrmrZNNA8bIp3QGHFCgbIL7bIJeoQUUKCMdkAD+9A8IHcsgnLUQWvKAdkC7bsgUdAZxUoQNygeEAsKoMbdXuvWjOkmH/ZMfGc11BNl+vC5LhZgE6INSOdFUSJdvxRBzX0wxEMthyTZvF51V06PVtRxrnh3R709keMw13PNpMJktPRr9a5PCmOPfPVHbPhEtKOonUvWfVTOIc21lmUM2DDxGLBZdhwYMHghX/c4D+aPmZE8Rs4DQjrmWZVhMnteiwlO+eNU+1V3zyjsjd3zvcizPNsXnF30uKq4cKY9mnujr7Z390bnWAa1vusgxmihxV7oobnZECho9lpjS+ota6hwuk9KZacdmmMcwSn9MEqWPzTpsf8iXC4eI8gAGIgHz4vF2MDYqxOJq6NFPnM9URzmeUeM6Q9OEwd/HX6cNhqelXPwjrmeUR/61lvf0Y6MZB0gyGLDYWaMfnWPhhizTNI4GjnxC0uAfyJULn0we5cklcYz7Pb+dXtavVt0+zT1d/XM858I3O1ZBkNjJLHRp31z7VXX2R1RHKPGd7Ij8rAs+oKBsAyAUCxvVAsgXFkCnCBUU2QVkEpsKIG4IQAw90BxyyDqPV7HTMv6Sa3zDDxtNw2m8ymyyDURDDRs3uspkluLuZ4eiqN03KP4oYrO7k28sxFdPGKK5/dl85JUuGRLlSYA0MuCGAdgAB+5d6qnpTMzzcBpp0iI6nIVpRRQEE2dAdtkCrtzwgpOzoJ3QQPuAg5dwEEofdAAhZuECv0QD/blBGN0FaiBXf6oG1UC1S7IA5H6ID0bdA71QSodymgoqXCCVdBb7IDk2QHb+pBCS7IKKILVyg2G+CPOP2bXuqsgFBmOTYXGgd8PPjgP2xEK0bb6x08FZv+7XVH4oif9rfNgL3Qxt6x71MT+GZj/c3Bd3NfquVurJVADvc1QKOgrg1QR69kB3QPCCnygHYII/CASTUlAblA3ch0Q3RS9WQGogVpshJY9kFHtVBKCiBT6oCBa4QDXhALboGxqgrcII42DIG/CDUr44Mxgnaj0Tk8MVcNgsyxkY/4yZIlwn6QRrp+wFro4fEXZ5zRHlFUz8nL/wDEG7rfw9qOUVz5zTH82ttDRb856PV6ID93QGq9kAkAcIFUEpZBbnugU4QQObocVqQgiCu4cIHnZBRehdDedjug4xxQS5ZmzI4YYIQ8UUREIhHcmysRMzpBO6NZdn0R0v6i9RjDHonSGNzDCRFjmE0DDYIVYn58xoY2eol+s9ljsfm2ByyJ+l3Ypn3Y31fhjfH7WkMjgMox2Z/9ramqn3uFPnO6fDWWwehfgowMr5eN6narm46MNFFlmTGLD4eh/LHiIv42YCP5glLRsx29qnWnLrXR+1Xvnwp9mPHpN6y3YKmNK8wudL7NO6PGr2p8Oi2A0foPRugcAcr0XpnL8mw8QHzBhZIhjnEWMyZWOYe8RJWkY7MsXmVfpMXcmue2eHdHCO6IbzgctwmW0ejwtuKI7I4988Z75e+AAAhZh4ovE9wwsLIFjQ7IDIFSfHZAanlAFmCBQUKASLAIBdBRQvygj1qgOwsyBWxQDwECj2DIHugMfCAWugIJcV8IPzxGJw+Dw87GYvESpGHw8uKbOnTYxBBLghDxRRRGgAAJJNl9UUVXKooojWZ4RHGXzXcotUzXXOkRvmZ5NW+sXxdRTvn6b6NTYTCT8ufqObLBh7jBy4h+I7fNjHpofTDE4iHR8i2KijS/mvhbif455fdideuY4Oa55ttNWtjK/Guf9sTx753dUTxaxzJk6fiJ+LxeIn4nE4mYZ2IxE+YZk6fMNTHMjiJiiiPJXRIiKaYopjSI3REboiOqI5Q51VNVdU11zM1TvmZ3zM9czO+U90RAeEFqav5QN3/sUHttJaQ1Hr7UmG0npHADF5ligZjRxGCTh5IIEU+dGH9EuFw5ZySIYQYiAvNjcbh8usVYnFVaUR5zPVEc5n4cZ0iHqwWBv5jiIwuFp1rnyiOuZ5RHxndGsy3y6QdHdNdH8gOWZT/juaY0Qx5pms2WIZuMmCwAr6JULn0SwWAJJJiMUR4tnueYjO7/AKS5uop9mmOER85nnPPsiIiO2ZHkeHySx0Le+ufaq5zPyiOUcu/WZ781iWZYRnEYAlAYgoBc0JQU+EDflAobIHG9PogGrAFA3QBau/KChzF6YASdwA6cU10dE1j1y6S6Enx4TUuu8slY2XEYYsFhYosZioYhtFJkCKOH/WAWawOzuZ5jT0rFmZp659WPOrSJ8GFx20eWZfPRv3oirqjfPjFOsx4sT6h+NzTEj8OkOn+dZpECQZuZYiXl8oj+cAPmTD4MEK2fC7A36t+Kv00/diap+UfGWsYrb+xTuwtmqr70xTHzn4QxvnXxhdZMzEUvKsLpfI5ZJ9EUnBTcXOhH+nNjEJ/5tZ7D7EZTZ/1JrrntmKY8oiZ+LAYjbjNb2vo4oojsiap+MxHwdF1F1r6v6twWIyzUfUfNcTgsXKjw+IwsqVh8NJmyowYYoIoZUuEmEgkEE2JWZw2Q5Xg64uWLFMVROsTM1TMTHOJmfkwuJz/NMZRNu/fmaZ3TERTETE8Y3R83TbinhZViEp7IF6ILaiCXCIDwio/dBSGsaXQL9kB6ugcsAyBQiyEI70aycA28oK9UBgdymqDguHRU3coi71+yKMRR0Cx3J4QL0P6IDCzIDd0Qs4RUrdygbWZBf7MgAuaILRBlr4T8zjy/rtk+GgiiEOa5bmOAi7/xcE8D/qCtZ2xs+lya5VP1aqJ+M0/7m0bHXvRZzbp96mqPhFX+1vYKh2NVxh2pWCDi70QVwSyAyCts6CEOb0QNxVA8eUAIG90DYFkBBRTdA7hBN0AX7IFNggN9eyBd9kCqBajoCA6AA6CDsgpG6CsNkENUC6DSf4x8XDiOs2EkQxUwWmcHAaWimYjExn7CFdd2Ho6OUzV71yr4U0x/Nx/bqrp5tFPVbp+NVTCFRbZbg01N0ByShxBZAal0C3ugAtVBQOUE3ZggUCCjygW3CA3BQVqh0OLlhZGJx+PlZTl2DxOOzDEH+KweEkRz8RM/0ZUAMR+iVVU26Ju1zEUxxmZiIjxnctFFV2uLduJqqnhERrM+Eb2ZtD/CP1S1WJeK1JHhNIYCMgti/wDGsdFCQ4Iw8s+iDj8cxxvDstTzHbTLsFrRh9btUdW6n8U758I07W3ZdsVmOMiK8Rpap7d9XlG6PGdexsJob4W+keipkrHT8ij1HmUuoxmeRQ4n0Gn5JDCTLYihEHqHJWi5jthmePiaIr9HRPKjd5z7U+M6N6y/Y/K8BMVzR6Svrr3+UezHlr2ssgAAQ7QhoQ1AOANlrEzM720RTpuUh9kXgC/ZAZAZApcoDlAD1IQL1QDQ0QD3QOxdAIrfwgHhAZkDzZAq1SgMXQS210FNLoFiyCdwgt1B1HqV1V0V0ryeHNdXZn6I53qGDwMgCZi8bEA5hlS3D7PGSIIXHqiDrK5Vk2Lzi76PDU7o4zO6mnvn5cZ5RLE5tnWDya16TFVaTPCI3zPZEfPhHOYaT9WuuOtesE44XN4ocr0/BGI5GR4aYYpURBcR4iZT58YowYQBg0L/AIj1/Jdn8JkdPStR0rnOuY3/ALMfVj4z18nIM62hxmdz0bs9G3yojh+1P1p+HZzdAJpUrNMFxTsioB3RBIDYkoPc6N0XqXqFqTDaR0hgBiswxLzI4oyYZGFkggRT58X8mXC47xFoYQSQF5cdjsPlticVip0pjzmeqO34RG+dIh68DgcRmeIjC4WNap8ojnM9kfGd0b5b7dJekmmukOnBk2SD9qx2K9M3NM0mywJ+OnQhgT/MlwuRBLFIQ94jFFFxXO87xGd3/S3d1MezTHCmPnM854z3RER23I8kw+SYf0VrfVPtVTxqn5RHKOER26zPdxdYZml7IA7oDbuge6B9UAD7UQT2QVBdm90HgZ3nuTacyudnWoM2weW5fhw87FYudDJlQeYoiB7Xdfth8NexVyLVimaqp4REaz5Q/DEYqzhLc3b9UU0xxmZ0hr1r340NP4QTMJ0w09Nz6ax9OZZiI8JggWoYJZHzpo9pcJ2iK3vLtg71elWY19CPdp9arxn2Y/e7miZjt5Zt60ZfR0596r1afCPanyjva9a16vdUOohmSdVazx0eBmODluAJwWCEJL+ky5ZEUwf8ZFGt5wGSZdlmk4azHSj61XrVec7o/ZiGiY/PMxzPWMTdnoz9Wn1afKN8+My6dIlSsNB8vDSYJUI/kwQiEfZZWqqa51qnViaaYo3Uxo5t/cvlVPCDiyGgWdvZA3/egboFEBACBVBN6IKADZAaiBTYoI71QD2ZA2ayAb7j2QLboKXugAVYbKgO6gX8oHjZBCSEBApd1RRQUCgjP43QBUGqA9aJoL2CC1FAg7r0OzM5P1p0LmDs+cwYUntiJM2R9zMAWJz+16bKcTT9nX8MxV8mX2fvehzfDV/a0/FE0/N9EIXAEJuKLhDva05QN7MgNW7oAQK3QR60CC/2ZAZnOxQLFAsaFAIAQPBdArZA3FUFB5QRAcX3CAwOyAgv3QTyEAsUD2ugdkBtwgON0A7sgbsghtZ0GhPxQYiLEdfNUQRRkjCycuw0I4AwkEbfWaV2rZKnoZLZnr6c/vTHycR2ur6Wd3+yKI/d1+bF/wBVsbWwAioVEetCVAFy6BuyCi6AeCW90EugvdA7BApukigAIPYaZ03qTWma/wABaN0/js7zAN65ODliISQbRTZhIglQ944gvwxWKw+Bt+mxVcUU9c8+6OM+ES/fC4TEY656HC0TXV1Ry754R4zDYnQHwWYzEiVmHVLU5kQlov4KyWOux9M3FRB+QRLhDbRlaLmW3lFGtGW29ftV/KmPnM9zfct2DrqiLmY3NI92j51aeekR2S2N0b0/0T08wJyzROmcBk8iIATTh5bTZzWMyaXmTDW8URK0HHZnjMzr9Ji7k1z2zujujhHhDfsBleDyyj0eEtxRHZxnvnjPi7B6QLBeHVkChuWQDuWUBUGJugPuECxqgBA7OgfZAAHKBS5QPGyB3CA9bIKLuaIIzlA2JugM1t0DtvugbboAa6AXNxZAAciEByTQbocGv3Wf4rsl0lHidLdN/wBkz3P5ZMqfjIiY8Bl8e4JhP8fNFvRCRCD+aIEek7zkWx13GRGJzDWi3xiPrVf0x2zvnlG/Vouf7ZWcFM4fAaV3OEz9Wn+c9kcOc8mo2dZznWpM3xOodSZtis1zXGF5+MxUTxxi4hhAAhggG0EIEI2C6hYs2cLaixYpimiOERw7+2Z5zOsy5ZiL93FXZv36pqrnjM8f+I6ojSIeG3Zfo/JHfZAaiAgM1EHutE6J1N1F1Lh9I6SwcOIx88fMmTJriRhJALRT58Q/LAOLxFoYaleTH4/D5Zh6sVip0pjzmeqO34RG+dz2Zfl+IzTERhsLGtU8+UR1z2fGZ3Q336S9JdNdIdOHJciEWJxuLMM3M8znQgT8dOAYRRfzYIXIglikIO5MUR4tnWd4jO7/AKW9upj2aY4Ux85nnPGe7SI7ZkmSYfJMP6K1vqn2qp41T19kdUcIjt1me7ALCs0AUd1Q+6CIL5r2UEoqKxsUBno/2QQ+UFBD90jWSZ0je176r/F1prTcc7IumsnDamzWWTBMx0UZ/g3DRB3HrhL4iIN+WWRDWsYIZb1kuxV/E6Xsw1t0e79efDhTHbO/saHnW22HwmtnARFyvr+pHjG+qe7d9pqpqzWGrNfZnDnOt9QYvOcXLJMn5xEMnD0tJkwgS5Vrgeo7krpWCwOGy636LCURRHPTjPfPGfGdOxzTG47E5lc9Li65rnlrwjuiN0eWva9SSTE5Lr08HkRA/RByAewUV+c+fh8KBFip8qSDR5swQP8AUr6ppmr2Y1SZiPanRcDFDmcZl5XKn46I09OEw8zEH2+XCVLn6qNbsxT3zEfnMLbib06W4mruiZ/KJe3laO1vOgEyToDV02E2ig09jYh9flLyzj8HTOk37f8A/wBKP6nrjLsbVGsWK/wVfyfnidK6uwUPrxuitUYaAByZ2Q4yAD3Mqi+6MXhbnsXqJ7q6P6nxVgcXRGtdmuO+ir+T0szMsBIjMvEYuXIit6Z7yj9IwF6otV1b6Y17t/5PLNdMTpM6d+7837y4oZsAmSY4Y4D/ACoYgQfcKTrG6rcR62+F8VXypUUQKcoIAGqgU4QEEDWugrugjILu1HQS52QX2REetSqq0UDezoDhnQ0PH9CCb0q6oUFC6gOgvhBASapoBqgE8BkF+qoWUHtdIY8ZXrXTGaRH8GCz/K8RFTaHGSifsvNjrfpcJetxzorj9yXrwNcWsZZuTyron96H0zP54g38o/qV/Pc7n9DRwS54KKC6A/aiAGBQKnugbsHQGdA3ogeSgAbHdAQW1aoI2zoLYsgldkNTdAvugpvR0EY7ILW6CVQWxbhBKoFqDdAQNnF0DYoFyHQSP8pL7FIHz2+IDE/tfXPXM4m2ZypX+xhMPD+5dz2cp6GT4aPszPnVVLhO0tXTzjEz9qI8qaYdCFmWaYNAS1vdAp9EFt7WQSoNkCltkCjMEBygEAVdBdgGVEimS5UEU2ZGIIIAYojFQAAXTSZ3QkzERrLYHol8KuP1nhcPq3qZHi8ryWeIZuEymUTKxeMl3Ec6P80iXEGaGH+MILkwWOkZ/thRgZqw2X6VXI41caaZ7I4VTHXPqxyiW9ZBsfXjaYxOYa00TvinhMx9qeNMT1Rv65htrpzTWntIZRJyDS2S4PKstkD8GFwkoS4Ad4i35oi1Yi5JqVzHF4y/jrs3sTXNVU85nX+47HUMJg8PgbUWcPRFNMco/vj2vZW5XmekLGwQVy7BBOWCBU1A9kCo3qgWvdAfY/QII5dBR2QAHNf0QKAsgHwgP2QNkDt9kB60KAz3dAaqahV0AVZAA3ZAJ+iCXN0Hp9Xay0zoPI52pNXZxIyzLZJEBmzXJjjNoJcEIMUyMsWhhBJZezA4DE5jeixhaJqqnq/OZ4RHXM7oePHY/DZdZm/ia4ppj+9IjnPZG9pn1k+JjVfU2HEaf03BitOaXmQmXMlCP047MIDf58cJ/ipZH+SgLlz6oiCYR1fItlMNlOl6/pcvdf1afuxPGftTHdEcXJs92sxOba2cPrbtTy+tV3zHCOyPGeTDsEMqVBDJlQQwQQBoYYQwA7ALa5nXfLU40iNIHKiCB4QXsyCIPeaI0NqfqPqSRpTSOChn4yaPmTZ01xIwch/xTp0QtANheI0FbePH5hh8rw84nFTpTHCI41T1R2/COMvbgMvxGa4iMNho1meM8ojrns+M8Ib89KelWmukmmxkGn4Ip2InmGbmOYzYQJ+OnAfnjb8sIqIYBSEUFXJ4rnOc4jOr/p706RHs0xwpjqj5zxnydsyXJcPkuH9DZjWZ31VTxqnrn5Ryjx17k5dYhmQu9UBuFAdqMqJQcoKCgN2QWlmQTyUHp9Xaw03oXIp+pdW5vJy7LsMQIpsxyYojaXBAHimRlqQwgk8L14HA4jMb0YfDUzVVP96zPCIjnM7nkxuOw+XWZv4mqKaY/vSOueyN7SfrJ8RGq+rMc7JsvGIyDSZMUIy+CNsRjoLCLFxwmxFfkwn0h/xGNg3Xci2YwuTRF2vSu973Kn7sT/FO/qiHIM92nxOczNq3rRZ93nV97T+GN3XqxSBDCIYYIYYYYAwhhDADgNZbLx3y1fTTce5QIbug/XAYPHZtmMvJ8ny/F5jmM4PKwWCkRz58Y3IlwAlu5Yd1LldFi3N27VFNMcZmdI85fVq3XfuRatUzVVPKI1nyhmXR3wi9WNSmXidQzMu0lhIzUYuP9sxjEUIkSj6B/rTQRuFqeO20yzCa02NbtXZ6tPnMa+VOna27A7FZlitKr+lqnt9aryidPOrwZl038GnSrKoYY9TYzPNSzmaOHE404WR6uYZeH9BbtFFEtTxe3eZXp/6eKbcdkdKfOrX4RDbMJsHltmP181XJ7Z0jyp0+MyyVp/pH0s0uYDp/pxpvATJf5Z0vLJRneTMiBiPuVr+JzzMsZrF+/XVE8ulOnlwbFh8iy3CaTZsURMc+jGvnxduBiAEMMREIDAQ0A+ixfSnXVk+jCCKMU+ZH/tlNZNIV43H8ZH/tFNZNIfli8PJx0g4XGyYMRJjpFLnS4ZkMXkRAuvui5XbnpUTpL4rtUXI6Ncaw6Hn3w+9FNSv/AAn00yOCYS5nYGQcDNJ5MzDmCJZnDbTZvhP9PEVTHVM9KPKrWGGxWzGUYv8A1MPTE9cR0Z86dJYv1R8Euk8WIpuitaZxk0xzF8jMIIcww7bQg/gmjz6z4Wx4Tb/E0TpjLVNcddPqz86f3Ya1jNgMNX62Eu1UT1T60fKr4sJ6z+HDrFocTMTP0x/DuXy74zIYjimH+dhyBOh7+mGMDlbfgNqMqzDSKbnQqnlXu/e30+cx3NQx+y2a5frM2+nT10b/AN3dV5RMR1sZSJkrECIyJsMwQRGGJrwxcRC4PY1Ww1UzT7UNdpqirg5NWxtsvlRBSa0KAgjGhLMgMzOUED2QASb02V4BTZQKktZBQGt9UEBo4QUeEA3qK8IJ4F0FrtRBKXO6B+iCsBuyAaWogm1fdBbU2TQOxQcMVOjw8k4iCL0mRHLnA8GCZDE/2X1RT0qtOvWPOJSqejGsctPzh9TJgImxtRy6/nCeL+konc4DZFU3ogO5sgtHsyCVJezIDPQoG6C0QTdroDuaoF7oKACgm3CBZAua0HhA3QNqBAugcIDP7oI42KC+wQN0BrIAdqlAYkPVAvUFAugRD1QkdmRXzl6wT/2nrDrqY7n/AAhxUD/6Hpg/7K71ktMU5Zho+xT8dZfz/nVXSzTEz9ur4aQ6iH5+6yjGAsoLaqBSyDjRByZBLILDRgkgKio9kDwwQZT+Gbp3guofVXDDOcNDiMo05IGb4uTHC8E6aI/ThpUXb5nqmEFwRJYggla7tZmdeWZbV6KdK7k9GJ6o01qny3eOrZNk8spzPMo9LGtFuOlPVM6+rHnrPg30qS5LvVcUdt4HYopsEEPbZBbIH6oFRWqgGu6oUKCdggrkliEE9kA8oOR+gQS3sgICBW6B3QO7IFDV0BqhA7sgb2ZAZ/qgxH1l+I/SXSszckwMEOfaoEI9OWSJoEvCuKRYqaH+UGqIADHFRgAfUNoyLZXE5vpeuepa96Y3z92Off7Mdeu5q2fbV4XJ9bNv17vuxPD708u7fM9Wm9pjrbXGq+o2enUWtM4ix+LhMQw8uEejDYOCK8EiU5EELAAmscTfiiiXWcBl+Gyuz6DCUdGOc86u2qefdwjlEOSY/MMVmd70+Lr6U8uqOymOUfGecvRuvY8SNwiAG/CA1WQG904BRuUHvtCaE1R1K1NJ0ppPCCZipgEyfiJoPyMFIdjOnEWFwIbxmg3I8eYZjhsqw84nFT6scIjjVPVHz5RG+Xvy7LsTmuIjDYaN/OeUR1z/AC5t+el/S3TPSfTcOQaflxTZs6ITswx86EfPx09m9cwiwFoYBSEUG5PE83zjE5zf9Pf3RG6mmOFMdUfOeMzxdtyfJ8Pk2HizY3zzmeNU9c/KOERwdwoaBYplkrYoKabIBYWQN2CCNzugp/sEDjZAZB1bqP1I0x0u01N1PqnExQShF8nDYWSBFiMZPIeGTJhJHqiLPUgQgGIkAErI5XlWIzjERh8PG/jMzwpjrmer4zwjexuaZrhsow84jETu5RzmeqI6/hEb53atC+pXU3VfVjUQ1BqmcJUrD+qHLsskxk4bL5ZuIX/PMI/PNIeKwEMIEI7VleU4bJrHoMNG+faqnjVPyjqp5c9Z3uJ5tm+Jzm/6fETpEezTHCmPnPXVx5RpGkOrQ03ZZJi07oP0w0nE4zF4fL8Dg8RjMZi4/l4bC4aVFNnT4/5sEEIMUR8W3Uqqpt0zXXMRTHGZnSI75ngtNFdyuLdETNU8IiNZnuiN8tiOmXwc59m4lZt1XzKPJ8KfxQ5Nl82GLFxh7T54eGUC1YZfqiY/nhNFoub7cWcPray2npz79Uer4U8Z76tI7Jb7lGw16/pdzKro0+7Tx8auEd0a98NntHaG0foDLf4I0XpzBZRhSQZgw8DRzoh/KmzC8cyL/OjJK53jsxxWZXPS4q5Nc9vLujhHdEaOjYHLcJltv0WFtxRHZz754zPbO970UsBVeF7tDyUDgoDbIHbZA2fhA4QPKALsSECx9QJB54QdA6jdCumvVCKLFaiyGHD5qYfTBnGXkYfGwU3jAaaA35ZkMUPZZzK9o8wyn1bFetHu1b6fLl3xMSwOa7OZfm+tV6jSv3qd1Xnz7qomOxqZ1V+G7X/S+XOzfCwnU2npQMceYYGQRPwsADk4jDhyIRV5kHqhYEkQBdMyfanBZvMWqv1d2fqzO6fu1fKdJ6plzHONlcblETdo/WWo+tEb4j7VPzjWOuIYqgigmwQxy44Y4IgDDFCXBHIK2aYmmdJazHYvsoIRWiACWp9kEBsR90FajIDuD5QBZgUAB6WRC1h7oo1XCAAGqggdUVmN/ooHYlBLBkFfZBHO9UA8gMgo5AdBEFVHi5yD/A2PAuMNNP0hK+7G+7T3x+b5uexV3S+p8E750ME4VEyGGIe8IK/nCuNKph/SNuYqpiV8H+pfL7W9kA8m6AgOfKBRA3qUFvYoH9yCUtVBeKoI9UBkC1XugVeqAWdA8lA3ogroIT9AgVI7oArugFwUC26AboAIIZAd7MQgVNOUFFSO5DfVDV83Op0Rj6pa4iJDnU+Zj6YiIfoF37Ko0y7DR/8AXR/DD+fM135jiZ/+yv8Ai0dZtwsg8AQN1Bb0qyA26BZAcFBGqCUFd6fRArf2QAdkGzHwOYmRBnOvMJHMhGInYXKZsuE3MuGPFCIjxFEP9oLn3+INNU2MNVHDWuPHSjR0P/D2qmL2Jp5zFHlHTbXsy5m6eW/qQO9kOIP1QKIHcIDoDE7oHugUFfZAA4IQStXQV2uUEqKnZAHcoK26B3dkFBN01ENy26By6AB3QLoA7IPGzPNMuybL8Tm2b5hh8DgcHAZuIxOJmwy5UmAXijjiYAeV+lmzcv3It2qZqqndERvme6H53r1vD25uXZimmN8zO6Iak9Yvi2zTPxP050kmz8syyIGCdn0cBgxeJBp/i0EQeTCz/wAZEPWX/CIGER6dkexlrC6X80jpV8qPqx96Y4z2Ru65ng5fnm2dzE62Msno0c6+c/dieHfO/qiNNWu0EIgB9EJeKIxxExOYoiXMRJqSTcmpW+TMzxaDwcuwUEfdBA9rIK39yB2QEHYNAaB1P1O1NK0rpXCiKfEBMxeKmwkyMBIdjOmke/pgFYyGFASPDmOY4bKsPOJxM7uUc6p6o+c8nvy3LMTm2IjD4aO+eVMdc/KOct+OmPTHTHSnTcGntOSIjFGROxuNnAfPx09mM2YfsIR+GEUAC4pm+b4nOcRN+/PZERwpjqj+fGebt2UZRhsnw8WLEd885nrn+XLk7e+26xbKjk7oD+UA8Ae6A9aoFmQTduKIF6lBSg9FrnW2n+numMdq7U+LikYHAwB4ZcPqmz5kVIJMqF/xTIywA5LkgAke3L8vv5niKcLh41qnyjrmeqI5vDmOYWMrw9WJxE6Ux5z1RHXM8nz96l9SdS9VtUTNUakbDwy4YpOX5fBM9UnL8OS/y4T/ACo4mBmTGeMgWhhhhHb8ryuxk+GjDYffzqq51T19kR9WOUdszLh2a5rfznEziMRu5U08qY6u/rnnPZEQ6w/dZFjCvgIO2dNOl2sOrOdR5PpTCwQSMNEP2/M8SCMLgQatERWOYR+WVD+Iu5MMP4ljc1zfC5NZ9LiZ3z7NMcav5R11Tu6tZ3MplOTYrOb3osPG6PaqnhT/ADnqiPHSN7dzpR0V0Z0jwBhyLCx4vNsRAIcbnGLAOKxFXMIIpKluzS4GFAT6i8R5BnOf4vOq/wBdOlEcKY9mP5z2zv7o3Ow5Ls/g8lt/qo1rnjVPGf5R2Ru753u+1YLBs6O91BR2VEuKXQXdgbID7oB5CA+36oGygnlUUX/qQQn7oKHs30QISQfUCxCamkNfutfwqZNq39r1V02lYXJdQxkzp2ALS8DmMX8pwB/ETT/PhHpiP54SSYhvOQbY3cH0cNj9a7XCJ+tT/VHZO+I4TyaJn+xtnG9LE4CIoucZj6tX9M9sbuuN+rUHMstzPJczxeR51l+Iy/MsBM+VisJiIPTMkxXDixBFRECYYgQQSC66jau28RbpvWaoqoqjWJjhP9844xO6XLLtq5h7tVm9TNNVO6YnjH98p4S/Bv0X2/PRDXZArYH3QRAoyC3Lb7oON6MgrbDe6C3s6CENYkjygrMWdBKmtkC4BQVuUAIJYNd0FqBe6EoAeyCilfsgCiDx81D5TjR/+Fnf/AV92f8AUp74/N83PYq7p/J9QMhmnE5Hl08/5TB4eP6yoSv51xMaXqo7Z/N/RuEnpWaJ7I/J5+91+L9zf9WQL7oAFUClmqgG9UDsgBDUugbkoBQPdkC2yBUhA32QHsgOLoD1JDoLchigj7EUQNnG6B7t2QPGyB2F0CqBuUC1aBBEHOH80P8ApD9Ugl81+pEP/wAp+uA4DanzUH/+qjX9AZX/AP5+G/8A50fww/nvNN+YYn/+lf8AFLr269rwlt6oICUFZAezMggqgqCfdBRRAp/Qg7X0t6i5j0p1xg9ZZfh4sXJglx4PMcGCAcVg4yDHBCTQRwxQwxwOQHhYkCIrG5xldvOMHVhLk6TxpnqqjhM9kxrE9ksnk+aV5PjKcXRGscKo66Z46dusax2t/tF660n1DyOXqDR2cScxwUbQzPQWm4eO5lzpf5pcY3hiAPsuJY/LcTll2bOKommfhPbE8Jjth3HL8yw2Z2Yv4auKo+MT1THGJ7Je+BDODReGXuOzIDDZQAQ11Q37oF6EnhDgWQN2QN3uoFjd1QsalAY7BAc2KBSg5QHQKNZA5IQDZkCyB32QLeN0HQeq/WnRXSPAQzM+xEzFZtiJZjwOUYQiLFYmreog0ly3vMjYUIDlgc3k2QYvOq/1MaURxqn2Y/nPZGs90b2DzraDCZJRrenWueFMcZ/lHbO7vnc0o6odW9a9XMxhn6pxcMjLJEz5uDybCxEYTDnaKJ6zpoH+Ujs59MMALLr2U5LhMko6OGjWud01z7U93ux2R4zLkObZ3i87r6WInSmJ3UR7Md/XPbPDlEOnEl3NVlGI0K3qkIlexHhAHfdAHYIHhBWajoOxdPunep+p+pZeltKyIPmtDNxmLmwkyMBIJb5sxrksRDAKxENQAkeDMszw+U4ecTiZ3cIjnVPVHznkyGWZZiM3xEYbDR3zypjrn5Rzb89NOmmmulempWm9NYeJifm4zFzmM/Gz2YzZhFzsIRSEMAAAuKZrm2IzjETfxE9kRHCmOqP71md8u3ZRlOHyfDxYsR3zzqnrn+93CHa+KrGMoPVAqSCEBql7IBYIDubIDDi6CeDTZBXQcJ+IkYaTMxGKxEqTJlQRTJsyZEIYJcADxRRRGgAFSVaaaq6oppjWZfNdVNFM1VTpENBOu/WTE9YdWCdgJ8cOlsojigyaQxh+ebRYyMGvrjFIAR+CXsDHG/btnsjjJMN0a4/W1+3PV9mOyOfXPZEOIbR55VnWJ9Sf1VHsx19dU9/LqjtmWNzWgWea8MxDBBkPon0Uz7rNnccEqZOy7TWXTRBmmawwj1epgf2bDuGinEEPEXhlgglyYYTg8/z6zkVmJn1rtUerT/uq6qeqONU7o3azGfyDIb2e3tI9W1T7VX+2n7XXPCmN++dIne7TGl9PaNyLCaa0tlUjLcswUHpk4eSCw5iiJrHGTWKKImKIkkkkrjGMxt/H36sRiaulXPGZ/vdHVEbodqweDsYCzTYw9PRpjhEf3v7ZnfPN7QbOV5XpVq+UAjugIJugruUELVb9EFFasgn7kF3QRmLklBfeiC7sggZAogAi5QYz619DdP8AV/KhMjjl5bqPAyjBl2bQwOYRf5M4D/dJJP8AJvCSTCxd9hyDaG/klzT2rVU+tT846qu3nwlruf7O2M7t6z6t2I9Wr5T1x+XGO3RXUWns80jnuM0vqfLosBmuXxCGfIJ9QIP5ZkEVo5cQrDFuKUIIHZcLibONs04nD1dKirhP5xPVMc4cXxWFvYG9Vh8RTpXTxj5x1xPKXrz/AFL93nQsUABqpqFXs/CBuhITRxbZBDwECjsLIKLsLIFTQiyA4d2QQWJBQVAugcsEEdq90CpoyAKUZAALtsg/HMgDluMBDPhpo/6BX3a3XKe+PzSv2Ku6fyl9NtGknSORmIVOWYMn/mIF/PWP/wC6ufen839D5fP/AEtufsx+UPbgbryPYvu4QLXKB5N0C3lAarvRBd7oFygnugdvZA7oHugU8lAuKIA7oFSKoADmm6Bt+qBXhA3qEEatUFHdA8oFzRANLIIWQVgxQDzdBQ/qBaxH6pCS+bfUof8Ayn63BI/+k2af/wCTGu/5V/8A5+G//nR/DD+fc0j/APIYn/8ApX/FLrZ53XueBGQN2JQWrMgAcWQN2QQoK2wogmyCi/hBbGtvCDycpzXOMhzAZvp3OswyjMIYRD+1Zfio8PNMLv6YjCR64afliBHZfF+zaxNv0WIoiunqqiJj48PDSX6WL13C1+lw9c0VddMzE/Dj3Sy/pf4vOr+RGXKz05PqnDg/jOMw37JiTDwJ0gej6yitWxexOV4rWqz0rU9k9KPKrf8AvNrwe2+aYXdd6NyO2OjPnTu/dZc0r8aPTvM/lydXZFnempsTmOaZP7fhIf8AlJH8Z7xSwtXxmwWOtazha6bkdWvRq8qt3lVLacHt7gb27FUVW57ulT507/3YZh0n1D0JrqX83R2sMnzn8Pqil4PGQRzYB/nS39cPggLVcZleNy/dirVVHfE6eE8JbXg81wWYR/0t2mvumJnxjjHi7C4BY0PC8G979dTsCgO9ggMoFGblUANkC1XQOyA1CglEFrs6AgWqgGoqgboDFxsUHGZNlSpcU2bMhgly4THHHEfTDDCA5JNgANyrTTNU9GmN75qqimNZnRrF1j+L7D4X5+m+j0yTi8SIopc7UM2WI8NJah/ZYDSfE7/xkX8WGcCYCuiZFsTVVpiM1iYjjFEcZ+9P1Y7I9br6LnWe7bUU64fK9886530x92PrT2+z3tXMXisbmGOxOaZpjsTjcfjY/mYnF4qaZk6fFzHGangCwFAAF0eiii3RFq3TFNNPCI3RHdDm1ddd25VduTM1Txmd8z3y/PfhVDygIiM10C9kAkNdAHt7IOydPOnep+qWpYNL6Tw8PzIRDNxuMmgnD4CQS3zJjXJY+mWKxEbAREeDM8zw+U4ecTiZ3cojjVPVHznhHfpDI5XlmIzfERhsPHfM8KY65+Uc+5v1026b6Y6WaZk6Y0zh4hAD83FYqaxn42eR+KdNiFybAWhAAAAAC4nmua4jN8ROIxE9kRHCmOqOz853zvduyrKsPlGHjD4eO2Z5zPOZ7fyjdG52gNZY1k18FQN1RCN0F54QLVIugNyUE7cIBP1QKAdkGsfxg9WI8JhZfR/IMU0/MZUOJz+ZLjDy8JF/ueFJ2M0gxRih+XCAQRMXRNiMmiqqc0vxupnSiJ51c6v2eEfa7aXOduM8mimMrsTvqjWvTlTyp/a5/Z+81WPeq6S5mjMUHc+kPSrOOr+roNOYCZNwmXYQQYjOMxghf9kw5JaCEmnzpjEQAuzRREEQscRnWcWskwvp699c7qaeuevujn4RzZjJMnu51ivQUbqI311dUdUds8vGeT6A6a01kWj8iwOmNNZZKwGWZbK+ThsPLtDC7kkmsURJMUURcxEkkklcSxeMvY69ViMRV0q6p1mf78ojlG53HCYSzgbNOHw9PRppjSI/v4zzl7MLzPSjh34QCyAxsgXLIAp4QVvCBcMUEPHKB/KCCk7oAcoBayC/qgjsgNZAQTuyDGHXroll3V3T0MzCGTg9T5ZLiOVY6KkMW8WGnEVMqPm8ETRCxEWybOZ/cyW/pXvtVe1H+6O2PjG6ezWto9n7edWNaN12n2Z/2z2T8J3x1TobisJjMvxeJyvMsHOwWNwM6PDYrDToWmSJsBaKCIcg+xBBFCF2eiui5TFy3OtNUaxMcJief99zitduu1XNu5GlVM6TE8YmH5Wsvp8KRuEEdj/UhoEnlkBj7mqAzVBdALiyCGxKA4dA8+yA6A+/sgfSqBcDdAFggM39yAyBTuEH45i/8G4zj9mm/wDwFfpan9ZT3x+b5r9irun8n050lAZelclls3oy7Cw/9TAv54x09LE3J+1P5y/onARphbcfZj8oe1obLyvWM0XCB9XQG2QLC1kEDMgty4dAQN0Asa8IAugEAoDvVA/VA7IHd0AhAQK8oK5f+gIIH3QLbID9kCr90BjtZBCD9UFNwyAb3QDEBd0Hzg6qyxK6s67lW9Opcef9qZ6v+0u+5Pvy3Df/AM6fyfz/AJvGmZ4mP/sq+M6ur7VKyDGo3CBugtkB3ZBPIugtQgVBQG4BQQHlBWsaoKC57IOLCzKiilvsoPzjw2HnTYcRMkQGbBWCazTITzDEKg+CvqK6qY6MTu6uXlwSaaZnWY39f/PF3zS3XTrDo0QwZN1CzOfh4W/xXNiMwksLQj5rzIR/oxhYbGbP5Vjt92xET10+pPw3T4xLN4TaHNcDutX5mOqr1o+O+PCYZf0t8bmbyY5cnXfT+RiZb/jxWQ4r0RgdsPPLH2mrVsZ/h/Zr9bBX5jsrj/dT/S2rB/4gXadIxlnWOuif9tX9TL2lPid6K6rMqRBrGTkuMmh/2TO5cWAjhP8ANEcz+KiP+jGVq2M2RzbB6z6Ka6euj1o8o3x4xDacFtblOM0j0vQnqr9WfOd3lMsoSZ0ufKgxMmZDMlTB6oJkEQigiHIiDgrXKqaqZmmqNJbHTXTXEVUzrDk4IoX8KPpQyCbvzZQLqgzHeqA4sUEHhAFEFrcoJ+iCoOqdRep+jeluTw51rDNv2eGb6ocJhZUPzMVjYwHMEmUKxGoc0hhcGIgVWTyvJ8Xm930WFp104zwimOuZ5fnPKJYvNM4wmT2vS4qrTqiN8zPVEc/yjnMNKer3XrWvV+OZl2MMWS6aBBgyXDTTEJzFxFipgb5xevoDSwwpER6l1zJNnMHkcRXR69335jh92OXf7U9ccHIc72kxed60V+pa92J4/enn3cO/ixySs81/iVqyCWLoKgHvZApZBaXdAA3ZB2fpt011N1X1NBpjTEsS4ZYhm5jmM2AxSMvkEkeuO3qjLEQSwXiINoRFEMdmua4fJ8POIxP7NMcap6o6ojnPLv0hkspyvE5ziPo+H3ae1VypjrnrmeUc+7WW/XTvp3pnpjpuTpbS2FilyIIjNn4iaRFPxc8gCKdNiDeqMsOAAAAAAAuKZnmmIzbETicTO/lEcIjlER1R/wAzvduyvK8NlGHjDYeN3Oecz1zPXP8AxGkbnZAVjmSW9kB9kENaBBa2dA2ugMdkClnYoFigm1UHpNdayyvp/pHNtZ5yCcLlOGinxS4S0U6P8suVD/nRxmGAd4gvbl2AuZlireEtcap07uue6I3vFmWOt5bhK8Vd4Uxr39Ud8zujvfN/Ns5zfUecY7UeocSMRmmbYmPGYyYCfSZkZ/LDxDCAIIRtDDCF3yzYtYa1TYsRpRRGkd3b2zxntl/P9/EXcVdqv351rqnWe/8AlEbo7IeK5Aa6/R+TyMryzNM8zTBZDkWBOMzPM8RBhMHhwW+ZNiLBz/JhFYoorQwwxE2Xxdu28PbqvXqtKKY1meyPnyiOc7n6WbNzEXabNmNaqp0iOuZ+XOeqH0N6TdNMo6UaMwmlMumHETwTicwxhhAixmLiA+ZNPAoIYRtBDCKs64VnWbXM4xdWIubo4Ux7tMcI/n1zMy7vkuU2snwlOGo3zxqnrq5z8ojlERDuH2WKZcF2dBdkENKsgtqkAoG4Zk4h2ZnQTsgppdBKm4ogWYBBbUKCV57ILVANDTdA7FAYuyB90DubIH2Qa0fF50f/AISwEfV7TeFfH5ZKhgz6TKlucTg4Py4ml45I/MTUynr/ABcIXQdis8m3X+i8RPq1T6k9VU/V7quX2u+XPNtsji5R+k8PHrUx68Rzpj63fT/Dr1Q1PIsQaHcbrpjmCtsAglrBAqgUHsgOXQGLXQK7IAYRVQLE0+yADs9kEDMgocs36oIBzVBTXygAkhBCHJdBXszoPHzT8OV40/8A4ab/APAV92d92nvj83zc/wBOrun8n1CyOWZOTYCRHeXhJEJ8iVCF/OuInpXaqo65/N/RuFjo2aaeyPyebbdfi/ceoQDaiAzVQCSC3sgVdQV9lRO7sgc0dA7EICB4QO4KAHFEC1kB+NkBtyUCyAKVQGN3QAeyAKIBG6AOOEEABQXlAogfVBIw0ERF/SW+iQPnl12wn7H1v11hjCz5uJ1P+Ew0iP8A7S7rs/V08ow1X2NPKqqHBtoqPR5tiI+1r500y6NTdZlhk/RQK7GyAPugUAoTRU4FiAoKUIQEPdBWJqgjVVAB7qCt2KB9aIDHlACcRQ3KAz790AkxgwRARQxBjDEAQR4ThvJ37nnad1DqHR8352jtR5tkMUUQjiGW4yORLiI/nSgflx/60JX44rDWMdHRxdumv70RM+E8Y8JejC4vEYKdcLcqo+7MxHjHCfGGXNL/ABf9XcgjlytQQZNqnDwkmM4qR+xYqIbATpI+X9ZJWsYzYjK8TrNjpWp7J6VPlVv/AHm04PbfNMNpF7o3Y7Y6M+dO791mHSnxm9Mszhgl6uy3OdLTv5cyfI/bMK/AmyPVEB3jghC1bG7CZhZnXC1U3Y7J6NXlVp8JltWC27y+/uxNNVue2OlHnTr8YhmLS+tNH62wpxuj9T5VnUiEAxRYDFwTzA9WiEJeE9iAtUxeXYvAVdDFW6qJ7YmPLrbXhMxwuOp6WGuU1x2TE/8Ap7h9iajbheN7HIMgjE2KBdAoSgUDHlAYksA5NgmiTOnFgDrH8WGQ6QjxOmenUOF1Bn0s/LnYwxevL8DHuIooS8+YN4ICADSKIEek7xkWxl7G6YjHa27fGI+vV/THbPhE8WjZ7tnZwWuHwMRXcjdM/Vp8frT2Rw5zExo1FzzO891TnOI1JqjOMTmua4qk3F4iIeswuSIIIQBDLlgmkEAEI4XUMPh7OEtRh8PRFFEco/Oecz1zOsuXYnEXsZdm/ia5qrnnP5RyiOyNzwWN3X6vwQtcfZADMgtBR6oAZy2yB2/RALWCCsyDtHTLplqfqzqcaZ0zAJMuSIZmZZlNgMUnLpER/NEKeqZEx9EsF4iC5EIiiGOzbNsPk2G+kYjfM+zTzqn+Uc55d+kMnlOU4nOsR9Hw+6I9qrlTHX2z1Rz7I1lvz096e6Z6Z6Zw+ldLYSKVhZZM2dOmkRT8XPIAinTov5UcTDYAACGECEADimZ5piM2xE4nEzvnhHKI5REcoj/md8y7dleV4fKcNGHw8aRHGeczzmZ5zPw4RpERDsrh7rHMigPCC+SgOgeECxQO5+iAeyCABBaoJWzINUvjS17FPxuSdMMBO/i5IGeZpDCQxLxQYWUWPImzCD/NlldL2Dy6KaLuY1xvn1Kfzqn8o8Zcy29zHpV28uond7dX5Ux+c+ENZ7vVdCc74lT+FlUbQ/Bp0xlxwYzq7m+HBimGbluReoWlgticSO8UY+VCRUCXHtGuc7dZtMdHK7U9VVff9Wnwj1p7ZjqdI2FynXpZndjrpo7vrVeM+rHZE9baRqWXN3Slo9LIJ7IK/IIdAsgleUD3QVt0AOUCxQTu9UDsgrAHsgg+yC1eqBZAZAYoAFf0QKgugUdjUIOMcEEcMUubLhmQRwmGKCIAwxQmhBG4IViZidYSqmKo0ng+enW3pkek/ULGabwkqMZNjIf4QySOKo/ZYi0Ulzcyo3gqSfT8sn8y7nkObfpnA036p/WR6tff1/tRv79Y5OEZ/lE5LjqrFMfq59ajunl+zO7u0nm6K3ayzLC6I3sEFZAuyCO0KA5dyEFpaqCNuKIKX2QRkADZroAF+9XQ4IH32CDkPoUEHlA/KKXTiKAXoUHj5pAZuW4mVBebLMseYqfvX3ano3Iq6kuRrRMPqhEPTHFDD+WFofoAF/N88X9JUxu3JdFGQANggXQG+qAwNygd9kB6IBogUFUAgu6AwNd0DxsmgUNAgX8IBBZ9rJxCpogMUCwqgMhxOxCBU1QOzIG7sgEsKC6CF/sgvgJAeEEiYwmHsUGgfxMS/ldf9ZGwnR5fPh8HASIf1gK7bsrV0skw/wC1H79X83Dtq6ejneI/Zn9yP5MadlsLXl7MoIH2QBWlLICA/AQB90FhoaIG6COXpdBe90AMf0QQILwHQTeiAOXQVzY7IJcUKC2LIK5fwgAkMQSCaUQcRKlQYqXj5cPysVKIil4mTEZU6A8wzIGiB7gq6zNM0TvpnlO+PKdyxGlUVRumOcbp843skaT+I7rVo/5crCa2jznDSyf8Vz6V+2Ql/wDhQYZ4/wCcPhYHGbMZTjtZrs9CqedHq/DfT8GfwW1GbYGYim7046q/W+O6r4yzTpL42sln+jD690PmGXRMITi8omjGyCd4jLiEE2EdoRGtSxuwF2nWcFeirsq9WfPfTPjMNuwW39qrSnHWpp7afWjy3THhEs2aN6qdOuoEIGkNaZVmU6IOcLBPEvFQ/wClIj9MyH3hWn47Jsfls/8AVWppjr01jzjWJ8244HOsBmUf9LdiqerXf+GdJjxh2uIRQj8QI8hYzTRktYUCKIUgJ8BNDV0nXnWXpx00gjl6s1ThJONhh9UvLcOf2jGzaOBDIgeIOzeqJoeSFl8uyHH5pOuGtzNPvTupj9qd3hG/sYjMs+y/Kon6RciKvdjfV+GN/jw7WpfWD4l9YdToJ+Q5JBP03piYDLjw8qd/juOlmjYibAWggIvKllqkRRRgsOnZJsphMomL13S5djnp6tM/ZieMx70+ERxcvzza3F5trZs627XVr61X3pjhHZHjMwxDBLhlwQy5UEMMEELQwwhhCBsAFtMzrOstV4boKsoHZkCjIDk2QTdwgvugUZ0BtkHa+mHTDVHVvUw03pqESJEgQzMzzOZLMUnL5JJYkU9cyJj6JYLxEEkwwgxDG5vm+HyXD/SMRvmfZp51T8ojnPLhvncyeUZRiM6xH0fD7oj2quVMfOZ5Rz7t7fnp/oDTHTPTOG0ppTAmRg5JMyZNjIinYqeQPXPnRhvXMiYObAAQgCEADieZZniM2xFWJxM6zPDqiOURHKI/5nWZmXb8syzD5Th4w2GjSI85nrmecz/xGkbnY7BeBkDZ6oJe6C1AFEBhwgU3CBQIG7FAQECo8qDjNjlSpcU2fOhlyYAY5kccXphhhAeIk7AAFfVNM1zEUxrMpVVFNM1VS+aetdXzuoGss811PMQ/hvGx4iRDGzy8KGgw8BbiTBL9yV/QWAwUZbhLWDp+pERP3uNU+NUy/nrMMbOZYu5jKvrzrHZHCmPwxD01916njebkGn8z1Zn2WaTyQtj86xcvAYeL0mISzGWimkD+TBB64z2gK/LEYm3grNeJvezREzPbpwjvmdI8X74bC3Mbeow1r2q5iI7NeM90RrM9z6U6d0/lWlciy7TORyPkZdlOFl4PCwXIly4RDC53JZydySV/P+KxNzGXq8RdnWqqZme+X9B4TDW8HYow9qNKaYiI8HsHNwvO9C3uPZAZkEDEkOgIDhAAaqBYuboKzsUDitkEcUNggtCUCvCCWLoKgh/CWQWpQGJsglSgtxygWQKIMNfFb08/wz6XYnPMFI9eb6RMebYYgD1R4cQ/41Kr/OlAxgC8UuBbZsbmn0HMYsV+xd9Weyfqz4Tu7plqO2eV/T8um9RHr2vWju+tHjG/viGjwMEUIilxCKCIPCRuDYhdh4cXG+PBGL+3CBUFOIOXpD9kEF0F2pbsggNGdBXD8IIGahJQHsqKO6gdnQH4QQd7qgKVUAEuyDlR+EHl5Tgv4TzrKcr9JP7bmmAwrNf14qXD+9fneueis3LnVTVPlTMv2w9Hpb1Fvrqpjzqh9PCT643H8qL9V/O075f0XG6E8BFL2QAGogbiyCXQWp8IcDfdAvZAH2QGaiAUC26AfogMWugtBVBA1EB+EBhYlAO26A26CcILfZAv4QKIHZ7IcShogWdApYoDOKINHPi8wAwXXDETxfMMiy7F+4inyj/+7C7FsVc9JlFNPu11x8KZ+bjW21r0ebzPvUUz8ao+TDbVW2NSFBB2KAGPlBR+iCb1QKB2QWguUBtw5QA258IFNvqgMAbsggvwUFNwEDuyBT+26AOPKCCqC2QHa6BaiBVAelSgoYUQfnNw+GxBhinyJcyKAvDFFCDFCeQbj2X1TVVRupnRKqaauMauw5Xr3qFksqDDZP1G1XgpMAEMMmVnOIMuEdoY4ogPYBeG9l2BxEzVdsUTPX0KdfhEPfazPH2I0tX64jq6c/OZMw6gdRM3kxYbN+pGrcbJmBopUzOsQICODDBFCD7pay3A2J6VqxRTPXFFOvxiS5mePvaxcxFyYnl05/KJh12RIw+GEQw8mXL9dY/SGMR7m5Pcr3VVVV+1LwRTTRwjR+lDW6+VVBxbhBaOgUuyCD9EFuUCxogNVkHbelnSzUvVzUv+D2nR+z4bDemPNM0mQeqVgJUVqfy5sQB9Et63LQglY3N83w+SYf0+I3zPs086p+URznwjeymUZPiM6xHoLG6I9qrlTHzmeUeM6RrLfjQegtM9NtN4bSmlMCcPg8O8yZHGRFOxM4geqdOjp65kTBzYAAACEADieZZliM1xE4nE1a1T5RHKIjlEf8zrMzLt2WZZh8pw8YbDRpTHnM85mecz/wCt2kOwgu4Kx7ILThUL0QCHuaoFtkB+LIDAGiAGd0A8lAcEtC5PAqrpJq5Qy5hLeiL3DfqppKdKHAn8TeuBxt64X/VXo1JNcMWfFDqqZpLovn3yJny8ZnkMGR4Qs/4sSfRMIaxhkibF/qrZNkcH9Mza30o9WjWuf2d8edWkNa2uxv0PKbnRn1q/Uj9rdPlGstDPTDCBDLhEMMIEMIGwFgu0a797iukRwV3TgM+fBpo2HOuoGa61xUqGKRpnBDC4UkGmMxTgxA2eGTBEPE9aVt1j5w+BowlM77k6z92n+dU/ut42GwMX8bXi6uFuNI+9Vx8qY/ebk0YQrk7rKs1NkDugCpogjMaoLyEAtbdAubIG1HKCbAsgp4QS7FA2avhBQRd0EANkFIAoUDw6AyCBrILRA8VQKO/6oB7IIRCW9QEQ3hI/MNx9FY3TuSY1jSXzc6laMPTvqJqHRMsenD5ZjScEHJH7HNAmyKm7QRiA94Cu+5Vjv0ngbWLnjVG/70bqvOY17pfz9muAjLMddwkcKZ3fdnfT5ROnfDrgIB4XvY87M6BxugO/PKB+5QBZ1Q33KCWN0AEA2+qClgHQG7oHZApt9EE8IK7Ihuiuz9K8JFmHVfQ2EA9Xr1Jl8w12lTfnH7S1j83ri3luJqn/AOOr4xp82SyiibmZYan/AOymfKdfk+kAi9X4ifzVXAnf0HKKtCboFGQHAZigUsEChLOgG7OgWaqB7ILuglDZAA73QKPdA8BAHAQHpZAZjVAqPzboDEBkFHl0EJp/UgP2dAtRECRvuinsgrOUEY2QDUhA9kGn3xtZZ8jX2lc4IDY7JMThQeTIxEEX/wD0LqewV7pYG9a92uJ/FTP9LlO31jo46zen61Ex+GYn/c15Bqt6aHojEXQ4IOwQcn2CBvenhA2Y7IA54QLNVA9TfVDigHKovupoDoG9Poge6CAMD+I1RClu1kVdrIJ2ZBe/KA4F2BQBwzBBK7oLV6oFrIG/KAHB/cgBk4AOEA3sgjjnsgV5CCg8IIECl0FYFvqgrFxRFdu6V9KtSdXtTf4P5Cf2XCYT0R5pmkcHqlYGUbAC0c6IP6IPctCK4vOM5w+SYf09/fVPs086p+VMc58I3stk+TYjO8R6CxuiPaq5Ux86p5R4zub8aF0LprpzpnC6U0pgf2bA4b8cRjIim4iafzzpsf8ALmRGpNrAAAADimY5liM1xFWJxM61T5RHVEcoj/md+rtmW5bh8rw9OGw1OlMeczzmeuZ/44RDsFx2svC94CEAWugrk1f7IJS3KBRlAbhUQkQwmMsBCHJJYAdzskRMzpCTMRGssSa2+Kfo9o+bNwWHzybqTMJR9MWFyKWMSIS1op5IkwsaEeskcLacBsdmmNiK6qPR0zzr3eVPtT5adrV8w2xyvATNFNfpKo5Ub/j7Mdu/XsYP1R8Z/UjNjHK0npnJNPSIoWEzFGPMcUD/ADgf4uVCe3pjHcrcMJsJl9nfirlVyezSiPnP5NOxm3mPvbsNbptx261T8o/NjTO+tHWLUkfqzjqjqIggj5eCxMOAgbj04aGB/clbBh8iyvCx+qw9HjHSn96Za5iM9zXFf6mIq/Znox+7o6jjDMzOYZ2Z4rG46ZFePF4ydPJ8mOIrJ24ptRpbiKe6Ij8oYy7M3Z1uTNXfMz+cvE/gjKqf+jMM/wDxYX6+mue9L8vQ2/dfvLkypMIhlQxQw+r1CH5kRhBs4hJYFqOzr4mqZ4/J9RERuj+/k5O3ZRVEPqIFKpqacm8Hwi6dGS9FsBmkyGIT9SYzE5xMBH8mKL5Uljx8mTLPuuP7a4r6Rm1VqJ3W4ijy31fvTLsmxWF+j5VTcnjcmavPdH7sQzMQtSbcWDbIHlAqUEoboLQoISKUCA4IugCgsgVJeyChA3Z7IJem3JUAF6uqB2LILugXQEDfhAr9UE33QVBPKgtXuqNRPjY0yMFqvTOtJUJEOa4KdlOIMMP4RMw8XzpPuYJs4eIAuobBYv0mFvYSfqTFUd1W6fjFPm5Zt/hPR4qzi4+tE0z3074+E1eTXNhtcrfWgaLRvdBKgIFQUBhugboHsyCN90J3Kw8IAYIJ5QW1kDxsgg9qoKORZBeKe6DJHw14EZj170dBHB6oMNNxuMjB2+Xg5oB9opkCwO1NybeS4ievox51xP5RLYNlaPS51Yjjp0p8qZ+cw39gBhAAazLiDuSipugVoUDsECyAW2I8oBAugNWoQLFBacoIa7oFbVQP3oAIFGQHamyBdANdy6Agt68oJTygdiEA2ugHhANUBmQH3qgXe3hAJL0sgb3ugr9qINZvjgyozMi0Zn4FMLm2KwBb/h8MZg++HC6F/h9e0u4iz10xV+GrT/c53/iDZ1s4e91VTT+KmZ/2tUQSWNF0tzFB5ZBAgtNggnuEFpUNZArcoI3CA1nQO3KAeyC+LoFWQPeyCA2CBRADoHdkFNUE3ogsNCyCXpRkFFN1RCTZQGbdOIvq2ugM1QPogb9kB9nflAtR0AG6AHLVogCt0AMQ7oA4ug7l0o6Vai6van/gPJY4sLgcH6Jma5nFB6oMFKitDCLRTogD6IP9Y0FcVnOcWMkw3pru+qfZp96flTHOfCN7MZLk9/OsR6G1upj2quqP6p5R4zub76J0Ppvp7p3C6V0nlwwmAwoMTE+qZOmH802bGaxzIt4j4DAALimYZhiMzv1YnE1a1T5RHKIjlEcnbcvy/D5Zh4w2Gp0pj4z1zPOZ63vm2C8T2qzFighLXCCk8BBxdAo9LqAzn0gOTYBUYV6rfFTofQU3EZFpmAap1BJJlzZGFnCHB4SOgIn4gAj1Bz/FyxFG8LH03W35Psdi8yiL2J/VW54TMa1THZT1ds6RzjVp+dbY4TLZmzh/1lyOUT6sfeq+UazynTi1P6gdWeonVGZHBrLUMybgIi8GU4J8Pl8AdwDKBJmsd5sUZ8LpmW5NgMpj/pbcdL3qt9Xny/ZiHM8zzrHZtM/Srnq+7G6ny4z+1MupiGGACCCGGGGEMIYQwHgWWS472J00jSFvRAseGQHQAQ9EAUQQIPwx82LDYDFT5YaOXImRwt/OEJb7svu3HSrpieuPzfNc9GiZ7JfTfReQQaW0fkOmJdsnyvCYClH+VKhhf3Zfz1mGJnGYu7iJ+tVM+c6v6Iy/DRg8Jbw8fVpiPKIh7d/C8j2FfI4QPCB3NEEA73QEFsgCvugjuUAXugKC0VEelEDygWogpcoDbhAD8oG9EDalXQKv/QgnuoKqFEGFfjCyWHMui2JzWI/jyDNMDmMIF/TFM/Z4/b0T4j7Lb9h8RNrNote/TVT8OlHxphp23GHi7lU3fcqpq+PRn4VS0jZi3dl15x/TQrR0RO7ID1QOO90B9kDc1QCgD/OQHKBcPRAdv3oHhkEDC6Ban70HLx5QZx+DbLxjOr2YY+OWDDl+nJ5hiI/LMn4iTBCfPplxj3Wnbc3fR5XTR71yPKmmZn84bnsJa6eaVVz9WifjVH8pbq3XI3Xw7IFXQAgA8ugdroDBAJQO7IDl6sgjIK590A+ECqA9N0FqTV0EPZAYi6AP70CgqgM5ZAFkAbkFAvvdBfJQKvdBA7UQWpKCGhd6IG6DCvxgZSMf0UxeYxM+S5rl2OAarGeJER/2Z0S2/Yi76PNot+/TXT+70vzpaftzZi5lM3J+pVTV8ej+VUtIv807Lr3a46lk4i7NZAArVA8ID7boFn4ZBC7tugrbu6CMSgtnqgbsgNThBNwxCCgk0BQS26IUsijIKHZkA3psggIs6BYsCguyCNug5b3Q1cR9GQV2DmiCoIOUEZkCu9tkFFKhBB4VFAUHudF6PzvqFqzLNF6f9MONzKYYTOjh9UGFkwj1TZ8Yo8MENWp6ojDDeJeXHY21luGrxd/2aeXXM8KY758o1nk9eX4K9mOKowln2qufVEcZnu+M6Q+hugdBac6b6XwmktLYWKVg8M8ccyYXnYmdF+edNi/lRxEVNgGhAAAA4XmWZYjNcRVicTOsz5RHKIjlEf8AM6zOru+WZbh8qw1OGw0aRHnM85nrmf8AiNI0h2GwZeCWQA25QEFFAgleUFI3UHrNR6kyLSOS4vUmps1w+W5ZgYPmYjEz4mhgFgALxREsBCHiiJAAJIC9OFwl7G3qbGHpmqueER/fnM7o4y8+KxdnA2ar+IqimmOMz/flHGZ3Q0w6yfE1qjqSZ+QaUixWndLTITLjhhj+Xjsxh/4aMVkyyP8AJQFyCfXExMA63kWyeGyrS/idLl7zpp7ven7U7uqObkee7WYnNJmxhpmi15VVd/VH2Y39c8mGJcEuVLEmTLggggDQwwgAAdgtrmZmdZ4tQiIiNIcquHUUYMfugREQQRTI4hDBCHMUVAB3KcZ0gnhq8rIsozvVMcUvSuQZtnkUBaL+DMvnYoQ+YpcJhHuQvzv3rOEjXE3KaPvVRT+c6/B+1jD3sXOmGoqr+7TNX5Ro7vl/w8dds0kwz8L0wzGVLjFDjMZhMKfeGOb6x7wrEXNpsmszpViYnuiqfyp0Ze1sxnN2Iqpw8+M0x8Jq1ezl/Cx15jeP/BHK4D/Njz2S/wBoSPuvPO1+Sxxuz+Cf5vRGyGc//FH44/k8ef8ADF18w4Hp6eQYoCp/Zc5wURHtHMgdfdG1eS1//v076avlEvivZPOqONjXurp+cw6vnfS/qfpqGM59031Ng5coExzocujxEqAcmZI+ZCB5KyNjNsvxUxFi/RVM8ulET5VaSx1/KMwwus37FcRHPozMedOsOvZVKwueZngMqlTZc39rzHB4SOEFyPXiZcBEQuPzWK916asPbruzu0pqnypmXisU04i9RbiddaqY86oh9RYyDMie/qIX85zL+jYjSHE1RQOgOKD7oBHdAr2QDXugGzBAZgwP1QOeyBuwQH3CCmoCCIHhAQPdA+iBayQACA2wQK8oF0A8WZQAK0ZUdH66ZTBnfRrXOXRQv69P46ZAGf8AjJckzIP+lAFmdnr02M2w1f26fjOk/CWG2htReyrEUT7lXwiZh88RGJ0MM6H8swCMeCHXdNOju6nBtelvPKCNWyCihQN9mQSli6BUbIFR+qCU4HsqDNuyg5VNaIIwu6CVCCtvsEA3sgWHdUbR/A7lUYh1xqCOWPlzZ2X5dKiaoMqXMnRj/r4Fzn/EG9H/AE9jnpVV5zER/DLpP+H1mY+k3+UzTTHhEzP8UNpGLXXN3SRkBmYoA2oyBXjwgqCNXugV4QLlA96oHYbIFEAUqyA1GQCXKC2ZA2sggrVA3QXehoiIHvRFO6Bd+UAl7/ogUNbIBtUoHYIKed0DyUC9kHS+tWRf4T9JNY5HDLMybickxZw8AuZ8EszJX/TghWWyHE/RMzsXp4RXTr3a6T8JYjP8N9Lyy/ZiNZmmrTviNY+Oj50yp8OJky8VAfwzoIZo8RB/3rvFVPQmaZ5bvJwSJ6URV173IMoJ4INNkBABPIZNBb7oDnygA1ZADACu7oIA/wBdkA0LkoG7IBAQWlOwQLb0QEBz7fqgVsyCDmqBVApv4QKWQWgQT8SBc1psgov3QAyBVAqbXQEEcuyCuLFAbYmiC1sUGwfwTZfKndQNU5rHC83B5JhsPLP82GfiIjH9fkwfRaNt9dmnA2bUcKq6p8ojT+KW97A2Yqxt67ziimPOZmf4YbhuVyt1c7FAsgbOUBAFqqD0us9Zae6f6axuq9UY8YTL8FCDFEB6o5kZpDLlw3ijiNIYRcle3AYC/mV+nDYenWqfLtmZ5RHOXjx+OsZbYqxGIq0pj+9I65nlDQjqx1b1L1fz6HMs79WEyrBzDFleTwxvLwoZhMjakyeQax2hcwwsHMXasmyTD5HZ9HZ31zHrV857I6qeznxns4nnWd4jO73Tu7qI9mnq7Z66u3lwh0ousuwveV5QcY5kEv0+o1jiEEAAJijiNoYQKxEmwFVYjUmdGZunnwodStawysw1H6NHZXMAiBxsr5uYTYf83DAgS35mxCIfzCtTzTbLL8v1osfra+ydKY/a5/sxp2ttyvY3MMfpXf8A1VHbvqn9nl4zr2NjdGfDB0b0cZeIi0z/AA/jpY/9dz6MYyPsYZRAkwEcwwBaFj9r81xutPpPR0zyo9WPP2p8Zb9gNkMqwOk+j9JV11+tPl7MeEMqSoIZMuGRJhEuXLAhgggAhhAFgAKBa3NVVU6zLZaaKaI6MQCGEWgA9lH0qA0JNQD7IIPw/lJhHYkJqTES9BqHp7obV2MwuZam0nlWY43BTpOIw2LnYaEYiTMlRiOAwzYWjAEUILOxsXC92FzPGYOiqixcqppqiYmIndMTGk6xw4PDiMsweLri5etxNUaTE6b4038eLsJYkk7kleGXtjcjCg2RQblAF2ugO2yBugC9UAACiAGPnygDdAettkCrXQKkeEAckoFLoHdkAijuoL2oqJvU/ZAHAQGs5QW1gggLUKBcVQVB6TWmEON0jnuCDn9pyvGSmZ39UiML15fX0MVbr6qo/OHizGj0mFu0ddNUfCXzKy0mPLMGSGJw0o3/AMyFf0NdjS5V3z+b+eLc60U90fk8nd3X5vpB4ogOH7oF7hAqLMgOQf6UChuhoe6CGn9yC7XQ4ApQIFwgj+yCt9VRQC7C5opKt1vg5yeLL+jcGaG2e5zj8eO8MEYw0P8A0cOFyPbq/wClzX0fuUU0+cdKf4nX9hcP6LKvSe/VVPx6P+1nCGtGotOblwCwaqAzsUB6s6BugVBYoBogcIBd+yAfFEDflAFN7oL2QSgDbocQ1uED2QG2KBugPsgNYOgVQGYuxQVnNkEq/CAaVQK8oBq+6B7oDgW3QW7MggEMUXpmQ+qGL8MQNiDQ/YlImYnWEqp1h8wc0yWZprOc00vNi9ceR5ji8rJ5+ROjlg+8MMJ91/RNnERirNGIj69NNX4oifzfzlew/wBEvV4efqVVU/hmYeLsv0fmtQaIFTWjBAN6+1ECroJ9kBmNDRBSyBY2QB3QKg0O6CWNEBvIQUDdADIApsgUa10EAqgu+yB72QEEcILUNVA7HygAEm4QL0ABQQk+6C8AboA3ogjDc1QUNZAYlBX3N0GzPwMwCLNOoE1vySMmlj64uI/uXPf8Qp/U4WO25/sdE/w8/wBbFT2W/wDe2t7uFzR04Z7lQLAclUUd0By6DxszzLAZPl2KzfNcZKwuBwMiPE4rETYmglSoITFHHEdgACV+lmzcv3KbVqNaqpiIiOczwflfvW8Pbqu3Z0ppjWZ6ohoF1r6x5p1k1LBjvTOwmnctiiGTZfHQsXBxM4bzoxYfyID6RUxmLt2RZFbyPD9Djdq9ur/bH2Y/enfw0iOIZ/nl3PcR0+Fqn2af909s/uxu46yx85N6LNsCfR0V2DQegdXdTc+/wd0dlgxE+WIY8ViJpMGFwMuK0c+YAfS7H0wh44mLChI8OY5lhcpsfSMXVpE8Ij2qp6qY/OeEc5e/LssxWbXvQYWnWeczwp75/KOM8m63SL4etFdJoJeZy5QznUhhImZzipQEcDisOHluRIguKPEX/FFFRckzvafGZzM29eha5UxP8U/Wn4RyiHXMj2YwmT0xX7d33pj+GPqx3b+uZZQapLVO61ts2mg9boBqgfRAq+yBQ7oFfU49k4CF0HLdBGpeyBahQO7u6C1fhBK8IBQRkFNKX5QQl9mQUPZAJqgFigFggWKAxu7IFSXQDzugbUKA3CCABroKgcIDb3QO6DjOky8TJjkYiD1ypkEUuOFyHhIIIcWoSrTVNFUVU8YfNdFNdM0zwlg/M/g36L4yCCXlMnUORwy4BBAMDnEybCAAw/DifmBbhZ25zWif1vQr76Yj409Fp+I2Fyq7H6vpUd1Uz/F0nTM1+B/1euPT3VHFS2Dwy8zyiXOBPBjkxyyPPpWXs/4gf/Ph4n7tUx8Koq/Nh73+H0cbGImPvUxPxiafyY81F8JvWrIYDMwOWZRqKUAYmyvH/Lnekb/KxAgr2hjKzmF2yyjEzpXVVbn7Uax506+ejA4rYzNsNvoppuR9mdJ8qtPhMsUZplmZ5HmRyXP8qx2U5jDD6jg8fho8POMP84QxgeqHvC47rZrN63iLfpbFUV09dMxMeccO6WtXbN3D3PRXqZpq6qo0n48fB49Qvt+QeyAPCB2dAPCBVrIFv3IAOzoFdzZAta1kAE+yDjNnDCyZuJitJgim/wCyH/crTT05imOaVT0YmrqfRno7pw6R6VaR03MlGTOwWS4SHEQEVE+KWI5v/TiiXBs9xX03M79+J1iqurTu10j4Q79kWF+hZbYsTGkxTTr36b/jq7h5WKZUJ3QRwgtjVAqUDz4Q4hB8IFHqUDd0DuECthsgNT7oAuzoFvdAuboQeEAMLIG6AWQUu/ZAFKjdBC9KlAJdAF67ISeEAsDu3ZBX4QDdBCUAugGoICEtBfiayD/B3rjqSCCR8qRnEOFzqQBuJsoS5h/52RMPuu2bKYr6Vk9mdd9HSonwnWP3aocQ2rwn0XN7vVXpXHjGk/GmWMuy2JrhvRQKuQLIHsgCprdk4AxQC70sgCtDRADoB3JQAECl/wBEDdyUEFTQoKGJ8pqJUnu3KCg1cmiA1GQTsgUeoQUXogNR0EoLBigO19kFeoqgj1ZBaVQEBqbvwgWq9UClmQLVQV0Gz/wNQn52v58X5Y48plj/AFZc8/8AaXOv8QZjo4Wn7/50uj/4eR62Kq+5Hwq/m2nJcsubull7l/ZA4ugvtVBxJbYsg1G+L3q5FnOa/wDkjyLFf+jstjl4jPpkERafiqRysKWoYYAYZkYq8Rlw09MQXUdisljD2/0nej1qtYo7I4TV3zwjs1nnDlu2+c/SLn6Msz6tO+vtnjFPhxnt0jlLXQ3cLfGgI9XenZE0du6V9LtRdXdUHTmQRHDYXDCCbmmZxy/XLwMmI/hpaObGxEEG7GI/hBWLzjN7GS4b09/fM+zTzqn5RHOfCN8stk+UYjOsT6CzuiN9VXKmPnM8o8Z3RLfjQugtL9N9OYfSuksvGFwUkmZHHEfVOxM4geqdOjvHMiYOTYAAAAADimZZliM1xE4jE1a1T5RHVEcoj/njvdty7LcPlWHjDYanSI85nnMzzmf73RDsAXhe8dzugeUA90A/qgU5QCRZAtZ0AWQOxQL1Q1GI7oFt0De9ECu6Ber0QKuyAbsC6Ab3QNkAAkIJsAgt0D8uyB2F0ANugOeUBAD0QOP3oHlBQdigncoCBfygXKgU2oqF0HpdX6M0trzKI8i1jkODzfAx/iErEwOZcTN65cY/FLjAdooSCOV7MFmGKy676bC1zRV2fOOEx2TuePG5fhswtehxVEVU9vy6p7Y3tS+r3wn6j0bKm5/05mYvUWSwAxzcvmD15lhIWqYGH+MwCtABMAakdSum5Jtjh8dMWMfpbucqvqT3+7P7vc5jnmxuIwMTewGtyj3frR3e9H73ewJLmS50AmyoxHBFaIf22Oy3WYmJ0lo8TExrDlYu5UAEUQL7oJ+qBUbID0Ie6AKX8oLsgCp8oPZaayD/AAr1TkWk2iMOdZrg8BH6Q7S45sPzD7SxGfZefFYj6HhruJ9ymqrxiJ0+Oj04PDfTMTaw3v1Ux4TO/wCGr6bE+qIxAuCaeNvsv56ni/oiI3IQ6KndByL8oIeUAugNwgb1ugUaqA/ayASgu/6IJ+iB+iBV3QCoDVdUK8IG7sgpJJuglBygF2ZAI+qBblAcboCBXsgEPvRAqgGu9UDe6A5Qap/G/pyKVmGj9ZypFJsGLyXEzDZ2GIkA+0OI+q6X/h/itbd/CTPDo1x/DV+dLmP+IGF6Nyxi4jjrRP8AFH5VNZOwXQnOyoIYoHiyC3AO+6DixFyXQXygANvflArsgGn4nQWouUEqP60BzsUAO4/fsgdnQKVIQRmNKoLv+qB23QRgUCtkFZiGP0QAw32QTzsgrG5QHu29kAAIH7kCqCe6AR3QHFQ/ZBUFZt0G1vwPYeIZHrTGm03NcJJ94MKIj/8AvAuaf4g1a3cPR1U1T51T/J07/D2j9TiK+uqI8qY/m2ZI3cLnrohem6ARtb96gW7IOo9WeoGH6YdP841lNhgmz8HJ9GBkRmmIxkw+iRLIcEgxxAlrQiI7LLZJltWbY63hY4TO+eqmN8z5cO3Ric7zKnKcDcxU8YjdHXVO6I8/g+dU2djMTOnYvH4uPF4zFTY8RisRMrHPnxxGKZMiPMURJ913emmiimKLcaUxGkR1RG6I8IcGqqquVTXcnWqd8z1zO+Z8ZcAKqvh7DT2ns61hqDL9Kabw8E/NM2n/ALPhYY3EEJZ45kZAcS4IQY4iNhRyQvxxOJtYKxXicROlFEaz8ojtmd0P3wuFu429RhrEa11TpHzmeyI3z2PoZ0x6c5H0t0jhNI5CDNhlEz8Xi44QJmNxUQHzJ8bblgAP5MIhhFAFwvNs0vZviqsVe57ojlTTyiO74zrLu+UZXZyfCU4a1y3zPOZ5zP8Ae6NI4Q7ULsN1jGUW9EEYAIArTdAPKBv2QCzHcOgUJBCCUKC0QGYitECtkEPLoLchAq/ZAvugXDiroIboKgMRugVeqA27lAY0QKHsgDh0Ct0Dwgu9UEbhBaFBHJo4QHogVJqyAe6A2yBQ7FAF24QN6IFeUDwUBvZBgDr98M2D1tDi9a9PcLJwWqS87E4MES8Pm539W0vEHaZQRGkdxFDvGzW1leBmnCY6Zm1wieM0fzp645cY6p0baXZOjHRVi8FGl3nHKv8AlV1TzndVx1jTiOCZLmTJM+ROkTpMyKTOkz5ZlzJMyEkRQRwmsMUJBBBqCF1WJiYiaZ1id8TG+JieExPOJ63J5iaZmJjSY3TE7piY5T1THOEYCzohTYsgV4AKAXuaoICgtHQTwg5IMvfChp/+Het2X46IAytO5di81ieFwZkQGHlDz/HTIh/oLWNssT9HyiuiONyqmnwj1p/KPNtWxmG+kZvTXyt01VeM+rH5z5N6IQwFyPC4y7QIHFaIAA2KAQ1FA3/eqLV0E8lA99kOKke6CVoOUA8oFQUAPdALngIHugoYUQB+qCdwUDsgMgPSxqgMad0kO7FA7tVAQRxugpIIQDR0Dd0FI4F0De6DEvxUaYi1J0Tz2dIk/NxOQmTnkhj+UYeN53/UmcPdbPsdi/oub2qZndXrRP7UaR+9o1bbHB/SsouzEazRpXH7O+f3dWiRDRFrbMuzOLT1IiFOaoqVFrpxFDmiB4qgj2dBT2QB2ZELEopayBapZ0EcbB0AF6FAogoNQ7eEDagogj7ugV7oLQIIRwUCxufogrVsghfwgvugCtWpsgP3ZBNqO6C+6A/KCCv9CC0N6oLWyDcL4I5MI6dalxDfimanmQv/AKGCww/eVyzb/fjbNP8A9cfx1urf4fxH0G9VH/yT/BQ2EutFb4d2QLWFuUCjW8oNSPjU1lHjtSaf6eYaa8jK8PFneNAIIixE31SsOCNjDLhnxf8AKQldQ2DwHo8Pdx1Ub6p6Ed0aTV5z0Y8Jct29x3pb9rA0zupjpz3zup8o6U+MNcSt9aAsL25Qbc/B10ygyjTk/qjm2GbH6igMjLBGC8nLREPxAGxnRw+vvBDK7rl+3ObTevxl1qfVt76u2vq/Zjd3zLqew+TxYszmF2PWubqeyj/ynf3dFsWtCb8PwgM5sgGvKC1uglHQP0QL3QN2RSxRECC73QO5QPG6ACgfQIA2qUAXvdAYWqgbB0DlkB3LGiBwgIDbg3TgFEA0sUAcoKxIp/cgXF0CgqgnhBWB3QS1A4QBZ90BmH7kEp3QXdBQz0QSyAOUC4IaqARsfog1k+LLonKxmFxPWDSeDbGYSWI9QYWVD/6zhoA37VCB/lJQA9X86WHvAAeh7G5/NFVOV4mr1Z9iZ5TP1e6rl1Vdkuc7Z7PxcpnM8NHrRHrx1xH1u+nn109sb9UwRE0UJEQIcEVBC6U5mgugvcFA35QShv7oi2DiqKiDkNqINsPgj038rINVa1miuY5hKyvDvD/ksLB6o4geDNnRg95a5nt9i9b1nCR9Wmap76p0j4Ux5un7AYSabV7Fz9aYpjupjf8AGqfJstwufOhl6oF6XQKBA3BZAZygrVQRw/lA3ugFiSgtqFBBX2QA10CjuzlBfNeEEr9UBgLoKzIiUN0Ve5QGIugneiAK0AQWuyCfqgoqfH3QGqUEogNuGqgUDVQUPyghv3sg/DH4HB5pg8Rl2YSRNwuMkx4afLitHLjhMMQPZiV92btVmuLlE6TE6x3w/O/apv26rVcaxMTE907nzGzLI8VpfN8x0rjo/Vicixs/K50X8+KTGYBH4ihhhi8RL+iLWIpxlqjE0cK4iqP2o1+E6w/nW9Yqwl2rDV8aJmmf2Z0+Mb34FgWqV9PzQcEsgphJpwhoClEDs4dArdAarFNQvRAb2KA3ARUvTdELFkFoKhBOyC+Agb8BAc7boJtsgoBZBCxNaIFPogtqgoG709kAXoXQL3IQPCCWNaugrsUEogo/rQRggrdroNzfgrkGDpPmE0ANiNSY6On+bBJg/wCyuTbe1a5nRT1W6fnPzdb2Bp6OW11dddXyj5M9UWlt3UtwgjWdBWEREJBaIgGiJO6HzZ6j6r/w76h6m1lDNE2TmmZzThY2Z8JKaTh/rLlwxf6xXf8ALMF+jsDZwkxpNNMa/enfV8Z08H8/ZrjP0hjr2K5VVTp92N1PwjXxdeADuPC9zHvcaJ0jieoOsck0LhIpkMWe4yDDTY4C0UvDAGPETA+8MmGYR3ZeXHY2nLcLcxlX1I1jtnhTHjVMPZgMFVmOLt4Sn686T2RxqnwpiX0oweEwmAwkjAZfh4MPhMLKgkSJMuFoJUqGEQwwwjYAABl/P9y5Vdrm5XOszOsz1zL+grVum1RFuiNIjdEdkcn7UJqF8P0G7dkC6BQIBTiBrTlDgbi/lAIPhAPhAZxfwgEAmyBWlUC9HZAtdAat3dAYk7IF7MEDahQGG26BQH0nZArugNV0AXugeWQCgFigMgW8IDbugIKXogjVdBT7FBO7qAx3CofZBBVBSa+UDsgMXc8IIzoLW2yCnsXQcYhDEDDFCIgQxhiqCDcHsmsxOsJMRMaS+e3XTplD0q6i4zIMDJMGS5hCcyyUsWgw8UTRyH/4GN4QL+iKW913LZ/Nv0zgKb9c/rKfVr7+VX7Ub++JcL2hymcmx1VmiP1dXrUd3OP2Z3d0w6GAbkrNsElkCo4ZBO4QEFYboOM+fLwsiZipg/BJgimxAXaEOf0Vpp6cxTHMmejE1TyfRLojpCdoPpNpbTGLlRS8Zh8vhn42GIMYcVPJnTwfEyZEPZcK2hx0Zhmd6/T7M1aR92n1afhEO8bP4GcuyyzYqj1ojWfvT61XxmXd34WFZoua+1FQLILugh+6CjkXQTeu9EClrugMgboFkBnKBSwCCsTWyCV5QVtkHGrs6CsgMA9UBg7velkAU8oA5dA8IG9ygOQHQGA8oAtVBCd2QV3od0FQTuCgqDiQ/ug0g+LrScWnurxz+TJMGF1Vl8vHQlmH7VIaRPA/1P2eL/WK7DsXjfpWVegmd9qqY8KvWj49KHHNtcDOFzT00Ruu06/tU6UzHl0ZYYW2NQA9leAMSoJuyC02ZBHq9UAf2ZBQaVPlAqCKoJuwQGsyBRANdkA8+yCnZuEE2QCdkDsKIK/hBLX3QAEDsgULBiCgMgU2QXalkEA+qC2pRBNq3KpwW2zFQTd3QUeX7qjd/wCD/D/K6I5diLftWaZrOPf/ABuOH/sLj23FWub1U9VNH8MT83ZNh6Ipyimeuquf3pj5M0N3tstSbcd0AoOmdaNVTNFdKNV6mkzIoMRhMrnQ4SIU9OJmj5Un/rI4Vl8hwcY/MrGHmN01Rr3Rvn4RLEZ/jZy/Lb2IidJimdO+d0fGYfOqVIgwsqVhZf5JEEMqHxCGH6Lu81TVM1Tz3+bgukU7o5OQpUhRGwvwVaXl5hrbUessTLhihyXASsuw3qH+WxMRjmRDgiXJgHiYeVo23uMm1g7OEp+vVNU91O6PjM+Te9gsFF3F3cXV9SIpjvq3z5REebcEWZcrl1fgDuUAUN0EHNgoKeVRKfVA4dBb2QPogM1igjOaoAuUFs5QQXZBXQCGqeED3QH3QBfshB7IBtQoFRU37IHugVuEA8PbsgF3oyAKVQCOEAsSEDlkAkE1KBvdQKWAVDajoKN0EejhAdADksgdgUB0B7IJ5DoFx5QV3QLIMJfFtoiDU/SufqWRIMeY6Qm/wrLihDxRYVvRioH2h+WfmeZUK2/YrMJwmYxh6p9W76v7X1Z893dMtP21y76Xls36I9a1PS8PrR3ab/CGk5uwLjZjdde5b3Hpje4sTZgd0Qv7oI2zIAO5dUUMS45UHaelOkYdedTtMaRmwQx4bG4+HEYyGKxwmHBnTQe0QliD/XCx2c439HZdexMcYp0j71Xqx5a6+DJ5Lgv0jmNnDTG6atZ+7T60+emni+jzmM+s0MVSuBu/REQEeHRTdA4ZAvU22QN0BA9kAAnsgboD7oH70NSnCAC29kDwgHndAJG9EBzZAQk7hALUayB3CA43QOyBuxQCd+EB3QEBqXQLn+lAbl6IFEF35QSqDBHxjaPGedLZeq8PJEWK0njoMdFEATF+yTf4nEQjsPVBMP8AxS3PYbHfR8wnDVTuuxp+1G+n8pjxaVtzgPpGX/SaY9a1Ov7M7qvhOvg0vIILeQutuRArQkP5UAeXQGZiSgm6Cs+9kEt5QP3IKfIQQdmQUUDIJdAFwqi7MVFL3QTdigrMgjGtUBgge6C15QRBQyCCordAfhA7OgAOgroFaIAG6CILCajdJOLe74UJYg6B6ZMN45uZzD74+eVxnbOdc6u91H8FLtGxcf8A4W131/x1Ms+61htRaiBtZBgL4z88OC6ZZXkMud6Ys8z7DwTYP58mRBHiD/05cr6hbtsHY9JmFd6Y9iifOqYp/KZaPt7f9Hl9FmJ9uuNe6mJq/OIab+o7+66u5Kl/coN0vgzyY4DpBNzeKEerPM8x2LETV9Eow4aEeP4g/Urku3d/0maRa9yimPP1v9zr2wuH9Flc3ffrqny9X/azoCeCtMbob2QCwo6A49kBy7FkAcIDnj7oFigWuzlAsWJdAZzdAQKuyB4QKmiAH2QKju6ASxZAZAYIF9kC9QgWNkBkBw10CrugfZALBA7B2QKuyBRqkugrNbdOIWQQugdkAIBugClnQHQOAgGpZBLg90FFKbIDuT+5BLoPwzDL8Fm+BxGU5jJhnYTHSY8LPlxWjlzITBED2IK/SzdqsXKblE6TTMTHfG9+d+1Rft1WrkaxMaTHZPF8xMVlWLyDH4zTmPifF5NisRlk8gu8zDzIpRPv6H91/RFF6nE0U4ijhXEVR3VRr8386XLNWGuVWK+NEzTPfTOnyfns6r4SvKooUEvsqOQLFRWyvwS6QOKzfU3UPEwfxeDly8hwUdx64/TPxJ7EQ/s4f/SC59t9jpotWcDTO+fXnujWmn/d8HQdgMB0717G1Rw9SP4qv9vxbY7M65m6gOUAN5QLCyBwEC1igVqoDF1QPfYoFGHdAQH4QR3QWlxVAognugqCsW7oIfKB5KBXayC0al0CvKCHtdADoDHsgbs6BvdAd6GroFH7oHe6Aw+qAzXQKMyDw86yjL9Q5Pj8gzWV83A5nhZ2CxUD/nkzYDBGPpEV+2Hv14W9Tet+1TMTHfE6w/DE4ejFWa7FyNaaomJ7pjSXzOzXI8w0xm+YaXzc/wCPZLi52XYiLaOOVF6fX4ih9MY7RBf0JZxFvF2qcTa9muIqjx36eG+PB/PF7DXMJdrw132qJmmfDn4xpPi8W9LL7fmbsgo96oI1WQLUDoJugrHuECzUdAH9qoBZr+UBn90CnCA7OgjsaIKwaqBQeEEatUFAPlA8IB4QPAcoJsyBauyA1a1QP14QHCC0QBY07oJXZBfKDlKrMgH+cB90ngRxhvl8LcoyugOjoTCR68LPnefXiZsT/dcW2wnpZ3iNOUxHlTEO2bH09HJLHdM+dUyymX5Za22YrYIHdBqb8cOZCdnuiMoETGRhMzxkyHb8UeHlwH6QzB7rpv8Ah/a6OHxF3rmiP4pn5OYf4g3Olew9qOUVz/DH82tdgugOeOUABihfkKTwWOLfX4YMH+ydBNFwCnzsBHiy/M6dMmH7xriu11c3M6xE9VWnlER8nbdkbfo8lw8dca+czPzZPs7rXGyFHVD96A7WJQKAoFnZAIQHdA+leUDhQG3KoU2KBcIHugENVAt4QCatz2QLILRBxPc1QVu3dAdiGCA+w9kFN0EqUFagKCd0DuEAvsgUuyAEAj2QViGF0E8IcRmd0BmqgWQR9ygpZ0DxQhBaDap2QcaIK3ugW8oFy7IJExhN3ZIHz3+IDLJWUdctbYOQPTBHmUrGAAf7/hZM2I/7cUa7ns5dm9k+Grn3Zj8NUx+WjhO0dqLOb4iiPeifxUxP5ug0e6zTBgsqHuoG9EHGdOl4eTMxE4kQSoDMjb+aA5VpiapiIKpimJmeT6E9BtDzun/SfT2QY6UZWYR4Y4/MRFC0QxeIPzZkMXPoMQgB4gC4btHmEZlmV29R7MT0afu07o8+Pi7rs5l85bllqzX7WmtX3qt8692ungyBcP8AuWDZ0CBV25QOGZAcln/RAp9UCnCBWxDIFLfogoFbUQQoKX7IJu5UB38qh7IHZAse6AO6B+9AqECndAqgd2QD3QO6Ba5QBWwQWlhsgh7IG/KB5CAwsKOgroJ4QG70QaZfGPomLIuoeA1thZTYTVWFEnERMWGPw0Ihc7D1yPQw3+TEus7D5h9JwFWDqn1rU7vu1fyq1/FDkW3GX/RsfTi6I3XY0n71P86dPwsCvZ2C3RpQ7FrOgDugWQDWjIFRY9kAHygOX2dDQr7oHdAagtdBQ/ZyiIA9t0UtfbZ0BjcOge6CWrVBag29kCgQ0SzNuhCugUIQRvVsgu1HQRq0QKGoTsFAbf7JqFi7IFUCxZBygi9McJL3CkxrCxxfQX4fMMMJ0P0FKDj1aewUz/bl+r/tLh+01fTzjEz9uqPKdHddmqfR5Rho+xTPnGrIFNisGzhc8oFGc7oNMfjSmP1UyKQ/4YNN+oD/AEsXMf8A+ALrOwlOmW3Jj/5Pypj+bke3lUzmdqP/AK/zqn+TA9QHC3RpLlLH4wGYuFJ4LHF9APh0nS5/QrQkcqJx/AWGhpzCGP3BXEdqaZjOcVE+/V+buey8xOTYfT3IZDWBZ5WYoFfCCN7ILQhkENTVBQ4CAR9UD2coDoJe2yA3G6C7eECyC3QS6B2UCpNVQQDUuCgU5QLijIBt4QHa6A/kqBR1QNTQIA72QO6B+9ALhQHdUATflNQAcoHhAaiAeyCvyEEdkFY3QSmyAzUZA7Oggqgrn2QLAoNDfikAh686iIf+MwuWxnz+zN/2Qu07Iz/+Fsx21/m4ltfGmdXZ7KP4WKj2WyNaS3tdBdqEIFtkHd+ieh//ACidVNP6cnSDMwEif/CuZfheH9kwxEZhiHEc0yZf+uVic/zD9GZbdxFM6VTHRp+9Vu+Eaz4M1s/l/wCk8ytWKo9WJ6VX3ad+/vnSPF9EBEYojEbmq4Q7xwgbcl0DwgE/2ZAB4QP0QBxdAqasgXQH4DocSgN3QDugMECx7oF2KBVA8GiC3QEEBq9kD3QNrhAd/IogO5tRAFECh2QK2QP3IBAQPanlA3KCDeiCv2QDcm6AEBwDdBjf4h9Az+onSjOMqy/DfOzXLxDm2VwgExHFSHiEELbzIDMl/wDKLYNmMypyzMqLlc6UVerV92rdr4TpPg17ajLJzPLa7duNa6fWp76d/wAY1jxfP+TOl4iVLxEmIxS5sImQE8EOF26qmaJmmeMOG0zFUdKObl3DqLqnkID/AE3QNrURCp3RSu5sgXDIFUEd+yC2QQniiC1sCgOHvThAqSgdgKoIQyooD1F1BHaxQXxVBPLIFNkC10Ae/lDRa7VQQdhVBa/1IFzVAFg6BfYUQSafRLjmD+RBFF9A6sb5iEndGr6M9HJBkdIdCSDQy9MZXCfIwstcHz2rpZrip/8Asr/il3zIY6OVYamf/jo/hh28h6rEsuHkIB4LoNNfjVw0UHU7TuJI/DO07HLB7y8USf8A94F1fYOuJy+7T1Vx8af+HJdvaJjMbVXXRPwq/wCWAxx+9bs0dyhJEQiBtVOJDeP4Sc0lZh0MyXBwRiOZlGKx+WzAP5PoxMcUA/5uOA+647trZm3nFyufrxTV50xE/GJdm2Kuxcye3RHGiaqZ8Kp0+EwzCGPd+VqjbCrkoA3QDZBAW2ugqBuC6A5FED+wQC5sgVsgCz90AoDD3QHFt0ABqIFggDsboDVQBRANUA19+EDsgb1QKEsQgOH+yBXcIFNkA0AKByECjID8XQLmqAL9kD3QLeEDsgWQUXQS90DeiAK1KBan9ggeeUBBC1a7INB/iZxMOL6+atEEYMOGGX4UH/OhwcuI/eYu2bKUdDJbGvPpT+9MfJw/ayqK86vz1dGP3Yn5sZWK2Frrj7fRBR9UFYv5VG3HwXaGGC0rm/UfGyB8/UWI/YcBFFCHGCw0RhMUJuBHPMxxuJcBXL9vMw9JiLeX0TutxrV96r+VOnnLqWweXejsXMdVG+udKfu0/wA6tfKGx1qCi0F0AQKugWNEA9wgeCgV4QL3QC5/rQOyAadkBjZBb7IQlXtRAsbIG6B7lAvvVBTyglxdA90DetEEQV9xdA97pxC26Bu9UEB3QLhBaCj9kDygjVqgrC4dAs7oFroDXCBUfihLEVQ4vnt150B/5N+qmcZJhpHysszKL+GcqEMIEMOHnxRGOUAKD5c4TIQNoTByu57O5j+lMtt3ap1rp9Srvp4T406T36uE7R5b+i8yuWqY9Sr1qe6eMeFWsd2joVgs0wbj4CC1JcJ3iEEboHZ1RX7qCf2ogvd0EdkFq3DoIDV3dBbi6CeEB0C7VQCSgC6CuwqggqPCBsgpICCeUBnpv2QLUQKuUFHnugUf+tA7IJ53QfhmJMGW4yN/y4acfH4Cv0tb7lMdsfm+bm6iqeyfyfTbROEGA0bkGX+kQ/suVYOSwsPTIgDL+ecwr9Ji7tfXVVPxl/RGXW/RYS1R1U0x5Q9z2Nl5HsGhI7lBIiAHNBuSg1E+NrMcnxOrdI4DBZhhZuZZfgswhx+HlzRFNw8E2LDxSfmQisPq9Mwh6kAldS2BtXaMLfrrpmKapo0nlOnS1069N2rlW3961XirFFFUTVTFfSjnGvR016td+jXSoqt7aEPXyg2f+CHVEMudq3Qk+aITHFIz3CS94gYRh8R9DBhz/rrne3+DmabGNjton+Kn86vJ0f8Aw/xkRN/BTPVXH8NXlpHm2oC5s6WNuEChQK/VArvUKBc0VA/dAvU/RBHq6ALkfdA2dAFnQXa/sgMggQUObFAFN0AO/lAqgHwgeCgB3YlBOyC7IJf2QU1CCW3QVhsgEWKEFkD7IBBdwUB2rVBaIJT6oAFQ70QPCAGq6AO6BYIAP3QQHvRBalBCz1QXeiAB6ooYXJBIFOEiNUndD5pa21DL1drrU2q5EwzJGb5zjMTh4/50j5hgkn/m4IF/QWAw04LB2cNVxpopie/TWfjMv56zHE/TMZexFO+Kqqpju10j4RD0tAbr1vGNsEAXflB5mSZBmuqs8y7SmRAfwjnWKl4HDEgkS4ozWYW/kwQ+qM9oCvyv4m3g7NeJvezRE1T26cu+Z0iO9+2Hw1zGXqMNZ9quYiOzXn4RrM9kPpTprT+V6T0/lumMklGVl+U4SVgsNCWf5cuEQgk7ks5O5JK/n/F4m5jb9eJu+1XMzPfO9/QmEw1GDw9GGtezTERHhGj2Ic0XnehaoDFqkIHshwSroLw5QGY7oFq0QLd0EublAIDvZApugo9ighZ3CCizuEBgS4uhqMTUlABG+yBRygVQKvdA2qEFNCCUEJ2ugUatUFYBBCedkC7sgdwgUYlkBmQKPfZANt0AoF7lAHG6BygwZ8XnT+PVHTqHWOXyIpmZaOjjxhhgBMUzARgDFQAf5ohgm1/3ojdbnsTmcYTHfRLk+pd0juqj2Z/OnxaXtvln0zAfSqI9a1v/AGZ9qPD2v2WlZO4IIuCNwutcXIQOglXFrIFONkFbfdAQLVBQD9SkCWN0APwgPyECz+UFfhggjDZygPWyBeJ0FrZ0OCWQHOyAxFygg4VFergKB7oFb/vQKsQEBuDVAY/zkBmuqFdgoPFzd/4JxrX/AGeYPrCV+lnddpnth83Y1t1adUvqjBLhlQiVA3pghhhHgQgL+b6pmZmX9JUREUxEKbMo+nr9QaiyPSuUzs91JnGDyzLcNC83FYudDKlw8BzcnYByTQBfvhsJextyLOHomqqeERGsvwxOKsYK3N2/VFNMcZmdIapdW/i9zjPPn6f6RwTcrwBeXMz3EyfTipwdj+zSYh/EwkD/AHSYPWxpDCQ66Vk2xNrDRF/M/Wq9yPZj70xx7o3dczG5zLOttrmJ1s5Z6tPOueM/dieHfO/qiJ3tdSY45k2fOmzJs6fMinz502ZFMmTpsReKOOOIkxREuSSSSt95REcI3REboiOUREcI7GgzrMzVVO+d8zPGZ65nnMigf2CDtXSnXf8A5NOouRazmzDBgcLPOFzQB2iwM9oJxIFT6PwTW5lBY3Ocu/SuAu4SPamNafvU74899PiyeTZh+isfaxU+zE6Vfdq3T5bp8H0dEUMQBhiEUJAIILgjYj2XBJjSdJd+iYmNYAe6KIDsgXQVhavdBC9wEBuEA8bIBDBigboA4QAwQC4ILoDcIHA7oHuacIFTUoABLkFDUs7oAH04QLugNRAvcoDcFAYCroKT5QRAN6IDUp9UBgP7kAVPdAY2BdAFSge5CBTwgXRS9X2RFsggPCA/ZAcG6B5FUAjlAPhBjzr9rk9P+k2fZ3h5/wAvMsTJ/gzLGi9MRxeI/i4Iof8AQEUUw9oCs9s1l36TzO1Zqj1YnpVfdp3z58O+WA2lzH9GZZdvUzpVMaU/eq3R5ce6Hz5lSZeGky8NJcS5UAggep9IDD7LuM1TVM1TxlwyIiIimOTlR18hUeFRWexUXVsf8GfT3+Es+zTqlmEmGLD5UI8oylx+bExgHEzRuPTAYZYI/nzRstB26zP0NijLqJ31aVVd0ezHjOtXhDf9hcs9NerzG5G6nWmnvn2p8I0p822wpZcwdRVq/vRRAQN/CAb0QGF0AeUBt0AUtVArdA37II5NQboL7IAJ+qATVAALuEA3ZABPCB+66A9eyQF7lAejFALmpQPsgboI71a6CkPVA5QRn3QU0vugO+zIBrTdAcD2QKHeu6AXe1UB/TRvKB4KDjNkyZ0qOTiJUE2VMhMEcEY9UMcJDGEg0IILK01TTV0qZ0l81URXTNNUaxL5y9Vunk7pX1CzXRTR/sMmIYzKZkVfm4CaT8qpqTARHKJ5lvuu9ZNmcZzgaMZ9ad1XZXHHz3VR3uBZzlk5Rjq8J9XjT20zw8t9M9zqoCyTGIGJoXQQcBUW7bKCVaqCgOW2QDchkEvtZAdt0AMLIA7FkFZDel0A18oLXiiCXKA1aFAY2QB4QGQU9gg47+lVHKjVpRRUHZAD7DwgAUQNkADbhB+eLk/tWFnYUljOlxyweHBD/dfVFXQqirql81U9Kmaetv7ozrp07n9MdP6t1NrjJssmYrLZRxUvF42CXOhxMuAQT5Ylk+uKITIYgwhL0IuuJ5hs9jozG7hcPaqq0qnTSNY0mdaZ14cO3c7jl+0WBqy61icRdpp1pjXWYidY3VRpx3TrHDuYx1/8aeClevL+lum48wmBwM1ziCPD4YWaKXhwRNmA1/OZfutiy3YOudK8xudGPdp0mfGr2Y8Ol4NczPb2iNaMut9Kfeq3R4R7U+PRa2au1jqzX+aQ5zrfUOLzjFynMkTmhk4cFgRJkwgQS7B2DlqkrfsFgsNl1r0OEoiiOenGe+Z3z4zp1Q5/jcdicxuelxdya55a8I7o4R+c85eoNwvU8YPLoFOENDygGGGOEwRQiKCIGEg1BBuD7JHxJjXi3P8AhK6qw6r0cNAZxixFnelZMEqSY4vxYrLfyyZg5MukqPxBET+Ncm2zyf6HivptqP1d2d+nKvjMePtR4xydc2LzmMZhfoV6f1lqI8aOU+Hsz4TzZ5cndaW3ZBS6Agm6CtdBN+6Cl/qgCm7oIUAmvdBWuCEBggOgn1cIKgboIHQX2QNjYIJU0ZA9nQEFfcVKARygfRAu1L7oHce6AfCCPuUF9kBnNUB3btRArYG6gVFlQ3rVAb2QKM7oADNugWsgOzOgEuzhAoP0QK7KCEtQv43V4jSz4uOo8vV2vZOiMrxIjyzSPqhxJgieCbmcyECO1D8qWRByIpk0bLrmxeVTgsFOLuR693h2URw/FO/uiHIdtc0jG42MJbn1LXH788fwxu7JmYYMf+3Zbi0sZ6oG71QfvgcvzTOcfg8kyTDDEZnmeJl4LBSrCOfMi9MDnaEO5O0IiOy+bl23Yt1Xr06UUxMz3Rx/lHa+7dq5frps2o1qqmIjvndH/L6QaA0XlfTvRmT6JyiIx4bKcNDJM0hjPmkmKbOi/wA6OYYoz/pLgWZ4+5meLuYu7xqnXTqjlHdEaRD+gMswFvK8JbwlrhTGnfPOfGdZdgDgsvC95vVAQP3oD7nZApygUZAoLIFHQGHKAxQG3dAFDT3QKoBJJZ/CBepKBvUoBawuUCj0QHr3QHNHQAAgVG6AGQEDu6Axe7IFN0Dd3ZAs5QGAr+9A3dArd6IBqKILsdkEN34QDRBTSjII4sUGDfi06YRay0ENZZVhjMznSUMzFCGXD+LEYAscRK7mEQibDu8sgfmK3LYzNvoOM+iXZ9S7pHdV9WflPZOs8GmbZ5R9Nwf0q1H6y1rPfTPtR847Y05tKoIoY4YYpUYigjAihihLgg1BC65pMbpcg113wEKCOUF5+yBS7UQGqzuEAilEE8KiGlkFDXBCgUBABQUBj2QT3oiFf3IpTcoHcIL/AGqg4sdroKeOOUD2KChql0AfqgldkDugV3VAGlFEK/dVRh4QN6UKDjDKkwzDNhkyxMiDGMQj1H3uvrWZjTXc+ejHHTe5gnd18PoYoFygVZkDsa0QK1qhMjEbfdB7XSmqs90PqbLtYaaxEMrMsrmGOXDM/wBznQENMkzBvBHC8J3FIgxhBXmxmDs5hh68LiI1pq84nlMdsTv+HCXqwWMvZfiaMVh59amfCY5xPZPw4xvh9Cum/UXT/VDSGE1dp2YRKnPKxOGjiBm4PEwgfMkTRtFCTe0QMMQcRArhua5XfyjFVYa/G+OE8qo5THZPwndO+Hd8qzOxm2GpxNmePGOcTzie2Py0mN0u03o91jWRRq3QLxUQDdqoFqOgOyAzEII/AUFFyOFQN3dAflA2ZAYWFUCroAQHALfZAvygeCgXtZBLoKECv0O6ALvVAqKIB3QGZA8hA3d1BXaiom7IA5IQPZAuB90CnvsgboFggVpugO+yBugG90EN3QDugxj8QHV+V0k0dFOwEUuZqTOPXhclkRVAmAD14iMf73KEQiPMRghp6nWxbM5JVnOL0uf6VG+uezlEdtXDsjWeTWtps8jJcJM0b7te6mO3nPdTx7Z0jm0GhEwOZs+bPmRRGOZOmxGKZNjiJMUcRNTFFESSdySu2buUaR1RwiOUR2RDiW+d8zr2zz65WoUBA+hVGxvwcdNDm2f43qrmeHP7Lk5mZdk/qB/Hi44WxE8WpBBF8oGoeZN3hWh7c5r6CxTltqfWr0qr7KYn1Y8Z9ae6nrb7sNlXpr9WZXI9WjWmn70+1PhHq+NXU26ZgwXLXVUBo7oLQjugFAv4QPKB5QPD1QHq7miAdigrmzoIfHdA4JeiAz1JQg7oFdvogXDoL5Qcb7EILbZBQggBd6oDtcIHh0BxQn2QKAWQXwEOCF3ZAIqgefsgWsgdmQGLt9kAtv8ARAQUV2+yA/mqCP8AW6AAOUBn5QDawL7Gx5SNY4JMa7pfPbrr0yi6VdR8bkeEw0UvI8yEWZZKW/DDh4ov4zDg2eTMJhap9EUsm67ls9m0ZxgKb1U63KfVr7+VX7Ub++JcK2hyn9D4+q1TH6ur1qO7nH7M7tOrR0G1vKzbBjIHiiBenCAaszoDEhAoEENbIL4QTZnqgoGwCBsxCCVQVvsggHn2QKFqsgpdA5oWQSllQ/KoAsgt/dBL3YILRAZrIIgrDlAPAqglGAZBeyCsK9kHEWYlygu6BSyCBgg5CyCCjMEHb+lvVLU3SLU41Fp7/GsNiRBKzTK5kz0ysfKhdg/8ibC5MEzZyC8JIWLzfJ8PnWH9Bf3THs1c6Z+cTzjxjfDL5PnOIyXE+nsb4n2qeVUfKY5T4TulvvoLX+l+pWm8PqrSWYDE4OaflzZcY9M7CzgAYpM6C8EyFw43BBBIIJ4rmWWYnKr84fE06VfCY5TE84n/AN6TrDtmWZnh81w8YjDVaxPnE9UxymOrx3xvdhuse94LqhXYKGpSwDBUSrsgM9XQLhQWpLqiM6QKBSodAogWqgvlBPKBUfVA90A1qCgX/rQGFwoFQqBACAwLF2QN70QCa2QBV2QLoDMW5QLBAQAyAa1QGYkKBV0Aht1QAApuUAXYDsmoByblkC/lAfZggM1QPqg6r1J6k6b6XaZn6n1NiCJY/isLhZbGfjZ5H4ZMqHeI7m0IBiJABKyWVZViM3xEYfDxv4zPKmOcz2fGeEb5hjc1zTD5Rh5xGInujnM8oj++2dzQDXeuNQ9SNU4zWGp50JxeKaXJkQREysFhoSTBh5f+aHJJoYojFEbsO35dl9jK8NThcPG6OM86p51T38uqNzhuY5hfzTE1YrETvnhHKmOUR8+ud70Pdex4Q1KCu/hB52ntPZxq7UOWaT09BDFmecYmHCYb1AmGWS5imxN/IlwCKZF2gX5YnE2sHYrxN/2KI1nt6o75nSI7374bDXcbfow1n2q50j5z3RGsz3Po/orSWT6E0plWj8glmHL8pw0OHlGL80w1McyLmOOMxRxHcxFcCx+Nu5jia8Ve9qudf+O6I3R2O/4DBWsuwtGFs+zTGn/PfM757XuS1t15HsLlAPcIBrdQVgd1Qh3QTdAoC1UCmwIZAsgGhQAgbgbIBDl6hAqUAsS/CAECt/UgBr/ZAYlBR4QC9hVBD5ZA2cXQWvKAgD2QCa1ugClUEs3dA2QUPt+qAxd2QPZBN63QDQoHZ0AE1qmgOXrZBahn+iCUuyDGHxEdK4+qXT+dhsrkwx6gyaM5hk8TiEzJsMJEzDk7QzYHhuAIvREfyrYtmM4jKMbFVyf1dfq1d3Kf2Z0nu1jm1vajJ/0vgZi3H6yj1qe/nH7Ubu/SeTQWCdBPlwzYBEIYg7RBoodiCNiC4I7Ltk0zE6S4jE6xrDl2qoHdBGDud0Favd0FDihugjoAYhnugB9wgns/KC7XQRn3QXuQgjd0BzV0F3DIJ3qgdkFcw8IFrBkDiiCOWQHCCizII4JcoBrZBRWtkEYcAILcuT5QGq4p2QKVLoDbsEgHfZAc+yAO4QK0rfugCjILVrXQe70XrrVfTnP4NS6MzU4DG/hhxEuKH14fGSx/k58tx64bsXEULn0xBePH5fhs0sfR8XT0qeXKaZ66Z5T8J5w9uAzDE5Ze9PhKtJ584mOqqOcfGOUw3M6P/Etovqd8nJMxig07qaP8P8G4qcPl4qLnCziwmu4/AWmCrwkBzyjO9k8XlOt63+ss+9Eb4+9HLv8AZnr5OtZHtZhM1iLNz9Xe92eE/dnn3cezmy+Hdqg7gharwbVxDdFN1Aq9VQ+vdOAHdw5UAE7fdUGr4QADsgpfkIJYoFaEKAqCHAuQSyAKIBpZArugbsKIG+zoBZAFaEuAgb0QAHCA70QHINd0C10AIAcbeUDZADUqgBwgGqA7IFizhArQugGn6oDvUsAoMb9YOu+jukOE+RmMZzPP58ox4PJcNMAnR8RzYqiRKf8AlxByx9MMRDLYcj2cxed19Kj1bcca54d0e9PZHjMQ1/PNo8JktHRrnpXJ4Uxx7592O2fCJnc0e1zrzVXUnUMeqNX46HEYswxS8PIlAw4fBSiX+VIgJPpFA8ReKIh4jYDsGX5dhsrsRh8LTpHOZ41T1zP5Rwjk43mOZYnNb/0jFVazyiOFMdUR8+M83od6L2vCM5BKBarN4V4ijtuoNrPg46W/suXz+r2cyCJ2ZwR4LJII4ay8GIv43EDgzY4QAWH4IAQ4jXNduc36VcZXandTvr+9yp/Zjj2z2Om7DZN0KKszvRvq3UdlPOf2p4dkdUtmm4queOim3Cgbkbqi9vuggez0QWgKCOagXUA+VQ/VAcO6BV0IUsgVQRySgbnhBf3IF7oJTYhBf7kE7OgHlAYXe6BvUoI9WQU+UF7oIHPhAQGq+6CILQE3KCPsgoI3QPAQDtygN9EAdwgDgIHdAB4CAwA/VAub0QHe1+UGlfxY9Kho3WUOvsnw3oyTVU+IYqGAfhw2aMYovEM6EGMX/HDMf8wC63sbnH0/CfQ7s/rLUbu2j+dM7u6Y6nIds8n+gYv6baj1Ls7+yv8A8uPfE9bBkIPL1W5NLKEoD80QBWqCUHZA/cgeyAP1QUUJIQPsgONz90E7e6C0qglGYoL2QCG3QQ3CHBX5/RAoLJxE3QV3psiFropfayCDsgvlA+iCFxQoDOfKA5ogezlAejlkFo4a6A9Li6Bsgmzt9lQHlQUWZABq7oqTZUqfLMqfKhmQRXhiAI8+e6RVNM6xJNMVbpjVlfp38THVLp8JWAxOMg1Tk0r8IwWbTo/2iXBxKxYBmDsJgmACgYLW802Uy7M9a4p9FXPOmN099PDy07dWz5XtZmOW6UVVelojlVx8KuP4ul1Ro2K0b8WfSDUvypGdZlidKY2MiH5OdS/RJJ3MOJgMUn0vb1RQnstDx2xeaYSZqs0xdp+xvn8M+t5RPe3zAbaZXjNKb1U2qvt7o/Fvp85juZdyzNMtzrBwZjkuPwuYYWZ+WfhJ0M+XF4igJBWr3bF2xV0LtM01dUxpPlLaLOItYiiLlqqKqZ5xOsecPJJAH4i3ksvyfsVKaClt0D6oB5EKBetkD2QHoyACeboDn37IDvR6qAB+K1VRd2dBHqgptwgnugrvsgjMEFfsmgljZAP9mQGrwgpc03QQBqsgMaFAfYpoK7BkCrCiCeygVsyoEkXQR0OCs9IIYovAdNCZh03XPWLpp049UrV2r8DhMWB+HASov2jGRlnHpkS/VHXkgDkrLZdkWYZpOuFtTNPXwp/FOkMTmOe5flcT9JuxE9XGr8May1r6kfGJqrUMqblfTXLI9NYGN4TmWNEE3MJkP/By6y5G9YjHFWghK6BlWw+GwulzH1ekq92NYp8Z41eHRjr1hzzNtuMTiom3gKfR0+9O+rwjhT8Z7pYAmRzZ+InY3FT5+JxWJmGbiMTiJsU2dOjN445kRMUUXclbvTEU0xRTEREboiN0R2REboaPVNVdc11zrM75md8zPbM75cXuyItEEBsxKAGdB2/pN01xnVjXeB0bK+bLwDftmb4mWWMjAwEetjtHMP8AFwXYxGJiICsZnOa05LgqsXPtcKY66p4eERvnwjmyuS5TXnONpwsezxqnqpjj4zwjv15Polg8Fg8uwmHy7L8LKwuEwkmCRIkSoPTBKlQAQwQQgUAAAAA4XCLlyu7XNyudZmdZnrmebvVq1RZoi3bjSIjSIjlEP29l8PsuUFhvRBAB4QPsgWKAPCB3CA34nugXsgeEAUIQAzgl0B2QNroAqgIBHlA90Qo6KM9d0B62QUHlBC93QKXugtrcIG9mQQ08IG6AQ34kAcWCA/2QUnhCEpayBxVkDhBXBQTwgb0CAxDEsgbIALU/cgOd0Ho9b6NyXqBpXM9H6glRR4DNZHyZkUtvXKiBBgmwE2jgjEMcJ5hC9uX4+7lmKoxVifWpnXsnrieyY3T2PFmOAs5lhq8LfjWmqP8A1MdsTvjtfOjVWl880PqXMtHaklQw5llM75U2OCkE+Ah5c+D/ADJkLRDguDWErvOExdnMMPRi8PPqVRr3dcT2xO748JcDxmCvZdiK8Jfj1qZ8+qY7Jjf8OT1g8L93mTdyyAQb0QLfRBLWDIHhA3oqg5NNkU7P9FAYWh2QGDiiAzB0AnhAdroDAAIHKAD4QK7fZXcDDZEBayKMeUFHCgioKAPCC3ugXsgVegqgVvyge/s6oGhqVA9kAE27oHsGQQ1t4ZBS/FEAV7oG6Ch3flABuHRdTLzHlGLhx2Sz8RleKhLifl8+PCzQf9KUYSlzS/T0LsRVHVVEVR8dVtzNmrp2pmmeuJmmfho7rlPXDrRkcAl5b1W1EYQbYyZJxv3xEuM/dYm9s/lOI33MNT4a0/wzDL2doM2w/wDp4irx0q/iiXvJPxRdepI/HrjBYin+WyPDH/4RCvFVslktX/6Zjurq+er2U7XZ1TxvRP7FP/D94fir66ABtSZKfORS/wB0a+P8nZP/APHV+Of5P0jbHOPfp/B/y/SH4r+uUP8A9uZDF/pZHCG+kxSdjsn9yr8f/iv+c839+n8P/Ll/52HXA/8A2xp8/wD7Eh/71T/JuT+5V+P/AMV/znnEfWp/D/5A+LLreAP/AErp73yMf96n+Tco92v8f/ikbaZxH1qfw/8Ak5D4tOuH/tXTv/uQf96pOxuUe7X+P/xWNs83j61H4P8AyUfFr1vP/wBo6b/9x2/65J2Nyj3a/wAf/isbaZv71H4P/JxHxa9cAzZjpr/3J/8A3k/yblHu1/j/APEjbTN/eo/B/wCTlD8W3XH/ANo6a/8Acn/95J2MyfnTX+OP6SNtM396j8E/1H/nbdcL/wAI6Z/9xn/vk/yZlHDo1/jj+kjbXN+uj8M/1L/523W8Xx+meP8A5jP/AHyf5Myifq1/jj+k/wA65vHOj8E/1L/52/W+wxmmD/8AsSL/AL9P8mZR1V/jj+lf865t10fhn+pIvi463PTG6XHjI4vrWep/kzKPdr/HH9B/nXN+uj8M/wBSD4uOt5IfHaZ/9yRf98n+TMon6tf4/wDxT/OubRzo/DP9TkPi563bYzS9v/YkX/fp/krKOqv8cf0kba5v10fhn+oh+LfrcanGaYL/AP5HF/36TsXk/VX+OP6VjbbN+uj8M/1L/wCd11tYH9p0t/7kj/79T/JeUdVf44/pI22zb7H4Z/qIfi662kA/tWlvfJIx/wD71Z2Lyjqr/HH9JG22bfY/DP8AU5D4vetb/wC6aT7f+hZn/iFP8lZR1V/jj+l9f52zb7H4Z/rD8XvWwf5TSZLf+xJn/iE/yXlHVX+OP6E/ztm32Pwz/Uo+L7rWCz6SPnJZv/iE/wAk5RPv/ij+hY23zbqo/DP9aj4wetQ/kaQPnJpv/iFP8k5T/wDZ+KP6CNuM26qPwz/W5D4w+tFjI0dT/wDJp/8A4lfP+SMp67n46f6H1/nnNfdt/hq/rT/zwetDkCVo7t/6Fnf+JV/yRlPXc/FH9Cf55zbqt/hq/rcx8YvWf/7rooj/APRsR/4pSdh8p67n4qf6FjbrNfdt/hq/rUfGN1noDhNGHzlGI/8AEp/kfKeu5+Kn+g/z1m3u2/w1f1qPjH6zj/6jok+coxP/AIpP8j5T71z8VP8AQf56zX3bf4av6w/GP1nJpgtE+2UYn/xSn+Rsp965+Kn+hf8APOa+7b/DV/Wv/njdZv8A2dog/wD7JxP/AIlP8j5T71z8VP8AQf56zWPq2/w1f1uQ+MnrKSHyvRHn+CcV/wCKT/IuU+9c/FT/AEH+es2923+Gr+t63MPix645gCcPnGnss2BwWSAkdwZ02ZVfva2Mye1xprq76/6aYfhd20zi97NVNPdT/OZdH1D1U6par9Y1F1I1Hi5c0GGORKxpwkiMNUGVhxLhI8grMYbKMvwek2LFETHOY6U+dWssNic5zHGRPp79c68onox5U6Op4eRIw0Ppw2Hgleo19ELGI8k3J7lZKqqqv2p1YyKaafZhzIb2UVb1soFkBqoFzZUSOMwQ+oS5kyIkQwwQQ+qOOIlhDCLmIkgAbkhI38Z0/v5J3f32N9/h36Sf+SjQ8MrNJUB1HncUONzmZCRF6IwP4vDQxC8MqEmHd4jHEPzLiu0+dfpjF/qp/VUbqfnV31ce7SOTtuzGSRk+D0uR+tr31fKnup4d+s82Ua3WttmN6BA/MgWQHal04h4QCXQPKCWqUFru1UChNgCgtrBBHerIFboFHAQN0F90EsaB+yAzVQVnv9EEcbugHgoLR0EcMyCXaqC3N04g4uUCvKBWyA3kIFiQgUdygjtugO7sgqCboKwNy3hAYEsaIDEWKB5QDduUB60QDQoI6CgsG5QYL+Kjo5N17pqDWumsFFO1JpyRH/EyoHmZhgHMUyQAKxRwF5ksc+uED8a3LY/PIy/EThMROlq5PH3auU908KuzSeTStsMinMbH0vDx+tt/vU8ZjvjjT26xzaVy5sudLgnSoxMgmQiKGIWINiuuTE0z0Z4uRRMVRrHBy2UEcugXPKGiCmyBvQoDIDjZBb7VQHqyA7eEEp3QLHsgvZmQRnvugEckogCAboqkcBBOyAgD3QEFA7oJRwwugvfhBH4QUHZA9Q/pQPOyCO6Ckj9yALf0oALoFwyCClERRwx90VLmiChvZAQH5QBXsnALIDttRAoxDMgFv7kD7oDcfRAAQXh0Eqgd0D3QLXQNwUCtOUB6IFQgOGsUABkDgs4QCSLBAFOyA42CA9SFQUCm1EFFN/ugCtkECCuyKn1coi13KKP3dQBXdVEoC6BZAvQEIFHuzocStuECoLCr7INhvhI6RHUmeDqtqDCerKsnnRSsllzIPw4rGwvDHia0MEqsMJ3mGIuDLC0bbTO/oln9G2J9euPX7KeMU99XGeqNI5t72KyT6Vd/SV6PUp9jWONXOr9nhHbrP1W4AuGXK3V1QHqglhVBd3FEDdkCr9kDYkoDggboD24QChA5dBO6Citn7oG7bIDCpCB3dA90AX38IAJQH5qEB9yECnLIKglqBAFCgb0QC1gaIFfZAozMgrMXCCMEAl0A0qgF9wgu1UAXogWqECqCVdAPYBAHJQKbIDvQhAH0QOwd/CBUEMWKHFpT8UfRf/ADUZ13pvB+jTeoMQRipUuH8GX4+MuafyZU4uYdoZjw0EUAXXdkc9jMsP8AQ78/rbcbvtUx86efOad/KXINr8inLcR9NsU/qq53/Zqn8oq+FWsc4YOqKWW4NMXwgldrIIBVggeEADb9URaE8IJ93RRi1Ke6Ct390Q33HlFSr0KqG4UUrd0C5oUBhugoLOgmz28ILY3QRg9kBq0QPqqK/KgMw7IDVQKbEIFQ7UQKWdALgoIBV7IKS90EtbdAFmCIrdqIoOxQN6IDPflBKbIK6CXFUBmogu7t3QGp+5AQKIAp+qCIDXZkF4bdBA3IQWtwgjB/KCm6CU88lAsUFLII31QUlAdrIAqLoDVqgbuEAULoAHkhAAY1QPdk4Bau6KWNGREq9ygENVBfYIAqgg42QXd3QKIIgoY0dAY2Qdu6TdL826ua0kaVwEc7DYCTCMTm+Plj/wBTwjt+EmnzZhBhgFf5UTEQFYzOc3t5JhJxNe+rhTT11dvZHGfCObLZLlF3OsXGHo1injVV1R/OeEeM8IfQzJcmyrTuU4LIciwMvA5fl8iDDYXDyvyy5cIaGEc+TUlyVwvEYi5irtV69OtVU6zM85l3bD4e1hbVNizGlNMaRHVEPNce6/F+wgD3QHsgC9roG6BTlDVRSoQSyBRAFboKglaFA7lA/egX3dAtRA8IAu1EDdxZ0FoCgg5dAD8oLUMgbtZBKPRAtQkoFAEFHKCb0Kgt1Q7HdANbn6IJ4QHJdzRAJ+6AdkD3QVyaUQTetUOS+yCXu6Cs5b6KCb1VChNCgXN0DehQevz/ACDJ9U5LjtOahy+XjsszKRFhsVh5v5ZkuIVDioIuIgQQQCC4C/fDYm7g71OIsVaVUzrE9rz4rDWsZZqsXqdaao0mP7+HU+e3VXphnPSTWM7SuaRzcRhJsMWIynHxhxjcI7AkgN82BxDMh5aIUjC7nlGbWc5wsYm3uqjdVT7tX9M8aZ8OMS4VnOUXclxU4e5vpnfTV70fzjhVHdPCXURTa6ybFcDdnQQVtdA8KhbdBQO91BH/AKEBiT2KCO1EFbYmqBRxVByB2QQUZ3QTZ0DsgWqQ6JoF6VCKGndUAAP1UD96BbdAvynAUveiAK7IAoXQKitkByN0Eqd0AIFXoERfCKUZAqaH6oJ2CC05QRABqXqgdnZ0BmQksWFEDs/2QVu6CIDML1QUNXdBL2Q0XdiEEHnwgNVBRVqoJUm6JwNgin1ZADd0AhqugMKF3QPKC2qgA9wGTQTeqADVjcIHZAQXsyKgpR1UVq8hQT2QX7oF+aIDAbuEEpzRBd3ZAFrtsgjF2P2QCGNEHLug/fLcszbO80weRZBlszH5pmU+HDYPCwUimzYtiTSGEAGKKI0hhBJoF8XbtuxbqvXqujRTGsz1R/PlEc53P1tWbuIuU2bNPSrqnSI65/vjPKOL6CdGelGW9IdGydP4aOXisyxEf7Vm2YQwscXiSGJG4lwBoIIdoQ9ySeH5/nVzO8XN6rdRG6mOqP5zxmevs0dxyHJrWTYSLMb6p31T11fyjhEdXbq72w3WFZwYbbIAKAKipQAEC+9kF4CCN9EFIaiCVuyBvdAYcoKT4KCMSWQPugb0CQFigcUdAQUD6IFSdkDfZBDQiiCs26CP2sgd0A3QKjuUAO1AgOgUsUFogUKCeEBn2QKugDdwgpvYVQS4dkBAq9LoFxwoBfdUHdAQA3uUAgWDoHgUQWiDpPV7pXk3VvR87TmZRDDYyTEcRleYQweqPBYoBhG38qAgmGOH+VCTYsRl8kzi7kuKi/b30zuqp96Orv5xPKfJhs8yeznWFmxc3VRvpnqnr7uUxzjt0mPnznmR51pfO8fpjUmAOCzbK5vycXhyXEJZ4YoT/KlxQkRQxbg+y7jh8RaxdmnE4erWiqNYn5T2xwmOUuGYnDXcHeqw2IjSumdJj5x2TxjseGKL9X4n7t0E8X3QBwgrb7IJQOgGhcG/dAZ6fdBW7oJRAvRAYje90FrYlADje6AGezoAPFXQGiCCFgEAgNXdUAPqoKKeQgn96BugB90AfV0FDcoJu/sgp2aKnCBtSjIIOHVFeigjUYFBRVuyAK7sUEI4qUFoggPIQXZBAGo6cQqgb03QAaUQWu6CdiERWBRSvKAASgAl7oAB2QTyUCvPayA7OqFGuoK7oI1GQPAZBahBEDy30QNhVBX+qCUc0QUAIDNzRAoHYIJ71QUO1/KCCu6CgboHZkBrVdAAIF04iOQKcqi0O/2UHCZMgkwRTJsTQwCtH3s1yeAF9UxNU6QkzFMay3T+GHoTM0Dlp11rDB+nVObSPTKw8wVyrCxMflN/v0dDMOzCAWJi5JtZtFGY3PoeFn9VRO+ffq6+6OFPnzjTr2yezv6Nt/TMVH62qN0e7HV3z9by5TrnZmpwtLbqoO4QO7VQEEvZBQ4o6A+wQKWBQXwgntZA8hBTdwbIFHZkE5AQHDIKHHhBx+yCs5QKmpKBXiiB4QPFHQCBRBC6CtvugvdBLG6CksboFDsgFqUKAaXLoBoboAY1ZBEChrugMgU2QUOEBuyCXogHygtXflBGKAgUBugAuDtwgAIBZAQG4JQGogw98RnQuDqvkkGd6dlSJWrsnkxQ4OZERBDjpD+qLCTIjYEuYIjSGMm0MUT7XsvtD+h7vob8/qa538+jPvR845x2xDU9qNnozizF6xEempjd9qPdmfynlPVEy0aigmy5k2RiMPOw8+RMjkzpE+WYJsmbAfTHLjgNYYoSCCDYhdiiYmIqpmJid8THCYnhMTziXGqoqpmaao0mJ0mJ4xMcYnthNy1kQvZBBelFRRWpUAu9AgjILuz0QA1+E4B2uiI7Kqu92UC1EDuEDaqAKbIFmYIDII+7UVC1UB6sUFcil1AblAH2QCAd0EcEsgtNkDuEANtuggdn2SRQwoyCeaIK1UBxsyAKWugDiqCD7oKb7MgIIOyC13o6AHZuEDuge6BRrIFCgCj28IIGBdg/JQOwQEAtZ0BqsVQFAoKD/QnADx90Ak0dAck+lAIogC9Cglqqi2UEug5Al9kEHLFJDsgdwPugXQBapNEEd/6kF+iADQIAKoXdQQxQwgxRRCGGEOSSwAHJVJ3Nl/hV6E/wjMwfV3WuWthoIhP07gZ8DGYf5OOmQnb/AHkH/jP5hHPtsdovQxVlmDq3zurmP4In+LT7vKXRNjtnPS9HM8XTujfRE/xz/t1+91NsRw5PdcydOAX/AHoA77oF/KAgt+yCNuTeyAODTwgM1BZAuGCAEDjugM6BVygWQEA0oxKAL2QOw3QHqyAgr8oIgM1EB2sgUe6CuCLIAQQ8i/CBvdAQN6lAG16IFmYILQIJ3BQDWyAaPf3QU0Lksgnugd0DetEC6AQ6Bu7IHchAflAQPZBacIJVA7FAB5A7oNc/ie6AT9UwT+pug8vM3PpEsHNMvkwfizOTBCwmSwL4iCEM38uEen8whC3zZLaSnCaZfjatLc+zV7szyn7M/Cd/CZaDtds1OLicwwdP6yPaiPrRHOPtR8Y3cdGoMmZLnyoZ8qMRy5geGIbhdSmJpnSeLlcT0t8OdqqKiJAwFSUFHICAS9kEcOzoL4Z0DzugPsmgb2uEEcPdArcAIK1WQAQ1CyCU2sgV8IFkFoPFkEBNkFD78II1xshCgUQQNsgB+UCj0/VBfJQEDYgIiAsbIo5eiC+NkDhrlALk1SBLoDgboJYILe6BTahugAubILS9kAnwggDoLccIDMgg/tVApshC1sAgm1d0CoIHCAAFQ7KBQFjRABJpsgP/AGZBbFBK32QAasQgMgAMaIGyCgUQR3rZAdwXogt6IB8myCN3sgtzVBH9ygtkEHZBQC7c7AIrNHw49BZnU/MINY6swhGjsBOIlSpg/wDnjEQGsA5kQRBo4rRkegOBGtT2o2ijKLc4XDT+vqjf9iJ5/enlHKN879G37LbOTm1yMXiY/U0zuj35jl92Oc853cNW7/At2AsuPTOu92GN25KbBFUUNEE83QBXZBaHlAJ/rZAcoHtfhAtygWoSgGiBZqIBHCAAgfogtjVDVP7FA3QHq32QA4/VAugbVQL3CCXdwgpuGQAz0QLboBAIogfVAetkDjugfVAqgu1PqglxXZAo77IIUFp/SgOgEPQVQVAsUDsggQB5QPsUBud0BggVfhA2Z0AV3QH2QN7oH5TSiJ3tVvid+HqKXHjeqvT3LoojGYsRn2V4eBzGbxYyTAP5W8yAfmrGPxer19J2T2niqKctx1XZRVPwpmer3Z5cOGmnN9rNmNJqzHA07+NdMc/tR2+9HPjx111ghjgjghmy4hFBEHhMJcEHcFdFnWJ0ni5tE6xrDkz2Kgm/DoLvVBCgfVBWQcd90FtSnZBO9EFN6m6CPZAuG2QVgCA+yA4b7IHBH0QBQt9UAAIIwQX7oI3a26BwHQAzsgtbeyAKUNkA8oFUC6CCv5aFBQPZBSSd0HGgLhkFtQcIJ3KpxVg9FBHtt7Kh3+6grBBBQNygrA0KCM9LIK4Nthyhqg/sXQUUdihqXq4ZBGFye6A73TgD1oiH9iijBBTUoJTdBa7fVApQugm7BBRSzIGyCeDsiKe4RSxZ0B3QLBygBnqUChJQGYoJ90HIsGJQcb/RBf0QUO7AXQiGUOg/Q7HdYc5ix2ZwzsLpHLZvy8fioCYI8ZMH/wBVkxCo/wCEjH5RQfiLw65tHtBRkdroW9JvVRuj3Y96flHOd87uOzbN7P153d6dzWLNM754dKfdifzmOEbo3zu3uwGBwOWYPD5bluDk4TB4SVBIw+HkwCCXJlQhoYIYRQQgAAALjN27Xfrm5cnWqZ1mZ4zM83aLVq3Yt027caUxGkRG6IjlD9/7l+b9FryhogHZAd96oFrIKwNUC3ugGwQVgA/NEEpdygU29kDugVfwgO5QKPRAAr4QLIAZ290AU3ogfvQRig5dyWQSjhkEtRkF/VAoQ9QgCligEDh0AAb1QA3ugWKAeSEAeED2QXugm90F3QT3ogt7oFrIIzmhugUaoQKoHsgbO6BYIFBsgAEIBrvRBLnygqA1UCxQUgeyCXQVyCGokEtR/iT+HCbkseM6l9OMuijy6KKLEZzlGHgc4YmseKw8AvBczJYtWKEM4XT9ldqYxEU5fj6vW4UVTz6qap6+qfCeTl21Wy3oJqx+Ap9XjVTHLrqpjq648Y5tboI4JkMEyXHDHBGBFDFCXBBsQt/mJidJc+1ieDkyhCB+EAhAuKBApsgiC/dBPd1QuEC5ZAJox4UFZgHQSpsfugXQW1dkABqepBG+pQGbZBRRAoU4BQ1sgnKA1XeiIv6ooA1X/uQLFBAT3PlBRTcIFSD+5BC+1kF8KhewUEBAoqFLBRD3qilDQsqI39Kg5VdArbm6ACgiChggMge4QGrVDRLFANN6KgK+yiLZFT2QNvKItPCKlXqEFQSisC9r7qAGFkACnDoIBuECm6Cs6CEElBfKA7UH2TQBWoQOzIKL0QZF6I9Ec66y5zFMjjn5fpbLpwgzLM5YaObGGfDYcmhmn+VHUSwf5zBYHP8AP7ORWvevVR6tPV9qrs6o41dzYNn9n72e3fds0z61XX9mnt655d+kN8cgyDJdK5LgtO6cyyRl2WZfJEjC4aRC0EuAfcklySXJJJLkri+JxN7GXqr9+qaq6p1mZ5u14bDWcJZpsWKejTTGkRH9/wDvm9h9V537g+6oHugC9UACjlA7BA7lAIYOgBzZAfZ0AgIBAO7IFbIFkAV8oDEFAYUQOCgVJQG5QGGyAx5ZBbIFBUoJfsgNygWq6AzFnQWt0Ebd0D3dADbmqA1XuhqXq6AH7VQBXaqAw2ogboFRUGiBQV2QK2G6AQXoEDdBUHFBWqaoF6FAQO6AgeUDwgCt7IFqhAZAJKA3ZAcgu7d0Jhql8RPwzTsHMxfULpflZmSZkUU/Ncjw0DmHeLEYWAX3McoXvAH/AAnpezG1cXIpwOY1b+FNc/CKp/KrwndvjmW1Gyc25qxuX07uNVEfGafnT4xv3NY5U2XPlwzZMwRwRw+qGKG0QXQ5pmmdJc6iYmNYc/dQS6CUVCjqA1iUBBDe9FRaBQCGIYoLugA8FADPRwUEtYoKD3QQlrIAQK3dBXZvugga6C3RE8opahVAU/qUAd0CjIHugCm6AAxQKUIKCiiCPVkFdBEQFwigoaC6oFjVQLPVAFUAdyiDd2RT3RCm5ZFW4uglbUKAHeqIWDopXmqAHCC77IIGqWQCwqaBAFbFBQhCCt0C1kDe9UDdialBXO9kBBCUF/tdAc7IFOyCNXwgrPYIMn9DehGddYsx/hDFzJ+XaTwc0wYvHwfhmYuKE/iw+GPNxFMtBUB4vy67tBtFayOjoU+temN1PKn7VXyp593HZNntnL2d1+kr1psxO+edXZT855dst6siyLJdL5Ng9Pady2Rl+W5fKEjDYaRC0EuAcckmpJqSSS5XG8TibuMu1X79U1VVTrMz1/35Oz4bDWsHapsWaYppp3REf3/7edalV+D9zahQRhdAJctsgthdAbyhqC7ugM5QO31QNrICAR5QQXZ0FA7kIDVCAGeqBU0ogu90ENUA8G3lAYv/AFoFSboG5dAHeJkBuUADugdx4QG9RugM1UB6WQLBAKAXNAgVeiCDZx5QV6eUCgQK/wBaBcsgVNCgMW3QKoAcFkBmDCiATWiAzoFkAsSzIFSb+UDwCgbugGqBRBLFnQVA3bhBN/0QV0Cn0QKjdu6DWv4hfhfOeTcVr/pbgYJebTDFOzPJpbQS8ebxTpG0E/eKGkMy9InMXQdmdrfQU04LMZ9SN1NXGaeyeunq50926Oe7TbI/SJqx2Xx6876qeEVdsdVXXyq7J46ltF6pkEcEcEcqOKXMlzIDBHLjhJEUEUJrDECCCDUELpu7dMcJ8tOuJ5xLl+k66THD4dgoAIsgWo1EFv4QHQRkF24QTdBSK+EBiKAe6B3fygg+yBVADiw+iAxBQUPWroHZkEFrIigEmtaIqdmAQL2QHDM/lArsLoDXLIKzd0E25QA4ufCIMwrymqp2qgBrKooBO7KKbsgBJFFqMgngIApY7IKzIJvZA7EUdAeqoB6bqA3uUBiCzsgoFX90EsGQSlQEADbhBXP9CBW7IDDn2QO7VQBbkoAfhAajgoFt0AXsgBuN0FalAgfvQQXogtAgNVA3ZBmPoL8OuadVJ0jU2qYMRl2jYIvVCxMufnBH8iUaGCR/OmhjFaC5jh1baLaa3k8Th8PpVf8AOKO2eurqp5cZ6p23ZzZi5m9UYjE602PjX3dVPXPGeEdcbt5bluX5Rl+GynKsDIwWBwcuGTh8NIliXLky4QwhhhFAAFx+7duX66rt2ZmqqdZmd8zPa7DZtUWKItW40piNIiN0RDye6/N+gXOyBdBEFAHlAvRkEqL1QB2ugtXQBWjoHeiAWckbbIFAgdwLoG7oDcboDbIIEFAq7lAY324QCCPKAboJ3QDUIKRRygX2QD3QKk2QK07oJ2QUMgt2Ysgm90A3t9UB0AmiBeiBwgB6tsgbIJugvKCoONXQciOUAUCCPSqBTugNVnQOwQKhjQIFEBA8ICBRgAgIFmQC5KBdA7ugIMJ9evhuyzqZ83Vekzhsq1dDCPXHH+HD5nDCGEGIYfhjAAEM4BwGhi9UIAG4bObU3Mr0w2J1qs/Gntp7OunhzjSWnbR7K2811xOH0pvfCr73b1VceU6xw0uzbKc2yDNsXp/UGWYjLc0y+P5eKweIhAmSjsaOIoSKwxQkwxAggkLrNq9axNqm/YqiqirhMcJ/5644xPFyO9Yu4a7VYv0zTXTxieX846pjdPJ4ndfo/Na7oh9GKB4QA/1CBbwgjBuUF3QhL/3oHuUFq7lkDwG7IAYEAoIUAugMEB3KAHKC73coA5hKBQ0oghZqoLYMiIAbIq2ZygldwgvmnKAb1oCiHKKgAsgPeyBQF27IKbNwgXogj90AWdBQ9C9EErsLoKPCCboJU7h+GVHJwd1BGq5sFQLMwKgbUQC+xQH7hA+iCgbgoIQxQH/DT+9Bdg6BW5dkAO9jVADXF0AfRAB2sgIBbcoFN/0QcZkyXKlxTJsQgghqSdlYiap0hJnSNZbIdB/hYxWdR4bWfVrLZmGy4NNwWnp8Jhm4k3hmYwXhg4kXi/yjB4DoO0W19GGicLllWtXOuOEdlHXP2uX1et0HZ3Y+rETTi8yp0p4xRPPtq7Ps8/rdU7bwQQSoYZcuCGGCCEQwwwhhDCLAAUAXMJmap1l1GIimNIct+FFNnQAGNECqCC6C2LOEC1HQBcOgbv7KC91RA/KBuzoFw3KC70NEEPKBbeiCtsggDBAAqgtQWQGQ1QsCgF7IBugEoinjjlFTyaoG9AE4hvZApcoCA3CB3CcQetEBArwgDwgb0sgM2yA4fYIAQDQ9kEp39kFP9ggUsgdrhA5pdAev6oHi6Bcv+qCs26CeKoDVogUF0DdnCACeEB0DfZDUrDR0AU4ZAtQboIOPsgtqMgdmKDH3V3oppLrBlUMjOZcWBzfCwGHL84w0AOIwpv6Ygf8AdZRN5cVKkgwxNEM5kmf4nJLkza9aifapnhP8p6pjx1jcwWd5Bhc6t6Xd1cezVHGP5x1xPwne0d6hdN9YdLc9hyDWWXQyop/qOCx0gGLC4+AXilRm0QH5pcX44XFCCIj2LLM0wub2PT4SrXTjE+1T3x1dUxunv3ON5nlWKye96HFU8eExwq7u3rid8d2kut+y97HnsidwxFkC1ggCt0AvyhwLX2QA10By1kD+9AoAUABkEugvhA3ce6CbkBBaNQoJbsgrbAoH6oJUIAJIbcUQW4/D90Eo1kQ3RS9UAeUCvhBWcnxsgUsglXYILv2QABsXQR3QA1ggqCMBZBe7IJbdAruUA1q6AL1KC7sgUBeiCA05QBSqGi+UEQX9EAoIAxQAeaoKOEEue6ChqCo9kAfZBQD9UEQeTlWV5nnma4TIsiyzE5jmePj+XhcHhofXNmxAOWFhCBUxREQwgEkgL4u3reHt1Xr1UU0U8ZnhH/PVEb55Q/WzZu4m5TYs0zVVVwiOM/8AHXM7obhdDPheyzQ8zCaw6gfs2a6mlETsNhofx4PK4tjA4/jZw/30hoT+QBvUeV7QbXXMdFWFwOtNqd0zwqq7+qns58+p1bZ/ZG3l8xisbpVd4xH1ae7rq7eXKI4znw0L7m7rSW7m6ACDsgBrtRANGcIFrIG90DwgWLlBLlBy2ugjiyBSiAHAdBC52QXsgo+iCHugWIAoglboLu2yBR35QH5CAWdAQQXQW9GQG3DIBd3JQW1UE8IAfhkDaoCBYO90AMPzboHZkAjjhANOUByUCpHCB4QL32QCXDoAq6CIOTEh90EvX6IAZ7IADd0AjlA7MgW7IDcoDmre6BXZArsgABAsEBgL7oJ3PsgqA2xQECqASyBcs9EChQeq1TpPTmtskxOm9WZNh80y3FAfMkTgWEQtHDEGigjFxHCREDUFerBY7EZfepxGGqmmqOcf3vjrid0vJjcDh8wszYxNMVUzyn+909sb2l/Wj4Z9U9MxiM/0wcVqHS0sGZHNEHrxuXwC/wA+CEfxssCvzYA4APrhAHqPWci2qw2baWcRpbu/u1fdmeE/Znjynk5LnuyeJymar2H1uWvOqnvjnEdcb45xzYclxQTIYY5UcMcMQeGKEggg7gi4W1TGk6Txal2w5dkEPO6AL0QB5ogopfwglTcoIIu6Af1QhboDHhA7oFdrIFwzIAQSjOgXP5UFo7DdBKVQEDsUByBSyA29UFGwQPCB2CHYOPdApzZBGDlBb0dAArVAHdBDCL/dBau/0QD9UEZkBBRvRAqKIIBuHQV9igdkEuGZkFc8IJV2coFeEFpuEDdBGLoKKXKCN3qgtnKA5AQUHhAqa/dBQ5oBVRXa+mXSrWnVrNosu0pgoYcHh5nox2a4mEjCYPmEkVmTGIaVBWo9RgH4ljs2zjCZLa9JiZ9aeFMe1V/KO2fDWWUynJsXnV30eGjSmONU+zH857I8dI3t3elHRfRvSPLIpGQyIsVmmKliHH5xigDicU1fS4pLlg2lwtCGBLl4jx/Oc+xWdXNb06UR7NMcI/nPXM7+6NzsOS5Dhclt9GzGtc8ap4z/ACjqiN3jvd9FFhGcAEBnKBU3KCAbi6CilUEuXQOzoLaiBszoA+roKGuEEcIFALIAZqoAF3KBXeJADIBrTdArzRAYbfVALk1NkC9/qgnug5e6Cb27IQGiA1fsgWKBV/sgOXoUAjugM+6BsXQHQKPQN3QN0C6AgtN2QRtnPlBbf0IIzVQKUQN7oFN0FCCX2QSwe6C+6A4BqUFLP+iCVL2HsgHhroFuUAPT7oFDQVQOwCAXCA7FBW2QQWQH42QCgAWqEADZAoghYiyC3QLFwW4IKDXzrJ8JuS6sm4nU/TWPCZDnkyIzZ+BiBhy/HR7kiH/cJh/nwAwkv6oST6lvORbZXsHFOGx+tdvlP1qf6o7J39U8mi57sbZxk1YjAaUXJ4x9Wry9me2N3XG/VqTnuQ59pXOZ+m9U5NispzXDj1TMJiYQIjC7euCIPDMlli0cJMJ5XTsPiLOMtRiMPXFVE84/KecT2TpLl2Jw1/B3Zw+IommuOU/nHKY7Y3PBIIDk1K/Z+AGQO6B5QGogiC+6CMyB3JQcgK3ZA90HFm3QVm8WQS9SgbWQX6FBDuEAAUY+EC9B9UFsGIQK03UBxyqAtv7oJW7oAFkD96C/qgGtEEoBdEWroobs1kAXugM6CADugvs6CfvQWwoUEd0AIJ2QUGrOki07WUOA/O11RBdBSOSgl+EFq/KCC1UFDIAZmQPAQUAIJFMglARRxfmiEMIAJijiNoYQKxRHYCpViJnh/f8AJJ3cWwXR/wCEvPdT/J1B1TgxOR5RF6ZkrJpcXy8fioWdp0Q/9WgNPwj+NNXMs30jPNs7OD1sZdpXX7/GmO73p7Z9X7ze8j2LvYvS/mOtFHHocKp75+rHZHrcdei24yXJMn05lOFyHT+WYXLstwUAl4fC4aWIJcuG9IR3qTckklcuxGIu4q5VevVTVVO+ZmdZl1LD4e1hbcWbNMU0xwiODzLgL8X7L2Q4IBV+UFYO4KABwgOxQ4j7IBdkEQXcglA7lA7oKwdBKksgDh7oI1G4QUb0QPZBN3QWqAQkBY2KBu6CkVYIJc3QEAitkC9UClzRBW3dBDc9ygUegQXb+pBHBvVAUF4V4iVeiB4QC7oKboJSm6AC3dA3dAZA3P2QL3QK0ogrF0OKVd0B/dBakMAgiCm7coI1bUQUvblBO5KA1aIJS7oLugd9kBArugVQGal0AVayBR6fRA8oJ2CCuSgcoHsgFjRB1nX3TbRnUzJv4E1jk8vGS5fqiw0+AmXiMJGf5cmaPxQGgdixZiCKLI5bm2Lym76XC16dccYnsmOE/nHGNJY3MsqwmbWvRYqjXqnhMdsTy+fPWNzTvqx8Mmu+nBnZtkUM/VOnIPVGcThpP+O4SD/h5EI/GALzJQIoSYYAuqZNtZg81iLV7S1d6pn1Z+7VPDXqq7omXKc52SxuVzNyzrctdcR60R2xHHvp8YhiGVNlz5cM2RNgmS4g8MUEQiB8ELaZjozpVG9qkTrGsLVRSvhAqgM3ugUugd2QR9kFLHsEC+yA6AHQNwUENQaoDfRBdr0QTsxQWgsgVbkoJUoB7IDixduUAdkBALFBS7nlAp5QRqsEAWfZBdkBz5QA+wQEDdAYPVAaqA4CCXAQL/mQ4LuxQQ8lBaoF0EerM3ZAB3coDMaoBbauyCihqUBkAAk2Qdm6edMtb9VcxiwGicnGIlSI/RisyxJMvA4Q0cTJrfijDj+Lg9UfIAqMfmWbYPJ7fpMZXpM8KY31T3RyjtnSGRyzKMZnFz0eEp1iONU+zHfPOeyNZbl9Ifhy0R0sil5vGDn2pQC+b4uUB8hwxhw0qokQ3q5jLl4iGA5Rne1OLzfW1HqWvdieP3p+t+UcodayTZbCZPpcn17vvTy+7H1fjPXMsrCputZ4tmGZFQ+UFvUUQPCBR0DY0coDhAoL/ogIHdBbG6CV4QAge9eECgogCiA7AhA7DdBdqoJ4FEDygMCgeyA/aiB3dA3ogrG5CCV2QUlkEeqA6Cj6oDi9ggltkA1tRAPlAaqB3CB3NUBAI3dBXsGQQVdAPP1QL7s6BU+UDu6BsgptRBCzAIF7IKQH7oFt7oIWdv0QCR9UDwgbFAA7IBApuge9EB/ogCgugWKCNTugrfZA2QH7IFqugHyEOBalwgfdA34QN0AIAcROHBAumow31Y+F/QvUWbiM7yj/APhnUU0mOPG4OUDIxUbu+Iw7iGMmrxw+mOtYiAy2zJtrsZlkRZu/rLUcpnfH3auMd06x2NRznZHBZpM3rf6u5POOEz9qOE9+6e1qL1E6W696V4sSNbZGcPhY5ggkZphojNwGIJP4QJrD0RFj+CYIYqUe66hlmb4LOKdcJXrVzpndVHhz76dYcuzLJ8blFXRxdGlPKqN9M+PLunSXVm9Jqsixh3AQEAIADWZAvVBO7IA4RCjIoasECrOgMDZ0DsN7oKxZkNU9qBAB7IALoK6BQUTiFAQEEFLCrIBAKIW8WSFOQ6AOUC39roAHdAerfVADg1QW9CgWpwglzVBf1QQAcIDsKIApa26qCio4FtkFDbIHa6B4QBSroIyDkW5QQMPZBQ90HkZXl2ZZ1msjI8iyzF5nmWJrJwWDkmbOjAufSLQjeItCNyF8Xbtuxbm9eqimiOMzOkefyje/S1auYi5FmzTNVc8IiNZ/vtnc2W6VfBxMm/KzrrFjAIS0UOQYCf8Ah8YnEQ1i7wSmFKxxCi59nG3EU62crj9uY/hpnh31az2Q6Fk+w8zpezSr9iJ/iqjj3U6R2y2fyzKssyXLsPlGS5bhcvwGEg+Xh8LhpMMqTJh4hghAAXO71+5iLk3btU1VTxmZ1mfF0ezYt4eiLVqmKaY4REaRHhDytmX5P1PAQW1hsggANkD3QQnygtxb6IFLoK3KCAEUQLCm+yBQIAd3aiBe6AGdAo3lAN6oBAFUADsyCdybILX2QG7IJ3DoK6AQ4fdABYiiB2QGQPe6B2OyBal+yB4QLoHKBR6IHZNA7IKX2NN0AgWe6AO2yCUBqyB5QUgbII27oHhBRd/sgnlAQHdAtYXQO9kF8sgnZBb3QQPwgeEIN2AQDshxEDYBADs6C1dygn6IAQPJQDWwQWvAQGQSt0D9EBq+UDdAQL0ZAuUBu6BcIBsg/HF4PB4/CzsBjsLJxGFxMBlzpE6WJkubAQxhihIaIEGoK+7dyu1VFdE6THCY3TD87lui7TNFcaxPGJ3xPg146lfBtpvNzNzXpdmMGm8bETEctxPqmZbMJuIGeZh7n8vqgFhAFveVbc37OlrMafSU+9G6vx5VeOk9rQ822GsXtbuX1ejq92d9M93Onw1jsaw610JrPpxj4cu11p3E5RHMj9EjERtHhMQf+Cnw/giLfySRHzCF0TAZhhM0o6eDuRX1x9aO+nj48O1zrH5di8rr6GMtzT1T9We6qN093HsekIIfbsvXul4huUEvYIAYoQNVkCvhArszlBEF7IIyB4dAHAQQmiDkggDVKItbE0RRmYAoDcbIJUVdAp3QWvZBxbjdE4DVcuiuQdkEDBBRf8KCbdigDsURWs5RUrcOgPVkDaoQP80JwCjoiMbDmqKo87oDVYBu6BaiIrEmqKADlA7lBWfhkFkS52IxcjA4XDzsTi8VEJeHw2HlRTZ0+P8AmwS4QYoj2AKszFNM11TEUxvmZnSI75ndCxFVdUUURM1TwiN8z3RG+Wdum/wg631SZWadQsZFpTLImi/Y5XonZnOhoWN5WHcbn1xDeGErS8122weC1t4GPS19c7qI/KavhHbLdcq2IxmM0uY6fRUdXGuflT8Z7G1Wg+m2iemmWxZVorT+Hy6XNY4icHmYjEkP+KdOieOYam5YOwYUXNsxzXGZrc9Li65q04RwiO6I3R4eLpWXZTg8qt+iwlEU68eue+eM+Pg7NYrHMk4g8oOQqaC6AHBrugVeyCe90DxdAI2QRj6kFalvKCsRsglUB6MyAOUDelkD2QU9qoDgkfuQCN6oFkEoReiAeDZAYMgNsgHuUAcoFLVTiFqoLuLIG7oidxuimyBZBbghBGDugtEEerMge/lAcEoFdkFoAgIJ4CA/H0QVBOAUCyA6CindrIJV70QXuTRALs6CMTSyAB3sgvZBGauyA2x+yAWNGQDXdAtZADmo2QSou6Ctx9kNVr7ID1QCOblApsgl6lBeECtGQTlA3syAx5qgpG1UEbh0B2QX2QcTegQWyAx5QG7EIBcWP2QePmOW5dm+AnZVm+Aw2NwWJh9E/C4mVDNkzYTtFBECCPK/S1euWK4uWqppqjhMTpMeL8r1i3fom3dpiqmeMTGsT4Tua99Qvgy0tmhm5h0zzaLTeKIMQy7E+rEZfGeIa/MkOT/JMUI2gW85Zt3iLWlvMKfSR70bq/HlV4xE9rRcz2Ew17W5gKvRz7s76fDnT4TMdjWvXvTDX/TKbENb6YxGBwoi9MGZST8/ATKkBp8IaAlqQzBBF2XQMuzbA5tH/R3Iqnj0Z3VR+zPHvp1hz3Mcox2VT/1duYj3o30z4xw7p0l1iEiKCGZARFBEHEQLgjkHdZCY03Sx3aNwgf2ZAqC9Sglm7IG6AyCUPZBdxdAu3HZAqC+904g53ugN3CAKDsgP2QHo6BsqDM/KgUFWZAq7uggDCrIL4tvVA9kAbn6oJ5QWtXQN0AeUEcM6CjlmQN+6AiFbIpUUACAgMEFD7lENhdFfpgMLjc1zKVk2U4DF5hmM8EysHgsPFPxEfcS4AS3c0HKlyuizRN67MU0xzmdI85fVu3Xeri1apmqqeERGs+UM86A+DrWufxS8b1CzWXpfAxEE4LCmDE5hMhcODFWTJLb/AMYeQFpeZbb4PC+pgafS1dc6xTHh7U/ut2yzYbF4nSvG1ejp6o0mqfHfTH7zZvp90l0B0vwpk6L05Iwc+ZD6J+OmEzsZiP8AjJ8bxkOH9IIhGwC55mWd43NqtcXc1jlHCmO6I3fPtdEy3JcDlVOmGo0nnPGqe+Z3+HCOTt4d6LFMsVsyAaUogOXQBQ13QXdgUEFUCm6AX5QKeUBq/wBKC2YlAv37oI226A+9KoDG6CoIKPVAbghkF8MglahBQDdnKCWCAGQKoLW+6CEVdnQVrDZAtUlAAHCIUFgi8TuUEq4CAUC34jZAP6oFacIB7oA7IKeCgWia7oJ90AipQLVZAo7IAr7IBrQoBoQgni6C+6B4QCfUgAboCALmlUAVi2QCNkBqOgOLoF3AoUDgIBFECjlABqgA8IBYV5QLXQHfyUAd0DwVAIHsqAp7oIgvugHygObjdA/VAZ90DdAPCAwc28IFiwTgFWdALO9UAuDQhAYXQcY5cuZLjlTIYYoJkJhjgiDwxQmhBBoQ3KsTNM6xL5qpiqNJYZ178JnSvV8c/H5Bhp2kcymgxfOykQjDRx0YzMLF/Fkc+j0RHlbblu2eY4LSi9MXaI5VcfCqN/nrHY1HMti8uxszXZj0VfXTw8aeHlpPa161v8LXV/R3zcVl2VydV5fLEUQxGTlsQIQf5eFmH1v2lxTFvOX7XZXjtKa6vRVdVXD8UbtO+IaLmGyGZ4HWq3TF2nrp4/hn5TUxLGTKxc3L58EyRjJEXonYWfLilT5RG0UuICKE+Qtnj1qYrp30zwmN8T3TG5rExMVTRVuqjlO6fKd6/WiiIKVQRuCgorsgUdBHCB9FUHCinYhAHBRCuyKClSGCIgpsqq0egUAOaBBanZBGH9SCb2QGNwyoWsoAs6Dkg42/qRFdA7uig90A9kApAm/dVFFUVQBY/ooKOEEiiglSzOmxwwS4fzRxRNDD5JorETM6Qk7o1l2bRXS7qN1H9MzRWjcdj8LER/j84DC4IB6n501hG3/BiM9lj8fm2Ayzdi7sUz7setV5Rw8dGTwGT4/M9JwtqZj3p3U+c8fDVsBob4KMNBFBjep2r5mLNCctyN5Ei9o8TGPmxg/5glnutHzDbydJoy+1p9qvfPhTHqx49JvGXbA0xpXmF3X7NG6PGqd8+HRbCaQ0No/QGXfwTovTWAybDRN8yHCyRDHNIFIpkyscyL/OiJK0bHZji8yuelxdya57Z4d0cIjuhveCy7CZdb9HhbcUx2c++eM+L3tLP9F4ntTahdBWqAPugO6BuHFUChvRAP5qIBG9kAUQC5PCAO6BtsgbVQKs6A5Idm5QACgmyChABrdAH3P2QPZAFahqoA8oHcoBLC1UAilEBggeUBtggoZkErv9UBmo6AgiCoHcIDOUEoPKC7oHuglOzoK25QC3h0BkCxcICCVdtnQUXQGFEAgEsCEEpYbIOV6BBxLcoLXZAq6A6BuWQPAQU0sglOEDfwgGl0BAvYoBFaoDC6BeyCkFBHYu1UAuUFrdBPKAAfZAZAFHZAoLUQO2yAPLILYOR3sgjIB5sgFndANUCo3ogNygNuUC90C1kC7coIyBu/6IOv6x6eaH6gYQYLWulctzmCGEwy48VIEU2UD/AL3NDTJZ7wxBe/A5pjMtq6eEuTR3TunvjhPjDH47KsHmVPRxdqKu+N/hPGPBgzWnwU6fxXzMV091jjsojLxQ4HNIDjsM+0MMx4Z0A7xRR+FueA29vU+rjrUV9tPqz5b6Z8IhpeP2Bs161YG7NHZV60eE7qo8ZlhLVnw69ZtHfMm4vRk3N8JLLftmRTRjYD3+U0M8f82fK27B7T5TjtIpvdCZ5Vx0fjvp+LUMZsvm2Bn1rXTjro9b4bqvgxv82VDiY8FMj+XiZcRhjw8wGXNgIuDBE0QPkLPdGejFccOuN8ecbmvzMRVNE7p6p3T5TvctiDSqioGJOyC9i30QBaiALhwgjVQWpJQRiLoL7OiJVkUqGQTdkHJmO6AD7eUEoC5sUBkDuKoFexQA+yCsQgC+yAHQCzUqgjWRF7bFFKXQcZs2Xh4Pm4idLlQChimRiGEe5X1ETVupjVJmKY1nc7BpTp/r3XZgOjNFZxnEqMkDEysP8rCv/wDzE0wSvpEV4cZmWCy//ur1NE9WutX4Y1q+D3YPLMbmH/a2aqonnppT+KdI+LM+j/gu1rmRl4nXGq8uyGSQIosJlsBxuJ7wmbGIZUEXiGYPK1PG7d4Oz6uDtzXPXV6seUa1T5w27A7B4u7EVYy5FEdVPrT5zujyqZy0X8NHR3RUyVjMPpSDOMwlN6cfnUz9tmgguIoYYx8qWRzBBCtOx+1ea4+Jom50KJ+rR6seOm+fGZbngNk8ry+Yrpt9KqPrVetPx3R4RDKBqQYiS1u39C1zXVskRygbl1AtRAoS+yAx3QGrUIDcoDXQK8WQLoAFSgjlu6C05QDZAQK8VQWxZggN9UE9kBg43QGL0QCCUC/ugWZA3oEFobBIEL9mQHcOgtuyCdtkDxugruLoIwAQC1xugv70E3CBRBQKUQRjvZAv7IFEFF3dBB3QLG1ED+hBfCCM4dBaoHCCfynQEAg0ogMUFruEDyglSaIDV5QL3QLP+iCi9kEIbdBfDIIGPCAL0KBejIDnZBXLO6CXdAFSglEHIkswugnYIKTS6CCpQGogGtkBjYWQGJQACdkADsgdnQGYeEB3sgV5QO26B9kBid3TUHQBtVAFUAhigjUqUFo1EBkEd2PCC73QGcgug9LqjQ+jdayBhdYaVynOpcIMMH7fg5c4ywd4Yoh6oT3BC9uEzHF4CrpYW7VRPZMw8WMy3B4+OjibVNffET5dTEGp/gz6WZr65umcdnumZvpaCXhsX+1YZ+TLxAjI8QxwraMJt3mNndiKabkdsdGfOnT4xLVsXsHlt7fh6qrc9k6x5Va/CYYs1F8GHUvLIootN6m09n0mEOIcQJuXz4uwBE2An/WC2XDbd5fej9fbrons0rj/AGz8JazidhMwsz/09ymuO3Wmf90fGGM9QdHOrelRFFnvTPP5cuEExTsJIGOlQjkxYYxsPIC2DD53lmL3WcRR3TPRnyq0a7icizTCb72Hq74jpR506ulw4vBxTTh/2uWJ0JMJkxH0Rg8GGJogfZZboVxHS03dfLzjcxPTp1013/Hy4v39MUNCCPK+NdX1pKIIA13QNkBqIDf3IAohvOzIDNdAAG5QQUogrIApZAA9zwgMLoFDsgqCB9qoOM6fh8K0WKnypIP++xiH9V9U01V+zGvck1RT7U6PZZBprVWrf/olpTPM7HqEPry/Lps2VCTzN9Pyx5MS8+IxWGwf/dXaaPvVRE+WuvwejDYTE43/ALa1VX92mZjz4R5smae+E7rjnsT4zIsq09LoRHmuZwxxmHkS8MJhftFFD7LX8Ttlk+G9muq5P2afnV0fylsOF2MzjE76qKbf3qvlTr8ZhlLTfwQZLKMM3WfUHM8eWBOHynCy8FLfcGOZ8yYR3hMBWt4vb+7VuwliI7apmqfKOjH5tlwmwFqnfi781dlMRT8Z6U/GGXNJ9BOj+iZkOIyLQWWftcJEQxmNhixuJEQ3E2eYoof9VgtXxu0maY+JpvXp06o9WPKnSPNtOD2cyvAT0rNmnXrn1p86tZ8nfmMVIiTwNvosJqzcRDiRVnRTwgrC6BQ22CA1QUDv9kDvRDih/tRBTeqC32BQRyTWjoLZBLVKBeosgWaqC0Jd7dkE2qaoF7oL7IJuECpBqgG10Bi7oAHsgMOED2QXsDTdAoglyxuggfcoLeyAKFA3sgteUErd0AGrBAaqBVroHfdA8pIVZBfKagEEZmeqAAT4QKv4QGN0QAc3uim4QWgN6oI5sUAgv6kCvFEDhA90BBXANaMghdy6AHugFwHAqgVAqgF0DeqACd0F9nQBdAFbcOgjN7IFbjdAvUoA43QPH3QHI2QL3CC92QO6CF7WKC1H70Ep3QDwyA5FggF+KIDUD0QUDZBKm9EAcFAoWCgF1QqyA5uyA6BsgVOyBR7oK5BL2QSoQDwgrUugl2ZArYhAqdggbIDGEkw07iiao9VqDSeltVyxI1RpnKM5lwhhBmGBlYgDx64Sy9WGx2Jwc9LD3KqJ+zMx+Ty4nAYXGR0cRbprjtiJ/NjrOfhT6F5sZkcjRcWUzo7TMpzDEYQQ+JcMXy/+is/Y2yzmzpFV3pxHvU01fGY1+LAX9jcnvTMxa6Mzzpmqn4ROnwdHzf4H9LTQP8HOo2ocCRtj8PhsZD/0YZcX1iKy9jb/ABEf6+Hoq7pqp+dUfBh7/wDh9hpj9Rfqp+9FNXypn4upZr8E2u8PERknULT2P4GMwGIwh+sEU0fZZSzt9ga/9azXT3VRV+cUsVe2Ax1P+jeoq76Zp/KanVcz+E3rhl7nDZRkGattgs6EJPtPlyx91krO2WTXfarqp76P6Zn8mNvbF5xa9mmmr7tX9UU/m9Bjvh966ZcDFiulWbRAb4XE4PED/q5xP2Xtt7SZPc9nE0+MVR+dLxV7M5xbj1sPPhNM/lU9FiumXVDCuMV0r1lAzv6cjnzAPeXDEF7Kc1y6v2cTb/HTH5zDxVZTmVv2sNc/BM/lq9Vi8i1Fl7nH6V1BhGNf2jJcVLb/AGpa9NGJsXPYuUT3V0z83nuYTEWv9S1XHfRVHyeum4uTIPpxMcUkgsRNlRwH7gL0U0TX7O/umJeaqqKJ37u+Jj5OH8J5a7RY6SPMSvobnuy+ZvW441QDM8siFMfIPiN09Bd92T01uONUEOOwUVIcTBG/80GL9Anorkck9Pb101ebhcBmWNIGDyjNcUTtIy3EzH/2ZZdfjXXbo9uqmO+qmPzl6aLddz2Kap7qap+T2uH0D1DxY9WD6b6xnvvBp/GN9TLAXmrzLA0e1iLcft0/zemMsx9fs4e5P7FX8ntsB0S6zZoYRgulGpvxGn7RIlYYe5nTIWXluZ7lVr2sTR4TM/lEvTa2fzW77OHr8dI/OYdiwPwudesbGBO0Vg8uD/mx2dYYADuJRmFeG5tbktuN16au6ir/AHdF7reyGdXJ0m1FPfXT8tXZcv8Agv6q4mKE5pqjSOXyzf5MeJxkY9vRLH3WOu7d5bR/pW66u/o0/OpkrOweZV/6tyinu6VXypduyv4HMJDNhi1B1SzCfKasvLcplYaIH/TnRTf0WOvf4gzppYw0RP2qpn4RFLJ2P8Poidb+JmY6qaYj4zNTueUfB30Xy+maYXUGe/8A6hm82Af7OH+XD7MsRf25za5/pzTR92mPzq6Usth9hMptRpciqv71U/lT0Y+DvunejXSjSZlzNPdOdOYOdK/JPGXy454P/GxiKMnyVhcVnuZ43WL9+uqJ5dKdPKN3wZ3C5FlmD0mzYoiY59GNfPj8XcniI9JiJ7PT6LEazLKxEONqBFWhsglx+iDlVBKuxQKmiBvRAanCB7XTiKHQD5+iCcdkBqIFdkFfsggNe6Ch6hwgj8IBfkqCn3VEsgAndA8ILVBC9zRAZAs6AEFL7GyCAboDblBfKCOGZAcguyC02qgd6BENj+5FRt0AIK7VKCb3QNwUCr9kF8UQAz0sUEDCyA3ZkB0Bt9ygVBpdBaXQK8oB4AugCpognlAQNuyBQ3CA7nsgCprdA3qgW8oD/RA2d0A97IFTdAetKoLW7IICDR0B2NFBCqL35QXbdBC72QPdAfcoFHqgB+Qgps5KCX2qgM1kF7gUQQMzoB7IBL3QKVdAJDWQN6FANLmqBvb3QK+6BYOKIIRwgp8oJ2NUFugPUIDs7MgUfl0AnYFAvWyBaiB7oBY8eyCiqCeC3CASgteKIJYoArugA7lAN7UZBPRCP5I+iGkKHh/lEDsSETSF9UX++R/7ZQ0URzRSGYfcumppCmOYR+d+xAV1Oi4iOMWiHtCP6E1TowomTn/3Qt7JqvRjm4+qY4PzI/8AaKmsmkBMTkGOI/6xQiIQQw3EIRQUe103i3JBQGfZA3/RBaGoQTe3sgB3ogF0B/ZANLVQKM6AaUQHPIQDsgEVZCDzugp7oJXw6AaCl0FuHKCdwgbVCBe5ZOIUQCWQCNkD2QDdybIL4QQoHtdBXpygnhA/VABLhA+yCuQWQHcdt0EBowQB5QLBApsED9QgEN7oHgkID0QhQ3dAvdBB4ZA3bhAYPVAoTZAruyAyB2CaATW7oAIoXqgA1QHQCwQKoDB71QGQBQXQkugWuSgWsgFhuEC5sgjsUFrsgod6oiWKKWQO26AaF9ggboBL33QH5CCsf7BBLN3QN3u6BahQAXLhAOyA/DUQGpZAYEh7oFCamoQB3sgDlALEoFebIBcl2KBZAeqAwpVAoOyBY+pA71QOaUQG+yAGQCzO7lAqHQKteoQKg0QG+iB3A+yAbuQ6AyBtVAb2QKlA7UQC7oFAgE1Zige6BaroCASSgB3LFANbFBL3QX8pZkBqsgbhAbvVAQXsCgjHdAatkFQRr1vsgNugM+9ECzVQCeyBfZAob7oFi6Az3D1QN7oI24ogrMgEPsgf2ZA7oBtV0A0DbIAFPZA3coAdAuSUCjugIA73QKE0QV0EFKoKUEq9mQLVQOxpygcMEBAa3a6AwNBRAevsgNW6BWr2QN0C1XQPKAzIAiLugNv9EB0CyAS/ugUt7oKQH2QQkPdAAD1ogVtZArbhBdwUNECB3Isgb0ugFAenlAuCEEp5QWyA26CU32QVyBUILZ0ELFmQKkoAe/KA31QAPZAatCgWJZA7EWQ4n1QLUCAQPKC0droJZ3qyBQ7oDsahAAQBZNAfdAd0kSxQXu/2QOImq6BugNugEBwQUCr90BAcOhqGpqgWIqgNSyBQ3QWK/NEE3QCgHtZBUCjOSUEIO1UBtwUBmugWoEBvqgEPdBW+yDix2QUt7IDlAA3KBvZBSxKCeDdArVkCu3KARxV7oA7FBLWFCgrABArd0D3QD+aqC7oG1AyCNVAAeiAOUAW5QG2ACAwdkAtsgeUFqSghH3QCCgClWdArdAbZAsKIFb/ZAdnogeGQDZkAIA5Q4iAasyAeW+qA1X3QGeoLIFRUIKKmtEENeyAXqyBsSyBe6B7oBpTZA4FUA2QDTdAJrSiBUIHd6oFCUFbZ3QRjvVBLFBSXogeQUFpStkEQBehQGeodA3cfonYBHKCtRBCgMHCAaoLVnQRgCxKC2ugjksUFetkAefKEogp+qBuQUEdmDoGyA23KBcoBCBQN/QgDhkFDAIJbZAHBugrd0EfsgpKCHh0Cp3QB3QW1TugjF0NVsK7oJ5QKvzugFAo6B4KBfZAZBaGyahVBPd0AeboHl0C5QN0CuyC+10Db96CbuaoK9bCyCbElBW4QLEIF6vVBK3ZAd6sgXQRqbIL2ugDhAsWYUQCOd0BAYOzsgM9SgV4QBSv2Q4iaA71QD2QLUHCAEFDu90EsgtboF2ICCV3QOzoHsgPvZ0CgFAgNWiAHdBWQTep7IDHb+9AcblAP3QUjjZA7sgbUQR33ugu1roJTlAts6BuzIKyAexQRkAfdAvdAvdAuUF9nQQjgoKD9kE3QG2LN4QKIL+qCeKlAJFi6C7u90E3QN0FFLeEBBAOEBvogWsgM6Ct2uggclyUC10A22ogVdBWf6IJ3L9kCtiUBiDRAcIFGpRALXKB2QWxQDwyCIDC6AOyBs/KAzFBSNxRAt2QS9TRAYbUQPCC02F0BnDsgjoDbugC+1EBqWogN90FI7IIeQECroAYXQVg3HhBL1QKugVCB7WogVQVq8FBD3CAK2sgNfhALIAuSDdAre7IK3anCAabMglQKvVAYAoHcIHugMXBQUuSyB3QQ/ZALPeiC9ygjIDNZBaCm6CEIBdxRArv+iBXhAD7oBugM4uCgjADdAbhBUCwqgFr8oG/ZAsgOG8IG1/KB5QCgF78IF67IHsgDeiCVuEAHdkFqRe6BvUIB4+iCdqoL4sgF9kD3QLFBUC9HQKbC6CFAbcIBoaIHsgVo+6C2QQFAYCgQP0QECzcugDhALv5QLC9UAcOgAUugDkhAq7VQQ1qgoFKgIKglxVBWFiEC5QQuEFO1EEYGqAz1ZBdmdA92QS1UAC5QBygHxVAFdkDugGqBYuboI7ILt7IG16oCBS5QPaiAPogldkF9mQKks6B3QKXNaoHuzIFqM6BTfZAf3QXsyCPygAcIAt3QKCr0QKcoDd0FNKoJR6oBtVA4NUFfYIIWBfdApdAKBbygWIQKcIJuyBygGt0FfsgCoNUCoqEBt/qgXQK2QG33CAgdt0C1kOIz7IAG6AexQS7Eh0HKn1QS+4ZAFRygrsglUCoLoFCDRAugd9kCtygXBIuglOEFBogl7+EFaqBVA7BBDygr05QPdAZBGNUFCCEIKHd0CyCHsPKC3qgntVBR2qgOxAQLbIFUC4eqC23QQPugHhAFEAVq9UAsSyEDNVA7AoFKMUCrsgeUBuzhAfygboD8oAYVQA5o1kBQAS7FUB3QHY13QKHZAPBQEBncILXYIJVBTRkE5KB7IHnZAcvVAF3ZAogvugnsgV4QDUhqIBY2QEFNkECAzh/dADvVAbsgB0CoZqoBvQIAf6IBoWQLeUFsEEtcBBTcEVCCeUFbn6IJUAOUCu6B+iC1NWQRAepcIB7boKRszIDNZBC5uyC27IJsgfvQAXqhobN+iCk7XQRm2QV6bIBQQ+EFrc1QQMUA8oKxbhOwAas9OUE4+iC1aqCAFqIFd0DlkBtySgbWQWtzVBBSrIHhAqQUCgDlAQUO6Bc0QR9kCvdACAXKBa6BV0CwsgIDNRAZADs/CAxa6B2YoFAgE1cIFaN7oDdkAdh5QKIA7bIG45QD2QO1kDfhAIIuECpLoLXhBKu6AxetkE2QWougVFEB3Z3QVBAeUC9EC9G7IHKBy4QX3QSp3QVg9kE7oBJsgrFkEsbIG+6APqgMUB+LoL4CAaVG6CDwgcuEFNNkEdroBrQ0QUeEEq7UQHsCgtAHQSp3QC5QA72ogvYoFXO6CEB7IFj5QLoFUF7CyB3ZBHQN2dA2GyBtRA3QHqxQHrXZBaAoIbhA8ICA26Cts6CNsyBS6A2yBuxQN0CgqEAlmogOd0BmKBQmqAzoFW7oAZiEFeqCboApThA2QG3BQBXdACAXZwEC9XQVg3hAZu6CV39kA1CAgiC0dggGvZ0BkBmPdAbugB7ugWo9ED9Agoomgl9qILahQT3QLM6AgIDvWzlADDdBWbZBEFYvVBOyBVANDW6AzNygWp+iAQAasgIG4LoF6OgbMCgeUDxdAogdkCgdADoBHsgGoqglRugv9igP7IKXYIIz0KAzXQLlA9kFY0CCGiBXlAqmgtTughNNwQgoHCCEhmdAvuyBex+iC/UMgl0EeqC0NHugG9Cgb+yAz0QG/EgUKCl3oUEZ+yAwQHawQVy1KIaJ2CAd6oHYIDVFa9kAud0BBbXQSo2QUoJTgoBG4QKA1QDehQOKoA7oFUAg2sgOgAcoBoboFaOgAt/SgAb0QTeyC70QSo2QXdggID9kDhy6B2uUC4fhAFf3IAQKndALGiC/pwgjAWQBsgXLoBqeGQH3QN0FFKhBHFxuge10A97IFAUAjhAsgWqUDbugUCB2ugboIGFTsgtrXQB72QK3QBy6AOxogUNrDhALcoFfZBDRBaCzVQO6AQzIAtdBDUVKCmlUFYEXdBGDU3KAK7oHZArX9UC1IkAuyACgeCgedkBmQQMyC2uLoFEAUsguyCNyaID1tZAIL+EBjcBAHO3dAoRSqBYhkAcDhAP2QTy9UFrRCC1UA0QHYoDclBGDfZBd70QKu3KBaiBbdAZ9igtO6CXDBBNgGqgtCaugb0QAw5QGQLe6Cb0QUXdAelkCyB7oIOwQUB9kEpsgt0D8PdBQ/dBN0DugbtugXQO6A3dAIQDwgWogHsUDdAA7IH5TdADhAZ2QRqu9EFYu9nQKiroHugNWjgoFkBtnQPdAAa6CMQgo5F0D9ED8QsAgNuEQNdkU2pugh2QVqugg7ILvUIBB2KA1an2QKlAZuyAH2QA4FUCjWQGeroL2JoUEvRBLm6B2KC0GyAxFroF0BA/pQGIqgH7IFXdAuUAiqBVAqCgN9UClkCjoFkEYoL7oFRVNAL35QLVCBenKB4QB3CAB90BA+qBv2QDQIFeyA9EC9GHlNQYtVAbdANbt9EAPcmiBcs6BYIFnJCAGBsgn2QUhizIHZ0C9UAVogl0BkF7190C9PsgCpCAxZBDeyCm9EAOghvSyCsSgeEA14ugWFECwQW+6CAIFrpqCA/ZAsyAeW+iCB0F7EILT3QSpQSrsgWQWxQP3lDRKuyAKHlBSAzGwQDSqCFyyC9kChQSnFUFQCG3ogFuKoKXPlBxsUFqd0BnL8IG7B/dAtUIBs7fVAdA37oBBdAqbIAe4syAgfVAYEoArdAod0F3QcaeUC7IKBcO6BY+UDu7IFi7oCCoOL2LoLZmQGCA1boHNkA8oaDd0CroFT7ICC/6yCIHZAdAFKOyAUB0De7FApTugXQG2B9kQ3dFKiKqAQPDoG4ZAHAQGOyBQl0AnnZAejm6BV0DugmzPdBWAaqBv3QBZAayAUB3qgnlBd0AF+yB7hA7oBsyBcXQGQPKAeWQGq4LoDO6BcUqgNwUAvZAugIAqSgMRuguyDj90FQBf+hBKEoL2e6BajoDUQKIFLIJveiCs1XQDXdBTQ28IIgUCBRAFRdANC5QQe6CgF2QKoFR7IAcIHhAqHQWxFPsgnhBH5QUjkoHdAfhAq16oF0Ct+3CC2ogfoggflAG4QDyUBrFAq9ggHygGlKoHvQoHd0Bg7oFDRAbckMgdwgbhA2QVzcboJQVCB2sgvhBCCN0AdggDwgAUvugb13QKEsEFBQR3ogbhE1CKvdFH52QRBT9UF7oIPNO6A6Bc1ugqCF2Q1LVdBbF0ELWCBu5KAgIF0F8FkEqgdiPdANLfRADGiB2QCeEAOgWKAOEBq0NEFqgnlkB32QO7IBuEgKoLw6CeSgeyB70QN6oAc3QKXdBXqgh8oFbIA7IB4ZA8FAt5QO6BUoHcoG9boFQWQX9EEua/RApRAI2BQC5F7IHdkBh3QD2ugNSyAa0QKmqBZAP96QFg7oFboAFUAWQKXq9kA+EEAehQLkILuHQCeCgGqAXugbugtSKoJQILXcIIzIBqWQVmp+5BN9ggebIDm5QB2QLEIHd0A90DvdBLcoOXbhBGAQGILmiBV0AM6CtRyghDoD1qUCyB3CA5dAO26ARVxugV9QqgU4ugWPdBSwsUEPugbsgu7ugPyUEvVkCyAHeqAboFtygFnQECoL7IDOLIDksgp/VBC7U2qgvFEEPlANwgVv6UEfygu7coB+6AfKBXbZA3ZBaoIL3QH8oDVsgl/dBfZAAvVBO4QU77IHugcN7oBsgX3QKbIAKBWwF0Dh0Ag7oDMgDugb0sgMd6IHlAFbFAN0FLnf6IJajoJuyCgOdvdAtdAqaIFA4CCgFuyCF7lBSxsLoJ/SgPsyAQ5YBAu9UBnLbIAqgMCEAt5QP6UB7VQKuxCBamxQW5cFBD2QLH9yBQhmQBU0LIJ4CC+bIL2QTdigvZBO6CAOgprSyBajXQA7XugElAZ6lkAOgVpRAfiqAb8IAsaoHugO1kC6ABtugX3ugXLMgpFEED2JdBBSyC7EIDF3Q1KkkbICBv2QKugO1AgC7O6BeyBSwBdAc7VQVv85ACCB/ZAL2ZAqaMgBuC6AQxQO7ILQmgZBKXQN7FApuECxr90A3oEC36IL4uUENS5QDyyBvugD6oDc7IAqECiAw5QCDf9yA+5QLF0CvKBtfsgROgt6FBA+5ugeSgoEVkEfdADoD7WQKoANzUIG/ZAoCKIBd6FAdqg/VALcoHhA2QDVADkoHd0AF9w4QKPyECpogOGvVAdi43QA7MUA1oEDZ0C26BQ90CyAgB7oG10E90FqDRAsglUFqKpIB34QO4sgAcIF61I4QL9kFfYoJUIDm/3QN6VZA2ugDh0DwgUAdkC5ogE8oCAGTiBBfdAQSoNaIK55QTev0QX3KCW3QUcoAuyBYuSgXJQEDcIFxQilkCrMUB33QCdt0AOSKgDwgUN0B+UCrsgeLIDVQC2xqUB0DZygDsgDf7lAJQD2KASRRAqgCnKBV2dNAqyBX+pAHlygbOQgOUAsxQA/KCfVBa7IFXuUF8hBBarIFSSgjoLZAqK3QCA6CnlAufKBy6AN0ByUEe1UCt0A9kB+DVA/tZBW7u6CXYugXKB3fsgu/sgjDlAdAfZkDugClUDzugrtRBHLvwgouRughFXDVQK8oLahFkEfwgPRnsgHkIFN9kFqKhBHfZAc8Ih3RSnCBYUQPd0B9jZAuGeyAaMyAzugd0C9kDegQA1AUC9CgHZigEvcoBpYVQKOgMUC1GQWwog41pygo/VAN3QDZ90CwYIcRAIQA+58oB5CCvXsEE3ogE7oIKuUFqTwgV5sgMGeiA5BZAPZAeoBQ0CWQHJ7IKgm3hBWqyCIGzIDCzuyB2CBcoIbugvndAHcuUAVd0AchABb+lA2vRAd0CtEB6s6A1EAWQKlA3rQIG90BxsgVAQKlkCvKACEDuyBTlAdAqaoBQNqBArygCpsgeyB5QGQAxKAKUCAgOgd0AFhZAANUF7iqCHwgeCgNWqB5KAaFroDlAa7fVAHi6C12RENw0KKM26BuwZAAFN0DeuyCjufZBAK1KAeUBAd6sgbeUH//Z"
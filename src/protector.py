@@ -1,78 +1,223 @@
 import os
+import struct
 import asyncio
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from . import aes, rsa
+from .compressor import Compressor, decompress, decompress_chunks
 from .utils import read_file, read_file_in_chunk, write_file
 from .config_manager.config_loader import get_encrypted_symmetric_key
 from .constants import (
     NONCE_LENGTH,
     TAG_LENGTH,
     CHUNK_LENGTH_FOR_LARGE_FILE,
+    CONTAINER_MAGIC,
+    CONTAINER_VERSION,
+    FRAME_LENGTH,
     ENCRYPTED_PRIVATE_KEY_PATH,
 )
 
+# AES-GCM runs in C without holding the GIL -> the chunks of a file are encrypted/decrypted on every core
+CRYPTO_WORKERS = os.cpu_count() or 1
+_crypto_pool = ThreadPoolExecutor(CRYPTO_WORKERS, thread_name_prefix="crypto")
+# chunks read ahead by all the files being encrypted/decrypted at once (on top of one chunk per file)
+# -> enough to keep every worker busy, the memory held does not grow with the number of files
+_read_ahead = threading.BoundedSemaphore(CRYPTO_WORKERS)
+
+# Encrypted objects (small files, parts, chunks and packed files) are containers
+# -> header: magic, version, codec, frame length, data length
+# -> frames: aes.encrypt of every FRAME_LENGTH bytes of the data, bound to the header and their position
+# objects pushed before the container have no header -> one aes.encrypt of the whole data
+_HEADER = struct.Struct(">4sBBIQ")
+_CODEC_IDS = {None: 0, "zlib": 1}
+_CODECS = {codec_id: codec for codec, codec_id in _CODEC_IDS.items()}
+
+
+def encrypt_object(key, data, codec=None):
+    header = _HEADER.pack(
+        CONTAINER_MAGIC, CONTAINER_VERSION, _CODEC_IDS[codec], FRAME_LENGTH, len(data)
+    )
+
+    # memoryview -> the frames are not copied out of the data
+    data = memoryview(data)
+    # empty data still gets a frame -> its tag authenticates the header
+    frames = [
+        aes.encrypt(
+            key, data[offset : offset + FRAME_LENGTH], _get_frame_aad(header, frame_num)
+        )
+        for frame_num, offset in enumerate(range(0, max(len(data), 1), FRAME_LENGTH))
+    ]
+
+    return b"".join([header, *frames])
+
+
+def decrypt_object(key, encrypted_data, codec=None):
+    # -> (data, codec), the codec of objects without header is the given one
+    if bytes(encrypted_data[: len(CONTAINER_MAGIC)]) == CONTAINER_MAGIC:
+        try:
+            return _decrypt_container(key, encrypted_data)
+        except ValueError:
+            # the random nonce of an object without header may start like the magic
+            pass
+
+    return aes.decrypt(key, encrypted_data), codec
+
+
+def _decrypt_container(key, encrypted_data):
+    if len(encrypted_data) < _HEADER.size:
+        raise ValueError("Truncated container header")
+
+    _, version, codec_id, frame_length, data_length = _HEADER.unpack_from(
+        encrypted_data
+    )
+    if version != CONTAINER_VERSION or codec_id not in _CODECS or frame_length == 0:
+        raise ValueError(f"Unsupported container (version {version})")
+
+    header = bytes(encrypted_data[: _HEADER.size])
+    frames = memoryview(encrypted_data)[_HEADER.size :]
+    encrypted_frame_length = NONCE_LENGTH + TAG_LENGTH + frame_length
+    data = b"".join(
+        aes.decrypt(
+            key,
+            frames[offset : offset + encrypted_frame_length],
+            _get_frame_aad(header, frame_num),
+        )
+        for frame_num, offset in enumerate(
+            range(0, len(frames), encrypted_frame_length)
+        )
+    )
+
+    # the data length is authenticated with every frame -> dropped frames are detected
+    if len(data) != data_length or not frames:
+        raise ValueError("Truncated container")
+
+    return data, _CODECS[codec_id]
+
+
+def _get_frame_aad(header, frame_num):
+    return header + frame_num.to_bytes(8, "big")
+
+
+def _is_container_file(file_path):
+    with open(file_path, "rb") as f:
+        return f.read(len(CONTAINER_MAGIC)) == CONTAINER_MAGIC
+
+
+async def encrypt_data(key, src_path, checksum=None, compressor: Compressor = None):
+    def encrypt():
+        original_data = read_file(src_path)
+        if checksum is not None:
+            checksum.update(original_data)
+        codec = None
+        if compressor is not None:
+            original_data = compressor.compress(original_data)
+            codec = compressor.codec
+        return encrypt_object(key, original_data, codec)
+
+    return await asyncio.to_thread(encrypt)
+
+
+def encrypt_chunks(
+    key, src_path, checksum=None, compressor: Compressor = None, skipped_parts=()
+):
+    # encrypt one chunk at the time -> only the chunk being processed is held in memory
+    # the same chunk also feeds the checksum (if given) -> no need to read the file twice
+    chunks = read_file_in_chunk(src_path)
+    if checksum is not None:
+        chunks = _update_checksum(chunks, checksum)
+    # compressing sits between reading and encrypting
+    if compressor is not None:
+        chunks = compressor.compress_chunks(chunks)
+
+    # skipped parts (already uploaded) are still read for the checksum/compressing but not encrypted -> None
+    codec = None if compressor is None else compressor.codec
+
+    def encrypt(numbered_chunk):
+        part_num, chunk = numbered_chunk
+        if part_num in skipped_parts:
+            return None
+        return encrypt_object(key, chunk, codec)
+
+    yield from _map_in_order(encrypt, enumerate(chunks, 1))
+
+
+def decrypt_chunks(key, encrypted_chunks):
+    # every chunk is encrypted on its own (with its own nonce) -> they are decrypted in parallel
+    yield from _map_in_order(
+        lambda chunk: decrypt_object(key, chunk)[0], encrypted_chunks
+    )
+
+
+def _map_in_order(function, items):
+    # the items are handed to the pool as they are read and the results come out in the same order
+    # -> the first pending chunk of every file is free, the ones after it take a share of _read_ahead
+    # -> when no share is left, the file waits for its oldest chunk instead of reading more
+    pending = deque()
+    try:
+        for item in items:
+            while pending and not _read_ahead.acquire(blocking=False):
+                yield _pop_result(pending)
+            pending.append((_crypto_pool.submit(function, item), bool(pending)))
 
-async def encrypt_file(key, src_path, dns_path):
-    loop = asyncio.get_running_loop()
-    future = loop.create_future()
+        while pending:
+            yield _pop_result(pending)
 
-    def encrypt():
-        if os.path.getsize(src_path) <= CHUNK_LENGTH_FOR_LARGE_FILE:
-            original_data = read_file(src_path)
-            encrypted_data = aes.encrypt(key, original_data)
-            write_file(dns_path, encrypted_data)
-        else:
-            with open(dns_path, "wb") as f:
-                for chunk in read_file_in_chunk(src_path):
-                    encrypted_chunk = aes.encrypt(key, chunk)
-                    f.write(encrypted_chunk)
+    finally:
+        # the consumer stopped early (or a chunk failed) -> drop the chunks not started yet
+        for future, is_read_ahead in pending:
+            future.cancel()
+            if is_read_ahead:
+                _read_ahead.release()
 
-        if not future.done():
-            # just await to finish the encryption process then no need to hold actual data
-            loop.call_soon_threadsafe(future.set_result, None)
 
-    encryption_thread = threading.Thread(target=encrypt, daemon=True)
-    encryption_thread.start()
+def _pop_result(pending):
+    future, is_read_ahead = pending.popleft()
+    try:
+        return future.result()
+    finally:
+        if is_read_ahead:
+            _read_ahead.release()
+
 
-    await future
+def _update_checksum(chunks, checksum):
+    for chunk in chunks:
+        checksum.update(chunk)
+        yield chunk
 
 
-async def decrypt_file(key, src_path, dns_path):
+async def decrypt_file(key, src_path, dns_path, codec=None):
     loop = asyncio.get_running_loop()
     future = loop.create_future()
 
     def decrypt():
-        # Plusing nonce=12bytes and tag=16bytes
-        # because if the file has the exact 7MB size after encrypting it will be 12bytes + 16bytes + 7MB
-        if (
-            os.path.getsize(src_path)
-            <= NONCE_LENGTH + TAG_LENGTH + CHUNK_LENGTH_FOR_LARGE_FILE
-        ):
-            encrypted_data = read_file(src_path)
-            try:
-                original_data = aes.decrypt(key, encrypted_data)
-            except ValueError:
-                loop.call_soon_threadsafe(
-                    future.set_result, {"success": False, "error": "Invalid password"}
-                )
-                return
-
-            write_file(dns_path, original_data)
-
-        else:
-            with open(dns_path, "wb") as f:
-                for encrypted_chunk in read_file_in_chunk(src_path, is_encrypted=True):
-                    try:
-                        original_chunk = aes.decrypt(key, encrypted_chunk)
-                    except ValueError:
-                        loop.call_soon_threadsafe(
-                            future.set_result,
-                            {"success": False, "error": "Invalid password"},
-                        )
-                        return
-
-                    f.write(original_chunk)
+        try:
+            # a container is a single object -> its frames are found from its header
+            # objects without header: plusing nonce=12bytes and tag=16bytes
+            # because if the file has the exact 7MB size after encrypting it will be 12bytes + 16bytes + 7MB
+            if _is_container_file(src_path) or (
+                os.path.getsize(src_path)
+                <= NONCE_LENGTH + TAG_LENGTH + CHUNK_LENGTH_FOR_LARGE_FILE
+            ):
+                encrypted_data = read_file(src_path)
+                original_data, file_codec = decrypt_object(key, encrypted_data, codec)
+                write_file(dns_path, decompress(original_data, file_codec))
+
+            else:
+                # several 7MB objects without header one after another (how big files were merged before)
+                # decompressing (if the file was compressed) sits right after decrypting
+                with open(dns_path, "wb") as f:
+                    for original_chunk in decompress_chunks(
+                        _decrypt_chunks(key, src_path), codec
+                    ):
+                        f.write(original_chunk)
+
+        except ValueError:
+            loop.call_soon_threadsafe(
+                future.set_result, {"success": False, "error": "Invalid password"}
+            )
+            return
 
         if not future.done():
             loop.call_soon_threadsafe(future.set_result, {"success": True})
@@ -83,6 +228,10 @@ async def decrypt_file(key, src_path, dns_path):
     return await future
 
 
+def _decrypt_chunks(key, src_path):
+    yield from decrypt_chunks(key, read_file_in_chunk(src_path, is_encrypted=True))
+
+
 def load_symmetric_key(password):
     with open(ENCRYPTED_PRIVATE_KEY_PATH, "rb") as f:
         salt = f.read(32)
@@ -17,15 +17,10 @@ from .constants import (
     PULLED_DIR_IN_DOWNLOADS,
     STRING_SESSION_PATH,
     STORED_CLOUDMAP_PATHS,
-    INCLUDED_CLOUDMAP_PATHS,
     CACHE_PATH,
 )
 
 
-def check_health_cloudmap():
-    return all(os.path.exists(path) for path in INCLUDED_CLOUDMAP_PATHS)
-
-
 def _get_default_pulled_directory():
     while True:
         user_choice = input("Your choice 1/2/3: ")
@@ -1,6 +1,5 @@
 import io
 import random
-import base64
 
 from telethon import TelegramClient
 from telethon.sessions import StringSession
@@ -12,9 +11,8 @@ from telethon.tl.functions.channels import (
 )
 
 from . import aes
-from .icon import ICON
 from .utils import read_file
-from .constants import STRING_SESSION_PATH
+from .constants import STRING_SESSION_PATH, ICON_PATH
 
 
 def load_string_session(symmetric_key):
@@ -47,7 +45,8 @@ async def delete_channel(client: TelegramClient, cloud_channel_id):
 async def set_channel_photo(
     client: TelegramClient, cloud_channel_id, file_name="icon.jpg"
 ):
-    file_bytes = io.BytesIO(base64.b64decode(ICON))
+    # read only when a channel is created -> not loaded by every command
+    file_bytes = io.BytesIO(read_file(ICON_PATH))
     file_bytes.name = file_name
 
     uploaded_file = await client.upload_file(file_bytes)
@@ -1,11 +1,13 @@
+import os
+import stat
 import socket
+import struct
 import time
-import asyncio
-import threading
 import json
 import hashlib
 import random
 import shutil
+import contextvars
 
 from colorama import Fore
 
@@ -29,13 +31,25 @@ def check_network_connection():
 
 
 def clean_prepared_data():
-    shutil.rmtree(PREPARED_DATA_CACHE_PATH)
+    # a daemon cleans it after every job -> it may be gone already
+    shutil.rmtree(PREPARED_DATA_CACHE_PATH, ignore_errors=True)
+
+
+# where the output goes -> the terminal, or the CLI which sent the job to the daemon
+# a context variable -> every job (and the tasks/threads it starts) has its own
+_output = contextvars.ContextVar("output", default=print)
+
+
+def set_output(write):
+    _output.set(write)
+
+
+def echo(msg):
+    _output.get()(msg)
 
 
 def logging(msg):
-    print(
-        f"{Fore.BLUE}{time.strftime('%H:%M:%S')}{Fore.RESET} {msg}",
-    )
+    echo(f"{Fore.BLUE}{time.strftime('%H:%M:%S')}{Fore.RESET} {msg}")
 
 
 def get_random_number():
@@ -77,22 +91,27 @@ def get_checksum(file_path):
     return checksum.hexdigest()
 
 
-async def async_get_checksum(file_path):
-    loop = asyncio.get_running_loop()
-    future = loop.create_future()
-
-    def hash():
-        checksum = hashlib.sha256()
-        for chunk in read_file_in_chunk(file_path):
-            checksum.update(chunk)
-
-        if not future.done():
-            loop.call_soon_threadsafe(future.set_result, checksum.hexdigest())
-
-    hashing_thread = threading.Thread(target=hash, daemon=True)
-    hashing_thread.start()
-
-    return await future
+def get_document_info(msg):
+    # what downloading the message needs later
+    return {
+        "msg_id": msg.id,
+        "document_id": msg.document.id,
+        "access_hash": msg.document.access_hash,
+        "file_reference": msg.document.file_reference,
+        "dc_id": msg.document.dc_id,
+        "size": msg.document.size,
+        "file_name": msg.document.attributes[0].file_name,
+    }
+
+
+def get_stat_info(file_stat):
+    # a file whose size, mtime, inode and ctime did not change is considered untouched
+    return (
+        file_stat.st_size,
+        file_stat.st_mtime_ns,
+        file_stat.st_ino,
+        file_stat.st_ctime_ns,
+    )
 
 
 def convert_bytes_to_int(bytes_num):
@@ -109,3 +128,30 @@ def convert_bytes(bytes_num):
         if bytes_num < 1024:
             return f"{round(bytes_num, 2)} {unit}"
         bytes_num /= 1024
+
+
+def is_socket_supported():
+    # the key agent and the daemon -> Unix sockets whose peer can be checked
+    return hasattr(socket, "AF_UNIX") and hasattr(socket, "SO_PEERCRED")
+
+
+def is_own_socket(socket_path):
+    # a Unix socket of this user which nobody else can connect to
+    try:
+        socket_stat = os.stat(socket_path)
+    except OSError:
+        return False
+
+    return (
+        stat.S_ISSOCK(socket_stat.st_mode)
+        and socket_stat.st_uid == os.getuid()
+        and stat.S_IMODE(socket_stat.st_mode) & 0o077 == 0
+    )
+
+
+def get_peer_uid(sock):
+    # struct ucred -> pid, uid, gid
+    ucred = sock.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+    )
+    return struct.unpack("3i", ucred)[1]